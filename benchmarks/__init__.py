@@ -0,0 +1,64 @@
+"""
+Pybox Benchmarks
+
+Benchmarks for the compute kernels in the shipped examples, run headlessly (see modules/pybox/_headless.py):
+
+- mandelbrot        \t -- The bulk-array loops in Simple Mandelbrot*/mandelbrot_faster.py (simple, smooth and 3-D)   \t - pixels/s
+- sobel             \t -- sobel_edge.sobel_filter() (requires SciPy)                                                 \t - pixels/s
+- pendulum_update   \t -- "Double Pendulum/pend_module.py" update()                                                  \t - steps/s
+- pendulum_render   \t -- "Double Pendulum/pend_module.py" render(), at several trail lengths                        \t - segments/s
+- fractal_tree      \t -- fractal_tree.draw_tree() (the recursive fractal_tree() function)                           \t - segments/s
+- sierpinski        \t -- sierpinski.calc_triangle() at several recursion levels                                     \t - triangles/s
+- set_pixels        \t -- N draw.set_pixel() calls against one draw.set_pixels() call                                  \t - pixels/s
+- plot_points       \t -- draw.plot_points() for a point cloud, with "replace", "add" and "alpha" blending            \t - points/s
+- bitmap_churn      \t -- A frame copied into a new bitmap and displayed, against a BitmapPool bitmap                    \t - pixels/s
+- bitmap_convert    \t -- display_bitmap() of uint8, normalized float, int64 and int32 gray images -- passed to the      \t - pixels/s
+                    \t    backend as they are, against the conversion stage (pybox.convert_bitmap())
+- image_pyramid     \t -- A 6144x6144 memory-mapped image opened and zoomed out across in 1200x800 views -- read whole   \t - views/s
+                    \t    against pybox.ImagePyramid tiles
+- image_files       \t -- 24 PNG files read forward and back with read_image_file(), against prefetch_image_files() +   \t - images/s
+                    \t    read_image_file_async() with the decoded image cache
+- options           \t -- opt.at() + opt.size() as passed by display_bitmap(), read by the backend -- option strings      \t - calls/s
+                    \t    against structured options
+- import_time       \t -- 'import pybox' (and new_window() + display_bitmap()) in a new interpreter, with and without   \t - starts/s
+                    \t    a bytecode cache
+
+The kernels are taken from the example source files themselves, so the benchmarks follow any changes to the examples.
+
+Each kernel is run at several sizes.  Throughput is the best of several timed runs, and peak memory is measured in a
+separate (untimed) run with tracemalloc.  Results are compared against baseline.json, and the run fails when
+throughput drops, or peak memory grows, past the tolerance.
+
+The numbers are headless numbers: drawing goes to the NumPy stand-ins for the native entry points, so they measure pybox and
+the kernels, not drawing to a desktop window with the native Pybox library.  The headless backend has only the entry
+points the native library has, so pybox takes the same paths as it does with the native library.
+
+Usage:
+
+    \t -python -m benchmarks                        \t - - run all benchmarks and compare against the baseline
+    \t -python -m benchmarks mandelbrot sobel       \t - - run selected benchmarks
+    \t -python -m benchmarks --update-baseline      \t - - store the results as the new baseline
+    \t -python -m benchmarks --tolerance .15        \t - - allowed regression (default .30, or 30%)
+
+Baselines are machine-specific -- regenerate baseline.json with --update-baseline when moving to new hardware.
+"""
+
+import os
+import sys
+
+# The benchmarks always run with the headless backend, using the modules in this tree and the examples for the running
+# interpreter (falling back to Python310 for interpreters without their own directory)
+
+os.environ["PYBOX_HEADLESS"] = "1"
+
+ROOT_DIR        = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_VERSION_DIR    = os.path.join(ROOT_DIR,"Python{0}{1}".format(*sys.version_info[:2]))
+VERSION_DIR     = _VERSION_DIR if os.path.isdir(_VERSION_DIR) else os.path.join(ROOT_DIR,"Python310")
+MODULES_DIR     = os.path.join(ROOT_DIR,"modules")
+EXAMPLES_DIR    = os.path.join(VERSION_DIR,"examples")
+BASELINE_FILE   = os.path.join(os.path.dirname(os.path.abspath(__file__)),"baseline.json")
+
+if MODULES_DIR not in sys.path : sys.path.insert(0,MODULES_DIR)
+
+from .kernels import BENCHMARKS
+from .runner import run_benchmarks, compare, load_baseline, save_baseline
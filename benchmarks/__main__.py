@@ -0,0 +1,38 @@
+"""
+python -m benchmarks [names...] [--repeat N] [--tolerance T] [--update-baseline]
+
+Exits with status 1 when a benchmark regresses past the stored baseline.
+"""
+
+import sys
+import argparse
+
+from . import BENCHMARKS, BASELINE_FILE, run_benchmarks, compare, load_baseline, save_baseline
+
+def main(argv=None) -> int :
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",description="Pybox example kernel benchmarks (headless)")
+    parser.add_argument("names",nargs="*",help="benchmarks to run (default: all): " + ", ".join(BENCHMARKS))
+    parser.add_argument("--repeat",type=int,default=3,help="timed runs per size; the best is reported (default: 3)")
+    parser.add_argument("--tolerance",type=float,default=.30,help="allowed regression as a fraction (default: .30)")
+    parser.add_argument("--baseline",default=BASELINE_FILE,help="baseline file (default: benchmarks/baseline.json)")
+    parser.add_argument("--update-baseline",action="store_true",help="store these results as the baseline")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown : parser.error("unknown benchmark(s): " + ", ".join(unknown))
+
+    results = run_benchmarks([BENCHMARKS[name] for name in (args.names or BENCHMARKS)],args.repeat)
+
+    if args.update_baseline :
+        baseline = load_baseline(args.baseline)
+        save_baseline(args.baseline,results,baseline)
+        print("Baseline written to " + args.baseline)
+        return 0
+
+    regressions = compare(results,load_baseline(args.baseline),args.tolerance)
+    for message in regressions : print("REGRESSION: " + message)
+    if not regressions : print("No regressions against " + args.baseline)
+    return 1 if regressions else 0
+
+if __name__ == "__main__" :
+    sys.exit(main())
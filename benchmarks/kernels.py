@@ -0,0 +1,406 @@
+"""
+Benchmark kernels, loaded from the example source files.
+
+Each benchmark has a list of sizes and a prepare(size) function that returns (run,units), where run() executes the
+kernel once and units is the amount of work done by one run (pixels, steps, segments, triangles).  A run() that times
+itself (i.e. in another process) returns its time in seconds as a float.
+"""
+
+import os
+import sys
+import ast
+import tempfile
+import subprocess
+import importlib.util
+import numpy
+import pybox
+
+from . import EXAMPLES_DIR, MODULES_DIR
+
+class Benchmark :
+    def __init__(self,name : str,unit : str,sizes : list,prepare,label=str) :
+        self.name       = name
+        self.unit       = unit
+        self.sizes      = sizes
+        self.prepare    = prepare
+        self.label      = label
+
+def _example_path(*parts) -> str :
+    return os.path.join(EXAMPLES_DIR,*parts)
+
+def _parse(*parts) -> ast.Module :
+    path = _example_path(*parts)
+    with open(path,encoding="utf-8") as f : return ast.parse(f.read(),path)
+
+def _names(node) -> set :
+    return { n.id for n in ast.walk(node) if isinstance(n,ast.Name) }
+
+def _target_names(node) -> set :
+    "Names assigned by a top-level statement (for 'f.attr = x', the name is 'f')"
+    if isinstance(node,ast.FunctionDef) : return { node.name }
+    if isinstance(node,ast.Assign) :
+        names = set()
+        for target in node.targets :
+            while isinstance(target,(ast.Attribute,ast.Subscript)) : target = target.value
+            names |= _names(target)
+        return names
+    return set()
+
+def _compile(statements : list,filename : str) :
+    return compile(ast.Module(body=statements,type_ignores=[]),filename,"exec")
+
+def _exec_definitions(module : ast.Module,names : set,namespace : dict) -> dict :
+    "Executes the top-level functions and assignments of an example that define the given names"
+    statements = [s for s in module.body if _target_names(s) & names]
+    exec(_compile(statements,"<example>"),namespace)
+    return namespace
+
+def _window(size) -> pybox.Window :
+    return pybox.new_window(size=(int(size[0]),int(size[1])))
+
+def _count_calls(run,entry_point : str) -> int :
+    "Runs the kernel once with pybox.profile enabled and returns the number of calls made to a _pybox entry point"
+    pybox.profile.reset()
+    pybox.profile.enable()
+    try :
+        run()
+    finally :
+        pybox.profile.disable()
+    count = pybox.profile.report()["entry_points"].get(entry_point,{}).get("calls",0)
+    pybox.profile.reset()
+    return count
+
+#
+# Mandelbrot (bulk-array versions).  The kernel is the timed section of each example, from 'start = timer()'
+# to 'end = timer()'.  Setup statements before it are run with win_size replaced by the benchmark size.
+#
+
+def _is_timer_assign(node,name : str) -> bool :
+    return (isinstance(node,ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0],ast.Name)
+            and node.targets[0].id == name and isinstance(node.value,ast.Call) and _names(node.value.func) == { "timer" })
+
+def _mandelbrot(folder : str) :
+    module  = _parse(folder,"mandelbrot_faster.py")
+    body    = module.body
+    start   = next(i for i,s in enumerate(body) if _is_timer_assign(s,"start"))
+    end     = next(i for i,s in enumerate(body) if _is_timer_assign(s,"end"))
+    setup   = [s for s in body[:start] if not isinstance(s,(ast.Import,ast.ImportFrom))
+                                          and "win" not in _names(s) and "win_size" not in _target_names(s)]
+    setup   = _compile(setup,folder)
+    kernel  = _compile(body[start+1:end],folder)
+
+    def prepare(size) :
+        namespace = { "np" : numpy, "pybox" : pybox, "win_size" : numpy.array(size), "win" : _window(size) }
+        exec(setup,namespace)
+        return (lambda : exec(kernel,namespace)),int(size[0])*int(size[1])
+    return prepare
+
+#
+# Sobel filter (sobel_edge.py)
+#
+
+def _sobel(size) :
+    import scipy.ndimage
+    namespace = _exec_definitions(_parse("sobel_edge","sobel_edge.py"),{ "sobel_filter" },
+                                  { "np" : numpy, "ndimage" : scipy.ndimage })
+    image     = numpy.random.default_rng(1).integers(0,256,size=(size[1],size[0]),dtype=numpy.uint8)
+    sobel     = namespace["sobel_filter"]
+    return (lambda : sobel(image)),int(size[0])*int(size[1])
+
+#
+# Double Pendulum (pend_module.py)
+#
+
+def _pend_module(trail_size : int = 300) :
+    spec    = importlib.util.spec_from_file_location("pend_module",_example_path("Double Pendulum","pend_module.py"))
+    pend    = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(pend)
+    pend.max_trail_size = trail_size
+    pend.trails         = numpy.zeros(shape=(trail_size,2),dtype=float)
+    pend.trail_colors   = numpy.zeros(shape=(trail_size,3),dtype=float)
+    pend.init(_window((1200,800)),240,225,10,10,-150,-150,.9985,.25)
+    pend.reset()
+    return pend
+
+def _pendulum_update(steps : int) :
+    pend = _pend_module()
+    def run() :
+        for _ in range(steps) : pend.update()
+    return run,steps
+
+_RENDER_STEPS = 20
+
+def _pendulum_render(trail_size : int) :
+    pend = _pend_module(trail_size)
+    for i in range(trail_size) :                                        # start with a full trail
+        pend.update()
+        pend.trails[i] = pend.pos2
+    pend.trail_size = trail_size
+    def run() :
+        for _ in range(_RENDER_STEPS) : pend.update(); pend.render()
+    return run,_RENDER_STEPS*(trail_size - 1 + 2)                       # trail segments + two rods
+
+#
+# Fractal Tree (fractal_tree.py)
+#
+
+def _fractal_tree(size) :
+    win         = _window(size)
+    namespace   = _exec_definitions(_parse("fractal_tree","fractal_tree.py"),{ "fractal_tree" },
+                                    { "np" : numpy, "pybox" : pybox, "win" : win })
+    scale       = size[1]/900.0
+    run         = lambda : namespace["fractal_tree"](win.get_window_size(),24*3.14159/180,130.0*1.45*scale)
+    return run,_count_calls(run,"WindowDrawLine")
+
+#
+# Sierpinski Triangle (sierpinski.py)
+#
+
+def _sierpinski(level : int) :
+    win         = _window((1200,800))
+    namespace   = _exec_definitions(_parse("Sierpinski Triangle","sierpinski.py"),{ "calc_triangle","colors" },
+                                    { "np" : numpy, "pybox" : pybox })
+    center      = numpy.array(win.get_window_center())
+    p           = [(0,-300),(500,350),(-500,350)]
+    run         = lambda : namespace["calc_triangle"](win,level,p[0] + center,p[1] + center,p[2] + center,0)
+    return run,3**level
+
+#
+# Batch primitives -- N set_pixel() calls against one set_pixels() call, drawing the same pixels.
+#
+
+def _batch_primitive(single,batch) :
+    def prepare(size) :
+        count,mode      = size
+        win             = _window((1200,800))
+        rng             = numpy.random.default_rng(7)
+        points          = rng.uniform((0,0),(1200,800),(count,2))
+        colors          = rng.integers(0,256,(count,3),dtype=numpy.uint8)
+        if mode == "batch" : return (lambda : batch(win.draw,points,colors)),count
+        def run() :
+            for i in range(count) : single(win.draw,points[i],colors[i])
+        return run,count
+    return prepare
+
+_BATCH_SIZES    = [(n,mode) for n in (1000,50000) for mode in ("single","batch")]
+
+def _batch_label(size) -> str : return "n={0},{1}".format(*size)
+
+#
+# Point clouds -- plot_points() with each blend mode, for a Gaussian cloud where many points fall on the same pixels.
+#
+
+def _plot_points(size) :
+    count,blend = size
+    win         = _window((1200,800))
+    rng         = numpy.random.default_rng(7)
+    points      = rng.normal((600,400),(150,100),(count,2))
+    colors      = numpy.concatenate([rng.integers(0,256,(count,3)),numpy.full((count,1),48)],axis=1).astype(numpy.uint8)
+    return (lambda : win.draw.plot_points(points,colors,blend=blend)),count
+
+#
+# Bitmap churn -- a frame copied into a new bitmap and displayed each frame ('create'), against a bitmap from a BitmapPool
+# that is released after display ('pool').
+#
+
+def _bitmap_churn(size) :
+    width,height,mode = size
+    win     = _window((width,height))
+    frame   = numpy.random.default_rng(7).integers(0,256,(height,width,3),dtype=numpy.uint8)
+    pool    = pybox.BitmapPool()
+    def run() :
+        if mode == "pool" :
+            bitmap = pool.copy(frame)
+            win.display_bitmap(0,0,bitmap)
+            pool.release(bitmap)
+        else :
+            bitmap = pybox.Bitmap.from_array(frame)
+            win.display_bitmap(0,0,bitmap)
+    return run,width*height
+
+#
+# Bitmap conversion -- a 1400x900 image of each kind displayed with display_bitmap(): uint8 RGB, normalized float32 (i.e. a
+# height map), int64 RGB (as built by "Mandelbrot Faster") and int32 gray.  'backend' passes the array to the backend as it was
+# before the conversion stage; 'stage' converts it with pybox.convert_bitmap() into a reused bitmap first.
+#
+
+_CONVERT_KINDS = { "uint8"   : lambda rng,h,w : rng.integers(0,256,(h,w,3),dtype=numpy.uint8),
+                   "float"   : lambda rng,h,w : rng.random((h,w,3),dtype=numpy.float32),
+                   "int64"   : lambda rng,h,w : rng.integers(0,256,(h,w,3),dtype=numpy.int64),
+                   "gray"    : lambda rng,h,w : rng.integers(0,256,(h,w),dtype=numpy.int32) }
+
+def _bitmap_convert(size) :
+    kind,mode   = size
+    width,height = 1400,900
+    win         = _window((width,height))
+    image       = _CONVERT_KINDS[kind](numpy.random.default_rng(11),height,width)
+    options     = { "normalized" : True } if kind == "float" else {}
+    if mode == "backend" :
+        win_id = win._Window__id
+        return (lambda : pybox._pybox.WindowDisplayBitmap(win_id,image,pybox.opt.at(0,0),pybox.opt.size(None),**options)),width*height
+    return (lambda : win.display_bitmap(0,0,image,**options)),width*height
+
+#
+# Image pyramid -- opening a 6144x6144 memory-mapped image in a viewer and zooming out from full size to 1/16 size across it,
+# in 1200x800 views.  'whole' reads the whole image into memory and samples each view from it, as img_view() did; 'tiled'
+# opens an ImagePyramid (with its disk cache filled by an earlier run) and reads only the visible tiles of each view.
+#
+
+_PYRAMID_SIDE   = 6144
+_PYRAMID_VIEWS  = [(x*_PYRAMID_SIDE/8,x*_PYRAMID_SIDE/10,0.5**x) for x in range(5)] + [(0,0,1/8),(3000,2000,1.0),(0,0,1/16)]
+_pyramid_files  = {}
+
+def _pyramid_image() -> str :
+    "A .npy image file shared by the image_pyramid benchmarks, made on first use"
+    if "image" not in _pyramid_files :
+        folder  = _pyramid_files["folder"] = tempfile.TemporaryDirectory()
+        path    = os.path.join(folder.name,"image.npy")
+        image   = numpy.lib.format.open_memmap(path,mode="w+",dtype=numpy.uint8,shape=(_PYRAMID_SIDE,_PYRAMID_SIDE,3))
+        rng     = numpy.random.default_rng(5)
+        for y in range(0,_PYRAMID_SIDE,512) : image[y:y + 512] = rng.integers(0,256,(min(512,_PYRAMID_SIDE - y),_PYRAMID_SIDE,3),dtype=numpy.uint8)
+        image.flush()
+        del image
+        _pyramid_files["image"] = path
+    return _pyramid_files["image"]
+
+def _image_pyramid(mode) :
+    path    = _pyramid_image()
+    cache   = tempfile.TemporaryDirectory()
+    width,height = 1200,800
+    def view_whole() :
+        image = numpy.array(numpy.load(path,mmap_mode="r"))
+        for x,y,scale in _PYRAMID_VIEWS :
+            cols = numpy.floor(x + (numpy.arange(width) + 0.5)/scale).astype(numpy.int64)
+            rows = numpy.floor(y + (numpy.arange(height) + 0.5)/scale).astype(numpy.int64)
+            view = numpy.zeros((height,width,3),dtype=numpy.uint8)
+            inside_x,inside_y = cols < image.shape[1],rows < image.shape[0]
+            view[:inside_y.sum(),:inside_x.sum()] = image[rows[inside_y][:,None],cols[inside_x]]
+    def view_tiled() :
+        pyramid = pybox.ImagePyramid(numpy.load(path,mmap_mode="r"),cache_dir=cache.name,cache_tiles=32)
+        out     = numpy.empty((height,width,3),dtype=numpy.uint8)
+        for x,y,scale in _PYRAMID_VIEWS : pyramid.render(x,y,width,height,scale,out=out)
+    return (view_whole if mode == "whole" else view_tiled),len(_PYRAMID_VIEWS)
+
+#
+# Image files -- a QA tool flipping through 24 1024x768 PNG files and back again.  'sync' reads each image with read_image_file(),
+# decoding it again on the way back; 'prefetch' starts reading the next 4 images with prefetch_image_files() and reads each one
+# with read_image_file_async(), so the way back is read from the decoded image cache.  The cache is cleared before each run.
+#
+
+_IMAGE_FILES = {}
+
+def _write_png(path : str,image : numpy.ndarray) -> None :
+    "Writes an RGB image as a PNG file with 'up' filtered rows"
+    import zlib,struct
+    height,width = image.shape[:2]
+    rows    = numpy.empty((height,width*3 + 1),dtype=numpy.uint8)
+    rows[:,0] = 2
+    rows[:,1:] = numpy.diff(image.reshape(height,width*3),axis=0,prepend=0)
+    def chunk(kind : bytes,body : bytes) -> bytes :
+        return struct.pack(">I",len(body)) + kind + body + struct.pack(">I",zlib.crc32(kind + body))
+    with open(path,"wb") as f :
+        f.write(b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR",struct.pack(">IIBBBBB",width,height,8,2,0,0,0))
+                + chunk(b"IDAT",zlib.compress(rows.tobytes(),6)) + chunk(b"IEND",b""))
+
+def _image_files() -> list :
+    "24 PNG files shared by the image_files benchmarks, made on first use"
+    if "files" not in _IMAGE_FILES :
+        folder  = _IMAGE_FILES["folder"] = tempfile.TemporaryDirectory()
+        rng     = numpy.random.default_rng(9)
+        ramp    = numpy.add.outer(numpy.arange(768),numpy.arange(1024))[:,:,None]*numpy.array([1,2,3])
+        files   = []
+        for index in range(24) :
+            files.append(os.path.join(folder.name,"image{0}.png".format(index)))
+            _write_png(files[-1],((ramp + index*10) % 256 + rng.integers(0,16,(768,1024,3))).astype(numpy.uint8))
+        _IMAGE_FILES["files"] = files
+    return _IMAGE_FILES["files"]
+
+def _image_flip(mode) :
+    files = _image_files()
+    order = files + files[::-1]
+    def run() :
+        if mode == "sync" :
+            for path in order : pybox.read_image_file(path)
+            return
+        pybox.clear_image_cache()
+        for index,path in enumerate(order) :
+            pybox.prefetch_image_files(order[index + 1:index + 5])
+            pybox.read_image_file_async(path).result()
+    return run,len(order)
+
+#
+# Options.  The opt.at() + opt.size() pair passed by each display_bitmap() call, made for positions cycling through a
+# sprite-sized set and read by the backend.  'string' builds and parses the option strings as opt did before structured
+# options; 'structured' uses opt.at() and opt.size().
+#
+
+_OPTION_POSITIONS = [(x*17,y*13) for x in range(16) for y in range(16)]
+
+def _options(mode) :
+    opt,read = pybox.opt,pybox._pybox._options
+    if mode == "string" :
+        def run() :
+            for x,y in _OPTION_POSITIONS :
+                read((opt(",LocX={},LocY={},".format(x,y)),opt(",SizeX={},SizeY={},".format(int(64),int(48)))),{})
+    else :
+        def run() :
+            for x,y in _OPTION_POSITIONS : read((opt.at(x,y),opt.size(64,48)),{})
+    return run,len(_OPTION_POSITIONS)
+
+#
+# Import time.  Each run starts a new interpreter, which reports the time taken by 'import pybox' (and, for 'window',
+# new_window() and display_bitmap() -- all a short-lived tool needs).  NumPy is imported before the timed section,
+# since such tools need it anyway.  'cached' runs use a bytecode cache written by the warm-up run, and 'cold' runs use
+# an empty one, so pybox is compiled from source.
+#
+
+_IMPORT_SCRIPT = """
+import sys, time, numpy
+sys.dont_write_bytecode = False
+sys.pycache_prefix      = {cache!r}
+start = time.perf_counter()
+import pybox
+if {window} :
+    win = pybox.new_window(size=(320,200))
+    win.display_bitmap(0,0,numpy.zeros((200,320,3),dtype=numpy.uint8))
+print(time.perf_counter() - start)
+"""
+
+def _import_time(size) :
+    stage,cache = size
+    env     = dict(os.environ,PYTHONPATH=os.pathsep.join([MODULES_DIR] + [p for p in [os.environ.get("PYTHONPATH")] if p]))
+    cached  = tempfile.TemporaryDirectory()                             # filled by the warm-up run
+    def run() :
+        with tempfile.TemporaryDirectory() as empty :
+            script = _IMPORT_SCRIPT.format(cache=cached.name if cache == "cached" else empty,window=stage == "window")
+            output = subprocess.run([sys.executable,"-c",script],env=env,check=True,capture_output=True,text=True).stdout
+        return float(output.split()[-1])
+    return run,1
+
+_WIN_SIZES  = [(350,225),(700,450),(1400,900)]
+
+def _size_label(size) -> str : return "{0}x{1}".format(*size)
+
+BENCHMARKS = { b.name : b for b in [
+    Benchmark("mandelbrot",         "pixels",       _WIN_SIZES,                 _mandelbrot("Simple Mandelbrot"),           _size_label),
+    Benchmark("mandelbrot_smooth",  "pixels",       _WIN_SIZES,                 _mandelbrot("Simple Mandelbrot Smooth"),    _size_label),
+    Benchmark("mandelbrot_3d",      "pixels",       _WIN_SIZES,                 _mandelbrot("Simple Mandelbrot 3D"),        _size_label),
+    Benchmark("sobel",              "pixels",       [(256,256),(512,512),(1024,1024)], _sobel,                              _size_label),
+    Benchmark("pendulum_update",    "steps",        [1000,5000,20000],          _pendulum_update,                           "steps={0}".format),
+    Benchmark("pendulum_render",    "segments",     [100,300,1000],             _pendulum_render,                           "trail={0}".format),
+    Benchmark("fractal_tree",       "segments",     [(650,450),(1300,900),(2600,1800)], _fractal_tree,                      _size_label),
+    Benchmark("sierpinski",         "triangles",    [4,6,8],                    _sierpinski,                                "level={0}".format),
+    Benchmark("set_pixels",         "pixels",       _BATCH_SIZES,
+              _batch_primitive(lambda draw,p,c : draw.set_pixel(p[0],p[1],c),lambda draw,p,c : draw.set_pixels(p[:,0],p[:,1],c)), _batch_label),
+    Benchmark("plot_points",        "points",       [(200000,blend) for blend in ("replace","add","alpha")],
+                                                                                _plot_points,                               _batch_label),
+    Benchmark("bitmap_churn",       "pixels",       [(w,h,mode) for w,h in ((640,480),(1920,1080)) for mode in ("create","pool")],
+                                                                                _bitmap_churn,                              "{0[0]}x{0[1]},{0[2]}".format),
+    Benchmark("bitmap_convert",     "pixels",       [(k,m) for k in _CONVERT_KINDS for m in ("backend","stage")],
+                                                                                _bitmap_convert,                            ",".join),
+    Benchmark("image_pyramid",      "views",        ["whole","tiled"],          _image_pyramid,                             str),
+    Benchmark("image_files",        "images",       ["sync","prefetch"],        _image_flip,                                str),
+    Benchmark("options",            "calls",        ["string","structured"],    _options,                                   str),
+    Benchmark("import_time",        "starts",       [(s,c) for s in ("import","window") for c in ("cached","cold")],
+                                                                                _import_time,                               ",".join),
+]}
@@ -0,0 +1,104 @@
+"""
+Benchmark runner -- timing, peak memory, and baseline comparison
+"""
+
+import gc
+import json
+import time
+import platform
+import tracemalloc
+
+from pybox import _headless
+
+def measure(benchmark,size,repeat : int = 3) -> dict :
+    """
+    Runs one benchmark at one size.  Throughput uses the best of 'repeat' timed runs (after a warm-up run), and peak
+    memory is measured with tracemalloc in an extra run, so that tracing does not affect the timings.
+    """
+    run,units = benchmark.prepare(size)
+    run()
+    times = []
+    for _ in range(max(1,repeat)) :
+        gc.collect()
+        start   = time.perf_counter()
+        elapsed = run()
+        times.append(elapsed if isinstance(elapsed,float) else time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try :
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally :
+        tracemalloc.stop()
+    best = min(times)
+    return { "benchmark"   : benchmark.name,
+             "size"        : benchmark.label(size),
+             "unit"        : benchmark.unit,
+             "units"       : units,
+             "seconds"     : best,
+             "throughput"  : units/best if best > 0 else 0.0,
+             "peak_kb"     : peak/1024.0 }
+
+def result_key(result : dict) -> str : return "{0}[{1}]".format(result["benchmark"],result["size"])
+
+def run_benchmarks(benchmarks : list,repeat : int = 3,report=print) -> list :
+    """
+    Runs each benchmark at each of its sizes and returns a list of results.  Benchmarks whose requirements are not
+    installed (i.e. SciPy for the Sobel filter) are reported as skipped.
+    """
+    results = []
+    for benchmark in benchmarks :
+        for size in benchmark.sizes :
+            try :
+                result = measure(benchmark,size,repeat)
+            except ImportError as e :
+                report("{0:<36} skipped ({1})".format(benchmark.name,e))
+                break
+            finally :
+                _headless.reset()
+            results.append(result)
+            report("{0:<36}{1:>14,.0f} {2}/s  {3:>10.2f} ms  {4:>10,.0f} KB peak".format(
+                    result_key(result),result["throughput"],result["unit"],result["seconds"]*1000,result["peak_kb"]))
+    return results
+
+def load_baseline(filename : str) -> dict :
+    try :
+        with open(filename,encoding="utf-8") as f : return json.load(f)
+    except FileNotFoundError :
+        return { "results" : {} }
+
+def save_baseline(filename : str,results : list,baseline : dict = None) -> None :
+    """
+    Writes results to the baseline file.  Entries in 'baseline' for benchmarks that were not run are kept.
+    """
+    stored = dict((baseline or {}).get("results",{}))
+    stored.update({ result_key(r) : { "throughput" : r["throughput"], "peak_kb" : r["peak_kb"], "unit" : r["unit"] } for r in results })
+    baseline = { "machine"  : { "python" : platform.python_version(), "platform" : platform.platform(), "processor" : platform.processor() },
+                 "results"  : stored }
+    with open(filename,"w",encoding="utf-8") as f :
+        json.dump(baseline,f,indent=2,sort_keys=True)
+        f.write("\n")
+
+# Peak memory below this is not considered a regression, since small allocations vary from run to run
+
+_MEMORY_SLACK_KB = 256.0
+
+def compare(results : list,baseline : dict,tolerance : float = .25) -> list :
+    """
+    Compares results against a baseline.  Returns a list of regression messages (empty when there are none).
+
+    A result regresses when its throughput is below (1 - tolerance) times the baseline throughput, or when its peak
+    memory is above (1 + tolerance) times the baseline peak memory.
+    """
+    regressions = []
+    stored = baseline.get("results",{})
+    for result in results :
+        key  = result_key(result)
+        base = stored.get(key)
+        if base is None : continue
+        if result["throughput"] < base["throughput"]*(1.0 - tolerance) :
+            regressions.append("{0}: throughput {1:,.0f} {2}/s is {3:.0%} below the baseline {4:,.0f}".format(
+                                key,result["throughput"],result["unit"],1.0 - result["throughput"]/base["throughput"],base["throughput"]))
+        if result["peak_kb"] > base["peak_kb"]*(1.0 + tolerance) + _MEMORY_SLACK_KB :
+            regressions.append("{0}: peak memory {1:,.0f} KB is above the baseline {2:,.0f} KB".format(key,result["peak_kb"],base["peak_kb"]))
+    return regressions
@@ -3,7 +3,9 @@ import pybox
 from pybox import opt
 import numpy
 
-import _dial_widget
+from pybox import _native
+
+_dial_widget = _native.load("_dial_widget")
 
 class DialWidget :
   
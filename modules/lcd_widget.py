@@ -1,6 +1,8 @@
 import pybox;
 from pybox import opt
-import _lcd_widget
+from pybox import _native
+
+_lcd_widget = _native.load("_lcd_widget")
 
 class LcdWidget :
     """
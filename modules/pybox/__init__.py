@@ -0,0 +1,179 @@
+"""
+Pybox -- Python interface to the Sagebox library
+
+The pybox package is split into modules that are imported the first time one of their names is used (PEP 562), so
+that a program only pays for the parts of pybox it uses:
+
+    \t -_core          \t -- native library selection, RgbColor, Bitmap, peek, and the bitmap functions (always imported)
+    \t -options        \t -- opt and OptionSet (always imported)
+    \t -window         \t -- Window and new_window()
+    \t -draw           \t -- the window 'draw' functions (imported on first use of win.draw)
+    \t -widgets        \t -- sliders, buttons, list boxes, combo boxes, input boxes, text widgets, and color selectors
+    \t -dev            \t -- Dev Window controls (DevControl, dev_ functions, new_devwindow())
+    \t -dialogs        \t -- dialog, message boxes, input dialogs, file dialogs, and please-wait windows
+    \t -image_view     \t -- img_view(), img_zoom(), and img_before_after()
+    \t -colors         \t -- PanColor, SageColor, Color, color(), RgbColorArray, get_color(), and get_hue_color()
+    \t -console        \t -- conio, debug, and the debug_write() functions
+    \t -events         \t -- event and exit functions
+    \t -forms          \t -- quick_form()
+    \t -mouse_region   \t -- MouseRegion
+    \t -display_list   \t -- DisplayList
+    \t -trail          \t -- TrailBuffer
+    \t -bitmap_pool    \t -- BitmapPool
+    \t -bitmap_convert \t -- convert_bitmap(), BitmapConverter, and conversion_stats()
+    \t -image_pyramid  \t -- ImagePyramid (tiled views of very large images)
+    \t -image_files    \t -- read_image_file_async(), prefetch_image_files(), and the decoded image cache
+    \t -draw_group     \t -- DrawGroup
+    \t -text_block     \t -- TextBlock
+    \t -markup         \t -- pybox.markup.compile() and Markup
+    \t -turtle_shell   \t -- TurtleShell
+    \t -frame_stats    \t -- FrameStats
+    \t -dirty_rect     \t -- DirtyRect (see Window.enable_dirty_tracking())
+    \t -settings       \t -- debug, defaults file, and timer settings
+
+All names are available directly from pybox as before, i.e. pybox.new_window(), pybox.PanColor.Cyan(), pybox.opt.title().
+"""
+
+from ._core import RgbColor, Bitmap, UpdateType, peek, read_image_file, create_bitmap, copy_bitmap, sysConvertInt32
+from .options import opt, OptionSet
+
+# Name -> module for the names imported on first use.  A name that is its module's name is the module itself (i.e. pybox.markup).
+
+_LAZY = {
+    "Window"                    : "window",
+    "new_window"                : "window",
+
+    "MouseRegion"               : "mouse_region",
+    "TurtleShell"               : "turtle_shell",
+    "FrameStats"                : "frame_stats",
+    "DirtyRect"                 : "dirty_rect",
+    "DisplayList"               : "display_list",
+    "TrailBuffer"               : "trail",
+    "BitmapPool"                : "bitmap_pool",
+    "BitmapConverter"           : "bitmap_convert",
+    "convert_bitmap"            : "bitmap_convert",
+    "conversion_stats"          : "bitmap_convert",
+    "ImagePyramid"              : "image_pyramid",
+    "read_image_file_async"     : "image_files",
+    "prefetch_image_files"      : "image_files",
+    "set_image_cache"           : "image_files",
+    "image_cache_stats"         : "image_files",
+    "clear_image_cache"         : "image_files",
+    "DrawGroup"                 : "draw_group",
+    "TextBlock"                 : "text_block",
+    "markup"                    : "markup",
+    "profile"                   : "_profiler",
+
+    "Slider"                    : "widgets",
+    "Listbox"                   : "widgets",
+    "Combobox"                  : "widgets",
+    "InputBox"                  : "widgets",
+    "Button"                    : "widgets",
+    "RadioButtonGroup"          : "widgets",
+    "CTextWidget"               : "widgets",
+
+    "PanColor"                  : "colors",
+    "SageColor"                 : "colors",
+    "Color"                     : "colors",
+    "color"                     : "colors",
+    "RgbColorArray"             : "colors",
+    "get_color"                 : "colors",
+    "get_hue_color"             : "colors",
+
+    "conio"                     : "console",
+    "debug"                     : "console",
+    "debug_write"               : "console",
+    "debug_show"                : "console",
+    "debug_hide"                : "console",
+
+    "DevControl"                : "dev",
+    "new_devwindow"             : "dev",
+    "dev_set_config"            : "dev",
+    "dev_set_nexty"             : "dev",
+    "dev_closed"                : "dev",
+    "dev_set_bgcolor"           : "dev",
+    "dev_set_bgbitmap"          : "dev",
+    "dev_bitmap"                : "dev",
+    "dev_text"                  : "dev",
+    "dev_text_widget"           : "dev",
+    "dev_slider"                : "dev",
+    "dev_slider_f"              : "dev",
+    "dev_checkbox"              : "dev",
+    "dev_button"                : "dev",
+    "dev_combobox"              : "dev",
+    "dev_inputbox"              : "dev",
+    "dev_window"                : "dev",
+    "dev_radiobuttons"          : "dev",
+    "dev_auto_close"            : "dev",
+    "dev_allow_auto_close"      : "dev",
+    "dev_set_location"          : "dev",
+    "dev_set_location_l"        : "dev",
+
+    "event_pending"             : "events",
+    "get_event"                 : "events",
+    "wait_event"                : "events",
+    "set_event_callback"        : "events",
+    "reset_event_callback"      : "events",
+    "exit_button"               : "events",
+    "wait_pending"              : "events",
+    "wait_close_any"            : "events",
+    "vsync_startthread"         : "events",
+    "vsync_endthread"           : "events",
+
+    "dialog"                    : "dialogs",
+    "get_integer"               : "dialogs",
+    "get_float"                 : "dialogs",
+    "get_string"                : "dialogs",
+    "get_open_file"             : "dialogs",
+    "get_save_file"             : "dialogs",
+    "msgbox"                    : "dialogs",
+    "msgbox_info"               : "dialogs",
+    "msgbox_yesno"              : "dialogs",
+    "msgbox_yesnocancel"        : "dialogs",
+    "msgbox_okcancel"           : "dialogs",
+    "quick_button"              : "dialogs",
+    "please_wait"               : "dialogs",
+    "close_please_wait"         : "dialogs",
+    "please_wait_set_progress"  : "dialogs",
+    "please_wait_canceled"      : "dialogs",
+    "color_selector"            : "dialogs",
+
+    "img_view"                  : "image_view",
+    "img_view_r"                : "image_view",
+    "img_zoom"                  : "image_view",
+    "img_zoom_r"                : "image_view",
+    "img_before_after"          : "image_view",
+    "img_before_after_r"        : "image_view",
+    "show_imgview_instructions" : "image_view",
+
+    "CQuickForm"                : "forms",
+    "quick_form"                : "forms",
+
+    "was_canceled"              : "settings",
+    "set_debug"                 : "settings",
+    "set_defaults_file"         : "settings",
+    "disable_defaults"          : "settings",
+    "display_default_paths"     : "settings",
+    "set_win_timer_update_ms"   : "settings",
+}
+
+__all__ = ["RgbColor","Bitmap","UpdateType","peek","read_image_file","create_bitmap","copy_bitmap","opt","OptionSet"] + list(_LAZY)
+
+def __getattr__(name : str) :
+    """
+    Imports the module for a name on first use (PEP 562).  The value is then stored in the pybox namespace, so this
+    is only called once per name.
+    """
+    if name == "_pybox" :
+        from . import _core
+        return _core._pybox                     # not stored -- pybox.profile may replace it
+    module = _LAZY.get(name)
+    if module is None : raise AttributeError("module 'pybox' has no attribute '{0}'".format(name))
+    import importlib
+    value = importlib.import_module("." + module,__name__)
+    if name != module : value = getattr(value,name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list :
+    return sorted(set(globals()) | set(_LAZY))
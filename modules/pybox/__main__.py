@@ -0,0 +1 @@
+print("Error: This is the pybox package and is not meant to be run as a main program.")
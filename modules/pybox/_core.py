@@ -0,0 +1,297 @@
+"""
+Pybox Core -- native library selection, RgbColor, Bitmap, and the bitmap functions.
+
+This module is always imported with pybox, and registers the Python types used by the native library.
+"""
+
+from __future__ import annotations
+
+import numpy
+import os
+import sys
+from enum import IntEnum
+
+from . import _native
+
+# The native _pybox extension is Windows-only.  PYBOX_HEADLESS=1 (or a platform without the extension) selects the
+# headless NumPy backend, which renders into in-memory framebuffers -- see _headless.py
+
+if os.environ.get("PYBOX_HEADLESS","0") not in ("","0") :
+    from . import _headless as _pybox
+else :
+    try :
+        _pybox = _native.load("_pybox")
+    except ImportError :
+        if sys.platform == "win32" : raise
+        from . import _headless as _pybox
+
+_pybox_native = _pybox
+
+_shared_memory = None       # whether BitmapGetMemory() returns the bitmap's memory rather than a copy (checked on first use)
+
+def _memory_is_shared(id,memory) -> bool :
+    "True when the memory from BitmapGetMemory() is the bitmap's own, writable memory -- two calls return the same memory"
+    global _shared_memory
+    if _shared_memory is None :
+        first,second = numpy.asarray(memory),numpy.asarray(_pybox.BitmapGetMemory(id))
+        _shared_memory = bool(first.flags.writeable and second.flags.writeable and
+                              first.__array_interface__["data"][0] == second.__array_interface__["data"][0])
+    return _shared_memory
+
+class RgbColor :
+    """
+    rgbcolor -- a Red, Green, Blue color value, i.e. pybox.RgbColor(0,255,0) for green.
+
+    RgbColor values can't be changed after the RgbColor is created, so the same RgbColor (i.e. PanColor.Red) can be shared by
+    any number of drawing calls.  RgbColors compare equal when their values are the same, and can be used as dictionary keys.
+
+    The values can be unpacked (r,g,b = color, or tuple(color)), and read as 3 uint8 values with numpy (numpy.asarray(color)) and
+    memoryview() (Python 3.12 and later).  The array and memoryview are read-only, as the color is.  Use pybox.RgbColorArray for
+    many colors in one (N,3) array.
+
+    Calling an RgbColor returns the color itself, so the palette constants can be used as PanColor.Red or PanColor.Red().
+    """
+    __slots__ = ("red","green","blue")
+
+    def __init__(self,red,green,blue) : 
+        object.__setattr__(self,"red",int(red))
+        object.__setattr__(self,"green",int(green))
+        object.__setattr__(self,"blue",int(blue))
+    def __setattr__(self,name,value) :
+        raise AttributeError("RgbColor values can't be changed -- create a new RgbColor instead")
+    def __delattr__(self,name) :
+        raise AttributeError("RgbColor values can't be changed -- create a new RgbColor instead")
+    def __repr__(self):
+        return "pybox.RgbColor"
+    def __str__(self):
+        return "[{0: >3}{1: >4}{2: >4}]".format(self.red,self.green,self.blue)
+    def __eq__(self,other) :
+        if not isinstance(other,RgbColor) : return NotImplemented
+        return self.red == other.red and self.green == other.green and self.blue == other.blue
+    def __hash__(self) :
+        return hash((self.red,self.green,self.blue))
+    def __iter__(self) :
+        return iter((self.red,self.green,self.blue))
+    def __array__(self,dtype=None,copy=None) -> numpy.ndarray :
+        array = numpy.array((self.red,self.green,self.blue),dtype=numpy.uint8)
+        if dtype is not None : array = array.astype(dtype)
+        if not copy : array.flags.writeable = False
+        return array
+    def __buffer__(self,flags) -> memoryview :                              # PEP 688 (Python 3.12)
+        return memoryview(bytes((self.red,self.green,self.blue)))
+    def __call__(self) -> RgbColor :
+        return self
+    def __reduce__(self) :
+        return (type(self),(self.red,self.green,self.blue))
+
+class Bitmap :
+    """
+    Sagebit Bitmap Class - this is the same as CBitmap in the C++ version of pybox (Sagebox)
+
+    A Bitmap's pixels can be read with numpy without copying them, when the Pybox library shares the bitmap's memory (i.e.
+    BitmapGetMemory() returns the bitmap's own memory rather than a copy): numpy.asarray(bitmap) (and memoryview(bitmap) with Python
+    3.12 and later) then returns a writable [height][width][3] view of the bitmap's memory, with Blue, Green, Red values.  Rows are
+    padded to a multiple of 4 bytes, as the bitmap is stored, so the view's row stride can be larger than width*3.
+
+    With a version of the Pybox library that can only return a copy of a bitmap's memory, numpy.asarray(bitmap) is a read-only copy.
+    Only this read side can be zero-copy: from_array() always copies the array into a new bitmap.
+
+    Bitmaps keep their memory until the program ends, since the Pybox library has no function to delete a bitmap -- use a
+    pybox.BitmapPool to reuse bitmaps of the same size rather than creating one for each frame.
+    """
+    def __init__(self,id=0) :
+        self.__id       = id
+    def __repr__(self):
+        return "pybox.Bitmap"
+
+    def __memory(self) -> memoryview :
+        memory = _pybox.BitmapGetMemory(self.__id)
+        if memory is None : raise ValueError("The bitmap is not valid, so it has no memory")
+        if not _memory_is_shared(self.__id,memory) :
+            memory = numpy.asarray(memory).view()                       # a copy: read-only, so writing to it can't be lost silently
+            memory.flags.writeable = False
+        return memoryview(memory)
+
+    def __array__(self,dtype=None,copy=None) -> numpy.ndarray :
+        """
+        The bitmap's memory for numpy, i.e. numpy.asarray(bitmap) -- see the Bitmap class.  This is a view of the bitmap's memory, with no
+        copy, only when the Pybox library shares its memory (BitmapGetMemory() returns the bitmap's memory); otherwise it is a read-only
+        copy.  The other direction, from_array(), always copies.
+        """
+        if copy : return numpy.array(self.__memory(),dtype=dtype)
+        view = numpy.asarray(self.__memory())
+        return view if dtype is None or view.dtype == dtype else view.astype(dtype)
+
+    def __buffer__(self,flags) -> memoryview :                              # PEP 688 (Python 3.12)
+        return memoryview(self.__array__())
+
+    @classmethod
+    def from_array(cls,array) -> Bitmap :
+        """
+        Creates a Bitmap from a numpy array [height][width][3] with Blue, Green, Red values (the layout returned by get_array()).
+        The array is copied into the bitmap's memory, with values that are not uint8 clipped to 0-255.
+
+        The Pybox library can't create a bitmap that uses numpy memory, so the array is always copied -- only reading a bitmap with
+        numpy.asarray(bitmap) is zero-copy, and only when the library shares the bitmap's memory.  To update a bitmap each frame
+        without creating a new one, write into numpy.asarray(bitmap) instead.
+
+        Examples:
+                    \t -frame = pybox.Bitmap.from_array(pixels)                  - pixels is a [480][640][3] uint8 array
+                    \t -view  = numpy.asarray(frame)
+                    \t -while win.vsync_wait() :
+                    \t -    process(view)                                         - changes the bitmap's pixels in place
+                    \t -    win.display_bitmap(0,0,frame)
+        """
+        array = numpy.asarray(array)
+        if array.ndim != 3 or array.shape[2] != 3 or array.size == 0 :
+            raise ValueError("Bitmap.from_array() needs a [height][width][3] array, not an array of shape {0}".format(array.shape))
+        height,width = array.shape[:2]
+        bitmap = cls(_pybox.CreateBitmap(width,height))
+        memory = numpy.asarray(bitmap)
+        if not memory.flags.writeable :
+            raise NotImplementedError("Bitmap.from_array() needs a version of the Pybox library that returns the bitmap's memory "
+                                      "from BitmapGetMemory(), not a copy")
+        memory[:] = array if array.dtype == numpy.uint8 else numpy.clip(array,0,255)
+        return bitmap
+
+    def size(self) ->  numpy.ndarray :
+        """
+        Returns the size of the Bitmap as a list (width,height). Will return (0,0) for invalid bitmaps.
+        """
+#        return numpy.array(_pybox.BitmapGetSize(self.__id)) 
+        return _pybox.BitmapGetSize(self.__id) 
+    def get_array(self) -> numpy.ndarray:
+        """
+        Returns the Bitmap as a Python array compatible with SciPy and other libraries that
+        use bitmaps as a Python array.
+
+        The array returned is 24-bit bitmap numpy unsigned char array in the dimensions [height][width][3], where the [3] elements
+        are Blue, Green, Red 
+
+        The array is initially returned as an aligned bitmap array, but any operations vis Python will probably convert it to an unaligned
+        bitmap.
+
+        The array is the one returned by the Pybox library.  numpy.asarray(bitmap) returns a view of the bitmap's memory that is kept
+        alive with the bitmap -- see the Bitmap class.
+        """
+        return _pybox.BitmapGetMemory(self.__id)
+
+    def is_valid(self) -> bool:
+        """
+        Returns True if the bitmap exists and has memory data (i.e a width and a height).
+        Returns False if the bitmap does not exist or holds no actual bitmap memory.
+        """
+        if (self.__id <= 0) : return False
+        return _pybox.isValid(self.__id)
+        
+class __typePeekEvent : 
+    """
+    This type is used as a special type to 'peek' at events.  
+    When events are polled they are typically reset so that subsequent polling returns False until
+    a new event occurs. 
+
+    Using a 'peek' will look at the event and not reset it so other code can look at the same event.
+    """
+    def __init(self) :
+        self.peek = True
+
+peek = __typePeekEvent()
+
+class UpdateType(IntEnum):
+    """
+    Window Auto Update Types.  This is used to set different auto update types for a Window:
+
+    The default for pybox is "Immediate".  The default for C++ Sagebox is "On"
+
+    On -    The window will auto passively update every 10-20ms.  This means when any pybox display or wait_event() function is called and a window needs
+            Updating, pybox will do it, but it is not guaranteed for code that lingers/loops after the last display function.  
+            
+            For most applications, pybox will update the window when necessary, since any waiting (i.e. exit_button() or wait_event()) function or
+            display function (i.e. Write()) will update the window if the window needs it. 
+
+            In loops that can take time, or without a pybox call of some sort, sometimes a pybox.Update() may
+            be necessary to ensure the window is updated.
+
+    Off -   The window will not be updated, and it is the program's responsibility to do so.
+            This can be useful when redrawing the screen in a real-time setting, to avoid flashing.
+
+    Immediate - Updates the screen after every single display operation.  This can be slow when a lot of data is put out to the screen, but it is
+                guaranteed and the update status never needs to be managed.  This can be useful for putting out data from equipment, etc. 
+                Also see 'OnTime'
+
+    OnTime - The update is mixed with 'On' (which updates when a Pybox function see the window needs it) and a timer in the 25ms range.
+             If Pybox has not updated the window on its own within 25ms, the timer set will instruct Pybox to do it immediately behind the scenes.
+             This can be a good mode because it is fast and guaranteed, because the window is only updated every 10-20ms, with a follow-up if
+            no Pybox functon was called in that time. 
+
+            This mode can interfere with real-time displays, so setting the Update to either On or Off can be more streamlined in this type of application.
+    """
+    on           = 1      
+    off          = 2
+    immediate    = 3
+    on_time      = 4
+
+
+def read_image_file(filename,cached : bool = False,**kwargs)  -> Bitmap  : 
+    """
+    Reads an image file and returns a bitmap. 
+
+    Currently, files may be of type .bmp,jpeg, or .png.  Other types will be added in the future. 
+    For other types, packages such as SciPy can be used.
+
+    Parameters
+
+    - filename      \t -- Filename of the image
+    - cached        \t -- [optional] Reads the file through the cache of decoded image files, so a file read before (or started with
+                    \t    pybox.prefetch_image_files()) is not decoded again.  See pybox.read_image_file_async() and pybox.set_image_cache().
+
+    Returns:
+
+    This function returns a 24-Bit Bitmap object with the bitmap.  If the file was not found, the bitmap will be empty.
+    If the image has a mask, such as a PNG or 32-bit bitmap, this will be attached to the bitmap. 
+
+    The Bitmap can be converted to a numpy array with the bitmap's get_array() function.  See examples.
+
+    Use the Bitmap's is_valid() function to determine if the bitmap was read ok.  You can also use pybox.was_canceled() to determine if the 
+    function could not find the bitmap
+
+    """
+    if cached :
+        from .image_files import read_image_file_async
+        return read_image_file_async(filename,**kwargs).result()
+    return Bitmap(_pybox.ReadImageFile(filename,**kwargs))
+
+def create_bitmap(width : int,height : int) -> Bitmap :
+    """
+    Creates a Bitmap object with a bitmap of the width and height specified.
+
+    The Bitmap object may then be used as a bitmap.  The Bitmap's get_array() function will return the data as a numpy array in the
+    form unsigned char: [height][width][3], where the [3] are the unsigned char Blue, Green, and Red values, respectively.
+
+    If the function fails the Bitmap's is_valid() function will return True
+    Also use was_canceled() to determine if there was an error
+
+    """
+    return Bitmap(_pybox.CreateBitmap(width,height))
+
+def copy_bitmap(bitmap : Bitmap) -> Bitmap :
+    """
+    Copies a bitmap ito a new bitmap and returns a Bitmap object.
+
+    This function can be useful for copying array-based bitmaps into pybox bitmap for pybox function use. 
+
+    Most pybox functions will use pybox Bitmaps or array-based bitmaps created by packages such as SciPy.
+
+    Creating a pybox bitmap can be faster, as it is stored separately and does not need to be translated or copied when used.
+
+    If the function fails, the Bitmap's is_valid() function will return true.
+    Also use was_canceled() to determine if there was an error
+
+    """
+    return Bitmap(_pybox.CopyBitmap(bitmap._Bitmap__id))
+
+def sysConvertInt32(val) : return int(val)
+
+__temp = numpy.array([123,123],dtype=numpy.int32)
+_pybox.SysSubmitTypes(RgbColor(0,0,0),peek,__temp[0])
+_pybox.SysSetEventCallback(sysConvertInt32)
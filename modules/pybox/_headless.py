@@ -0,0 +1,1533 @@
+"""
+Headless Pybox Backend
+
+This is a pure-Python/NumPy stand-in for the native _pybox extension.  It implements the window, drawing,
+bitmap, text-output and event entry points that pybox calls, rendering into an in-memory RGB framebuffer
+instead of a desktop window.
+
+This allows pybox programs (and the examples) to run offscreen on platforms where the native extension is not
+available, such as Linux build and test machines, with timings and pixel output that can be compared.
+
+Selecting the headless backend:
+
+- Set the environment variable PYBOX_HEADLESS=1 before importing pybox, or
+- Import pybox on a platform without the native _pybox extension (pybox falls back to this module automatically)
+
+Headless behavior:
+
+- Drawing functions rasterize into the window's framebuffer.  Opacity, pen sizes, and transforms are supported.
+  Anti-aliasing is not performed, so output is close to, but not pixel-identical with, the native GDI output.
+- Text is not rasterized.  write(), write_xy() and text widgets record their text (with the {} markup removed)
+  in the window's text log, and advance the write position as the native functions do.
+- There is no user, so there are no events unless they are posted with post_event().  get_event() returns False
+  when the event queue is empty, and vsync_wait() returns False once the frame limit is reached
+  (see set_frame_limit(), or the PYBOX_HEADLESS_FRAMES environment variable -- the default is 300 frames)
+- Dialogs return their default values, and exit_button(), wait_for_close() and similar functions return immediately.
+
+Headless Functions (not part of the native interface):
+
+- framebuffer(window)           \t -- Returns the window's RGB framebuffer as a numpy array [height][width][3]
+- text_log(window)              \t -- Returns the list of text written to the window
+- save_image(window,filename)   \t -- Saves the framebuffer as a .bmp or .ppm file
+- post_event(kind,target,...)   \t -- Queues a mouse, close, or control event for the event functions
+- set_frame_limit(frames)       \t -- Sets the number of frames vsync_wait() returns True for each window
+- reset()                       \t -- Removes all windows, bitmaps, controls and events
+"""
+
+import os
+import sys
+import zlib
+import struct
+import functools
+import itertools
+import collections
+import numpy
+
+_PAN_COLORS = {
+    "aliceblue":(240,248,255), "antiquewhite":(250,235,215), "aqua":(0,255,255), "aquamarine":(127,255,212),
+    "azure":(240,255,255), "beige":(245,245,220), "bisque":(255,228,196), "black":(0,0,0),
+    "blanchedalmond":(255,235,205), "blue":(0,0,255), "blueviolet":(138,43,226), "brown":(165,42,42),
+    "burlywood":(222,184,135), "cadetblue":(95,158,160), "chartreuse":(127,255,0), "chocolate":(210,105,30),
+    "coral":(255,127,80), "cornflowerblue":(100,149,237), "cornsilk":(255,248,220), "crimson":(220,20,60),
+    "cyan":(0,255,255), "darkblue":(0,0,139), "darkcyan":(0,139,139), "darkgoldenrod":(184,134,11),
+    "darkgray":(169,169,169), "darkgreen":(0,100,0), "darkkhaki":(189,183,107), "darkmagenta":(139,0,139),
+    "darkolivegreen":(85,107,47), "darkorange":(255,140,0), "darkorchid":(153,50,204), "darkred":(139,0,0),
+    "darksalmon":(233,150,122), "darkseagreen":(143,188,143), "darkslateblue":(72,61,139), "darkslategray":(47,79,79),
+    "darkturquoise":(0,206,209), "darkviolet":(148,0,211), "deeppink":(255,20,147), "deepskyblue":(0,191,255),
+    "dimgray":(105,105,105), "dodgerblue":(30,144,255), "firebrick":(178,34,34), "floralwhite":(255,250,240),
+    "forestgreen":(34,139,34), "fuchsia":(255,0,255), "gainsboro":(220,220,220), "ghostwhite":(248,248,255),
+    "gold":(255,215,0), "goldenrod":(218,165,32), "gray":(128,128,128), "green":(0,128,0),
+    "greenyellow":(173,255,47), "honeydew":(240,255,240), "hotpink":(255,105,180), "indianred":(205,92,92),
+    "indigo":(75,0,130), "ivory":(255,255,240), "khaki":(240,230,140), "lavender":(230,230,250),
+    "lavenderblush":(255,240,245), "lawngreen":(124,252,0), "lemonchiffon":(255,250,205), "lightblue":(173,216,230),
+    "lightcoral":(240,128,128), "lightcyan":(224,255,255), "lightgoldenrodyellow":(250,250,210), "lightgray":(211,211,211),
+    "lightgreen":(144,238,144), "lightpink":(255,182,193), "lightsalmon":(255,160,122), "lightseagreen":(32,178,170),
+    "lightskyblue":(135,206,250), "lightslategray":(119,136,153), "lightsteelblue":(176,196,222), "lightyellow":(255,255,224),
+    "lime":(0,255,0), "limegreen":(50,205,50), "linen":(250,240,230), "magenta":(255,0,255),
+    "maroon":(128,0,0), "mediumaquamarine":(102,205,170), "mediumblue":(0,0,205), "mediumorchid":(186,85,211),
+    "mediumpurple":(147,112,219), "mediumseagreen":(60,179,113), "mediumslateblue":(123,104,238), "mediumspringgreen":(0,250,154),
+    "mediumturquoise":(72,209,204), "mediumvioletred":(199,21,133), "midnightblue":(25,25,112), "mintcream":(245,255,250),
+    "mistyrose":(255,228,225), "moccasin":(255,228,181), "navajowhite":(255,222,173), "navy":(0,0,128),
+    "oldlace":(253,245,230), "olive":(128,128,0), "olivedrab":(107,142,35), "orange":(255,165,0),
+    "orangered":(255,69,0), "orchid":(218,112,214), "palegoldenrod":(238,232,170), "palegreen":(152,251,152),
+    "paleturquoise":(175,238,238), "palevioletred":(219,112,147), "papayawhip":(255,239,213), "peachpuff":(255,218,185),
+    "peru":(205,133,63), "pink":(255,192,203), "plum":(221,160,221), "powderblue":(176,224,230),
+    "purple":(128,0,128), "red":(255,0,0), "rosybrown":(188,143,143), "royalblue":(65,105,225),
+    "saddlebrown":(139,69,19), "salmon":(250,128,114), "sandybrown":(244,164,96), "seagreen":(46,139,87),
+    "seashell":(255,245,238), "sienna":(160,82,45), "silver":(192,192,192), "skyblue":(135,206,235),
+    "slateblue":(106,90,205), "slategray":(112,128,144), "snow":(255,250,250), "springgreen":(0,255,127),
+    "steelblue":(70,130,180), "tan":(210,180,140), "teal":(0,128,128), "thistle":(216,191,216),
+    "tomato":(255,99,71), "turquoise":(64,224,208), "violet":(238,130,238), "wheat":(245,222,179),
+    "white":(255,255,255), "whitesmoke":(245,245,245), "yellow":(255,255,0), "yellowgreen":(154,205,50),
+}
+
+_SAGE_COLORS = {
+    "defaultbgcolor":(20,40,121), "defaultfgcolor":(255,255,255), "slidertextcolor":(128,128,128), "green":(0,255,0),
+    "darkgreen":(0,128,0), "lightgreen":(128,255,128), "blue":(0,0,255), "darkblue":(0,0,92),
+    "midblue":(0,0,128), "lightblue":(128,128,255), "skyblue":(40,145,255), "skybluedark":(0,30,128),
+    "skybluelight":(75,165,255), "cyan":(0,255,255), "red":(255,0,0), "lightred":(255,128,128),
+    "lightyellow":(255,255,128), "yellow":(255,255,0), "magenta":(255,0,255), "mediummagenta":(255,92,255),
+    "lightmagenta":(255,128,255), "purple":(255,0,255), "lightpurple":(255,128,255), "mediumpurple":(255,92,255),
+    "white":(255,255,255), "gray172":(172,172,172), "gray192":(192,192,192), "gray220":(220,220,220),
+    "gray128":(128,128,128), "gray32":(32,32,32), "gray42":(42,42,42), "gray64":(64,64,64),
+    "gray72":(72,72,72), "gray92":(92,92,92), "black":(0,0,0), "lightgray":(200,200,200),
+    "lightgrey":(200,200,200), "midgray":(64,64,64), "midgrey":(64,64,64), "darkgray":(32,32,32),
+    "darkgrey":(32,32,32), "gray":(128,128,128), "grey":(128,128,128), "nearwhite":(220,220,220),
+    "buttontextcolornormal":(220,220,220), "buttontextcolorhighlighted":(255,255,255), "buttontextcolorpressed":(255,255,255), "buttontextcolordisabled":(170,170,170),
+    "checkboxtextcolornormal":(220,220,220), "checkboxtextcolorhighlighted":(255,255,255), "checkboxtextcolorchecked":(220,220,220), "checkboxtextcolorcheckedhigh":(220,220,220),
+    "checkboxtextcolordisabled":(170,170,170),
+}
+
+# Abbreviations used in {color} markup and console colors
+
+_ABBREVIATIONS = { "r" : "red", "g" : "green", "b" : "blue", "y" : "yellow", "c" : "cyan", "w" : "white", "m" : "magenta",
+                   "p" : "purple", "blk" : "black", "gry" : "gray", "dr" : "darkred", "dg" : "darkgreen", "db" : "darkblue",
+                   "dy" : "darkyellow", "dc" : "darkcyan", "dp" : "darkpurple", "dm" : "darkmagenta" }
+
+_DEFAULT_WIN_SIZE   = (1200,800)
+_DEFAULT_BG_COLOR   = _SAGE_COLORS["defaultbgcolor"]
+_DEFAULT_FG_COLOR   = _SAGE_COLORS["defaultfgcolor"]
+_DEFAULT_FONT_SIZE  = 14
+
+_windows        = {}                        # window id -> _Window
+_bitmaps        = {}                        # bitmap id -> numpy array [height][width][3] (Blue, Green, Red)
+_controls       = {}                        # control id -> _Control
+_viewers        = {}                        # img_view/img_before_after id -> list of displayed RGB arrays
+_events         = collections.deque()       # posted events, consumed by the event functions
+_debug_log      = []
+_next_id        = itertools.count(1)
+_canceled       = False
+_event_callback = None
+_frame_limit    = int(os.environ.get("PYBOX_HEADLESS_FRAMES","300"))
+
+_rgb_type       = None                      # pybox.RgbColor, submitted by pybox with SysSubmitTypes()
+
+def _new_id() -> int :
+    return next(_next_id)                   # atomic, for bitmaps read on image reader threads
+
+#
+# Option and keyword handling
+#
+
+def _norm_key(key : str) -> str :
+    return key.replace("_","").lower()
+
+def _split_opt_string(text : str) :
+    """
+    Splits a pybox option string (i.e. ',LocX=10,LocY=20,Font="Arial,20",') into (key,value) pairs, respecting quotes.
+    """
+    items   = []
+    current = []
+    quoted  = False
+    for ch in text :
+        if ch == '"' : quoted = not quoted; current.append(ch)
+        elif ch == "," and not quoted :
+            items.append("".join(current))
+            current = []
+        else : current.append(ch)
+    items.append("".join(current))
+    for item in items :
+        item = item.strip()
+        if not item : continue
+        key,sep,value = item.partition("=")
+        if not sep : yield _norm_key(key),True; continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == '"' and value[-1] == '"' : yield _norm_key(key),value[1:-1]; continue
+        yield _norm_key(key),_convert_value(value)
+
+def _convert_value(value : str) :
+    if value in ("True","true") : return True
+    if value in ("False","false") : return False
+    try : return int(value)
+    except ValueError : pass
+    try : return float(value)
+    except ValueError : return value
+
+def _options(args,kwargs) -> dict :
+    """
+    Collects pybox opt() objects, option strings, and keywords into one dictionary with normalized keys
+    (lower-case, no underscores), so that opt.bgcolor("red"), "bgColor=red" and bg_color="red" are the same.
+    """
+    result = {}
+    for arg in args :
+        if arg is None : continue
+        fields = getattr(arg,"_opt__fields",None)                       # structured options, i.e. opt.at(10,20)
+        if fields is not None :
+            for key,value in fields : result[_norm_key(key)] = value
+            continue
+        text = getattr(arg,"_opt__text",None)
+        if text is None and isinstance(arg,str) : text = arg
+        if text is None : continue
+        for key,value in _split_opt_string(text) : result[key] = value
+    for key,value in kwargs.items() : result[_norm_key(key)] = value
+    return result
+
+def _opt_pair(opts : dict,names : tuple,keys : tuple,default=None) :
+    """
+    Returns an (x,y) pair from either a pair keyword (i.e. at=(10,20)) or two separate keys (i.e. LocX=10,LocY=20)
+    """
+    for name in names :
+        value = opts.get(name)
+        if value is not None and not isinstance(value,bool) : return float(value[0]),float(value[1])
+    if keys[0] in opts or keys[1] in opts : return float(opts.get(keys[0],0)),float(opts.get(keys[1],0))
+    return default
+
+def _font_size(font,default : int) -> int :
+    if font is None or isinstance(font,bool) : return default
+    if isinstance(font,(int,float)) : return int(font)
+    for part in reversed(str(font).split(",")) :
+        part = part.strip()
+        if part.isdigit() : return int(part)
+    return default
+
+#
+# Colors
+#
+
+def _lookup_color(name : str) :
+    key = name.replace(" ","").replace("_","").lower()
+    if key.startswith("pancolor:")  : return _PAN_COLORS.get(key[9:])
+    if key.startswith("sagecolor:") : return _SAGE_COLORS.get(key[10:])
+    key = _ABBREVIATIONS.get(key,key)
+    if key in _SAGE_COLORS : return _SAGE_COLORS[key]
+    if key in _PAN_COLORS : return _PAN_COLORS[key]
+    if key.startswith("dark") and key[4:] in _SAGE_COLORS : return tuple(c//2 for c in _SAGE_COLORS[key[4:]])
+    return None
+
+@functools.lru_cache(maxsize=1024)
+def _parse_color(text : str) :
+    "Returns ((r,g,b) or None if the name isn't known,alpha) for a color string.  Cached, as programs pass the same strings each frame."
+    text  = text.strip()
+    alpha = 255
+    if text.endswith(")") and "(" in text :
+        text,_,opacity = text[:-1].partition("(")
+        alpha = int(max(0,min(255,float(opacity))))
+    parts = [p.strip() for p in text.split(",")]
+    if len(parts) == 3 and all(p.lstrip("-").replace(".","",1).isdigit() for p in parts) :
+        return tuple(int(max(0,min(255,float(p)))) for p in parts),alpha
+    return _lookup_color(parts[0]),alpha
+
+def _color(value,default=(255,255,255)) :
+    """
+    Converts a pybox color to an ((r,g,b),alpha) pair.
+
+    Colors may be RgbColor objects, pybox.Color objects (with their opacity), tuples/lists/arrays of 3 or 4 values, color names
+    (i.e. "red","forestgreen", "PanColor:forestgreen"), number strings (i.e. "0,255,0") and any of these with an opacity, such as "white(150)".
+    """
+    if value is None : return tuple(default),255
+    if isinstance(value,str) :
+        rgb,alpha = _parse_color(value)
+        return (tuple(default) if rgb is None else rgb),alpha
+    packed = getattr(value,"_packed",None)                  # pybox.Color -- resolved by pybox.color()
+    if packed is not None : return packed
+    if hasattr(value,"red") : return (int(value.red),int(value.green),int(value.blue)),255
+    if isinstance(value,(int,float,numpy.integer,numpy.floating)) : return tuple(default),255
+    values = numpy.asarray(value).ravel()
+    if values.size >= 3 :
+        rgb = tuple(int(max(0,min(255,v))) for v in values[:3])
+        return rgb,(int(max(0,min(255,values[3]))) if values.size >= 4 else 255)
+    return tuple(default),255
+
+def _is_color(value) -> bool :
+    "Returns False for the 0/None 'no color' placeholders used by border_color and similar parameters"
+    if value is None : return False
+    if isinstance(value,(int,float)) and not isinstance(value,bool) : return False
+    return True
+
+def _color_pair(value,second=None) :
+    """
+    Returns one or two colors for backgrounds and gradients.  A string of two color names, such as "black,blue", is a gradient.
+    """
+    if second is not None : return [_color(value)[0],_color(second)[0]]
+    gradient = getattr(value,"gradient",None)               # pybox.Color for a gradient, i.e. pybox.color("black,blue")
+    if gradient is not None : return [_color(value)[0],_color(gradient)[0]]
+    if isinstance(value,str) and value.count(",") == 1 :
+        first,_,last = value.partition(",")
+        if _lookup_color(first.partition("(")[0]) and _lookup_color(last.partition("(")[0]) :
+            return [_color(first)[0],_color(last)[0]]
+    return [_color(value)[0]]
+
+def _hsl_color(deg) :
+    "Bright hue color, where 0 = Red, 60 = Magenta, 120 = Blue, 180 = Cyan, 240 = Green, 300 = Yellow"
+    h  = ((360.0 - float(deg)) % 360.0)/60.0
+    i  = int(h) % 6
+    f  = h - int(h)
+    q  = int(round(255*(1-f)))
+    t  = int(round(255*f))
+    return [(255,t,0),(q,255,0),(0,255,t),(0,q,255),(t,0,255),(255,0,q)][i]
+
+#
+# Surfaces and Rasterization
+#
+
+class _Surface :
+    """
+    In-memory RGB drawing surface with the drawing state of a window (pen size, opacity, transform, clipping, write position)
+    """
+    def __init__(self,width : int,height : int,bg=None) :
+        self.pixels         = numpy.zeros((int(height),int(width),3),dtype=numpy.uint8)
+        self.bg             = bg or [_DEFAULT_BG_COLOR]
+        self.fg             = _DEFAULT_FG_COLOR
+        self.pen_size       = 1.0
+        self.opacity        = 255
+        self.transform      = numpy.identity(3)
+        self.clip           = None
+        self.cls_bitmap     = None
+        self.font_size      = _DEFAULT_FONT_SIZE
+        self.write_pos      = [0.0,0.0]
+        self.indent         = 0
+        self.padding        = 0
+        self.last_point     = None
+        self.text_log       = []
+
+    @property
+    def width(self) -> int : return self.pixels.shape[1]
+    @property
+    def height(self) -> int : return self.pixels.shape[0]
+
+    def resize(self,width : int,height : int) :
+        pixels = numpy.zeros((int(height),int(width),3),dtype=numpy.uint8)
+        h = min(pixels.shape[0],self.pixels.shape[0])
+        w = min(pixels.shape[1],self.pixels.shape[1])
+        pixels[:h,:w] = self.pixels[:h,:w]
+        self.pixels = pixels
+
+    def has_transform(self) -> bool : return not numpy.array_equal(self.transform,_IDENTITY)
+    def has_rotation(self) -> bool : return not numpy.array_equal(self.transform[:2,:2],_IDENTITY[:2,:2])
+
+    def apply(self,points) -> numpy.ndarray :
+        points = numpy.asarray(points,dtype=float).reshape(-1,2)
+        if not self.has_transform() : return points
+        return points @ self.transform[:2,:2].T + self.transform[:2,2]
+
+_IDENTITY = numpy.identity(3)
+
+def _region(surface : _Surface,x0,y0,x1,y1) :
+    "Clips a bounding box to the surface and clip rectangle.  Returns integer (x0,y0,x1,y1) or None when empty."
+    cx0,cy0,cx1,cy1 = surface.clip or (0,0,surface.width,surface.height)
+    ix0 = max(int(numpy.floor(x0)),cx0)
+    iy0 = max(int(numpy.floor(y0)),cy0)
+    ix1 = min(int(numpy.ceil(x1)),cx1)
+    iy1 = min(int(numpy.ceil(y1)),cy1)
+    if ix0 >= ix1 or iy0 >= iy1 : return None
+    return ix0,iy0,ix1,iy1
+
+def _grid(box) :
+    "Pixel-center coordinates for a clipped region, as broadcastable (1,W) and (H,1) arrays"
+    px = numpy.arange(box[0],box[2],dtype=float)[None,:] + .5
+    py = numpy.arange(box[1],box[3],dtype=float)[:,None] + .5
+    return px,py
+
+def _paint(surface : _Surface,box,mask,rgb,alpha : int) :
+    view = surface.pixels[box[1]:box[3],box[0]:box[2]]
+    mask = numpy.broadcast_to(mask,view.shape[:2])
+    if alpha >= 255 : view[mask] = rgb; return
+    if alpha <= 0 : return
+    a   = alpha/255.0
+    sel = view[mask].astype(numpy.float32)
+    view[mask] = (sel + (numpy.asarray(rgb,dtype=numpy.float32) - sel)*a + .5).astype(numpy.uint8)
+
+def _fill_rect(surface : _Surface,x,y,w,h,rgb,alpha : int = 255) :
+    box = _region(surface,x,y,x+w,y+h)
+    if box : _paint(surface,box,True,rgb,alpha)
+
+def _fill_polygon(surface : _Surface,points,rgb,alpha : int = 255) :
+    "Even-odd polygon fill, sampling at pixel centers"
+    pts = numpy.asarray(points,dtype=float).reshape(-1,2)
+    if len(pts) < 3 : return
+    box = _region(surface,pts[:,0].min(),pts[:,1].min(),pts[:,0].max()+1,pts[:,1].max()+1)
+    if box is None : return
+    px,py  = _grid(box)
+    inside = numpy.zeros((box[3]-box[1],box[2]-box[0]),dtype=bool)
+    xj,yj  = pts[-1]
+    for xi,yi in pts :
+        if yi != yj : inside ^= ((yi > py) != (yj > py)) & (px < (xj-xi)*(py-yi)/(yj-yi) + xi)
+        xj,yj = xi,yi
+    _paint(surface,box,inside,rgb,alpha)
+
+def _stroke_segment(surface : _Surface,p0,p1,pen,rgb,alpha : int = 255) :
+    r       = max(float(pen)/2.0,.7072)
+    x0,y0   = float(p0[0]),float(p0[1])
+    x1,y1   = float(p1[0]),float(p1[1])
+    box     = _region(surface,min(x0,x1)-r,min(y0,y1)-r,max(x0,x1)+r+1,max(y0,y1)+r+1)
+    if box is None : return
+    px,py   = _grid(box)
+    dx,dy   = x1-x0,y1-y0
+    length  = dx*dx + dy*dy
+    t       = 0.0 if length == 0 else numpy.clip(((px-x0)*dx + (py-y0)*dy)/length,0.0,1.0)
+    dist    = (px - (x0 + t*dx))**2 + (py - (y0 + t*dy))**2
+    _paint(surface,box,dist <= r*r,rgb,alpha)
+
+def _stroke_polyline(surface : _Surface,points,pen,rgb,alpha : int = 255,closed : bool = False) :
+    pts = numpy.asarray(points,dtype=float).reshape(-1,2)
+    if len(pts) == 1 : _stroke_segment(surface,pts[0],pts[0],pen,rgb,alpha); return
+    for i in range(len(pts)-1) : _stroke_segment(surface,pts[i],pts[i+1],pen,rgb,alpha)
+    if closed and len(pts) > 2 : _stroke_segment(surface,pts[-1],pts[0],pen,rgb,alpha)
+
+def _ellipse_points(cx,cy,rx,ry,start=0.0,sweep=360.0) -> numpy.ndarray :
+    steps = max(12,int(abs(sweep)/360.0*max(32,(abs(rx)+abs(ry))/2)))
+    t     = numpy.radians(start + numpy.linspace(0,sweep,steps+1))
+    return numpy.stack([cx + rx*numpy.cos(t),cy + ry*numpy.sin(t)],axis=1)
+
+def _fill_ellipse(surface : _Surface,cx,cy,rx,ry,rgb,alpha : int = 255) :
+    rx,ry = abs(float(rx)),abs(float(ry))
+    if rx == 0 or ry == 0 : return
+    box = _region(surface,cx-rx,cy-ry,cx+rx+1,cy+ry+1)
+    if box is None : return
+    px,py = _grid(box)
+    _paint(surface,box,((px-cx)/rx)**2 + ((py-cy)/ry)**2 <= 1.0,rgb,alpha)
+
+def _stroke_ellipse(surface : _Surface,cx,cy,rx,ry,pen,rgb,alpha : int = 255) :
+    rx,ry = abs(float(rx)),abs(float(ry))
+    half  = max(float(pen)/2.0,.5)
+    box   = _region(surface,cx-rx-half,cy-ry-half,cx+rx+half+1,cy+ry+half+1)
+    if box is None or rx == 0 or ry == 0 : return
+    px,py = _grid(box)
+    d     = numpy.sqrt(((px-cx)/rx)**2 + ((py-cy)/ry)**2)
+    _paint(surface,box,numpy.abs(d-1.0)*min(rx,ry) <= half,rgb,alpha)
+
+def _cubic_bezier(points,steps : int = 16) -> numpy.ndarray :
+    "Flattens a chain of cubic beziers (p0,c1,c2,p1,c1,c2,p2,...) into a polyline"
+    pts = numpy.asarray(points,dtype=float).reshape(-1,2)
+    out = [pts[:1]]
+    t   = numpy.linspace(0,1,steps+1)[1:,None]
+    for i in range(0,len(pts)-3,3) :
+        p0,p1,p2,p3 = pts[i],pts[i+1],pts[i+2],pts[i+3]
+        out.append((1-t)**3*p0 + 3*(1-t)**2*t*p1 + 3*(1-t)*t**2*p2 + t**3*p3)
+    return numpy.concatenate(out)
+
+def _quad_bezier(points,steps : int = 16) -> numpy.ndarray :
+    "Flattens a chain of quadratic beziers (p0,c,p1,c,p2,...) into a polyline"
+    pts = numpy.asarray(points,dtype=float).reshape(-1,2)
+    out = [pts[:1]]
+    t   = numpy.linspace(0,1,steps+1)[1:,None]
+    for i in range(0,len(pts)-2,2) :
+        p0,p1,p2 = pts[i],pts[i+1],pts[i+2]
+        out.append((1-t)**2*p0 + 2*(1-t)*t*p1 + t**2*p2)
+    return numpy.concatenate(out)
+
+def _curve(points,closed : bool = False,steps : int = 8) -> numpy.ndarray :
+    "Catmull-Rom (cardinal) curve through the points"
+    pts = numpy.asarray(points,dtype=float).reshape(-1,2)
+    if len(pts) < 3 : return pts
+    ext = numpy.concatenate([pts[-1:],pts,pts[:2]]) if closed else numpy.concatenate([pts[:1],pts,pts[-1:]])
+    out = [pts[:1]]
+    t   = numpy.linspace(0,1,steps+1)[1:,None]
+    for i in range(len(pts) - (0 if closed else 1)) :
+        p0,p1,p2,p3 = ext[i],ext[i+1],ext[i+2],ext[i+3]
+        out.append(.5*((2*p1) + (p2-p0)*t + (2*p0-5*p1+4*p2-p3)*t**2 + (3*p1-p0-3*p2+p3)*t**3))
+    return numpy.concatenate(out)
+
+#
+# Bitmap conversion
+#
+
+def _bitmap_rgb(bitmap,opts : dict = None) -> numpy.ndarray :
+    """
+    Converts a pybox Bitmap, bitmap id, file name, or numpy array to a uint8 RGB array [height][width][3].  As with the native library,
+    [height][width][3] arrays are Blue, Green, Red (the layout of a Bitmap's memory), and [height][width][4] arrays are Red, Green,
+    Blue, Mask.
+    """
+    opts = opts or {}
+    if isinstance(bitmap,str) : bitmap = _read_image(bitmap)
+    bitmap_id = getattr(bitmap,"_Bitmap__id",None)
+    if bitmap_id is None and isinstance(bitmap,(int,numpy.integer)) : bitmap_id = int(bitmap)
+    if bitmap_id is not None :
+        data = _bitmaps.get(bitmap_id)
+        if data is None : return numpy.zeros((0,0,3),dtype=numpy.uint8)
+        return data[:,:,::-1]
+    data = numpy.asarray(bitmap)
+    if data.ndim == 2 : data = data[:,:,None]
+    if data.ndim != 3 : return numpy.zeros((0,0,3),dtype=numpy.uint8)
+    if data.shape[2] == 1 : data = numpy.repeat(data,3,axis=2)
+    elif data.shape[2] >= 4 : data = data[:,:,:3]
+    elif data.shape[2] == 3 : data = data[:,:,::-1]
+    if data.dtype != numpy.uint8 :
+        data = data.astype(numpy.float32)
+        if opts.get("normalized") or opts.get("normalize") : data = data*255.0
+        data = numpy.clip(data,0,255).astype(numpy.uint8)
+    return data
+
+def _scale(data : numpy.ndarray,width : int,height : int) -> numpy.ndarray :
+    "Nearest-neighbor resize.  A 0 width or height keeps the aspect ratio."
+    h,w = data.shape[:2]
+    if w == 0 or h == 0 : return data
+    if width <= 0 and height <= 0 : return data
+    if width <= 0  : width  = max(1,int(round(w*height/h)))
+    if height <= 0 : height = max(1,int(round(h*width/w)))
+    if (width,height) == (w,h) : return data
+    ys = (numpy.arange(height)*h//height).clip(0,h-1)
+    xs = (numpy.arange(width)*w//width).clip(0,w-1)
+    return data[ys[:,None],xs[None,:]]
+
+def _blit(surface : _Surface,data : numpy.ndarray,x : int,y : int,mask : numpy.ndarray = None) :
+    "Copies data to the surface at (x,y), or blends it with a [height][width] 0-255 opacity mask"
+    h,w = data.shape[:2]
+    box = _region(surface,x,y,x+w,y+h)
+    if box is None : return
+    x,y = int(x),int(y)
+    target,source = surface.pixels[box[1]:box[3],box[0]:box[2]],data[box[1]-y:box[3]-y,box[0]-x:box[2]-x]
+    if mask is not None :
+        opacity   = mask[box[1]-y:box[3]-y,box[0]-x:box[2]-x,None]/255.0
+        target[:] = numpy.clip(source*opacity + target*(1.0 - opacity) + .5,0,255).astype(numpy.uint8)
+    elif source.strides[2] < 0 :                                          # Blue, Green, Red memory: one channel at a time is faster
+        for channel in range(3) : target[:,:,channel] = source[:,:,channel]
+    else :
+        target[:] = source
+
+#
+# Image files
+#
+
+def _read_bmp(raw : bytes) :
+    if raw[:2] != b"BM" : return None
+    offset,           = struct.unpack_from("<I",raw,10)
+    width,height      = struct.unpack_from("<ii",raw,18)
+    bits,compression  = struct.unpack_from("<HI",raw,28)
+    if compression not in (0,3) or bits not in (24,32) : return None
+    channels = bits//8
+    stride   = (abs(width)*channels + 3) & ~3
+    rows     = numpy.frombuffer(raw,dtype=numpy.uint8,count=stride*abs(height),offset=offset).reshape(abs(height),stride)
+    data     = rows[:,:abs(width)*channels].reshape(abs(height),abs(width),channels)[:,:,:3]
+    if height > 0 : data = data[::-1]
+    return numpy.ascontiguousarray(data)                                    # BGR order
+
+def _read_ppm(raw : bytes) :
+    if raw[:2] != b"P6" : return None
+    fields = raw.split(maxsplit=4)
+    width,height,maxval = int(fields[1]),int(fields[2]),int(fields[3])
+    if maxval > 255 : return None
+    data = numpy.frombuffer(fields[4],dtype=numpy.uint8,count=width*height*3).reshape(height,width,3)
+    return numpy.ascontiguousarray(data[:,:,::-1])
+
+def _read_png(raw : bytes) :
+    if raw[:8] != b"\x89PNG\r\n\x1a\n" : return None
+    pos,chunks,header = 8,[],None
+    while pos < len(raw) :
+        length, = struct.unpack_from(">I",raw,pos)
+        kind    = raw[pos+4:pos+8]
+        body    = raw[pos+8:pos+8+length]
+        if kind == b"IHDR" : header = struct.unpack(">IIBBBBB",body)
+        elif kind == b"IDAT" : chunks.append(body)
+        elif kind == b"IEND" : break
+        pos += 12 + length
+    width,height,depth,color_type,_,_,interlace = header
+    channels = { 0 : 1, 2 : 3, 4 : 2, 6 : 4 }.get(color_type)
+    if depth != 8 or channels is None or interlace : return None
+    stride = width*channels
+    rows   = numpy.frombuffer(zlib.decompress(b"".join(chunks)),dtype=numpy.uint8).reshape(height,stride+1)
+    out    = numpy.zeros((height,stride),dtype=numpy.int32)
+    prior  = numpy.zeros(stride,dtype=numpy.int32)
+    for y in range(height) :
+        kind = rows[y,0]
+        line = rows[y,1:].astype(numpy.int32)
+        if kind == 2 : line = (line + prior) & 0xFF
+        elif kind in (1,3,4) :
+            line = line.copy()
+            for x in range(stride) :
+                a = line[x-channels] if x >= channels else 0
+                c = prior[x-channels] if x >= channels else 0
+                if kind == 1 : pred = a
+                elif kind == 3 : pred = (a + prior[x]) >> 1
+                else :
+                    p  = a + prior[x] - c
+                    pa,pb,pc = abs(p-a),abs(p-prior[x]),abs(p-c)
+                    pred = a if pa <= pb and pa <= pc else (prior[x] if pb <= pc else c)
+                line[x] = (line[x] + pred) & 0xFF
+        out[y] = line
+        prior  = line
+    data = out.astype(numpy.uint8).reshape(height,width,channels)
+    if channels <= 2 : data = numpy.repeat(data[:,:,:1],3,axis=2)
+    return numpy.ascontiguousarray(data[:,:,2::-1])
+
+def _read_image(filename : str) :
+    "Reads a .bmp, .ppm, or .png file (and other types if PIL is installed).  Returns a BGR array or None"
+    try :
+        with open(filename,"rb") as f : raw = f.read()
+    except OSError : return None
+    for reader in (_read_bmp,_read_ppm,_read_png) :
+        data = reader(raw)
+        if data is not None : return data
+    try :
+        from PIL import Image
+    except ImportError : return None
+    with Image.open(filename) as image : return numpy.ascontiguousarray(numpy.asarray(image.convert("RGB"))[:,:,::-1])
+
+def _write_image(data : numpy.ndarray,filename : str) :
+    "Writes an RGB array as a 24-bit .bmp or a .ppm file"
+    h,w = data.shape[:2]
+    if filename.lower().endswith(".ppm") :
+        with open(filename,"wb") as f : f.write(b"P6 %d %d 255\n" % (w,h) + numpy.ascontiguousarray(data).tobytes())
+        return
+    stride = (w*3 + 3) & ~3
+    rows   = numpy.zeros((h,stride),dtype=numpy.uint8)
+    rows[:,:w*3] = data[::-1,:,::-1].reshape(h,w*3)
+    with open(filename,"wb") as f :
+        f.write(struct.pack("<2sIHHI",b"BM",54+rows.size,0,0,54))
+        f.write(struct.pack("<IiiHHIIiiII",40,w,h,1,24,0,rows.size,2835,2835,0,0))
+        f.write(rows.tobytes())
+
+#
+# Windows, controls, and events
+#
+
+class _Window(_Surface) :
+    def __init__(self,width : int,height : int,title : str = None,bg=None) :
+        super().__init__(width,height,bg)
+        self.title          = title
+        self.closed         = False
+        self.frames         = 0
+        self.presents       = 0
+        self.auto_update    = 3
+        self.mouse_pos      = [0,0]
+        self.click_pos      = [0,0]
+        self.drag_pos       = [0,0]
+        self.drag_prev      = [0,0]
+        self.button_down    = False
+        self.r_button_down  = False
+        self.wheel          = 0
+        self.flags          = set()                 # pending one-time events, i.e. "clicked", "moved"
+        _cls(self)
+
+class _Control :
+    def __init__(self,kind : str,title=None,opts : dict = None,window : int = 0) :
+        opts            = opts or {}
+        self.kind       = kind
+        self.title      = title
+        self.window     = window
+        self.flags      = set()
+        self.items      = []
+        self.text       = ""
+        self.as_float   = bool(opts.get("asfloat"))
+        rng             = opts.get("range")
+        self.min        = float(rng[0]) if rng is not None else float(opts.get("minvalue",0))
+        self.max        = float(rng[1]) if rng is not None else float(opts.get("maxvalue",100))
+        default         = opts.get("default")
+        self.value      = default if default is not None else (self.min if kind == "slider" else 0)
+        if kind == "input" and default is not None : self.text = str(default)
+
+def _window(win_id) -> _Window :
+    win = _windows.get(win_id)
+    if win is None :
+        win = _Window(*_DEFAULT_WIN_SIZE)
+        _windows[win_id] = win
+    return win
+
+def _target_id(target) :
+    if target is None : return None
+    for name in ("_Window__id","id","_CTextWidget__id") :
+        value = getattr(target,name,None)
+        if value is not None : return value
+    return target
+
+def _new_window(title=None,opts : dict = None,width=None,height=None) -> int :
+    opts    = opts or {}
+    size    = _opt_pair(opts,("size",),("sizex","sizey"))
+    if width is None : width,height = (int(size[0]),int(size[1])) if size and size[0] > 0 else _DEFAULT_WIN_SIZE
+    if height is None or height <= 0 : height = _DEFAULT_WIN_SIZE[1]
+    bg      = opts.get("bgcolor",opts.get("bggradient"))
+    win_id  = _new_id()
+    win     = _Window(width,height,title if title is not None else opts.get("title"),_color_pair(bg) if bg is not None else None)
+    if "font" in opts : win.font_size = _font_size(opts["font"],win.font_size)
+    if "textcolor" in opts or "fgcolor" in opts : win.fg = _color(opts.get("textcolor",opts.get("fgcolor")))[0]
+    _windows[win_id] = win
+    return win_id
+
+def _apply_event(event : dict) :
+    global _canceled
+    kind   = event["kind"]
+    target = event.get("target")
+    if kind == "control" :
+        control = _controls.get(target)
+        if control is None : return
+        if "value" in event :
+            control.value = event["value"]
+            if control.kind == "input" : control.text = str(event["value"])
+        control.flags.add(event.get("flag","pressed" if control.kind in ("button","checkbox") else "changed"))
+        if control.kind == "checkbox" and "value" not in event : control.value = not control.value
+        return
+    win = _window(target if target is not None else (min(_windows) if _windows else _new_window()))
+    pos = event.get("pos")
+    if pos is not None :
+        win.drag_prev = list(win.drag_pos) if kind == "mouse_drag" else win.drag_prev
+        win.mouse_pos = [int(pos[0]),int(pos[1])]
+        win.flags.add("moved")
+    if kind == "mouse_click" :
+        win.click_pos = list(win.mouse_pos)
+        win.flags.add("rclicked" if event.get("button") == "right" else "clicked")
+    elif kind == "mouse_down" :
+        if event.get("button") == "right" : win.r_button_down = True
+        else : win.button_down = True
+    elif kind == "mouse_up" :
+        if event.get("button") == "right" : win.r_button_down = False
+        else : win.button_down = False
+    elif kind == "mouse_drag" :
+        win.drag_pos = list(win.mouse_pos)
+        win.button_down = True
+        win.flags.add("drag")
+    elif kind == "mouse_drag_end" :
+        win.button_down = False
+        win.flags.add("dragended")
+    elif kind == "mouse_wheel" :
+        win.wheel = int(event.get("delta",1))
+        win.flags.add("wheel")
+    elif kind == "close" :
+        win.closed = True
+        win.flags.add("closing")
+
+def _pump() -> bool :
+    "Applies the next posted event.  Returns False when there are no more events."
+    if not _events : return False
+    _apply_event(_events.popleft())
+    if _event_callback is not None : _event_callback()
+    return True
+
+def _take(flags : set,name : str,peek=None) -> bool :
+    if name not in flags : return False
+    if not peek : flags.discard(name)
+    return True
+
+def _cls(win : _Surface,color1=None,color2=None,radial : bool = False) :
+    if color1 is None and color2 is None and win.cls_bitmap is not None :
+        win.pixels[:] = 0
+        _blit(win,win.cls_bitmap,0,0)
+        return
+    colors = win.bg if color1 is None else _color_pair(color1,color2)
+    if color1 is not None : win.bg,win.cls_bitmap = colors,None          # cls() with colors ends the use of the cls() bitmap
+    if len(colors) == 1 : win.pixels[:] = colors[0]; return
+    c1 = numpy.asarray(colors[0],dtype=numpy.float32)
+    c2 = numpy.asarray(colors[1],dtype=numpy.float32)
+    h,w = win.height,win.width
+    if radial :
+        ys,xs = numpy.ogrid[0:h,0:w]
+        t = numpy.sqrt((xs - w/2.0)**2 + (ys - h/2.0)**2)/max(1.0,numpy.hypot(w/2.0,h/2.0))
+        win.pixels[:] = (c1 + (c2-c1)*t[:,:,None]).astype(numpy.uint8)
+    else :
+        t = numpy.linspace(0,1,h,dtype=numpy.float32)[:,None,None]
+        win.pixels[:] = (c1 + (c2-c1)*t).astype(numpy.uint8)
+
+#
+# Headless functions (not part of the native interface)
+#
+
+def framebuffer(window) -> numpy.ndarray :
+    """
+    Returns the RGB framebuffer of a window as a numpy array [height][width][3] (Red, Green, Blue).
+    The array is the live framebuffer; use .copy() to keep a snapshot.
+    """
+    return _window(_target_id(window)).pixels
+
+def text_log(window) -> list :
+    "Returns the text written to a window as a list of (x,y,text) tuples, with {} markup removed"
+    return _window(_target_id(window)).text_log
+
+def debug_log() -> list :
+    "Returns the text written with debug_write() and debug.write()"
+    return _debug_log
+
+def save_image(window,filename : str) -> None :
+    "Saves the window's framebuffer as a .bmp (default) or .ppm file"
+    _write_image(framebuffer(window),filename)
+
+def post_event(kind : str,target=None,**kwargs) -> None :
+    """
+    Queues an event.  Each call to get_event(), wait_event(), or vsync_wait() applies one queued event.
+
+    Event kinds:
+
+    - "mouse_move"      \t -- pos=(x,y)
+    - "mouse_click"     \t -- pos=(x,y), button="left" or "right"
+    - "mouse_down"      \t -- button="left" or "right"
+    - "mouse_up"        \t -- button="left" or "right"
+    - "mouse_drag"      \t -- pos=(x,y)
+    - "mouse_drag_end"  \t -- pos=(x,y)
+    - "mouse_wheel"     \t -- delta=<value>
+    - "close"           \t -- closes the window
+    - "control"         \t -- target is a Slider, Button, InputBox etc.  Optional value=<new value>
+
+    The target is a pybox Window (or control for "control" events).  When omitted, the first window is used.
+    """
+    event = dict(kwargs,kind=kind,target=_target_id(target))
+    _events.append(event)
+
+def set_frame_limit(frames : int) -> None :
+    "Sets the number of frames that vsync_wait() returns True for each window.  0 or less is unlimited."
+    global _frame_limit
+    _frame_limit = int(frames)
+
+def reset() -> None :
+    "Removes all windows, bitmaps, controls, viewers, and posted events"
+    global _canceled,_event_callback
+    _windows.clear()
+    _bitmaps.clear()
+    _controls.clear()
+    _viewers.clear()
+    _events.clear()
+    _debug_log.clear()
+    _canceled       = False
+    _event_callback = None
+
+#
+# System
+#
+
+def SysSubmitTypes(rgb_color,peek,int32) :
+    global _rgb_type
+    _rgb_type = type(rgb_color)
+    return True
+
+def SysSetEventCallback(callback) : return True
+
+def SetEventCallback(callback) :
+    global _event_callback
+    _event_callback = callback
+    return True
+
+def ResetEventCallback() :
+    global _event_callback
+    _event_callback = None
+    return True
+
+def Canceled() : return _canceled
+def SetDebug(mode) : return True
+def SetDebugStr(mode) : return True
+def SetDefaultsFile(file) : return True
+def DisableDefaults() : return None
+def DisplayDefaultPaths() : return None
+def SetWinTimerUpdateMs(update_ms) : return 22 <= int(update_ms) <= 10000
+def VSyncStartThread() : return True
+def VSyncEndThread() : return True
+
+def FromHSL(deg) : return list(_hsl_color(deg))
+
+def GetColor(color) :
+    rgb = _lookup_color(color) if isinstance(color,str) else None
+    return list(rgb if rgb is not None else (255,255,255))
+
+#
+# Console and Debug output
+#
+
+def _strip_markup(text : str) -> str :
+    out,depth,i = [],0,0
+    while i < len(text) :
+        ch = text[i]
+        if ch in "{}" and text.startswith(ch*2,i) :         # {{ and }} are an escaped brace
+            out.append(ch)
+            i += 2
+            continue
+        if ch == "{" :
+            end = text.find("}",i)
+            if end < 0 : out.append(text[i:]); break
+            i = end + 1
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+def ConsoleWrite(*args) :
+    sys.stdout.write(_strip_markup("".join(str(a) for a in args)))
+    return True
+
+def ConsoleSetFgColor(color) : return True
+def ConsoleGetNumber(text=None,*args,**kwargs) : return int(_options(args,kwargs).get("default",0))
+def ConsoleGetFloat(text=None,*args,**kwargs) : return float(_options(args,kwargs).get("default",0))
+
+def DebugWrite(*args) :
+    _debug_log.append(_strip_markup("".join(str(a) for a in args)))
+    return True
+
+def DebugShow(show) : return True
+
+#
+# Windows
+#
+
+def NewWindow(title=None,*args,**kwargs) :
+    if title is not None and not isinstance(title,str) : title,args = None,(title,) + args     # options only, i.e. new_window(opt.bgcolor("blue"))
+    return _new_window(title,_options(args,kwargs))
+
+def WindowGetWindowSize(win_id,frame_size=False) : w = _window(win_id); return [w.width,w.height]
+def WindowGetWindowCenter(win_id,frame_size=False) : w = _window(win_id); return [w.width//2,w.height//2]
+def WindowGetWindowWidth(win_id,frame_size=False) : return _window(win_id).width
+def WindowGetWindowHeight(win_id,frame_size=False) : return _window(win_id).height
+
+def WindowSetWindowSize(win_id,width,height,inner_size=True) :
+    _window(win_id).resize(width,height)
+    return True
+
+def WindowVSyncWait(win_id) :
+    win = _window(win_id)
+    _pump()
+    win.frames += 1
+    if _frame_limit > 0 and win.frames > _frame_limit : win.closed = True
+    return not win.closed
+
+def WindowVSyncReady(win_id) : return True
+
+def WindowUpdate(win_id) :
+    _window(win_id).presents += 1
+    return True
+
+def WindowDontUpdate(win_id) : return True
+def WindowSetAutoUpdate(win_id,update_type) : _window(win_id).auto_update = update_type; return True
+def WindowSetBool(win_id,which,value) : return True
+def WindowShow(win_id,show=True) : return True
+
+def WindowClosing(win_id) : return _window(win_id).closed
+def WindowButtonClosing(win_id) : return _take(_window(win_id).flags,"closing")
+def WindowWaitForClose(win_id) : _window(win_id).closed = True; return True
+def WindowExitButton(win_id,text=None) : _window(win_id).closed = True; return True
+def ExitButton(message=None) : return True
+def WaitPending() : return True
+def WaitCloseAny() : return True
+
+def WindowCls(win_id,color1=None,color2=None,radial=False) :
+    _cls(_window(win_id),color1,color2,radial)
+    return True
+
+def WindowSetClsBitmap(win_id,bitmap,cls_now=False) :
+    win = _window(win_id)
+    win.cls_bitmap = _bitmap_rgb(bitmap).copy()
+    if cls_now : _cls(win)
+    return True
+
+def WindowUseWinasCls(win_id,use_bitmap=True) :
+    win = _window(win_id)
+    win.cls_bitmap = win.pixels.copy() if use_bitmap else None
+    return True
+
+def WindowSetBgColor(win_id,color) : _window(win_id).bg = _color_pair(color); return True
+def WindowSetFgColor(win_id,color) : _window(win_id).fg = _color(color)[0]; return True
+
+def WindowClipWindow(win_id,x,y,width,height) :
+    win = _window(win_id)
+    win.clip = (max(0,int(x)),max(0,int(y)),min(win.width,int(x+width)),min(win.height,int(y+height)))
+    return True
+
+def WindowResetClip(win_id) : _window(win_id).clip = None; return True
+
+#
+# Text output
+#
+
+def _write(win : _Window,text,opts : dict,newline : bool = False) :
+    text = "" if text is None else str(text)
+    pos  = _opt_pair(opts,("at","pos"),("locx","locy"))
+    if pos is not None : win.write_pos = [pos[0],pos[1]]
+    size = _font_size(opts.get("font"),win.font_size)
+    for tag in text.split("{")[1:] :
+        tag = tag.partition("}")[0]
+        if tag.isdigit() : size = max(size,int(tag))
+    if newline : text += "\n"
+    lines = text.split("\n")
+    for i,line in enumerate(lines) :
+        plain = _strip_markup(line)
+        if plain : win.text_log.append((int(win.write_pos[0]),int(win.write_pos[1]),plain))
+        if i < len(lines)-1 :
+            win.write_pos = [float(win.indent),win.write_pos[1] + size*1.2 + win.padding]
+        else : win.write_pos[0] += len(plain)*size*.55
+    return True
+
+def WindowWrite(win_id,text="",*args,**kwargs) : return _write(_window(win_id),text,_options(args,kwargs))
+def WindowWriteln(win_id,text="",*args,**kwargs) : return _write(_window(win_id),text,_options(args,kwargs),True)
+
+def WindowWriteXY(win_id,x,y,text,*args,**kwargs) :
+    win   = _window(win_id)
+    saved = win.write_pos
+    win.write_pos = [float(x),float(y)]
+    _write(win,text,_options(args,kwargs))
+    win.write_pos = saved
+    return True
+
+def WindowSetWriteIndent(win_id,indent) : _window(win_id).indent = int(indent); return True
+def WindowSetWritePadding(win_id,padding) : _window(win_id).padding = int(padding); return True
+def WindowSetWritePos(win_id,x,y) : _window(win_id).write_pos = [float(x),float(y)]; return True
+def WindowSetWritePosX(win_id,x) : _window(win_id).write_pos[0] = float(x); return True
+
+def WindowSetFont(win_id,font,*args) :
+    win = _window(win_id)
+    win.font_size = _font_size(_options((font,) + args,{}).get("font"),win.font_size)
+    return True
+
+#
+# Drawing state
+#
+
+def DrawSetDrawOpacity(win_id,opacity) : _window(win_id).opacity = int(max(0,min(255,opacity))); return True
+def DrawGetDrawOpacity(win_id) : return _window(win_id).opacity
+
+def DrawRotateTransform(win_id,angle) :
+    win = _window(win_id)
+    c,s = numpy.cos(numpy.radians(angle)),numpy.sin(numpy.radians(angle))
+    win.transform = win.transform @ numpy.array([[c,-s,0],[s,c,0],[0,0,1]])
+    return True
+
+def DrawTranslateTransform(win_id,x,y) :
+    win = _window(win_id)
+    win.transform = win.transform @ numpy.array([[1,0,float(x)],[0,1,float(y)],[0,0,1]])
+    return True
+
+def DrawResetTransform(win_id) : _window(win_id).transform = numpy.identity(3); return True
+def WindowSetPenSize(win_id,pen_size) : _window(win_id).pen_size = float(pen_size); return True
+
+#
+# Drawing primitives.
+#
+# 'fast' functions ignore opacity and transforms.  Regular functions use the window opacity and transform,
+# with 'opacity', 'pen_size', 'pen_color', and 'angle' keywords.
+#
+
+def _style(win : _Window,color,kwargs) :
+    opts  = _options((),kwargs)
+    rgb,a = _color(color)
+    alpha = a*(int(opts["opacity"]) if "opacity" in opts else win.opacity)//255
+    pen   = float(opts.get("pensize",win.pen_size))
+    pen_color = opts.get("pencolor")
+    return rgb,alpha,pen,pen_color,opts
+
+def _shape(win : _Window,points,color,outline : bool,kwargs,closed : bool = True,angle_center=(0.0,0.0)) :
+    "Draws a regular (opacity/transform-aware) polygonal shape, with an optional pen_color border"
+    rgb,alpha,pen,pen_color,opts = _style(win,color,kwargs)
+    pts   = numpy.asarray(points,dtype=float).reshape(-1,2)
+    angle = opts.get("angle")
+    if angle :
+        c,s = numpy.cos(numpy.radians(angle)),numpy.sin(numpy.radians(angle))
+        pts = (pts - angle_center) @ numpy.array([[c,s],[-s,c]]) + angle_center
+    pts = win.apply(pts)
+    if outline : _stroke_polyline(win,pts,pen,rgb,alpha,closed); return True
+    _fill_polygon(win,pts,rgb,alpha)
+    if pen_color is not None :
+        prgb,pa = _color(pen_color)
+        _stroke_polyline(win,pts,pen,prgb,pa*alpha//255,closed)
+    return True
+
+def _ellipse(win : _Window,x,y,rx,ry,color,outline : bool,kwargs) :
+    rgb,alpha,pen,pen_color,opts = _style(win,color,kwargs)
+    if win.has_rotation() or opts.get("angle") :
+        return _shape(win,_ellipse_points(float(x),float(y),float(rx),float(ry)),color,outline,kwargs,True,(float(x),float(y)))
+    cx,cy = win.apply([(float(x),float(y))])[0]
+    if outline : _stroke_ellipse(win,cx,cy,rx,ry,pen,rgb,alpha); return True
+    _fill_ellipse(win,cx,cy,rx,ry,rgb,alpha)
+    if pen_color is not None :
+        prgb,pa = _color(pen_color)
+        _stroke_ellipse(win,cx,cy,rx,ry,pen,prgb,pa*alpha//255)
+    return True
+
+def _fast_border(win : _Window,points,border_color,pen_size,closed : bool = True) :
+    if not _is_color(border_color) : return
+    _stroke_polyline(win,points,pen_size or win.pen_size,_color(border_color)[0],255,closed)
+
+def WindowDrawCircle(win_id,x,y,radius,color,outline,**kwargs) :
+    return _ellipse(_window(win_id),x,y,radius,radius,color,outline,kwargs)
+
+def WindowDrawEllipse(win_id,x,y,radius_x,radius_y,color,outline,**kwargs) :
+    return _ellipse(_window(win_id),x,y,radius_x,radius_y,color,outline,kwargs)
+
+def WindowDrawRectangle(win_id,x,y,width,height,color,outline,**kwargs) :
+    win = _window(win_id)
+    x,y,width,height = float(x),float(y),float(width),float(height)
+    if not outline and not win.has_transform() and not kwargs :
+        rgb,a = _color(color)
+        _fill_rect(win,x,y,width,height,rgb,a*win.opacity//255)
+        return True
+    center = (x+width/2.0,y+height/2.0)
+    return _shape(win,[(x,y),(x+width,y),(x+width,y+height),(x,y+height)],color,outline,kwargs,True,center)
+
+def WindowDrawTriangle(win_id,p1,p2,p3,color,outline,**kwargs) :
+    return _shape(_window(win_id),[p1,p2,p3],color,outline,kwargs)
+
+def WindowDrawQuadrangle(win_id,p1,p2,p3,p4,color,outline,**kwargs) :
+    return _shape(_window(win_id),[p1,p2,p3,p4],color,outline,kwargs)
+
+def WindowDrawBezier(win_id,p1,p2,p3,p4,color,outline,**kwargs) :
+    return _shape(_window(win_id),_cubic_bezier([p1,p2,p3,p4]),color,outline,kwargs,not outline)
+
+def WindowDrawQuadBezier(win_id,p1,p2,p3,color,outline,**kwargs) :
+    return _shape(_window(win_id),_quad_bezier([p1,p2,p3]),color,outline,kwargs,not outline)
+
+def WindowDrawPolygon(win_id,points,color,mode,**kwargs) :
+    """
+    mode: 0/1 polygon, 2/3 beziers, 4/5 quad beziers, 6/7 curve, 8/9 closed curve, 10/11 lines (odd values are filled)
+    """
+    win     = _window(win_id)
+    pts     = numpy.asarray(points,dtype=float).reshape(-1,2)
+    fill    = mode % 2 == 1
+    kind    = mode // 2
+    closed  = kind in (0,4) or fill
+    if kind == 1 : pts,closed = _cubic_bezier(pts),fill
+    elif kind == 2 : pts,closed = _quad_bezier(pts),fill
+    elif kind == 3 : pts,closed = _curve(pts),fill
+    elif kind == 4 : pts = _curve(pts,True)
+    elif kind == 5 : closed = fill
+    return _shape(win,pts,color,not fill,kwargs,closed)
+
+def WindowDrawArc(win_id,x,y,radius_x,radius_y,start_angle,sweep_angle,color,mode,**kwargs) :
+    "mode: 0 = arc, 1 = filled arc, 2 = pie, 3 = filled pie"
+    win = _window(win_id)
+    pts = _ellipse_points(float(x),float(y),float(radius_x),float(radius_y),float(start_angle),float(sweep_angle))
+    if mode >= 2 : pts = numpy.concatenate([[(float(x),float(y))],pts])
+    return _shape(win,pts,color,mode in (0,2),kwargs,mode != 0)
+
+def WindowDrawLine(win_id,x1,y1,x2,y2,color,**kwargs) :
+    win = _window(win_id)
+    win.last_point = (float(x2),float(y2))
+    return _shape(win,[(x1,y1),(x2,y2)],color,True,kwargs,False)
+
+def WindowDrawLineTo(win_id,x,y,color,**kwargs) :
+    win   = _window(win_id)
+    start = win.last_point or (float(x),float(y))
+    return WindowDrawLine(win_id,start[0],start[1],x,y,color,**kwargs)
+
+def WindowDrawLineToEx(win_id,first,x,y,color,**kwargs) :
+    win = _window(win_id)
+    if first : win.last_point = (float(x),float(y)); return True
+    return WindowDrawLineTo(win_id,x,y,color,**kwargs)
+
+def WindowDrawLineFast(win_id,x1,y1,x2,y2,color,pen_size=0) :
+    win = _window(win_id)
+    win.last_point = (float(x2),float(y2))
+    _stroke_segment(win,(x1,y1),(x2,y2),pen_size or win.pen_size,_color(color)[0])
+    return True
+
+def WindowDrawLineToFast(win_id,x,y,color,pen_size=0) :
+    win   = _window(win_id)
+    start = win.last_point or (float(x),float(y))
+    return WindowDrawLineFast(win_id,start[0],start[1],x,y,color,pen_size)
+
+def WindowDrawLineSegments(win_id,points,color,array_size=0,pen_size=None) :
+    """
+    Draws a polyline.  color may be a single color or an array of per-point colors, where segment i uses color i.
+    """
+    win   = _window(win_id)
+    pts   = numpy.asarray(points,dtype=float).reshape(-1,2)
+    if array_size : pts = pts[:int(array_size)]
+    return _line_segments(win,win.apply(pts),color,pen_size)
+
+def _line_segments(win : _Surface,pts,color,pen_size) -> bool :
+    pen   = win.pen_size if pen_size is None else float(pen_size)
+    multi = not isinstance(color,str) and not hasattr(color,"red") and numpy.ndim(color) == 2
+    if not multi :
+        rgb,a = _color(color)
+        _stroke_polyline(win,pts,pen,rgb,a*win.opacity//255)
+        return True
+    colors = numpy.asarray(color)
+    for i in range(len(pts)-1) :
+        rgb,a = _color(colors[min(i,len(colors)-1)])
+        _stroke_segment(win,pts[i],pts[i+1],pen,rgb,a*win.opacity//255)
+    return True
+
+def WindowDrawFilledCircleFast(win_id,x,y,radius,inside_color,border_color=0,pen_size=0) :
+    win = _window(win_id)
+    _fill_ellipse(win,x,y,radius,radius,_color(inside_color)[0])
+    if _is_color(border_color) : _stroke_ellipse(win,x,y,radius,radius,pen_size or win.pen_size,_color(border_color)[0])
+    return True
+
+def WindowDrawCircleFast(win_id,x,y,radius,color,border_color=0,pen_size=0) :
+    win = _window(win_id)
+    _stroke_ellipse(win,x,y,radius,radius,pen_size or win.pen_size,_color(color)[0])
+    return True
+
+def WindowDrawEllipseFast(win_id,x,y,radius_x,radius_y,inside_color,border_color=0,pen_size=0,outline=False) :
+    win = _window(win_id)
+    if outline : _stroke_ellipse(win,x,y,radius_x,radius_y,pen_size or win.pen_size,_color(inside_color)[0]); return True
+    _fill_ellipse(win,x,y,radius_x,radius_y,_color(inside_color)[0])
+    if _is_color(border_color) : _stroke_ellipse(win,x,y,radius_x,radius_y,pen_size or win.pen_size,_color(border_color)[0])
+    return True
+
+def WindowDrawFilledRectangleFast(win_id,x,y,width,height,inside_color,border_color=0,pen_size=0) :
+    win = _window(win_id)
+    _fill_rect(win,x,y,width,height,_color(inside_color)[0])
+    _fast_border(win,[(x,y),(x+width,y),(x+width,y+height),(x,y+height)],border_color,pen_size)
+    return True
+
+def WindowDrawRectangleFast(win_id,x,y,width,height,color,border_color=0,pen_size=0) :
+    win = _window(win_id)
+    _stroke_polyline(win,[(x,y),(x+width,y),(x+width,y+height),(x,y+height)],pen_size or win.pen_size,_color(color)[0],255,True)
+    return True
+
+def WindowDrawFilledTriangleFast(win_id,p1,p2,p3,inside_color,border_color=0,pen_size=0) :
+    win = _window(win_id)
+    _fill_polygon(win,[p1,p2,p3],_color(inside_color)[0])
+    _fast_border(win,[p1,p2,p3],border_color,pen_size)
+    return True
+
+def WindowDrawTriangleFast(win_id,p1,p2,p3,color,border_color=0,pen_size=0) :
+    win = _window(win_id)
+    _stroke_polyline(win,[p1,p2,p3],pen_size or win.pen_size,_color(color)[0],255,True)
+    return True
+
+def WindowDrawQuadrangleFast(win_id,p1,p2,p3,p4,inside_color,border_color=0,pen_size=0,outline=False) :
+    win = _window(win_id)
+    if outline :
+        _stroke_polyline(win,[p1,p2,p3,p4],pen_size or win.pen_size,_color(inside_color)[0],255,True)
+        return True
+    _fill_polygon(win,[p1,p2,p3,p4],_color(inside_color)[0])
+    _fast_border(win,[p1,p2,p3,p4],border_color,pen_size)
+    return True
+
+def WindowDrawPixel(win_id,x,y,color) :
+    win = _window(win_id)
+    x,y = int(x),int(y)
+    if 0 <= x < win.width and 0 <= y < win.height : win.pixels[y,x] = _color(color)[0]
+    return True
+
+def WindowDrawGrid(win_id,spacing=25,**kwargs) :
+    win     = _window(win_id)
+    opts    = _options((),kwargs)
+    rgb,a   = _color(opts.get("color"),(64,64,64))
+    spacing = max(2,int(spacing))
+    for x in range(0,win.width,spacing) : _fill_rect(win,x,0,1,win.height,rgb,a)
+    for y in range(0,win.height,spacing) : _fill_rect(win,0,y,win.width,1,rgb,a)
+    return True
+
+def WindowDrawVector(win_id,x1,y1,x2,y2,line_size,color,**kwargs) :
+    win     = _window(win_id)
+    p1,p2   = numpy.array([x1,y1],dtype=float),numpy.array([x2,y2],dtype=float)
+    d       = p2 - p1
+    length  = numpy.hypot(*d)
+    if length == 0 : return True
+    d       = d/length
+    n       = numpy.array([-d[1],d[0]])
+    head    = min(length,max(3.0*float(line_size),10.0))
+    base    = p2 - d*head
+    _shape(win,[p1,base],color,True,dict(kwargs,pen_size=line_size),False)
+    _shape(win,[p2,base + n*head*.5,base - n*head*.5],color,False,kwargs)
+    return True
+
+#
+# Bitmaps
+#
+
+def WindowDisplayBitmap(win_id,bitmap,*args,**kwargs) :
+    win  = _window(win_id)
+    opts = _options(args,kwargs)
+    data = _bitmap_rgb(bitmap,opts)
+    mask = None
+    if isinstance(bitmap,numpy.ndarray) and bitmap.ndim == 3 and bitmap.shape[2] == 4 and bitmap.dtype == numpy.uint8 :
+        data = numpy.concatenate((data,bitmap[:,:,3:]),axis=2)          # Red, Green, Blue, Mask -- the mask is the opacity
+    size = _opt_pair(opts,("size",),("sizex","sizey"))
+    if size is not None : data = _scale(data,int(size[0]),int(size[1]))
+    if opts.get("reversed") or opts.get("reverse") : data = data[::-1]
+    if data.shape[2] == 4 : data,mask = data[:,:,:3],data[:,:,3]
+    pos  = _opt_pair(opts,("at",),("locx","locy"),(0,0))
+    _blit(win,data,int(pos[0]),int(pos[1]),mask)
+    return True
+
+def WindowDisplayBitmapR(win_id,bitmap,*args,**kwargs) :
+    return WindowDisplayBitmap(win_id,bitmap,*args,reversed=True,**kwargs)
+
+def WindowTransformBitmap(win_id,x,y,bitmap,angle=0.0,zoom=1.0,reversed=False) :
+    """
+    Draws the bitmap centered at (x,y), rotated by angle (radians) and scaled by zoom, with nearest-neighbor sampling
+    """
+    win  = _window(win_id)
+    data = _bitmap_rgb(bitmap)
+    h,w  = data.shape[:2]
+    if w == 0 or h == 0 or zoom <= 0 : return False
+    x,y  = int(x),int(y)
+    ox,oy,colors,mask = _transformed(data[::-1] if reversed else data,float(angle),float(zoom))
+    box  = _region(win,x+ox,y+oy,x+ox+mask.shape[1],y+oy+mask.shape[0])
+    if box is None : return True
+    crop = (slice(box[1]-y-oy,box[3]-y-oy),slice(box[0]-x-ox,box[2]-x-ox))
+    view = win.pixels[box[1]:box[3],box[0]:box[2]]
+    numpy.copyto(view,colors[crop],where=mask[crop][:,:,None])
+    return True
+
+def _transformed(data : numpy.ndarray,angle : float,zoom : float) :
+    """
+    Resamples a bitmap rotated by angle and scaled by zoom, around its center.  Returns (x offset,y offset,colors,mask) -- the colors
+    and mask of the pixels covered, with the offset of their upper-left from the center pixel.
+    """
+    h,w   = data.shape[:2]
+    c,s   = numpy.cos(angle),numpy.sin(angle)
+    half  = .5*zoom*numpy.hypot(w,h)
+    ox,oy = int(numpy.floor(-half)),int(numpy.floor(-half))
+    size  = int(numpy.ceil(half + 1)) - ox
+    dx    = numpy.arange(ox,ox + size,dtype=float)[None,:] + .5
+    dy    = numpy.arange(oy,oy + size,dtype=float)[:,None] + .5
+    sx    = ( c*dx + s*dy)/zoom + w/2.0
+    sy    = (-s*dx + c*dy)/zoom + h/2.0
+    mask  = (sx >= 0) & (sx < w) & (sy >= 0) & (sy < h)
+    colors = numpy.zeros((size,size,3),dtype=numpy.uint8)
+    colors[mask] = data[sy[mask].astype(int),sx[mask].astype(int)]
+    return ox,oy,colors,mask
+
+def _bitmap_memory(height : int,width : int) -> numpy.ndarray :
+    "Zeroed bitmap memory [height][width][3], with each row padded to a multiple of 4 bytes as in the native library"
+    stride = (int(width)*3 + 3) & ~3
+    return numpy.zeros((int(height),stride),dtype=numpy.uint8)[:,:int(width)*3].reshape(int(height),int(width),3)
+
+def CreateBitmap(width,height) :
+    global _canceled
+    if width <= 0 or height <= 0 : _canceled = True; return 0
+    bitmap_id = _new_id()
+    _bitmaps[bitmap_id] = _bitmap_memory(height,width)
+    _canceled = False
+    return bitmap_id
+
+def CopyBitmap(bitmap) :
+    data = _bitmap_rgb(bitmap)
+    if data.size == 0 : return 0
+    bitmap_id = _new_id()
+    _bitmaps[bitmap_id] = _bitmap_memory(*data.shape[:2])
+    _bitmaps[bitmap_id][:] = data[:,:,::-1]
+    return bitmap_id
+
+def ReadImageFile(filename,**kwargs) :
+    global _canceled
+    data = _read_image(filename)
+    _canceled = data is None
+    if data is None : return 0
+    bitmap_id = _new_id()
+    _bitmaps[bitmap_id] = _bitmap_memory(*data.shape[:2])
+    _bitmaps[bitmap_id][:] = data
+    return bitmap_id
+
+def BitmapGetSize(bitmap_id) :
+    data = _bitmaps.get(bitmap_id)
+    return [0,0] if data is None else [data.shape[1],data.shape[0]]
+
+def BitmapGetMemory(bitmap_id) : return _bitmaps.get(bitmap_id)
+
+def isValid(bitmap_id) : return bitmap_id in _bitmaps and _bitmaps[bitmap_id].size > 0
+
+#
+# Image viewers (headless viewers are closed immediately, keeping the images displayed)
+#
+
+def _viewer(*bitmaps_and_opts,**kwargs) :
+    viewer_id = _new_id()
+    _viewers[viewer_id] = [_bitmap_rgb(b,_options(bitmaps_and_opts,kwargs)) for b in bitmaps_and_opts
+                            if getattr(b,"_opt__text",None) is None and b is not None]
+    return viewer_id
+
+def ImgView(bitmap,*args,**kwargs) : return _viewer(bitmap,*args,**kwargs)
+def ImgViewR(bitmap,*args,**kwargs) : return _viewer(bitmap,*args,**kwargs)
+def ImgBeforeAfter(bitmap1,bitmap2,*args,**kwargs) : return _viewer(bitmap1,bitmap2,*args,**kwargs)
+def ImgBeforeAfterR(bitmap1,bitmap2,*args,**kwargs) : return _viewer(bitmap1,bitmap2,*args,**kwargs)
+
+def viewer_images(viewer) -> list :
+    "Returns the RGB images shown by an img_view() or img_before_after() window"
+    return _viewers.get(_target_id(viewer),[])
+
+#
+# Events and mouse
+#
+
+def GetEvent() : return _pump()
+def WindowGetEvent(win_id) : return _pump()
+def EventPending(peek=None) : return bool(_events)
+
+def WindowMouseMoved(win_id) : return _take(_window(win_id).flags,"moved")
+def WindowMouseClicked(win_id,*args) : return _take(_window(win_id).flags,"clicked",args and args[0])
+def WindowMouseRClicked(win_id,*args) : return _take(_window(win_id).flags,"rclicked",args and args[0])
+def WindowMouseButtonDown(win_id) : return _window(win_id).button_down
+def WindowMouseRButtonDown(win_id) : return _window(win_id).r_button_down
+def WindowMouseDragEvent(win_id,*args) : return _take(_window(win_id).flags,"drag",args and args[0])
+def WindowMouseDragEnded(win_id,*args) : return _take(_window(win_id).flags,"dragended",args and args[0])
+def WindowMouseDragPos(win_id) : return list(_window(win_id).drag_pos)
+def WindowMouseDragPrev(win_id) : return list(_window(win_id).drag_prev)
+def WindowGetMousePos(win_id) : return list(_window(win_id).mouse_pos)
+def WindowGetMouseClickPos(win_id) : return list(_window(win_id).click_pos)
+def WindowMouseWheelMoved(win_id) : return _take(_window(win_id).flags,"wheel")
+def WindowGetMouseWheelMove(win_id) : return _window(win_id).wheel
+def WindowCaptureMouse(win_id) : return True
+def WindowCaptureRelease(win_id) : return True
+def WindowCaptureReleased(win_id,*args) : return False
+
+#
+# Controls and widgets
+#
+
+def _new_control(kind : str,title=None,args=(),kwargs=None,window : int = 0) -> int :
+    control_id = _new_id()
+    _controls[control_id] = _Control(kind,title,_options(args,kwargs or {}),window)
+    return control_id
+
+def _control(control_id) -> _Control : return _controls.get(control_id) or _Control("none")
+
+def DevSlider(title=None,*args,**kwargs) : return _new_control("slider",title,args,kwargs)
+def DevButton(text=None,*args,**kwargs) : return _new_control("button",text,args,kwargs)
+def DevCheckbox(title=None,*args,**kwargs) : return _new_control("checkbox",title,args,kwargs)
+def DevCombobox(text=None,*args,**kwargs) : return _new_control("list",text,args,kwargs)
+def DevInputBox(title=None,*args,**kwargs) : return _new_control("input",title,args,kwargs)
+def DevRadioButtons(buttons=None,*args,**kwargs) : return _new_control("radio",buttons,args,kwargs)
+def DevTextWidget(text=None,*args,**kwargs) :
+    control_id = _new_control("text",None,args,kwargs)
+    _controls[control_id].text = "" if text is None else str(text)
+    return control_id
+
+def DevText(text=None,height=None,**kwargs) :
+    win_id = _new_window(None,{},400,int(height or 100))
+    _write(_windows[win_id],text,{})
+    return win_id
+
+def DevWindow(title=None,numlines=None,*args,**kwargs) : return _new_window(title,{},400,int(numlines or 10)*20)
+def NewDevWindow(*args,**kwargs) : return _new_id()
+
+def QuickForm(type=None,*args,**kwargs) :
+    "Returns [quick form id, main window id, canvas window id, dev window id]"
+    opts = _options(args,kwargs)
+    return [_new_id(),_new_window(None,{}),_new_window(None,opts),_new_id()]
+
+def DevControlSlider(dev_id,title=None,*args,**kwargs) : return DevSlider(title,*args,**kwargs)
+def DevControlButton(dev_id,text=None,*args,**kwargs) : return DevButton(text,*args,**kwargs)
+def DevControlCheckbox(dev_id,title=None,*args,**kwargs) : return DevCheckbox(title,*args,**kwargs)
+def DevControlCombobox(dev_id,text=None,*args,**kwargs) : return DevCombobox(text,*args,**kwargs)
+def DevControlInputBox(dev_id,title=None,*args,**kwargs) : return DevInputBox(title,*args,**kwargs)
+def DevControlRadioButtons(dev_id,buttons=None,*args,**kwargs) : return DevRadioButtons(buttons,*args,**kwargs)
+def DevControlTextWidget(dev_id,text=None,*args,**kwargs) : return DevTextWidget(text,*args,**kwargs)
+def DevControlWindow(dev_id,title=None,numlines=None,*args,**kwargs) : return DevWindow(title,numlines)
+
+def WindowNewSlider(win_id,title,x,y,width=None,*args,**kwargs) : return _new_control("slider",title,args,kwargs,win_id)
+def WindowNewButton(win_id,title,x,y,*args,**kwargs) : return _new_control("button",title,args,kwargs,win_id)
+def WindowNewListbox(win_id,x,y,text=None,*args,**kwargs) : return _new_control("list",text,args,kwargs,win_id)
+def WindowNewInputBox(win_id,x,y,width,height,text=None,*args,**kwargs) :
+    control_id = _new_control("input",None,args,kwargs,win_id)
+    if text is not None : _controls[control_id].text = str(text)
+    return control_id
+
+def WindowTextWidget(win_id,x,y,text=None,width=0,height=0,*args,**kwargs) :
+    control_id = _new_control("text",None,args,kwargs,win_id)
+    _controls[control_id].text = "" if text is None else str(text)
+    return control_id
+
+def TextWidgetWrite(control_id,text,*args,**kwargs) :
+    _control(control_id).text = _strip_markup(str(text))
+    return True
+
+def SliderMoved(control_id) : return _take(_control(control_id).flags,"changed")
+def SliderGetPos(control_id) : return int(round(float(_control(control_id).value)))
+def SliderGetPosf(control_id) : return float(_control(control_id).value)
+
+def SliderSetPos(control_id,pos) :
+    control = _control(control_id)
+    control.value = max(control.min,min(control.max,pos))
+    return True
+
+SliderSetPosf = SliderSetPos
+
+def ButtonPressed(control_id,peek=None) : return _take(_control(control_id).flags,"pressed",peek)
+def ButtonUnpressed(control_id,peek=None) : return _take(_control(control_id).flags,"unpressed",peek)
+def ButtonChecked(control_id) : return bool(_control(control_id).value)
+def ButtonSetText(control_id,text) : _control(control_id).title = text; return True
+def ButtonShow(control_id,show=True) : return True
+def ButtonSetLocation(control_id,*args) : return True
+
+def _ListAddItem(control_id,item) : _control(control_id).items.append(item); return True
+def _ListItemSelected(control_id,*args) : return _take(_control(control_id).flags,"changed",args and args[0])
+def _ListGetSelection(control_id) : return int(_control(control_id).value)
+def _ListSetSelection(control_id,selection) : _control(control_id).value = int(selection); return True
+def _ListGetNumItems(control_id) : return len(_control(control_id).items)
+def _ListClearList(control_id) : _control(control_id).items.clear(); return True
+
+ListboxAddItem      = ComboboxAddItem       = _ListAddItem
+ListboxItemSelected = ComboboxItemSelected  = _ListItemSelected
+ListboxGetSelection = ComboboxGetSelection  = _ListGetSelection
+ListboxSetSelection = ComboboxSetSelection  = _ListSetSelection
+ListboxGetNumItems  = ComboboxGetNumItems   = _ListGetNumItems
+ListboxClearList    = ComboboxClearList     = _ListClearList
+
+def InputBoxReturnPressed(control_id,peek=None,*args) : return _take(_control(control_id).flags,"changed",peek)
+def InputBoxGetText(control_id) : return _control(control_id).text
+def InputBoxSetText(control_id,text) : _control(control_id).text = str(text); return True
+def InputBoxClearText(control_id) : _control(control_id).text = ""; return True
+
+def InputBoxGetFloat(control_id) :
+    try : return float(_control(control_id).text)
+    except ValueError : return 0.0
+
+def InputBoxGetInteger(control_id) :
+    try : return int(float(_control(control_id).text))
+    except ValueError : return 0
+
+def _ButtonGroupPressed(control_id,peek=None) : return _take(_control(control_id).flags,"changed",peek)
+def _ButtonGroupGetChecked(control_id) : return int(_control(control_id).value)
+
+#
+# Dialogs -- headless dialogs return their default values immediately
+#
+
+def GetInteger(text=None,*args,**kwargs) : return int(_options(args,kwargs).get("default",0))
+def GetFloat(text=None,*args,**kwargs) : return float(_options(args,kwargs).get("default",0))
+def GetString(text=None,*args,**kwargs) : return str(_options(args,kwargs).get("default",""))
+def WindowGetInteger(win_id,text=None,*args,**kwargs) : return GetInteger(text,*args,**kwargs)
+def WindowGetFloat(win_id,text=None,*args,**kwargs) : return GetFloat(text,*args,**kwargs)
+def WinConsoleGetNumber(win_id,text=None,*args,**kwargs) : return GetInteger(text,*args,**kwargs)
+def WinConsoleGetFloat(win_id,text=None,*args,**kwargs) : return GetFloat(text,*args,**kwargs)
+def GetOpenFile(filetypes=None) : return ""
+def GetSaveFile(filetypes=None) : return ""
+def InfoWindow(text=None,*args,**kwargs) : return True
+def YesNoWindow(text=None,*args,**kwargs) : return True
+def YesNoCancelWindow(text=None,*args,**kwargs) : return 1
+def OkCancelWindow(text=None,*args,**kwargs) : return True
+def PleaseWaitWindow(text=None,*args,**kwargs) : return True
+def ClosePleaseWait() : return True
+def PleaseWaitSetProgress(percent) : return True
+def PleaseWaitCanceled() : return False
+
+def ImgViewWindowClosed(viewer_id) : return True
+def ImgBeforeAfterWindowClosed(viewer_id) : return True
+
+# Native entry points without a headless implementation (menus, mouse regions, color selectors, etc.) resolve to a
+# function that does nothing and returns 0, which reads as False/None/empty for the pybox wrappers.
+# Calls are counted in unsupported_calls.  Any other missing name raises AttributeError.
+
+_NATIVE_STUBS = frozenset((
+    "ColorSelector", "ColorSelector_CancelPressed", "ColorSelector_DisableClose", "ColorSelector_GetRGBValue",
+    "ColorSelector_Hide", "ColorSelector_OkPressed", "ColorSelector_SetLocation", "ColorSelector_SetRGBValue",
+    "ColorSelector_Show", "ColorSelector_ValueChanged", "ColorSelector_WindowClosed", "ColorWheel_GetRGBValue",
+    "ColorWheel_Hide", "ColorWheel_SetLocation", "ColorWheel_SetRGBValue", "ColorWheel_Show",
+    "ColorWheel_ValueChanged", "ComboboxSetLocation", "ConsoleBox", "DevAllowAutoClose", "DevAutoClose", "DevBitmap",
+    "DevControlBitmap", "DevControlSetBgBitmap", "DevControlSetBgColor", "DevControlSetConfig", "DevControlSetNextY",
+    "DevControlWindowClosed", "DevSetBgBitmap", "DevSetBgColor", "DevSetConfig", "DevSetLocation", "DevSetNextY",
+    "DevWindowClosed", "GetMouseRegionWindowControlID", "ImgBeforeAfterCloseWindow", "ImgBeforeAfterWaitforClose",
+    "ImgBeforeAfterWindowCloseEvent", "ImgViewCloseAll", "ImgViewCloseWindow", "ImgViewWaitforClose",
+    "ImgViewWaitforCloseAll", "ImgViewWaitforCloseAny", "ImgViewWindowCloseEvent", "ImgViewWindowWindowCount",
+    "InputBoxAddArrowBox", "InputBoxDisable", "InputBoxEnable", "InputBoxGetMouseWheelValue", "InputBoxHide",
+    "InputBoxMouseWheelMoved", "InputBoxSetMax", "InputBoxSetMin", "InputBoxSetMouseWheel", "InputBoxSetRange",
+    "InputBoxShow", "ListboxSetLocation", "MouseRegionAddPoint", "MouseRegionAddPoints", "MouseRegionAutoDraw",
+    "MouseRegionEventReady", "MouseRegionGetCurrentHighlight", "MouseRegionGetCurrentSelection",
+    "MouseRegionGetDisplayIndex", "MouseRegionGetLastHighlight", "MouseRegionGetLastSelected",
+    "MouseRegionGetNumIndexes", "MouseRegionGetPoint", "MouseRegionGetRegion", "MouseRegionGetUserIDIndex",
+    "MouseRegionHighlightChanged", "MouseRegionKillPassedEvents", "MouseRegionMouseDragEnded",
+    "MouseRegionMouseDragEvent", "MouseRegionRemoveBoundBox", "MouseRegionResetPoints", "MouseRegionResetSelected",
+    "MouseRegionSelectionChanged", "MouseRegionSetAutoDraw", "MouseRegionSetBoundBox", "MouseRegionSetOptions",
+    "MouseRegionSetPoint", "MouseRegionSetPos", "MouseRegionUpdatePoints", "ShowImgViewInstructions",
+    "WinTurtleCircle", "WinTurtleGenBool", "WinTurtleGenColorValue", "WinTurtleGenMixedValue", "WinTurtleGetFloat",
+    "WinTurtleGetFloatList", "WinTurtleSetPos", "WindowColorSelector", "WindowColorWheel", "WindowCreateMenuString",
+    "WindowDisableMenuItem", "WindowDrawTriangle_Test", "WindowEnableMenuItem", "WindowGetMenuItemID",
+    "WindowGetMouseRegion", "WindowGetSelectedMenuItem", "WindowGetWindowPointer", "WindowHideMenu",
+    "WindowMenuItemSelected", "WindowNewTurtleShell", "WindowPrintMenuItems", "WindowSetMenuItemCheck",
+    "WindowShowMenu", "WindowisMenuIDSelected", "_ButtonGroupGetCheckedText", "_ButtonGroupGetText"))
+
+unsupported_calls = collections.Counter()
+
+def __getattr__(name : str) :
+    if name not in _NATIVE_STUBS : raise AttributeError("module 'pybox._headless' has no attribute '%s'" % name)
+    def _unsupported(*args,**kwargs) :
+        unsupported_calls[name] += 1
+        return 0
+    _unsupported.__name__ = name
+    return _unsupported
@@ -0,0 +1,121 @@
+"""
+Pybox Native Extensions -- loads the native extension modules (_pybox, _lcd_widget, _dial_widget) built for the running
+interpreter.
+
+Extensions are kept in pybox/native/cpXY, i.e. pybox/native/cp310/_lcd_widget.pyd for Python 3.10.  A source checkout
+has a directory for each supported interpreter, and an installed wheel has only the one it was built for.  Extensions
+without a per-interpreter build (i.e. _pybox from the pybox-gui wheel) are imported from sys.path as usual.
+
+Resolved paths are stored in a cache file (one per interpreter version), so that starting a new interpreter -- i.e. in a
+process pool -- takes one stat() of the extension directory and one small read instead of a directory scan.  The cache
+is checked against the directory's modification time and rebuilt when the directory changes.
+
+    \t -PYBOX_NATIVE_CACHE  \t -- cache file to use (default: %LOCALAPPDATA%\\pybox or ~/.cache/pybox); set to "0" to disable
+"""
+
+import os
+import sys
+import zlib
+import importlib
+import importlib.util
+import importlib.machinery
+
+NATIVE_DIR  = os.path.join(os.path.dirname(os.path.abspath(__file__)),"native")
+TAG         = "cp{0}{1}".format(*sys.version_info[:2])
+TAG_DIR     = os.path.join(NATIVE_DIR,TAG)
+
+def _cache_file() -> str :
+    path = os.environ.get("PYBOX_NATIVE_CACHE","")
+    if path == "0" : return ""
+    if path : return path
+    if sys.platform == "win32" : root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else : root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"),".cache")
+    return os.path.join(root,"pybox","native-{0}-{1:08x}.txt".format(TAG,zlib.crc32(TAG_DIR.encode("utf-8"))))
+
+def _dir_mtime() -> int :
+    try :
+        return os.stat(TAG_DIR).st_mtime_ns
+    except OSError :
+        return -1
+
+def _scan() -> dict :
+    "Returns { module name : path } for the extensions in TAG_DIR that this interpreter can load"
+    found = {}
+    try :
+        entries = sorted(os.listdir(TAG_DIR))
+    except OSError :
+        return found
+    for entry in entries :
+        for suffix in importlib.machinery.EXTENSION_SUFFIXES :         # most specific suffix first
+            if entry.endswith(suffix) :
+                found.setdefault(entry[:-len(suffix)],os.path.join(TAG_DIR,entry))
+                break
+    return found
+
+# The cache file is plain text (json would take longer to import than the scan it saves):
+#
+#   <extension directory>\t<modification time>
+#   <module name>\t<path>          (one line per extension)
+
+def _read_cache(filename : str,mtime : int) :
+    try :
+        with open(filename,encoding="utf-8") as f : lines = f.read().splitlines()
+    except OSError :
+        return None
+    if not lines or lines[0] != "{0}\t{1}".format(TAG_DIR,mtime) : return None
+    try :
+        return dict(line.split("\t",1) for line in lines[1:] if line)
+    except ValueError :
+        return None
+
+def _write_cache(filename : str,mtime : int,paths : dict) -> None :
+    lines = ["{0}\t{1}".format(TAG_DIR,mtime)] + ["{0}\t{1}".format(name,path) for name,path in sorted(paths.items())]
+    temp  = "{0}.{1}.tmp".format(filename,os.getpid())
+    try :
+        os.makedirs(os.path.dirname(filename),exist_ok=True)
+        with open(temp,"w",encoding="utf-8") as f : f.write("\n".join(lines) + "\n")
+        os.replace(temp,filename)                                       # atomic, for processes starting together
+    except OSError :
+        try : os.remove(temp)
+        except OSError : pass
+
+_paths = None
+
+def extension_paths() -> dict :
+    """
+    Returns { module name : path } for the native extensions built for this interpreter, from the cache file when it
+    is up to date.
+    """
+    global _paths
+    if _paths is None :
+        filename    = _cache_file()
+        mtime       = _dir_mtime()
+        paths       = _read_cache(filename,mtime) if filename else None
+        if paths is None :
+            paths = _scan()
+            if filename : _write_cache(filename,mtime,paths)
+        _paths = paths
+    return _paths
+
+def find(name : str) :
+    "Returns the path of the per-interpreter build of extension 'name', or None if there is not one"
+    return extension_paths().get(name)
+
+def load(name : str) :
+    """
+    Imports native extension 'name' from the per-interpreter directory, or from sys.path when there is no
+    per-interpreter build.  Raises ImportError when the extension can't be found or loaded.
+    """
+    module = sys.modules.get(name)
+    if module is not None : return module
+    path = find(name)
+    if path is None : return importlib.import_module(name)
+    spec    = importlib.util.spec_from_file_location(name,path)
+    module  = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try :
+        spec.loader.exec_module(module)
+    except BaseException :
+        del sys.modules[name]
+        raise
+    return module
@@ -0,0 +1,239 @@
+"""
+Pybox Profiler -- per-call accounting of calls into the native library (see pybox.profile).
+"""
+
+from __future__ import annotations
+
+import numpy
+import sys
+import time
+import itertools
+import collections
+from . import _core
+from ._core import _pybox_native
+
+class _ProfileEntry :
+    "Call statistics for one _pybox entry point"
+    def __init__(self,max_samples : int) :
+        self.count          = 0
+        self.total_ns       = 0
+        self.samples        = collections.deque(maxlen=max_samples)        # per-call times (ns)
+        self.frame_samples  = collections.deque(maxlen=max_samples)        # time spent in this entry point per frame (ns), 0 for frames without calls
+        self.frame_total    = 0                                            # calls in all ended frames
+        self.frames         = 0                                            # frames recorded in frame_samples
+        self.frame_count    = 0
+        self.frame_ns       = 0
+
+    def record_frames(self,frames : int,frame_ns : int = None) :
+        "Records the frames up to 'frames' without calls to this entry point, and then the time of the current frame when given"
+        empty = frames - self.frames - (frame_ns is not None)
+        if empty > 0 : self.frame_samples.extend(itertools.repeat(0,min(empty,self.frame_samples.maxlen)))
+        if frame_ns is not None : self.frame_samples.append(frame_ns)
+        self.frames = frames
+
+class _ProfileStats :
+    """
+    Collects per-call timing for the _pybox entry points.  Frames are bounded by vsync_wait() and update().
+    """
+    frame_boundaries = ("WindowVSyncWait","WindowUpdate")
+
+    def __init__(self,max_samples : int) :
+        self.max_samples    = max_samples
+        self.entries        = {}
+        self.reset()
+
+    def reset(self) :
+        for entry in self.entries.values() : entry.__init__(self.max_samples)
+        self.touched        = []
+        self.frame_work     = 0
+        self.frame_calls    = 0
+        self.frame_ns       = 0
+        self.frame_start    = time.perf_counter_ns()
+        self.frames         = 0
+        self.frame_wall     = collections.deque(maxlen=self.max_samples)
+        self.frame_ffi      = collections.deque(maxlen=self.max_samples)
+        self.frame_ncalls   = collections.deque(maxlen=self.max_samples)
+
+    def end_frame(self) :
+        # A frame needs at least one call besides vsync_wait()/update(), so a loop calling both counts one frame
+
+        if self.frame_work == 0 : return
+        now = time.perf_counter_ns()
+        self.frames += 1
+        self.frame_wall.append(now - self.frame_start)
+        self.frame_ffi.append(self.frame_ns)
+        self.frame_ncalls.append(self.frame_calls)
+        for entry in self.touched :
+            entry.record_frames(self.frames,entry.frame_ns)
+            entry.frame_total += entry.frame_count
+            entry.frame_count = 0
+            entry.frame_ns = 0
+        self.touched.clear()
+        self.frame_work = self.frame_calls = self.frame_ns = 0
+        self.frame_start = now
+
+    def wrap(self,name : str,func) :
+        entry = self.entries.get(name)
+        if entry is None : entry = self.entries[name] = _ProfileEntry(self.max_samples)
+        boundary = name in self.frame_boundaries
+        stats = self
+        clock = time.perf_counter_ns
+        def profiled(*args,**kwargs) :
+            start = clock()
+            try :
+                return func(*args,**kwargs)
+            finally :
+                elapsed = clock() - start
+                entry.count += 1
+                entry.total_ns += elapsed
+                entry.samples.append(elapsed)
+                if entry.frame_count == 0 : stats.touched.append(entry)
+                entry.frame_count += 1
+                entry.frame_ns += elapsed
+                stats.frame_calls += 1
+                stats.frame_ns += elapsed
+                if boundary : stats.end_frame()
+                else : stats.frame_work += 1
+        profiled.__name__ = name
+        profiled.__wrapped__ = func
+        return profiled
+
+class _ProfiledPybox :
+    """
+    Stands in for the _pybox module while profiling is enabled.  Functions are wrapped on first use and cached.
+    """
+    def __init__(self,module,stats : _ProfileStats) :
+        self._module    = module
+        self._stats     = stats
+    def __getattr__(self,name : str) :
+        value = getattr(self._module,name)
+        if callable(value) : value = self._stats.wrap(name,value)
+        setattr(self,name,value)
+        return value
+
+def _percentiles(samples,scale : float) -> tuple :
+    if not samples : return 0.0,0.0
+    p50,p99 = numpy.percentile(numpy.fromiter(samples,dtype=numpy.float64,count=len(samples)),(50,99))
+    return float(p50)*scale,float(p99)*scale
+
+_profile_stats  = None
+
+def _set_backend(module) :
+    "Sets the _pybox module used by all pybox modules, including those imported later (which take it from pybox._core)"
+    _core._pybox = module
+    prefix = __package__ + "."
+    for name,loaded in list(sys.modules.items()) :
+        if name.startswith(prefix) and getattr(loaded,"_pybox",None) is not None : loaded._pybox = module
+
+class profile :
+    """
+    Pybox Profiler -- opt-in accounting of calls into the native Pybox library.
+
+    When enabled, every _pybox function called by pybox (Window, Window.draw, DevControl, MouseRegion, widgets and the
+    top-level functions) is timed.  Call counts, cumulative time and p50/p99 times are kept per entry point, as well as
+    per frame, where a frame ends with each call to vsync_wait() or update().
+
+    Example:
+
+        \t -pybox.profile.enable()
+        \t -while win.vsync_wait() : ...
+        \t -report = pybox.profile.report()          \t - - dictionary of results
+        \t -pybox.profile.write()                    \t - - summary written to the debug window
+
+    Profiling adds a small amount of time to each call (about a microsecond), which is included in the times reported.
+    """
+    def enable(max_samples : int = 65536) -> bool :
+        """
+        Starts profiling calls into the native Pybox library.  Statistics are kept until profile.reset() is called.
+
+        Parameters
+
+        - max_samples   \t -- Number of recent call and frame times kept (per entry point) for the p50/p99 values.
+                            \t - Counts and cumulative times include all calls.
+        """
+        global _profile_stats
+        if _profile_stats is None : _profile_stats = _ProfileStats(max(1,int(max_samples)))
+        _set_backend(_ProfiledPybox(_pybox_native,_profile_stats))
+        return True
+
+    def disable() -> bool :
+        """
+        Stops profiling.  Collected statistics remain available through profile.report() until profile.reset().
+        """
+        _set_backend(_pybox_native)
+        return True
+
+    def is_enabled() -> bool :
+        "Returns True if profiling is enabled"
+        return _core._pybox is not _pybox_native
+
+    def reset() -> bool :
+        "Clears all collected statistics"
+        if _profile_stats is not None : _profile_stats.reset()
+        return True
+
+    def report(sort : str = "total_ms") -> dict :
+        """
+        Returns the profile as a dictionary:
+
+        - "calls", "total_ms"   \t -- Total calls into the native library and the time spent in them
+        - "frames"              \t -- Number of frames, with p50/p99 of frame time ("wall_ms"), time spent in native calls ("ffi_ms") and calls per frame
+        - "entry_points"        \t -- Dictionary keyed by _pybox function name, ordered by 'sort' (largest first), with:
+                                \t - calls, total_ms, mean_us, p50_us, p99_us -- per call
+                                \t - calls_per_frame, frame_p50_us, frame_p99_us -- time spent in the function per frame, over all frames
+                                \t -   (frames without calls to it count as 0)
+        - "conversions"         \t -- Bitmap conversions, as returned by pybox.conversion_stats(), when any bitmaps were converted
+        """
+        stats = _profile_stats
+        if stats is None : return { "calls" : 0, "total_ms" : 0.0, "frames" : { "count" : 0 }, "entry_points" : {} }
+        entries = {}
+        for name,entry in stats.entries.items() :
+            if entry.count == 0 : continue
+            entry.record_frames(stats.frames)
+            p50,p99 = _percentiles(entry.samples,1e-3)
+            f50,f99 = _percentiles(entry.frame_samples,1e-3)
+            entries[name] = { "calls"           : entry.count,
+                              "total_ms"        : entry.total_ns*1e-6,
+                              "mean_us"         : entry.total_ns*1e-3/entry.count,
+                              "p50_us"          : p50,
+                              "p99_us"          : p99,
+                              "calls_per_frame" : (entry.frame_total/stats.frames) if stats.frames else float(entry.count),
+                              "frame_p50_us"    : f50,
+                              "frame_p99_us"    : f99 }
+        entries = dict(sorted(entries.items(),key=lambda item : item[1].get(sort,0),reverse=True))
+        wall50,wall99   = _percentiles(stats.frame_wall,1e-6)
+        ffi50,ffi99     = _percentiles(stats.frame_ffi,1e-6)
+        calls50,calls99 = _percentiles(stats.frame_ncalls,1.0)
+        report = { "calls"        : sum(e["calls"] for e in entries.values()),
+                   "total_ms"     : sum(e["total_ms"] for e in entries.values()),
+                   "frames"       : { "count" : stats.frames, "wall_p50_ms" : wall50, "wall_p99_ms" : wall99,
+                                      "ffi_p50_ms" : ffi50, "ffi_p99_ms" : ffi99, "calls_p50" : calls50, "calls_p99" : calls99 },
+                   "entry_points" : entries }
+        convert = sys.modules.get(__package__ + ".bitmap_convert")                 # only when bitmaps have been converted
+        if convert is not None : report["conversions"] = convert.conversion_stats()
+        return report
+
+    def write(top : int = 20,sort : str = "total_ms") -> str :
+        """
+        Writes a summary of the profile to the debug window (see debug_write()) and returns the text written.
+
+        Parameters
+
+        - top   \t -- Number of entry points listed (the largest by 'sort')
+        - sort  \t -- Report field to order by, i.e. "total_ms", "calls", "p99_us"
+        """
+        rep     = profile.report(sort)
+        frames  = rep["frames"]
+        lines   = ["{div}",
+                   "{{cyan}}Pybox Profile{{}}: {0} native calls, {1:.2f} ms".format(rep["calls"],rep["total_ms"])]
+        if frames["count"] :
+            lines.append("Frames: {0}  frame p50/p99 {1:.2f}/{2:.2f} ms  native p50/p99 {3:.2f}/{4:.2f} ms  calls p50/p99 {5:.0f}/{6:.0f}".format(
+                            frames["count"],frames["wall_p50_ms"],frames["wall_p99_ms"],frames["ffi_p50_ms"],frames["ffi_p99_ms"],
+                            frames["calls_p50"],frames["calls_p99"]))
+        lines.append("{{y}}{0:<32}{1:>9}{2:>11}{3:>10}{4:>10}{5:>11}{6:>12}".format("Entry Point","Calls","Total ms","p50 us","p99 us","Per Frame","Frame p99"))
+        for name,e in list(rep["entry_points"].items())[:max(0,int(top))] :
+            lines.append("{0:<32}{1:>9}{2:>11.2f}{3:>10.1f}{4:>10.1f}{5:>11.1f}{6:>12.1f}".format(
+                            name,e["calls"],e["total_ms"],e["p50_us"],e["p99_us"],e["calls_per_frame"],e["frame_p99_us"]))
+        text = "\n".join(lines) + "\n"
+        _pybox_native.DebugWrite(text)
+        return text
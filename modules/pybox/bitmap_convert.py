@@ -0,0 +1,167 @@
+"""
+Pybox Bitmap Conversion -- converts numpy images to the uint8 [height][width][3] bitmaps displayed by Pybox.  See convert_bitmap().
+"""
+
+from __future__ import annotations
+
+import sys
+import collections
+import numpy
+
+_FAST_TYPES = (numpy.dtype(numpy.uint8),numpy.dtype(numpy.float32),numpy.dtype(numpy.float64))
+
+_conversions    = collections.Counter()         # conversion path -> count
+_slow_callers   = {}                            # slow conversion path -> Counter of caller locations
+
+def _caller() -> str :
+    "The file and line of the first caller outside of pybox"
+    frame  = sys._getframe(2)
+    prefix = __package__ + "."
+    while frame is not None and frame.f_globals.get("__name__","").startswith(prefix) : frame = frame.f_back
+    return "?" if frame is None else "{0}:{1}".format(frame.f_code.co_filename,frame.f_lineno)
+
+def _record(path : str,slow : bool) -> None :
+    _conversions[path] += 1
+    if slow : _slow_callers.setdefault(path,collections.Counter())[_caller()] += 1
+
+def _layout(image : numpy.ndarray) -> int :
+    "The number of channels of an image, or ValueError when it isn't a [height][width] or [height][width][1,3,4] image"
+    if image.ndim == 2 : return 1
+    if image.ndim == 3 and image.shape[2] in (1,3,4) : return image.shape[2]
+    raise ValueError("Bitmaps are [height][width] or [height][width][1, 3 or 4] arrays, not an array of shape {0}".format(image.shape))
+
+def _convert(image : numpy.ndarray,out,normalized : bool,swap_channels : bool,converter,keep_mask : bool = False) -> numpy.ndarray :
+    channels    = _layout(image)
+    height,width = image.shape[:2]
+    kept        = 4 if keep_mask and channels == 4 else 3               # [4] images keep their mask as a 4th channel
+    size        = image.itemsize
+    packed      = image.strides[-1] == size and (image.ndim == 2 or image.strides[1] == channels*size)    # rows may be padded
+    path        = "{0} {1}-channel{2}{3}{4}".format(image.dtype.name,channels," swapped" if swap_channels and channels > 1 else "",
+                                                    " masked" if kept == 4 else "","" if packed else " strided")
+    if channels == kept and image.dtype == numpy.uint8 and packed and not swap_channels :
+        _record(path,False)
+        return image                                                    # displayed as it is
+
+    if out is None : out = converter._output(height,width,kept) if converter is not None else numpy.empty((height,width,kept),dtype=numpy.uint8)
+    elif out.shape != (height,width,kept) or out.dtype != numpy.uint8 :
+        raise ValueError("out must be a uint8 array of shape {0}, not {1} {2}".format((height,width,kept),out.dtype.name,out.shape))
+    source = image.reshape(height,width,1) if channels == 1 else image[:,:,:kept]
+    if swap_channels and channels > 1 : source = source[:,:,::-1] if kept == 3 else source[:,:,(2,1,0,3)]
+
+    if image.dtype == numpy.uint8 :
+        numpy.copyto(out,source)                                        # gray values are broadcast to the 3 channels
+    elif image.dtype.kind == "f" or normalized :
+        scratch = converter._scratch(source.shape) if converter is not None else numpy.empty(source.shape,dtype=numpy.float32)
+        if normalized : numpy.multiply(source,255.0,out=scratch,casting="same_kind")
+        else : numpy.copyto(scratch,source,casting="same_kind")
+        numpy.clip(scratch,0,255,out=scratch)
+        numpy.copyto(out,scratch,casting="unsafe")
+    else :
+        numpy.clip(source,0,255,out=out,casting="unsafe")
+    _record(path,not packed or image.dtype not in _FAST_TYPES)
+    return out
+
+def convert_bitmap(image,out : numpy.ndarray = None,normalized : bool = False,swap_channels : bool = False,keep_mask : bool = False) -> numpy.ndarray :
+    """
+    Converts a numpy image to a uint8 [height][width][3] bitmap, as displayed by display_bitmap() -- or, with keep_mask=True, a
+    [height][width][4] (Red, Green, Blue, Mask) image to a uint8 [height][width][4] bitmap with its mask.  display_bitmap() converts
+    numpy images with this function, so it only needs to be called directly to convert images ahead of time, or into a buffer.
+
+    Fast conversions:
+
+    - uint8 [height][width][3]              \t -- returned as it is, without copying it
+    - uint8 [height][width] (gray) or [4]   \t -- gray values are copied to each channel; the 4th channel (the mask of a Red, Green,
+                                            \t    Blue, Mask image) is dropped, unless keep_mask is True.  display_bitmap() keeps the
+                                            \t    mask, and passes uint8 [4] images as they are.
+    - float32 or float64 images             \t -- values 0-255 (or 0-1 with normalized=True) are clipped and converted
+
+    Other images (i.e. int32 or int64 arrays, or arrays whose pixels are not next to each other in memory) are converted too, but are
+    slower and are reported by conversion_stats(), with the file and line of the call, so the array can be created as uint8 or float.
+
+    Parameters
+
+    - image         \t -- [height][width] or [height][width][1, 3 or 4] numpy array
+    - out           \t -- [optional] uint8 [height][width][3] array to convert the image into (not used for uint8 [height][width][3] images)
+    - normalized    \t -- [optional] True when a floating-point image's values are 0-1 rather than 0-255
+    - swap_channels \t -- [optional] Reverses the order of the channels, i.e. RGB to BGR (the mask stays last)
+    - keep_mask     \t -- [optional] Keeps the 4th channel of [height][width][4] images, returning a uint8 [height][width][4] bitmap
+
+    See BitmapConverter to reuse the output memory for each frame.
+    """
+    return _convert(numpy.asarray(image),out,normalized,swap_channels,None,keep_mask)
+
+class BitmapConverter :
+    """
+    Pybox Bitmap Converter
+
+    Converts numpy images as convert_bitmap() does, into memory that is kept and used again for the next image of the same size --
+    i.e. for converting each frame of an animation without allocating a new bitmap for each frame.
+
+    The bitmap returned by convert() is changed by the next convert() call.
+
+    Examples:
+                \t -converter = pybox.BitmapConverter()
+                \t -while win.vsync_wait() :
+                \t -    win.display_bitmap(0,0,converter.convert(heights,normalized=True))   - heights is a float [height][width] array
+    """
+    def __init__(self) :
+        self.__out      = None
+        self.__scratch  = None
+
+    def __repr__(self):
+        return "pybox.BitmapConverter"
+
+    def _output(self,height : int,width : int,channels : int = 3) -> numpy.ndarray :
+        if self.__out is None or self.__out.shape != (height,width,channels) : self.__out = numpy.empty((height,width,channels),dtype=numpy.uint8)
+        return self.__out
+
+    def _scratch(self,shape : tuple) -> numpy.ndarray :
+        if self.__scratch is None or self.__scratch.shape != shape : self.__scratch = numpy.empty(shape,dtype=numpy.float32)
+        return self.__scratch
+
+    def convert(self,image,normalized : bool = False,swap_channels : bool = False,keep_mask : bool = False) -> numpy.ndarray :
+        "Converts an image -- see convert_bitmap()"
+        return _convert(numpy.asarray(image),None,normalized,swap_channels,self,keep_mask)
+
+def conversion_stats(reset : bool = False) -> dict :
+    """
+    Returns the bitmap conversions made by convert_bitmap(), BitmapConverter and display_bitmap(), as a dictionary:
+
+    - "conversions" \t -- Number of conversions for each kind of image, i.e. { "uint8 3-channel" : 120, "int64 3-channel" : 4 }
+    - "slow"        \t -- For each kind of image converted by a slow path, the number of conversions made from each file and line,
+                    \t    i.e. { "int64 3-channel" : { "mandelbrot_faster.py:158" : 4 } }
+
+    Parameters
+
+    - reset         \t -- [optional] Clears the statistics after returning them
+
+    pybox.profile.report() includes these statistics while profiling.
+    """
+    stats = { "conversions" : dict(_conversions), "slow" : { path : dict(callers) for path,callers in _slow_callers.items() } }
+    if reset :
+        _conversions.clear()
+        _slow_callers.clear()
+    return stats
+
+_display_converter = BitmapConverter()
+
+def _display_options(image : numpy.ndarray,args : tuple,kwargs : dict) :
+    """
+    Reads the normalized option given with an image to display_bitmap(), img_view(), etc.  Returns normalized and the keywords without
+    normalize/normalized, which are applied by the conversion.
+    """
+    normalized = False
+    for key in ("normalized","normalize") :
+        if key in kwargs :
+            kwargs = dict(kwargs)
+            normalized = bool(kwargs.pop(key)) or normalized
+    if not normalized and image.dtype != numpy.uint8 :
+        for arg in args :
+            text = arg if isinstance(arg,str) else getattr(arg,"_opt__text",None)
+            if text is not None and ",normalized," in text.lower() : normalized = True
+    return normalized,kwargs
+
+def _for_display(image : numpy.ndarray,args : tuple,kwargs : dict) :
+    "Converts a numpy image given to display_bitmap().  Returns the bitmap and the keywords without normalize/normalized."
+    normalized,kwargs = _display_options(image,args,kwargs)
+    return _display_converter.convert(image,normalized,keep_mask=True),kwargs           # Red, Green, Blue, Mask images keep their mask
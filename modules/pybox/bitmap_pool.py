@@ -0,0 +1,166 @@
+"""
+Pybox Bitmap Pools -- see BitmapPool.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import numpy
+from . import _core
+from ._core import Bitmap, _pybox
+
+class BitmapPool :
+    """
+    Pybox Bitmap Pool
+
+    A BitmapPool keeps bitmaps that are no longer used so they can be used again, i.e. for a real-time image pipeline that would
+    otherwise call create_bitmap() or copy_bitmap() for each frame, allocating and freeing large bitmaps continuously.
+
+    Bitmaps are kept by (width,height,channels).  acquire() returns a free bitmap of that size (or creates one), and release() returns
+    it to the pool.  borrow() does both in a 'with' block, and copy() acquires a bitmap and copies a bitmap or array into it.
+
+    - channels=3    \t -- a pybox Bitmap, with Blue, Green, Red values.  With a version of the Pybox library that only returns a copy
+                    \t    of a bitmap's memory (see the Bitmap class), a writable uint8 [height][width][3] numpy array with the same
+                    \t    Blue, Green, Red layout instead, so that drawing into numpy.asarray(bitmap) changes the pooled bitmap.
+    - channels=1,4  \t -- a writable uint8 numpy array, [height][width] for 1 channel (i.e. masks), or [height][width][4] with Red, Green,
+                    \t    Blue, Mask values, as display_bitmap() takes them
+
+    The pool keeps up to max_free free bitmaps of each size -- bitmaps released past that are dropped from the pool.  The Pybox
+    library has no function to delete a bitmap, so a dropped pybox Bitmap keeps its memory until the program ends.  Keep max_free
+    at least at the number of bitmaps of one size in use at once (stats() reports the most bitmaps in use at once as 'high_water'),
+    so that every frame reuses bitmaps and none are created after the first frames.
+
+    Pooled bitmaps can be given to display_bitmap() and the other bitmap functions directly.  display_bitmap() passes them to the
+    Pybox library as they are, without converting them (see pybox.convert_bitmap()).  1-channel arrays are gray images, which
+    display_bitmap() converts to [3] for each call.
+    A bitmap must not be used after it is released, since it can be given out again by acquire().
+
+    Examples:
+                \t -pool = pybox.BitmapPool()
+                \t -while win.vsync_wait() :
+                \t -    frame = pool.copy(camera.read())                - copies the frame into a pooled bitmap
+                \t -    win.display_bitmap(0,0,frame)
+                \t -    pool.release(frame)
+    """
+    def __init__(self,max_free : int = 4) :
+        self.__max_free     = max(0,int(max_free))
+        self.__free         = {}                # (width,height,channels) -> free bitmaps of that size
+        self.__in_use       = {}                # id(bitmap) -> ((width,height,channels),bitmap)
+        self.__high_water   = 0
+        self.__closed       = False
+        self.__counts       = { "acquired" : 0, "reused" : 0, "created" : 0, "released" : 0, "dropped" : 0 }
+
+    def __repr__(self):
+        return "pybox.BitmapPool"
+
+    def __enter__(self) :
+        return self
+
+    def __exit__(self,*args) :
+        self.close()
+
+    def __len__(self) -> int :
+        "The number of free bitmaps in the pool"
+        return sum(len(free) for free in self.__free.values())
+
+    @staticmethod
+    def __create(width : int,height : int,channels : int) :
+        if channels == 3 :
+            bitmap = Bitmap(_pybox.CreateBitmap(width,height))
+            if not bitmap.is_valid() : raise ValueError("BitmapPool could not create a {0}x{1} bitmap".format(width,height))
+            if _core._shared_memory is None : numpy.asarray(bitmap)     # checks whether the library returns the bitmap's memory
+            if _core._shared_memory is not False : return bitmap
+        stride = (width*channels + 3) & ~3                      # rows padded as a Bitmap's are
+        array  = numpy.zeros((height,stride),dtype=numpy.uint8)[:,:width*channels]
+        return array.reshape(height,width,channels) if channels > 1 else array
+
+    def acquire(self,width : int,height : int,channels : int = 3) :
+        """
+        Returns a bitmap of the size given, from the pool's free bitmaps or newly created.  Its contents are whatever was left in it
+        by its last use.  Return it to the pool with release() when it is no longer needed.
+
+        Parameters
+
+        - width,height  \t -- Size of the bitmap
+        - channels      \t -- [optional] 3 for a pybox Bitmap (default), or 1 or 4 for a uint8 numpy array (see BitmapPool)
+        """
+        width,height,channels = int(width),int(height),int(channels)
+        if channels not in (1,3,4) : raise ValueError("BitmapPool bitmaps have 1, 3 or 4 channels, not {0}".format(channels))
+        if width <= 0 or height <= 0 : raise ValueError("BitmapPool can't create a {0}x{1} bitmap".format(width,height))
+        key  = (width,height,channels)
+        free = self.__free.get(key)
+        if free :
+            bitmap = free.pop()
+            self.__counts["reused"] += 1
+        else :
+            bitmap = self.__create(width,height,channels)
+            self.__counts["created"] += 1
+        self.__counts["acquired"] += 1
+        self.__in_use[id(bitmap)] = (key,bitmap)
+        self.__high_water = max(self.__high_water,len(self.__in_use))
+        return bitmap
+
+    def release(self,bitmap) -> None :
+        """
+        Returns a bitmap from acquire() or copy() to the pool.  The bitmap must not be used after it is released.
+        """
+        entry = self.__in_use.pop(id(bitmap),None)
+        if entry is None or entry[1] is not bitmap : raise ValueError("The bitmap was not acquired from this BitmapPool, or was already released")
+        self.__counts["released"] += 1
+        free = self.__free.setdefault(entry[0],[])
+        if self.__closed or len(free) >= self.__max_free :
+            self.__counts["dropped"] += 1
+        else :
+            free.append(bitmap)
+
+    @contextlib.contextmanager
+    def borrow(self,width : int,height : int,channels : int = 3) :
+        """
+        acquire() and release() in a 'with' block, i.e. 'with pool.borrow(640,480) as frame :' -- the bitmap is released when
+        the block ends.
+        """
+        bitmap = self.acquire(width,height,channels)
+        try :
+            yield bitmap
+        finally :
+            self.release(bitmap)
+
+    def copy(self,source) :
+        """
+        Acquires a bitmap the size of the source and copies the source into it -- a pooled copy_bitmap().
+
+        The source can be a pybox Bitmap, or a [height][width], [height][width][3] or [height][width][4] numpy array (values that are
+        not uint8 are clipped to 0-255).  Release the copy with release() when it is no longer needed.
+        """
+        data = numpy.asarray(source)
+        if data.ndim not in (2,3) or (data.ndim == 3 and data.shape[2] not in (1,3,4)) :
+            raise ValueError("BitmapPool.copy() needs a Bitmap, or an array of shape [height][width] or [height][width][1,3,4], not {0}".format(data.shape))
+        if data.ndim == 3 and data.shape[2] == 1 : data = data[:,:,0]
+        bitmap = self.acquire(data.shape[1],data.shape[0],1 if data.ndim == 2 else data.shape[2])
+        numpy.asarray(bitmap)[:] = data if data.dtype == numpy.uint8 else numpy.clip(data,0,255)
+        return bitmap
+
+    def clear(self) -> None :
+        "Drops the pool's free bitmaps (bitmaps in use are not affected)"
+        self.__counts["dropped"] += len(self)
+        self.__free.clear()
+
+    def close(self) -> None :
+        "Drops the pool's free bitmaps, and bitmaps in use when they are released.  This is called at the end of a 'with' block."
+        self.__closed = True
+        self.clear()
+
+    def stats(self) -> dict :
+        """
+        Returns the pool's statistics as a dictionary:
+
+        - acquired, released    \t -- Number of acquire() (and copy()) and release() calls
+        - reused, created       \t -- Bitmaps given out from the free bitmaps, and bitmaps created because none were free
+        - dropped               \t -- Bitmaps dropped from the pool because max_free bitmaps of their size were free, or by clear()
+                                \t    and close()
+        - in_use, free          \t -- Bitmaps acquired and not released, and free bitmaps in the pool
+        - high_water            \t -- Largest number of bitmaps in use at once
+        - free_bytes            \t -- Memory of the free bitmaps, with their rows padded to a multiple of 4 bytes
+        """
+        free_bytes = sum(((w*c + 3) & ~3)*h*len(free) for (w,h,c),free in self.__free.items())
+        return dict(self.__counts,in_use=len(self.__in_use),free=len(self),high_water=self.__high_water,free_bytes=free_bytes)
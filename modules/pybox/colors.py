@@ -0,0 +1,475 @@
+"""
+Pybox Colors -- PanColor, SageColor, Color, color(), RgbColorArray, get_color(), and get_hue_color().
+"""
+
+from __future__ import annotations
+
+import functools
+import numpy
+from ._core import RgbColor, _pybox
+
+def get_hue_color(deg : int) -> RgbColor :
+    """
+    Returns a bright, primary color based on the input value. 
+
+    GetHueColor() is a quick way to grab a bright color as specific value or in a random manner. 
+
+    For example, get_hue_color(0) returns a bright red, where get_hue_color(60) returns a bright magenta, and get_hue_color(120) returns a bright Blue, and so-forth.
+
+    Parameters
+
+    - deg      \t -- Input degrees, from 0-360. 
+
+    Notable Values:
+
+    - 0     \t --Red.  Same as GetHueColor(360)
+    - 60    \t --Purple / Magenta
+    - 120   \t --Blue
+    - 180   \t --Cyan
+    - 240   \t --Green
+    - 300   \t --Yellow
+
+    Returns: A pybox RgbColor object consisting of a Red, Green, and Blue value.  Colors are cached, so calling get_hue_color() again
+    with the same value returns the same RgbColor.
+    """
+    return _hue_color(deg)
+
+@functools.lru_cache(maxsize=1024)
+def _hue_color(deg) -> RgbColor :
+    color = _pybox.FromHSL(deg)
+    return RgbColor(color[0],color[1],color[2])
+
+def get_color(color : str) -> RgbColor :
+    """
+    Returns a pybox RgbColor type with the color string specified.
+
+    This function returns white if the color is not found.
+
+    Examples:
+
+    blue = get_color("blue")
+    my_color = get_color("forestgreen");
+    my_color = get_color("Pancolor:forestgreen")
+
+    Pantone and Sagebox colors can also be used symblically by importing PanColor and SageColor from pybox, such as:
+
+    my_color = SageColor.SkyBlue()
+    my_color = PanColor.ForestGreen()
+
+    """
+    c = _pybox.GetColor(color)
+    return RgbColor(c[0],c[1],c[2])
+
+class Color(RgbColor) :
+    """
+    Pybox Color -- a color resolved once with pybox.color(), for use in drawing loops.
+
+    A Color is an RgbColor, so it can be used anywhere a color is used.  Drawing with a Color skips the color-string parsing done
+    for each call that uses a string such as "MediumVioletRed" or "white(150)".
+
+    - opacity       \t -- Opacity of the color (0-255), i.e. 150 for "white(150)".  255 when no opacity was given.
+    - gradient      \t -- Second color of a gradient (i.e. "black,blue"), or None.  Used by functions that take gradients, such as cls().
+
+    The Pybox library takes colors as RgbColors or color strings, so pybox passes an opaque Color to the library as an RgbColor.  A Color
+    with an opacity or a gradient is passed as the color string it was made from, i.e. "white(150)" or "black,blue", which the library
+    parses on each call.  Color strings given to pybox functions are resolved to a Color once and cached, so they are passed to the
+    library the same way.  Strings pybox does not read exactly (i.e. "{255,255,0,128}", or names only the library knows) are passed
+    to the library as given.
+
+    As with RgbColor, Color values can't be changed -- pybox.color() returns the same Color object for the same string.
+    """
+    __slots__ = ("opacity","gradient","_packed","_library")
+
+    def __init__(self,red,green,blue,opacity : int = 255,gradient : RgbColor = None,text : str = None) :
+        super().__init__(red,green,blue)
+        object.__setattr__(self,"opacity",max(0,min(255,int(opacity))))
+        object.__setattr__(self,"gradient",gradient)
+        object.__setattr__(self,"_packed",((self.red,self.green,self.blue),self.opacity))     # the form used by the drawing functions
+        if self.opacity == 255 and gradient is None : library = RgbColor(self.red,self.green,self.blue)
+        elif text is not None : library = text
+        elif gradient is None : library = "{0},{1},{2}({3})".format(self.red,self.green,self.blue,self.opacity)
+        else : raise ValueError("A Color with a gradient is made from a color string, i.e. pybox.color(\"black,blue\")")
+        object.__setattr__(self,"_library",library)                 # the form passed to the Pybox library -- see _library_color()
+    def __repr__(self):
+        return "pybox.Color"
+    def __str__(self):
+        text = super().__str__()
+        if self.opacity != 255 : text += "({0})".format(self.opacity)
+        if self.gradient is not None : text += "," + str(self.gradient)
+        return text
+    def __eq__(self,other) :
+        if isinstance(other,Color) : return self._packed == other._packed and self.gradient == other.gradient
+        if isinstance(other,RgbColor) : return self.opacity == 255 and self.gradient is None and super().__eq__(other)
+        return NotImplemented
+    def __hash__(self) :
+        if self.opacity == 255 and self.gradient is None : return super().__hash__()           # equal to the same RgbColor
+        return hash((self._packed,self.gradient))
+    def __reduce__(self) :
+        return (Color,(self.red,self.green,self.blue,self.opacity,self.gradient,None if type(self._library) is RgbColor else self._library))
+
+@functools.lru_cache(maxsize=1024)
+def _resolved(value : str) :
+    """
+    A color string as its Color, or the string itself when pybox does not read it exactly (see _color_from_string()), which is
+    passed to the library as given.  Cached, so strings are resolved once, including those passed to the library.
+    """
+    try : return _color_from_string(value)
+    except (ValueError,TypeError) : return value
+
+def _library_color(value) :
+    """
+    A color as the Pybox library takes it: a Color or color string as an RgbColor, or as its color string when it has an opacity or a
+    gradient, or is not read by pybox.  Color strings are resolved once (see _resolved()).
+    """
+    if type(value) is str : value = _resolved(value)
+    return value._library if type(value) is Color else value
+
+def _color_rows(colors,opacity : bool = False) :
+    """
+    A list or tuple of colors with its RgbColors as (r,g,b) rows for numpy, rather than numpy reading each RgbColor's array --
+    or as (r,g,b,opacity) rows when opacity is True and a Color has an opacity.  Anything else is returned as-is.
+    """
+    if not isinstance(colors,(list,tuple)) or not any(isinstance(value,RgbColor) for value in colors) : return colors
+    if opacity and any(getattr(value,"opacity",255) != 255 for value in colors) :
+        return [(value.red,value.green,value.blue,getattr(value,"opacity",255)) if isinstance(value,RgbColor) else tuple(value) for value in colors]
+    return [(value.red,value.green,value.blue) if isinstance(value,RgbColor) else tuple(value) for value in colors]
+
+def _is_number(text : str) -> bool :
+    return text.lstrip("-").replace(".","",1).isdigit()
+
+def _parse_color(text : str) -> Color :
+    """
+    Converts one color string, i.e. "red", "PanColor:forestgreen", "0,255,0" or "white(150)", to a Color.  Raises ValueError for
+    any other form, and for names GetColor() does not know (it returns white for them).
+    """
+    given   = text.strip()
+    text    = given
+    opacity = 255
+    if text.endswith(")") and "(" in text :
+        text,_,value = text[:-1].partition("(")
+        opacity = float(value)
+    parts = [p.strip() for p in text.split(",")]
+    if len(parts) == 3 and all(_is_number(p) for p in parts) :
+        return Color(*(max(0,min(255,float(p))) for p in parts),opacity,None,given)
+    if len(parts) != 1 or not parts[0] : raise ValueError("pybox does not read the color string '{0}'".format(given))
+    rgb = _pybox.GetColor(parts[0])
+    if tuple(rgb) == (255,255,255) and parts[0].replace(" ","").lower() != "white" :
+        raise ValueError("Unknown color name '{0}'".format(parts[0]))
+    return Color(rgb[0],rgb[1],rgb[2],opacity,None,given)
+
+def _color_from_string(text : str) -> Color :
+    """
+    Converts a color string to a Color: one color (see _parse_color()), or a gradient of two, i.e. "black,blue".  Raises ValueError
+    for any other form.
+    """
+    first,comma,last = text.partition(",")
+    if comma and "," not in last and not (_is_number(first.strip()) or _is_number(last.partition("(")[0].strip())) :
+        start,end = _parse_color(first),_parse_color(last)                  # gradient, i.e. "black,blue"
+        return Color(start.red,start.green,start.blue,start.opacity,end,text.strip())
+    return _parse_color(text)
+
+def color(value) -> Color :
+    """
+    Resolves a color once, returning a pybox Color that can be used with all drawing functions without parsing the color again.
+
+    Use color() for colors used in drawing loops, so color strings are not parsed on each call.  Strings are cached, so
+    calling color() with the same string returns the same Color without parsing it again.
+
+    Parameters
+
+    - value     \t -- Color name (i.e. "cyan", "PanColor:forestgreen"), number string ("0,255,255"), either of these with an
+                    \t -opacity ("cyan(170)"), a gradient ("black,blue"), an RgbColor, or a list, tuple, or array of 3 or 4 values
+                    \t -(red, green, blue and opacity)
+
+    Raises ValueError for strings pybox does not read, such as names get_color() does not know and forms only the library reads
+    (i.e. "{255,255,0,128}") -- these can still be passed to the drawing functions as strings.
+
+    Examples:
+                \t -cyan = pybox.color("cyan(170)")
+                \t -for x,y in points : win.draw.fill_circle(x,y,5,cyan)
+    """
+    if isinstance(value,Color) : return value
+    if isinstance(value,str) :
+        value = _resolved(value)
+        if type(value) is str : raise ValueError("color() can't read '{0}' -- pass the string to the drawing functions as it is".format(value))
+        return value
+    if isinstance(value,RgbColor) : return Color(value.red,value.green,value.blue)
+    values = [int(max(0,min(255,v))) for v in value]
+    if len(values) not in (3,4) : raise ValueError("color() needs a color string, an RgbColor, or 3 or 4 values (red, green, blue and opacity)")
+    return Color(*values)
+
+def _rgb(value) -> tuple :
+    "(r,g,b) for one color of an RgbColorArray"
+    if isinstance(value,RgbColor) : return (value.red,value.green,value.blue)
+    if isinstance(value,str) :
+        value = color(value)
+        return (value.red,value.green,value.blue)
+    values = tuple(int(max(0,min(255,v))) for v in value)
+    if len(values) != 3 : raise ValueError("RgbColorArray colors must be RgbColors, color strings, or 3 values (red, green, blue)")
+    return values
+
+class RgbColorArray :
+    """
+    Pybox RgbColorArray -- a list of colors kept in one (N,3) uint8 array, for passing many colors to the drawing functions
+    (i.e. draw.set_pixels() and draw.plot_points()) without an RgbColor object for each color.
+
+    An RgbColorArray can be created from a list of colors (RgbColors, color strings, or (r,g,b) values), or from an (N,3) array.
+    Indexing returns an RgbColor, and slicing returns an RgbColorArray that shares the same array.
+
+    - array     \t -- The (N,3) uint8 array of colors.  The array can be changed directly, i.e. colors.array[:,0] = 255
+
+    The colors can also be used as an array with numpy (numpy.asarray(colors)) and memoryview() (Python 3.12 and later).
+
+    Examples:
+                \t -colors = pybox.RgbColorArray(["red","green",pybox.PanColor.SkyBlue,(255,255,0)])
+                \t -colors = pybox.RgbColorArray(numpy.random.randint(0,256,(1000,3)))
+                \t -win.draw.plot_points(points,colors)
+    """
+    __slots__ = ("__array",)
+
+    def __init__(self,colors = ()) :
+        if isinstance(colors,RgbColorArray) : array = colors.array.copy()
+        elif isinstance(colors,numpy.ndarray) and colors.dtype != object : array = colors
+        else : array = [_rgb(c) for c in colors]
+        array = numpy.asarray(array).reshape(-1,3)
+        self.__array = array if array.dtype == numpy.uint8 else numpy.clip(array,0,255).astype(numpy.uint8)
+
+    def __repr__(self):
+        return "pybox.RgbColorArray"
+    def __str__(self):
+        return "[" + ", ".join(str(c) for c in self) + "]"
+
+    @property
+    def array(self) -> numpy.ndarray :
+        return self.__array
+
+    def __len__(self) -> int :
+        return len(self.__array)
+    def __iter__(self) :
+        for r,g,b in self.__array.tolist() : yield RgbColor(r,g,b)
+    def __getitem__(self,index) :
+        values = self.__array[index]
+        if values.ndim == 1 : return RgbColor(*values.tolist())
+        colors = RgbColorArray.__new__(RgbColorArray)                  # slices share the array
+        colors.__array = values
+        return colors
+    def __setitem__(self,index,value) :
+        self.__array[index] = _rgb(value)
+    def __array__(self,dtype=None,copy=None) -> numpy.ndarray :
+        return self.__array if dtype is None else self.__array.astype(dtype)
+    def __buffer__(self,flags) -> memoryview :                              # PEP 688 (Python 3.12)
+        return memoryview(self.__array)
+
+class PanColor :
+    """
+    Pantone colors, i.e. PanColor.ForestGreen.  Each color is a constant RgbColor (PanColor.ForestGreen() also returns it).
+    All of the colors are in the PAN_COLORS table, in the order of PAN_COLOR_NAMES.
+    """
+    AliceBlue              = RgbColor(0xF0,0xF8,0xFF)
+    AntiqueWhite           = RgbColor(0xFA,0xEB,0xD7)
+    Aqua                   = RgbColor(0x00,0xFF,0xFF)
+    Aquamarine             = RgbColor(0x7F,0xFF,0xD4)
+    Azure                  = RgbColor(0xF0,0xFF,0xFF)
+    Beige                  = RgbColor(0xF5,0xF5,0xDC)
+    Bisque                 = RgbColor(0xFF,0xE4,0xC4)
+    Black                  = RgbColor(0x00,0x00,0x00)
+    BlanchedAlmond         = RgbColor(0xFF,0xEB,0xCD)
+    Blue                   = RgbColor(0x00,0x00,0xFF)
+    BlueViolet             = RgbColor(0x8A,0x2B,0xE2)
+    Brown                  = RgbColor(0xA5,0x2A,0x2A)
+    BurlyWood              = RgbColor(0xDE,0xB8,0x87)
+    CadetBlue              = RgbColor(0x5F,0x9E,0xA0)
+    Chartreuse             = RgbColor(0x7F,0xFF,0x00)
+    Chocolate              = RgbColor(0xD2,0x69,0x1E)
+    Coral                  = RgbColor(0xFF,0x7F,0x50)
+    CornflowerBlue         = RgbColor(0x64,0x95,0xED)
+    Cornsilk               = RgbColor(0xFF,0xF8,0xDC)
+    Crimson                = RgbColor(0xDC,0x14,0x3C)
+    Cyan                   = RgbColor(0x00,0xFF,0xFF)
+    DarkBlue               = RgbColor(0x00,0x00,0x8B)
+    DarkCyan               = RgbColor(0x00,0x8B,0x8B)
+    DarkGoldenrod          = RgbColor(0xB8,0x86,0x0B)
+    DarkGray               = RgbColor(0xA9,0xA9,0xA9)
+    DarkGreen              = RgbColor(0x00,0x64,0x00)
+    DarkKhaki              = RgbColor(0xBD,0xB7,0x6B)
+    DarkMagenta            = RgbColor(0x8B,0x00,0x8B)
+    DarkOliveGreen         = RgbColor(0x55,0x6B,0x2F)
+    DarkOrange             = RgbColor(0xFF,0x8C,0x00)
+    DarkOrchid             = RgbColor(0x99,0x32,0xCC)
+    DarkRed                = RgbColor(0x8B,0x00,0x00)
+    DarkSalmon             = RgbColor(0xE9,0x96,0x7A)
+    DarkSeaGreen           = RgbColor(0x8F,0xBC,0x8B)
+    DarkSlateBlue          = RgbColor(0x48,0x3D,0x8B)
+    DarkSlateGray          = RgbColor(0x2F,0x4F,0x4F)
+    DarkTurquoise          = RgbColor(0x00,0xCE,0xD1)
+    DarkViolet             = RgbColor(0x94,0x00,0xD3)
+    DeepPink               = RgbColor(0xFF,0x14,0x93)
+    DeepSkyBlue            = RgbColor(0x00,0xBF,0xFF)
+    DimGray                = RgbColor(0x69,0x69,0x69)
+    DodgerBlue             = RgbColor(0x1E,0x90,0xFF)
+    Firebrick              = RgbColor(0xB2,0x22,0x22)
+    FloralWhite            = RgbColor(0xFF,0xFA,0xF0)
+    ForestGreen            = RgbColor(0x22,0x8B,0x22)
+    Fuchsia                = RgbColor(0xFF,0x00,0xFF)
+    Gainsboro              = RgbColor(0xDC,0xDC,0xDC)
+    GhostWhite             = RgbColor(0xF8,0xF8,0xFF)
+    Gold                   = RgbColor(0xFF,0xD7,0x00)
+    Goldenrod              = RgbColor(0xDA,0xA5,0x20)
+    Gray                   = RgbColor(0x80,0x80,0x80)
+    Green                  = RgbColor(0x00,0x80,0x00)
+    GreenYellow            = RgbColor(0xAD,0xFF,0x2F)
+    Honeydew               = RgbColor(0xF0,0xFF,0xF0)
+    HotPink                = RgbColor(0xFF,0x69,0xB4)
+    IndianRed              = RgbColor(0xCD,0x5C,0x5C)
+    Indigo                 = RgbColor(0x4B,0x00,0x82)
+    Ivory                  = RgbColor(0xFF,0xFF,0xF0)
+    Khaki                  = RgbColor(0xF0,0xE6,0x8C)
+    Lavender               = RgbColor(0xE6,0xE6,0xFA)
+    LavenderBlush          = RgbColor(0xFF,0xF0,0xF5)
+    LawnGreen              = RgbColor(0x7C,0xFC,0x00)
+    LemonChiffon           = RgbColor(0xFF,0xFA,0xCD)
+    LightBlue              = RgbColor(0xAD,0xD8,0xE6)
+    LightCoral             = RgbColor(0xF0,0x80,0x80)
+    LightCyan              = RgbColor(0xE0,0xFF,0xFF)
+    LightGoldenrodYellow   = RgbColor(0xFA,0xFA,0xD2)
+    LightGray              = RgbColor(0xD3,0xD3,0xD3)
+    LightGreen             = RgbColor(0x90,0xEE,0x90)
+    LightPink              = RgbColor(0xFF,0xB6,0xC1)
+    LightSalmon            = RgbColor(0xFF,0xA0,0x7A)
+    LightSeaGreen          = RgbColor(0x20,0xB2,0xAA)
+    LightSkyBlue           = RgbColor(0x87,0xCE,0xFA)
+    LightSlateGray         = RgbColor(0x77,0x88,0x99)
+    LightSteelBlue         = RgbColor(0xB0,0xC4,0xDE)
+    LightYellow            = RgbColor(0xFF,0xFF,0xE0)
+    Lime                   = RgbColor(0x00,0xFF,0x00)
+    LimeGreen              = RgbColor(0x32,0xCD,0x32)
+    Linen                  = RgbColor(0xFA,0xF0,0xE6)
+    Magenta                = RgbColor(0xFF,0x00,0xFF)
+    Maroon                 = RgbColor(0x80,0x00,0x00)
+    MediumAquamarine       = RgbColor(0x66,0xCD,0xAA)
+    MediumBlue             = RgbColor(0x00,0x00,0xCD)
+    MediumOrchid           = RgbColor(0xBA,0x55,0xD3)
+    MediumPurple           = RgbColor(0x93,0x70,0xDB)
+    MediumSeaGreen         = RgbColor(0x3C,0xB3,0x71)
+    MediumSlateBlue        = RgbColor(0x7B,0x68,0xEE)
+    MediumSpringGreen      = RgbColor(0x00,0xFA,0x9A)
+    MediumTurquoise        = RgbColor(0x48,0xD1,0xCC)
+    MediumVioletRed        = RgbColor(0xC7,0x15,0x85)
+    MidnightBlue           = RgbColor(0x19,0x19,0x70)
+    MintCream              = RgbColor(0xF5,0xFF,0xFA)
+    MistyRose              = RgbColor(0xFF,0xE4,0xE1)
+    Moccasin               = RgbColor(0xFF,0xE4,0xB5)
+    NavajoWhite            = RgbColor(0xFF,0xDE,0xAD)
+    Navy                   = RgbColor(0x00,0x00,0x80)
+    OldLace                = RgbColor(0xFD,0xF5,0xE6)
+    Olive                  = RgbColor(0x80,0x80,0x00)
+    OliveDrab              = RgbColor(0x6B,0x8E,0x23)
+    Orange                 = RgbColor(0xFF,0xA5,0x00)
+    OrangeRed              = RgbColor(0xFF,0x45,0x00)
+    Orchid                 = RgbColor(0xDA,0x70,0xD6)
+    PaleGoldenrod          = RgbColor(0xEE,0xE8,0xAA)
+    PaleGreen              = RgbColor(0x98,0xFB,0x98)
+    PaleTurquoise          = RgbColor(0xAF,0xEE,0xEE)
+    PaleVioletRed          = RgbColor(0xDB,0x70,0x93)
+    PapayaWhip             = RgbColor(0xFF,0xEF,0xD5)
+    PeachPuff              = RgbColor(0xFF,0xDA,0xB9)
+    Peru                   = RgbColor(0xCD,0x85,0x3F)
+    Pink                   = RgbColor(0xFF,0xC0,0xCB)
+    Plum                   = RgbColor(0xDD,0xA0,0xDD)
+    PowderBlue             = RgbColor(0xB0,0xE0,0xE6)
+    Purple                 = RgbColor(0x80,0x00,0x80)
+    Red                    = RgbColor(0xFF,0x00,0x00)
+    RosyBrown              = RgbColor(0xBC,0x8F,0x8F)
+    RoyalBlue              = RgbColor(0x41,0x69,0xE1)
+    SaddleBrown            = RgbColor(0x8B,0x45,0x13)
+    Salmon                 = RgbColor(0xFA,0x80,0x72)
+    SandyBrown             = RgbColor(0xF4,0xA4,0x60)
+    SeaGreen               = RgbColor(0x2E,0x8B,0x57)
+    SeaShell               = RgbColor(0xFF,0xF5,0xEE)
+    Sienna                 = RgbColor(0xA0,0x52,0x2D)
+    Silver                 = RgbColor(0xC0,0xC0,0xC0)
+    SkyBlue                = RgbColor(0x87,0xCE,0xEB)
+    SlateBlue              = RgbColor(0x6A,0x5A,0xCD)
+    SlateGray              = RgbColor(0x70,0x80,0x90)
+    Snow                   = RgbColor(0xFF,0xFA,0xFA)
+    SpringGreen            = RgbColor(0x00,0xFF,0x7F)
+    SteelBlue              = RgbColor(0x46,0x82,0xB4)
+    Tan                    = RgbColor(0xD2,0xB4,0x8C)
+    Teal                   = RgbColor(0x00,0x80,0x80)
+    Thistle                = RgbColor(0xD8,0xBF,0xD8)
+    Tomato                 = RgbColor(0xFF,0x63,0x47)
+    Turquoise              = RgbColor(0x40,0xE0,0xD0)
+    Violet                 = RgbColor(0xEE,0x82,0xEE)
+    Wheat                  = RgbColor(0xF5,0xDE,0xB3)
+    White                  = RgbColor(0xFF,0xFF,0xFF)
+    WhiteSmoke             = RgbColor(0xF5,0xF5,0xF5)
+    Yellow                 = RgbColor(0xFF,0xFF,0x00)
+    YellowGreen            = RgbColor(0x9A,0xCD,0x32)
+class SageColor :
+    """
+    Sagebox colors, i.e. SageColor.SkyBlue.  Each color is a constant RgbColor (SageColor.SkyBlue() also returns it).
+    All of the colors are in the SAGE_COLORS table, in the order of SAGE_COLOR_NAMES.
+    """
+    DefaultBgColor                    = RgbColor(20,40,121)
+    DefaultFgColor                    = RgbColor(255,255,255)
+    SliderTextColor                   = RgbColor(128,128,128)
+    Green                             = RgbColor(0,255,0)
+    DarkGreen                         = RgbColor(0,128,0)
+    LightGreen                        = RgbColor(128,255,128)
+    Blue                              = RgbColor(0,0,255)
+    DarkBlue                          = RgbColor(0,0,92)
+    MidBlue                           = RgbColor(0,0,128)
+    LightBlue                         = RgbColor(128,128,255)
+    SkyBlue                           = RgbColor(40,145,255)
+    SkyBlueDark                       = RgbColor(0,30,128)
+    SkyBlueLight                      = RgbColor(75,165,255)
+    Cyan                              = RgbColor(0,255,255)
+    Red                               = RgbColor(255,0,0)
+    LightRed                          = RgbColor(255,128,128)
+    LightYellow                       = RgbColor(255,255,128)
+    Yellow                            = RgbColor(255,255,0)
+    Magenta                           = RgbColor(255,0,255)
+    MediumMagenta                     = RgbColor(255,92,255)
+    LightMagenta                      = RgbColor(255,128,255)
+    Purple                            = RgbColor(255,0,255)
+    LightPurple                       = RgbColor(255,128,255)
+    MediumPurple                      = RgbColor(255,92,255)
+    White                             = RgbColor(255,255,255)
+    Gray172                           = RgbColor(172,172,172)
+    Gray192                           = RgbColor(192,192,192)
+    Gray220                           = RgbColor(220,220,220)
+    Gray128                           = RgbColor(128,128,128)
+    Gray32                            = RgbColor(32,32,32)
+    Gray42                            = RgbColor(42,42,42)
+    Gray64                            = RgbColor(64,64,64)
+    Gray72                            = RgbColor(72,72,72)
+    Gray92                            = RgbColor(92,92,92)
+    Black                             = RgbColor(0,0,0)
+    LightGray                         = RgbColor(200,200,200)
+    LightGrey                         = RgbColor(200,200,200)
+    MidGray                           = RgbColor(64,64,64)
+    MidGrey                           = RgbColor(64,64,64)
+    DarkGray                          = RgbColor(32,32,32)
+    DarkGrey                          = RgbColor(32,32,32)
+    Gray                              = RgbColor(128,128,128)
+    Grey                              = RgbColor(128,128,128)
+    NearWhite                         = RgbColor(220,220,220)
+    ButtonTextColorNormal             = RgbColor(220,220,220)
+    ButtonTextColorHighlighted        = RgbColor(255,255,255)
+    ButtonTextColorPressed            = RgbColor(255,255,255)
+    ButtonTextColorDisabled           = RgbColor(170,170,170)
+    CheckboxTextColorNormal           = RgbColor(220,220,220)
+    CheckboxTextColorHighlighted      = RgbColor(255,255,255)
+    CheckboxTextColorChecked          = RgbColor(220,220,220)
+    CheckboxTextColorCheckedHigh      = RgbColor(220,220,220)
+    CheckboxTextColorDisabled         = RgbColor(170,170,170)
+
+def _palette(palette) :
+    "Returns (names,(N,3) uint8 table) for the colors of a palette class"
+    names = tuple(name for name,value in vars(palette).items() if type(value) is RgbColor)
+    table = numpy.array([tuple(getattr(palette,name)) for name in names],dtype=numpy.uint8)
+    table.flags.writeable = False
+    return names,table
+
+PAN_COLOR_NAMES,PAN_COLORS      = _palette(PanColor)
+SAGE_COLOR_NAMES,SAGE_COLORS    = _palette(SageColor)
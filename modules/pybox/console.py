@@ -0,0 +1,254 @@
+"""
+Pybox Console and Debug Output -- conio, debug, and the debug_write() functions.
+"""
+
+from __future__ import annotations
+
+from ._core import _pybox
+from .colors import _library_color
+
+class conio :
+    """
+    Console Class
+
+    This class contains functions to output and input to/from the console mode window.
+
+    Functions allow you to write out in color to the console window and to also input qualified 
+    input.
+    """
+    def write(*args) : 
+        """
+        Write out to the console window.  This is the same as print() except that colors and formatting may be used: 
+
+        - Use {color} to start a color and {} to end the color. Example: pybox.console.Write("This is {red}in the color red{}")
+        - You can use the first lett of the color, and do not need the closing {} if its at the end of the line:
+            Example: pybox.console.Write("This is {r}in the color red")
+        - Multiple colors can be used. Example: pybox.console.Write("This {c}is in cyan{} and this {r}is in the color red")
+        - Use "{x=<number>}" to set a column (does not use closing {}):
+            Example: pybox.console.Write("This {x=40}is at column 40")
+        - Use "{bg=<color>"} to set the background color: Example: pybox.console.Write("This {bg=r}background{} is in red") 
+        - Use "{lbg=<color>} at the begining of the line to make the entire line the background color:
+            Example: pybox.console.Write("{lbg=blue}This entire line is in a blue background")
+
+        Other commands:
+
+        - {u} -> Underline
+        - {r} -> Reverse (reverses color and background)
+        - {vl}, {vr}, {ht}, {hb} : Vertical left line, vertical left line, horizontal top line, horizontal bottom line
+                -> These can be used to make a box
+        Available Colors: Black, White, Gray, red, green, yellow, blue, cyan, purple/magenta,
+                          darkred, darkgreen, darkyellow, darkblue, darkcyan, darkpurple/darkmagenta
+
+        Abbreviation for Colors: blk (black), w, gry (gray), r, g (green), y, b, c, p, m (magenta), db, dr, dy, db, dc, dp, dm (dark magenta)
+
+        Examples: 
+                \t -pybox.conio.Write("This {r}Text is in red{} and {b}this text is in blue")      \t - - the first {} ends the red. The last {} is not needed
+                \t -pybox.conio.Write("This text {w}{bg=b}is in a blue background with bright white text.") 
+
+        - Important Note:  When using background color, underlines, boxes, etc., Windows can change the rest of the line to the background color if the window size is changed.
+            \t - you can end the line with {_} to end the block. "{bg=b}This is in blue{_}" vs. "{bg=b}This is in blue{}".  This will prevent this issue with Windows. 
+        """
+        _pybox.ConsoleWrite(*args)
+
+#    def Box(text : str,fg : str = None,bg : str = None) -> bool :
+#        return _pybox.ConsoleBox(text,fg,bg)
+
+    def get_integer(text = None,*args,**kwargs) -> int :
+        """
+        Get an Integer from the keyboard.  This can be qualified with a range with a default.
+
+        Example: MyInteger = pybox.console.get_integer("Enter a number: ")
+
+        Options and Keywords 
+
+        - use Range option to set a range:
+            pybox.console.get_integer("Enter a value from 1-10",range=(1,10))
+            pybox.console.get_integer("Enter a value from 1-10,opt.range(1,10)) also works.
+
+            When the value is out of range, the user will be asked again to enter the value.
+            If the user presses return, the minimum value is returned if there is no Default value
+
+        - use Default option to set a default (for an empty return)
+            pybox.console.get_integer("Enter a value from 1-10",opt.range(1,10),opt.default(5))
+
+            note: You can set a default out of the range (when not using "NoCancel" option) to determine the user entered a blank line
+                Example: pybox.console.get_integer("Enter a value from 1-10",opt.range(1,10),opt.default(-1))
+                    --> Check -1 as a return value to determine user pressed return and did not enter a number.
+
+        - use NoCancel option to disallow blank lines.  The user will be repeatedly asked for the number until a valid number is entered.
+            pybox.console.get_integer("Enter a number from 1-10",range=(1,10),nocancel)
+
+        - Colors may also be used to differentiate the question from the number:
+            Example: pybox.console.get_integer("{y}Enter a number from 1-10")
+                This will print the question in yellow (note that the closing "{} was not needed).
+        """
+        return _pybox.ConsoleGetNumber(text,*args,**kwargs)
+
+    def get_float(text = None,*args,**kwargs) -> float :
+        """
+        Get a floating-point value from the keyboard.  This can be qualified with a range with a default.
+
+        Example: MyFloat = pybox.console.get_float("Enter a number: ")
+
+        Options and Keywords
+
+        - use Range option to set a range:
+            pybox.console.get_float("Enter a value from 1.5-10",range=(1.5,10.5))
+            pybox.console.get_float("Enter a value from 1.5-10,iopt.range(1.5,10.5)') also works.
+
+            When the value is out of range, the user will be asked again to enter the value.
+            If the user presses return, the minimum value is returned if there is no Default value
+
+        - use Default option to set a default (for an empty return)
+            pybox.console.get_float("Enter a value from 1.5-10.5",opt.range(1.5,10.5),opt.default(5.7))
+
+            note: You can set a default out of the range (when not using "NoCancel" option) to determine the user entered a blank line
+                Example: pybox.console.get_float("Enter a value from 1.5-10.5",range=(1.5,10.5),default = -1)
+                    --> Check -1 as a return value to determine user pressed return and did not enter a number.
+
+        - use NoCancel() option to disallow blank lines.  The user will be repeatedly asked for the number until a valid number is entered.
+            pybox.console.get_float("Enter a number from 1-10",range=(1.5,10.5),nocancel)
+
+        - Colors may also be used to differentiate the question from the number:
+            Example: pybox.console.get_float("{y}Enter a number from 1.5-10.5")
+                This will print the question in yellow (note that the closing "{} was not needed).
+        """        
+        return _pybox.ConsoleGetFloat(text,*args,**kwargs)
+
+    def set_fg_color(color) -> bool :
+        """
+        Sets the foreground/text color of the text written to the window.
+
+        This only affects subsequent text written to the window with the write() or other window write functions.
+        This will not affect any current display on the window
+       
+        Note: set_fg_color() and set_text_color() are the same function.
+        
+        Parameters
+
+        - color         \t -- Foreground/Text color to set next output 
+        
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+        Window.set_fg_color("red")                      \t -- Sets the window's text color to the color red
+        Window.set_fg_color(SageColor.Red())            \t -- Sets the window's text color to red, also
+        Window.set_fg_color(PanColor.ForestGreen())     \t -- Sets the window's text color to PanColor.ForestGreen
+        Window.set_fg_color(MyColor)                    \t -- Sets the window's text color to a defined "MyColor", such as MyColor = pybox.RgbColor(0,255,0)
+        """        
+        return _pybox.ConsoleSetFgColor(_library_color(color))
+class debug :
+    """
+    Pybox/Sagebug debug functions provide a number of functions via the Sagebox Process Window.
+
+    To show the process window, move the mouse to the upper-right-hand part of the screen and hold it there for 
+    .25 seconds.
+
+    The Sagebox Process Window will appear, where you can write debug information.
+
+    You can also terminate the program by pressing the "Terminate program" button, in case the program is unresponsive or hidden.
+    In Python, this is really never an issue, but it still provides a nice way to terminate the program quickly.
+    """
+    def write(*args) :
+        """
+        Write a message out to the sagebox debug window. The SageboxDebug window is in the Sagebox Process Window.
+
+        When writing to the debug window, the debug window will come up automatically the first time it is written to.
+        The debug window can be manually hidden (it will not come up automatically after that)
+
+        The Sagebox debug window is a good place to put debug information so it won't clutter up the console window.
+        Each line has a line number and you can scroll through the debug output. 
+
+        --> To hide and show the debug/Sagebox process window, move the mouse to the upper-right of the monitor and hold for
+            1/4 of a second.
+
+        As with the console output functions, you can use colors to set the color of the output:
+
+            - Use {color} to start a color and {} to end the color. 
+                Example: pybox.debug.Write("This is {red}in the color red{}")
+            - You can use the first lett of the color, and do not need the closing {} if its at the end of the line:
+                Example: pybox.debug.Write("This is {r}in the color red")
+            - Multiple colors can be used.
+                \t -Example: pybox.debug.Write("This {c}is in cyan{} and this {r}is in the color red")
+            - "{x=<number>}" to set a column (does not use closing {}): Example: pybox.debug.Write("This {x=40}is at column 40")
+            - "{bg=<color>"} to set the background color: Example: pybox.debug.Write("This {bg=r}background{} is in red") 
+            - "{lbg=<color>} at the begining of the line to make the entire line the background color: 
+                \t -Example: pybox.debug.Write("{lbg=blue}This entire line is in a blue background")
+            - {bold} or {bld} for bold
+            - {italic} or {i} for italic
+            - {bolditalic} or {bi} for bold and italic
+            - {div} for dividing line (i.e. DebugWrite("{div}\n") 
+
+            Available Colors: Black, White, Gray, red, green, yellow, blue, cyan, purple/magenta,
+
+            Abbreviation for Colors: w (white), r, g, y, b, c, p, m (magenta)
+        """
+        _pybox.DebugWrite(*args)
+    def show(show : bool) -> bool :
+        """
+        """
+        _pybox.DebugShow(show)
+    def hide(hide : bool) -> bool :
+        """
+        """
+        _pybox.DebugShow(not hide)
+
+def debug_write(string : str) -> bool :
+    """
+    Write a message out to the sagebox debug window. The SageboxDebug window is in the Sagebox Process Window.
+
+    When writing to the debug window, the debug window will come up automatically the first time it is written to.
+    The debug window can be manually hidden (it will not come up automatically after that)
+
+    The Sagebox debug window is a good place to put debug information so it won't clutter up the console window.
+    Each line has a line number and you can scroll through the debug output. 
+
+    --> To hide and show the debug/Sagebox process window, move the mouse to the upper-right of the monitor and hold for
+        1/4 of a second.
+
+    As with the console output functions, you can use colors to set the color of the output:
+
+        - Use {color} to start a color and {} to end the color. 
+            Example: pybox.DebugWrite("This is {red}in the color red{}")
+        - You can use the first lett of the color, and do not need the closing {} if its at the end of the line:
+            Example: pybox.DebugWrite("This is {r}in the color red")
+        - Multiple colors can be used.
+            \t -Example: pybox.DebugWrite("This {c}is in cyan{} and this {r}is in the color red")
+        - "{x=<number>}" to set a column (does not use closing {}): Example: pybox.debug.Write("This {x=40}is at column 40")
+        - "{bg=<color>"} to set the background color: Example: pybox.debug.Write("This {bg=r}background{} is in red") 
+        - "{lbg=<color>} at the begining of the line to make the entire line the background color: 
+            \t -Example: pybox.debug.Write("{lbg=blue}This entire line is in a blue background")
+        - {bold} or {bld} for bold
+        - {italic} or {i} for italic
+        - {bolditalic} or {bi} for bold and italic
+        - {div} for dividing line (i.e. DebugWrite("{div}\n") 
+
+        Available Colors: Black, White, Gray, red, green, yellow, blue, cyan, purple/magenta,
+
+        Abbreviation for Colors: w (white), r, g, y, b, c, p, m (magenta)
+    """
+    return _pybox.DebugWrite(string)
+def debug_show(show : bool) -> bool :
+    """
+    Shows the pybox Process Window. 
+
+    This window can be used to terminate a program and is a good place to put debug
+    information.
+
+    use debug.write() or debug_write() to send text to the debug window.
+    """
+    _pybox.DebugShow(show)
+def debug_hide(hide : bool) -> bool :
+    """
+    Hides the pybox Process Window. 
+
+    This window can be used to terminate a program and is a good place to put debug
+    information.
+
+    use debug.write() or debug_write() to send text to the debug window.
+    """
+    _pybox.DebugShow(not hide)
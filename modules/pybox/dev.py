@@ -0,0 +1,869 @@
+"""
+Pybox Dev Controls -- DevControl and the dev_ functions that create controls in the Dev Window.
+"""
+
+from __future__ import annotations
+
+from ._core import _pybox
+from .colors import _library_color
+from .options import opt
+
+    
+class DevControl :
+    "--comment--"
+    def __init__(self,_id) : self.id = _id
+
+    def set_config(*args,**kwargs) -> bool :
+        """
+        Sets various configuration values for the Dev Window.  Note: autoclose, closeable, and topbar only work for Dev Window that are separate windows
+        (i.e. not embedded in QuickForm or other windows)
+
+        Most values can be set through various Dev Window function.  set_config() is a way to set multiple options at 
+        once, as well as setting values that don't have a specific functions.
+
+        set_config() works with the following keywords:
+
+        - bgcolor         \t -Sets the background color of the dev window.  This can be a single color or a string with one or two colors (for a gradient)
+                          \t -note: this should be used before any controls are placed in the dev window. Also see set_bg_color() for more options
+
+        - bgbitmap        \t -Sets the bitmap of the dev window background.  This can be a pybox Cbitmap type, and bitmap array (i.e. opencv, etc.),
+                          \t -or a text string with the location of the bitmap.
+                          \t -note: this should be used before any controls are placed in the dev window. Also see set_bgbitmap() for more options.
+
+        - ypos            \t -Sets the position of the next control.  This can be used to set the location of the first control when setting bgbitmap when the bitmap contains a top header.
+
+        - autoclose_x     \t -Sets the auto close 'x' button on or off.  By default, an 'x' is placed on the window to allow the user to close it.
+                          \t -autoclose_x=false will turn this 'x' off and also prevent the 'x' from appearing when the Dev Window is the only window open during wait_event() calls.
+                          \t -see the 'allowclose' option to set the 'x' visibility in other ways
+
+        - autoclose       \t -When set to true, this will cause the Dev Window to close automatically when no other non-dev (or other primary) windows are open.
+                          \t - otherwise, when set to false (default) the Dev Window will remain open when other windows are closed (with an 'x' placed for closure).
+
+        - closeable       \t -Sets the 'x' button on or off when multiple windows are open.  By default, the 'x' appears in all Dev Windows to allow the user
+                          \t -to close it, at which time the window will automatically close. closeable=True will force the 'x' on the window.
+
+                          \t -setting closeable=false will remove the 'x' when there are non-Dev windows open. the 'x' will appear when no other windows are open
+                          \t -to allow the user to close the window. See 'autoclose_x' option to disable the 'x' permanently.
+
+        - topbar          \t -Turns the topbar off (when false). When topbar=false, the top title bar will not appear in the dev window.
+                            \t -this is used for setting the background color and bgbitmap to help personalize the dev window.
+                             \t -note --> topbar must be used before the bgbitmap or bgcolor option, otherwise it will have no effect.
+                           \t -see set_bgbitmap() and set_bg_color() for more information
+        """
+        return _pybox.DevControlSetConfig(*args,**kwargs)
+
+    def closed(self,add_closebutton : bool = False) -> bool :
+        """
+        Returns True if the dev window was closed.  This is not an event and will return True continuously once the dev window is closed.
+
+        Note: When closed() is called, an 'x' will be added to the upper-right part of the window.
+
+        Parameters:
+
+            - add_closebutton      \t -- When 'true', a close button will be added as a control at the bottom of the dev window
+        """
+        return _pybox.DevControlWindowClosed(self.id,add_closebutton)
+
+    def set_nexty(self,y : int) -> bool :
+        """
+        Sets the Y position in the Dev Window for the next control.
+        This can be useful in setting a top header bitmap, or moving controls
+        down when setting a header bitmap. 
+
+        As with setting the background color or bitmap, set_nexty() should be used
+        before any controls are added to the dev window.
+        """
+        return _pybox.DevControlSetNextY(self.id,y)
+
+    def set_bg_color(self,color1,color2 = None,display_bar : bool = True) -> bool :
+        """
+        Sets the background color of the dev window. 
+
+        Note: This only works if it is called before any controls are added to the Dev Window. 
+
+        Parameters:
+
+            - color1      \t -- Color of the background 
+            - color2      \t -- [optional] When given, this sets a gradient from color 1 to color 2
+            - display_bar \t -- [optional] When set to True (default) the top display bar is kept and the bitmap is displayed underneath
+                          \t - when set to False, the top display bar is removed and the bitmap starts at the top of the window.
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+            my_dev.set_bg_color("black"); 
+            my_dev.set_bg_color("black","blue");
+            my_dev.set_bg_color(PanColor.ForestGreen())
+
+        """
+        return _pybox.DevControlSetBgColor(self.id,_library_color(color1),_library_color(color2),display_bar)
+
+    def set_bgbitmap(self,bitmap,display_bar : bool = True,*args,**kwargs) -> bool :
+        """
+        Sets the background bitmap of the Dev Window
+
+        Note: This only works if it is called before any controls are added to the Dev Window. 
+
+        This bitmap should cover the width and height the Dev Window will be at its maximum.
+        Dev Windows grow vertically when controls are added, and the bitmap should cover this space.
+
+        Parameters:
+
+            - bitmap      \t -- The bitmap to display.  This can be a path to the bitmap or a loaded bitmap.
+            - display_bar \t -- [optional] When set to True (default) the top display bar is kept and the bitmap is displayed underneath
+
+        Keywords and other options
+
+            - pady      \t -- opt.pady() or pady=True can be used to set the position of the next control relative to the bottom of the bitmap.
+                        \t - For example, pady(20) will add 20 pixels to the bottom of the bitmap for the next control
+
+                        This can be useful when a background bitmap has a header, so the first control can start underneath it.
+
+        Examples:
+
+            my_dev.set_bgbitmap("c:\\bitmaps\\mybitmap.jpg")
+            my_dev.set_bgbitmap(MyBitmap,pady=(20))
+
+        """
+        return _pybox.DevControlSetBgBitmap(self.id,bitmap,display_bar,*args,**kwargs)
+
+    def new_bitmap(self,bitmap,text = None,*args,**kwargs) -> bool :
+        """
+        Puts a bitmap in the dev window at the current place for the next control. 
+
+        The bitmap can contain a transparency (as a .png or 32-bit bitmap) to blend into the background.
+
+        Bitmaps in the Dev Window are meant to be either icons or header-style bitmaps, and are usually small vertically to keep
+        space for the controls.
+
+        Parameters:
+
+            - bitmap      \t -- The bitmap to display.  This can be a path to the bitmap or a loaded bitmap.
+            - text        \t -- [optional] Text to place directly to the right of the bitmap.  Pybox options can be used
+                            \t - to set the font and text color
+
+                            The center of the text is aligned to be at the center vertical center of the bitmap. 
+
+        Keywords and other options
+
+            - font,textcolor       \t -- These can set the font and color of the text. i.e. opt.textcolor("green") or opt.font(20)
+            - pady                 \t -- this will add to the Y value of the next control relative to the bottom of the bitmap or text
+                                    \t - (whichever hangs over more).  For example, pady(20) will add 20 pixels to the start of the next control.
+
+                                    \t -This can be useful when the bitmap (and text) is a header, to add space before the next control starts
+
+        Examples:
+
+            my_dev.new_bitmap("c:\\bitmaps\\mybitmap.png")
+            my_dev.new_bitmap("c:\\bitmaps\\mybitmap.png"," Project Controls")      -- note the space to add space between the image and text
+            my_dev.new_bitmap("c:\\bitmaps\\mybitmap.png"," Project Controls",font=20,textcolor=green)
+        """
+        return _pybox.DevControlBitmap(self.id,bitmap,text,*args,**kwargs)
+
+    def new_text(self,text = None,*args,**kwargs)          : 
+        """
+        Create a text widget int the Dev Window.    This is the same type of Text Widget that can be created in a regular
+        window with window.TextWidget(), but automatically placed and sized in the Dev Window. 
+
+        Since the Text Widget is automatically placed and sized in the window, fewer options are needed. 
+
+        new_text() returns a CTextWidget object where you can write out to the text widget.
+
+        The Text Widget can be used to create static or dynamic text of any font size in the Dev Window.
+        Parameters:
+
+        - text          \t -- [optional] Sets the text of the widget.  This can be set later with textwidget.Write()
+                        \t - When text is entered, the text widget is created to the width of the text.  Use the width() parameter to set a width or pad
+                        \t - the text with spaces to reserve width.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - TextColor         \t - Sets the text color of the widget (default is current window text color).  Same as opt.fgcolor()
+        - Font              \t - Sets the font of the text in the text widget
+        - TextCenter        \t - Centers the text inside of the widget (which can be longer than the text itself).
+                                \t - Use TextCenterX() and CenterX() together to make sure text is centered in the window. This is only needed if the Width of the
+                                \t - Text Widget and the text have been specificed separately.
+
+
+        Examples:   
+                    \t -my_dev.new_text(This is a text Widget)
+                    \t -my_dev.new_text(This is a text Widget",font=20,textcolor="Yellow")
+        """        
+        from .widgets import CTextWidget
+        return CTextWidget(_pybox.DevControlTextWidget(self.id,text,*args,**kwargs))
+
+    def new_slider(self,title : str = None,*args,**kwargs) : 
+        """
+        Creates a slider in the Dev Window. The slider is automatically placed.
+
+        A Slider class object is returned where the slider can be accessed and controlled. 
+
+        Parameters:
+
+        - title     \t -- Sets the title of the Slider
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Range             \t -- Set the range of the slider.  The default range is (1,100)          
+        - Default           \t -- Set the default value of the slider.  The edfault is (0)
+        - TextColor         \t -- Sets the color of the label of the slider.
+        - Style("small")    \t -- Sets a smaller slider handle
+
+        Examples:       \t -MyDevWindow.new_slider("This is a slider")
+                        \t -MyDevWindow.new_slider("This is a slider",range=100,500,default=200)
+                        \t -MyDevWindow.new_slider("This is a slider",textcolor="Yellow",valuecolor="red",style="small")
+                        \t -MyDevWindow.new_slider("This is a slider",opt.textcolor("Yellow"),opt.valuecolor("red"),opt.style("small))        \t - - (same as previous example)
+        """
+        from .widgets import Slider
+        return Slider(_pybox.DevControlSlider(self.id,title,*args,**kwargs))
+
+    def new_slider_f(self,title : str = None,*args,**kwargs) : 
+        """
+        Creates a floating-point slider in the Dev Window. The slider is automatically placed.
+
+        A Slider class object is returned where the slider can be accessed and controlled. 
+        A floating-point slider sets a default range of 0-1.0
+
+        User slider.get_pos_f() and slider.set_pos_f() to set and retrieve values.
+
+        Range may be either direction (i.e. min,max or max, min). 
+
+       Parameters:
+
+        - title     \t -- Sets the title of the Slider
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Range             \t -- Set the range of the slider.  The default range is (1,100)          
+        - Default           \t -- Set the default value of the slider.  The edfault is (0)
+        - TextColor         \t -- Sets the color of the label of the slider.
+        - Style("small")    \t -- Sets a smaller slider handle
+
+        Examples:       \t -MyDevWindow.new_slider_f("This is a slider")
+                        \t -MyDevWindow.new_slider_f("This is a slider",range=100,500,default=200)
+                        \t -MyDevWindow.new_slider_f("This is a slider",textcolor="Yellow",valuecolor="red",style="small")
+        """
+        from .widgets import Slider
+        return Slider(_pybox.DevControlSlider(self.id,title,opt._opt__as_float(),*args,**kwargs))
+
+    def new_checkbox(self,title : str = None,*args,**kwargs) -> Button :
+        """
+        Create a checkbox in the Dev Window.  The Checkbox is automatically placed. 
+        The checkbox is unchecked by default.  Use opt.default(True) to default to checked.
+
+        Parameters:
+
+        - title    \t -- Sets the title of the checkbox 
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Default    \t -- Default(True) sets the check in the checkbox.  Default(False) leaves the checkbox unchecked.
+
+        Examples:
+                    \t -MyDevWindow.new_checkbox("Check me!")
+                    \t -MyDevWindow.new_checkbox("Check me!",default=True)
+                    \t -MyDevWindow.new_checkbox("Check me!",opt.default(True))
+        """
+        from .widgets import Button
+        return Button(_pybox.DevControlCheckbox(self.id,title,*args,**kwargs))
+
+    def new_button(self,text : str,*args,**kwargs) -> Button :
+        """
+        Create a Button in the DevWindow.  The Button is automtically placed.
+
+        A Button type object is returned so the button can be used and events retrieved.
+
+        Parameters:
+        
+        text        \t -- Sets the text of the button. 
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Font     \t -- Sets the font for the button text 
+        - Style    \t -- This can be a style of the default button or the name of a created button style.
+
+        Example:   
+                    \t -MyDevWindow.new_button("This is a button")
+                    \t -MyDevWindow.new_button("This is a button",font=18,style="red"))
+        """
+        from .widgets import Button
+        return Button(_pybox.DevControlButton(self.id,text,*args,**kwargs))
+
+    def new_combobox(self,text : str = None,title_cell : str = None,*args,**kwargs) -> Combobox :
+        """
+        Creates a Combobox in the DevWindow.  The Combobox is automatically placed. 
+
+        A Combobox is like a list box except that it consists of a single tab that expands when activated, 
+        and rolls back up when released. 
+
+        This allows multiple listbox-style entries to take only the space of the height of one text line. 
+
+        NewCombobox returns a Combobox type object so that items may be added and deleted, and user selections retrieved. 
+
+        Parameters:
+
+        - text          \t -- [optional] Initial text in the combobox.  This text can be one line or multiple lines representing multiple entries.  See examples.
+        - titlecell     \t -- [optional] Tells the combobox to display this string int the combobox tab when no item is selected.  Otherwise the first added item is displayed.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Default    \t -- Default selection.  This is the index to the default selection (0 is the first selection, 1 the second, etc.)
+
+        Examples:
+
+                    \t -MyDevWindow.new_combobox() 
+                    \t -MyDevWindow.new_combobox("First Item") 
+                    \t -MyDevWindow.new_combobox("First Item\\nSecond Item\\nThird Item") 
+                    \t -MyDevWindow.new_combobox(titlecell="This is a combobox") 
+                    \t -MyDevWindow.new_combobox("First Item\\nSecond Item\\nThird Item",default=2) 
+        """
+        from .widgets import Combobox
+        return Combobox(_pybox.DevControlCombobox(self.id,text,opt.cb_titlecell(title_cell),*args,**kwargs))
+
+    def new_inputbox(self,title : str = None,text : str = None,*args,**kwargs) -> InputBox :
+        """
+        Creates a new Input Box in the Dev Window.  The Inputbox is automatically placed.
+
+        Optional Parameters:
+
+        - title         \t -- [optional] Label of the input box (displays to the left), but can shorten the input box itself.
+        - text          \t -- [optional] This sets the starting text for the input box.  Otheriwse the input box is left blank at first. 
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - NumbersOnly   \t -- Causes the input box to only accept numbers. 
+        - ReadOnly      \t -- Sets the input box as read only so it can be used as a way to place a large amount of text that can be copied.
+        - TextColor     \t -- Sets the color of the text in the input box
+        - bgColor       \t -- Sets the background color of the text in the input box
+        - Password      \t -- Causes the input box to display '*' for all text.
+        - WinColors     \t -- Sets the background input box color and text color to the current window color instead of the default white-and-black colors. 
+        - ThickBorder,Recessed      \t -These are two different border styles that can be used.
+
+        Examples:   \t -MyDevWindow.new_inputbox("This is the title)          
+                    \t -MyDevWindow.new_inputbox(text="This is the default text")
+                    \t -MyDevWindow.new_inputbox("this is the title,"This is the default text",wincolors=True,thickborder=True)
+        """
+        from .widgets import InputBox
+        return InputBox(_pybox.DevControlInputBox(self.id,title,opt.default(text),*args,**kwargs))
+
+    def new_window(self,title : str = None,numlines : int = 0,*args,**kwargs) -> Window :
+        """
+        Creates a new Window in the Dev Window.  The window is placed automatically and may be used to put out text and 
+        other data. 
+
+        The window defaults to 10 lines but can be set to any number of lines.
+
+        Optional Parameters:
+
+        - title         \t -- [optional] Title of the window.  This displays above the window. The default is no title.
+        - numlines      \t -- [optional] Sets the number of lines for the default font in the window.  The default is 10 lines
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Font          \t -- Set the font for the window
+        - TextColor     \t -- Set the text/foreground color for the window
+        - bgColor       \t -- Set the background color for the window. 
+        """
+        from .window import Window
+        return Window(_pybox.DevControlWindow(self.id,title,int(numlines),*args,**kwargs))
+
+    def new_radiobuttons(self,label : str,buttons : str,*args,**kwargs) -> RadioButtonGroup   : 
+        """
+        Creates a group of Radio Buttons with an optional outer border and label.  
+
+        The Radio Button group is placed in the window automatically.
+
+        new_radio_buttons() returns a RadioButtonGroup object class where the buttons may be queried to see when pressed, and which 
+        button was pressed.
+
+        Parameters
+
+        - title                 \t - - The title/label of the radio button group.  A box is drawn around the radio buttons with the title name.
+        - buttons       \t - - The buttons to place in the checkbox group.  This can be one more more buttons, each button name separated by a a newline,
+                                    \t -for example, "button" for just one button, or "button 1\\nbutton 2\\nbutton 3" for 3 radio buttons.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Default       \t -- Sets the default index for the highlighted button.  There can only be one active radio button.  Default sets the
+                            \t - index of the active/highlighted button (i.e. 0 = first button, 1 = second button, etc.)
+
+        Examples:        
+                        \t -MyDevWindow.new_radio_buttons("These are radio buttons","This is the button")
+                        \t -MyDevWindow.new_radio_buttons("These are radio buttons","button 1\\nbutton2\\nbutton 3")
+                        \t -MyDevWindow.new_radio_buttons("These are radio buttons","button 1\\nbutton2\\nbutton 3",default=1)
+
+        """
+        from .widgets import RadioButtonGroup
+        return RadioButtonGroup(_pybox.DevControlRadioButtons(self.id,buttons,opt.label(label),*args,**kwargs))
+
+def dev_set_config(*args,**kwargs) -> bool :
+    """
+    Sets various configuration values for the Dev Window. 
+
+    Most values can be set through various Dev Window function.  dev_set_config() is a way to set multiple options at 
+    once, as well as setting values that don't have a specific functions.
+
+    set_config() works with the following keywords:
+
+    - bgcolor         \t -Sets the background color of the dev window.  This can be a single color or a string with one or two colors (for a gradient)
+                      \t -note: this should be used before any controls are placed in the dev window. Also see dev_set_bgcolor() for more options
+
+    - bgbitmap        \t -Sets the bitmap of the dev window background.  This can be a pybox Cbitmap type, and bitmap array (i.e. opencv, etc.),
+                      \t -or a text string with the location of the bitmap.
+                      \t -note: this should be used before any controls are placed in the dev window. Also see dev_set_bgbitmap() for more options.
+
+    - ypos            \t -Sets the position of the next control.  This can be used to set the location of the first control when setting bgbitmap when the bitmap contains a top header.
+
+    - autoclose_x     \t -Sets the auto close 'x' button on or off.  By default, an 'x' is placed on the window to allow the user to close it.
+                      \autoclose_x=false will turn this 'x' off and also prevent the 'x' from appearing when the Dev Window is the only window open during wait_event() calls.
+                      \t -see the 'allowclose' option to set the 'x' visibility in other ways
+  
+    - autoclose       \t -When set to true, this will cause the Dev Window to close automatically when no other non-dev (or other primary) windows are open.
+                        \t - otherwise, when set to false (default) the Dev Window will remain open when other windows are closed (with an 'x' placed for closure).
+
+    - closeable       \t -Sets the 'x' button on or off when multiple windows are open.  By default, the 'x' appears in all Dev Windows to allow the user
+                      \t -to close it, at which time the window will automatically close. closeable=True will force the 'x' on the window.
+
+                      \t -setting closeable=false will remove the 'x' when there are non-Dev windows open. the 'x' will appear when no other windows are open
+                      \t -to allow the user to close the window. See 'autoclose_x' option to disable the 'x' permanently.
+
+    - topbar          \t -Turns the topbar off (when false). When topbar=false, the top title bar will not appear in the dev window.
+                        \t -this is used for setting the background color and bgbitmap to help personalize the dev window.
+                         \t -note --> topbar must be used before the bgbitmap or bgcolor option, otherwise it will have no effect.
+                       \t -see dev_set_bgbitmap() and dev_set_bgcolor() for more information
+    """
+    return _pybox.DevSetConfig(*args,**kwargs)
+
+def dev_set_nexty(y : int) -> bool :
+    """
+    Sets the Y position in the Dev Window for the next control.
+    This can be useful in setting a top header bitmap, or moving controls
+    down when setting a header bitmap. 
+
+    As with setting the background color or bitmap, set_nexty() should be used
+    before any controls are added to the dev window.
+    """
+    return _pybox.DevSetNextY(y)
+
+def dev_closed(add_closebutton : bool = False) -> bool :
+    """
+    Returns True if the dev window was closed.  This is not an event and will return True continuously once the dev window is closed.
+
+    Note: When dev_closed() is called, an 'x' will be added to the upper-right part of the window.
+
+    Parameters:
+
+        - add_closebutton      \t -- When 'true', a close button will be added as a control at the bottom of the dev window
+    """
+    return _pybox.DevWindowClosed(add_closebutton)
+
+def dev_set_bgcolor(color1,color2 = None,display_bar : bool = True) -> bool :
+    """
+    Sets the background color of the dev window. 
+
+    Note: This only works if it is called before any controls are added to the Dev Window. 
+
+    Parameters:
+
+        - color1      \t -- Color of the background 
+        - color2      \t -- [optional] When given, this sets a gradient from color 1 to color 2
+        - display_bar \t -- [optional] When set to True (default) the top display bar is kept and the bitmap is displayed underneath
+                      \t - when set to False, the top display bar is removed and the bitmap starts at the top of the window.
+    About Colors
+
+    Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+    Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+    Examples:
+
+        pybox.dev_set_bgcolor("black"); 
+        pybox.dev_set_bgcolor("black","blue");
+        pybox.dev_set_bgcolor(PanColor.ForestGreen())
+
+    """
+    return _pybox.DevSetBgColor(_library_color(color1),_library_color(color2),display_bar)
+
+def dev_set_bgbitmap(bitmap,display_bar : bool = True,*args,**kwargs) -> bool :
+    """
+    Sets the background bitmap of the Dev Window
+
+    Note: This only works if it is called before any controls are added to the Dev Window. 
+
+    This bitmap should cover the width and height the Dev Window will be at its maximum.
+    Dev Windows grow vertically when controls are added, and the bitmap should cover this space.
+
+    Parameters:
+
+        - bitmap      \t -- The bitmap to display.  This can be a path to the bitmap or a loaded bitmap.
+        - display_bar \t -- [optional] When set to True (default) the top display bar is kept and the bitmap is displayed underneath
+
+    Other options
+
+        - Pady      \t -- opt.pady() or pady= can be used to set the position of the next control relative to the bottom of the bitmap.
+                    \t - For example, pady(20) will add 20 pixels to the bottom of the bitmap for the next control
+
+                    This can be useful when a background bitmap has a header, so the first control can start underneath it.
+
+    Examples:
+
+        dev_set_bgbitmap("c:\\bitmaps\\mybitmap.jpg")
+        dev_set_bgbitmap(MyBitmap,pady=20)
+
+    """
+    return _pybox.DevSetBgBitmap(bitmap,display_bar,*args,**kwargs)
+
+def dev_bitmap(bitmap,text = None,*args,**kwargs) -> bool :
+    """
+    Puts a bitmap in the dev window at the current place for the next control. 
+
+    The bitmap can contain a transparency (as a .png or 32-bit bitmap) to blend into the background.
+
+    Bitmaps in the Dev Window are meant to be either icons or header-style bitmaps, and are usually small vertically to keep
+    space for the controls.
+
+    Parameters:
+
+        - bitmap      \t -- The bitmap to display.  This can be a path to the bitmap or a loaded bitmap.
+        - text        \t -- [optional] Text to place directly to the right of the bitmap.  Pybox options can be used
+                        \t - to set the font and text color
+
+                        The center of the text is aligned to be at the center vertical center of the bitmap. 
+
+    Other options
+
+        - font,textcolor       \t -- These can set the font and color of the text. i.e. opt.textcolor("green") or opt.font(20)
+        - pady                 \t -- this will add to the Y value of the next control relative to the bottom of the bitmap or text
+                                \t - (whichever hangs over more).  For example, pady(20) will add 20 pixels to the start of the next control.
+
+                                \t -This can be useful when the bitmap (and text) is a header, to add space before the next control starts
+
+    Examples:
+
+        dev_bitmap("c:\\bitmaps\\mybitmap.png")
+        dev_bitmap("c:\\bitmaps\\mybitmap.png"," Project Controls")      -- note the space to add space between the image and text
+        dev_bitmap("c:\\bitmaps\\mybitmap.png"," Project Controls",font=20,textcolor="green")
+    """
+    return _pybox.DevBitmap(bitmap,text,*args,**kwargs)
+
+def dev_text(text = None,height=None,**kwargs) -> Window :
+    """
+    *** note: This function is still being documented -- see various examples for usage ***
+
+    dev_text() is much the same as dev_text_widget(), except that it returns a Pybox.Window rather than a Text Widget.
+    The window created is transparent, with an update type set to "immediate", so everything that happens on the window
+    is updated immediately (this can be changed by calling set_auto_update()). 
+
+    note: use dev_text_widget() for more real-time displays, and dev_text() for more casual information that does not require real-time.
+
+    dev_text() as more flexibility since it is a Pybox.Window, where dev_text_widget() can be much faster and perform more automatic functions
+    as a text_widget() that only works with text display.
+    """
+    from .window import Window
+    return Window(_pybox.DevText(text,height,**kwargs))
+
+def dev_text_widget(text = None,*args,**kwargs) -> CTextWidget : 
+    """
+    Create a text widget int the Dev Window.    This is the same type of Text Widget that can be created in a regular
+    window with window.text_widget(), but automatically placed and sized in the Dev Window. 
+
+    Since the Text Widget is automatically placed and sized in the window, fewer options are needed. 
+
+    dev_text() returns a CTextWidget object where you can write out to the text widget.
+
+    The Text Widget can be used to create static or dynamic text of any font size in the Dev Window.
+    Parameters:
+
+    - text          \t -- [optional] Sets the text of the widget.  This can be set later with textwidget.Write()
+                    \t - When text is entered, the text widget is created to the width of the text.  Use the width() parameter to set a width or pad
+                    \t - the text with spaces to reserve width.
+
+    Pybox options can be included.  Some various options are as follows:
+
+    - textColor         \t - Sets the text color of the widget (default is current window text color).  Same as opt.fgcolor()
+    - font              \t - Sets the font of the text in the text widget
+    - textCenter        \t - Centers the text inside of the widget (which can be longer than the text itself).
+                            \t - Use TextCenterX() and CenterX() together to make sure text is centered in the window. This is only needed if the Width of the
+                            \t - Text Widget and the text have been specificed separately.
+
+
+    Examples:   
+                \t -pybox.DevText(This is a text Widget)
+                \t -pybox.DevText(This is a text Widget",opt.font(20),opt.textcolor("Yellow"))
+    """
+    from .widgets import CTextWidget
+    return CTextWidget(_pybox.DevTextWidget(text,*args,**kwargs))
+
+def dev_slider(title : str = None,*args,**kwargs) -> Slider : 
+    """
+    Creates a slider in the Dev Window. The slider is automatically placed.
+
+    A Slider class object is returned where the slider can be accessed and controlled. 
+
+    Parameters:
+
+    - title     \t -- Sets the title of the Slider
+
+    Pybox options can be included.  Some various options are as follows:
+
+    - range             \t -- Set the range of the slider.  The default range is (1,100)          
+    - default           \t -- Set the default value of the slider.  The edfault is (0)
+    - textColor         \t -- Sets the color of the label of the slider.
+    - style("small")    \t -- Sets a smaller slider handle
+
+    Examples:       \t -pybox.dev_slider("This is a slider")
+                    \t -pybox.dev_slider("This is a slider",opt.range(100,500),opt.default(200))
+                    \t -pybox.dev_slider("This is a slider",opt.textColor("Yellow"),opt.valuecolor("red"),opt.style("small"))
+                    \t -pybox.dev_slider("This is a slider",textColor=Yellow,valueColor=red,Style="small"        \t - - (same as previous example)
+    """
+    from .widgets import Slider
+    return Slider(_pybox.DevSlider(title,*args,**kwargs))
+
+def dev_slider_f(title : str = None,*args,**kwargs) -> Slider : 
+    """
+    Creates a floating-point slider in the Dev Window. The slider is automatically placed.
+
+    A Slider class object is returned where the slider can be accessed and controlled. 
+    A floating-point slider sets a default range of 0-1.0
+
+    User slider.get_pos_f() and slider.set_pos_f() to set and retrieve values.
+
+    Range may be either direction (i.e. min,max or max, min). 
+
+    Parameters:
+
+    - title     \t -- Sets the title of the Slider
+
+    Pybox options can be included.  Some various options are as follows:
+
+    - range             \t -- Set the range of the slider.  The default range is (1,1.0)          
+    - default           \t -- Set the default value of the slider.  The edfault is (0)
+    - textColor         \t -- Sets the color of the label of the slider.
+    - style("small")    \t -- Sets a smaller slider handle
+
+    Examples:       \t -pybox.dev_slider_f("This is a slider")
+                    \t -pybox.dev_slider_f("This is a slider",opt.range(100,500),opt.default(200))
+                    \t -pybox.dev_slider_f("This is a slider",opt.textColor("Yellow"),opt.valuecolor("red"),opt.style("small"))
+                    \t -pybox.dev_slider_f("This is a slider",textColor="yellow",valueColor="red",Style="small")        \t - - (same as previous example)
+    """
+    from .widgets import Slider
+    return Slider(_pybox.DevSlider(title,asfloat=True,*args,**kwargs))
+
+def dev_checkbox(title : str = None,*args,**kwargs) -> Button :
+    """
+    Create a checkbox in the Dev Window.  The Checkbox is automatically placed. 
+    The checkbox is unchecked by default.  Use opt.default(True) to default to checked.
+
+    Parameters:
+
+    - title    \t -- Sets the title of the checkbox 
+
+    Pybox options can be included.  Some various options are as follows:
+
+    - Default    \t -- Default(True) sets the check in the checkbox.  Default(False) leaves the checkbox unchecked.
+
+    Examples:
+                \t -Mypybox.dev_checkbox("Check me!")
+                \t -Mypybox.dev_checkbox("Check me!",opt.default(True))
+                \t -Mypybox.dev_checkbox("Check me!",default=True)
+    """
+    from .widgets import Button
+    return Button(_pybox.DevCheckbox(title,*args,**kwargs))
+
+def dev_button(text : str,*args,**kwargs) -> Button :
+    """
+    Create a Button in the DevWindow.  The Button is automtically placed.
+
+    A Button type object is returned so the button can be used and events retrieved.
+
+    Parameters:
+        
+    text        \t -- Sets the text of the button. 
+
+    Keywords and Pybox options can be included.  Some various options are as follows:
+
+    - Font     \t -- Sets the font for the button text 
+    - Style    \t -- This can be a style of the default button or the name of a created button style.
+
+
+    Example:   \t -pybox.dev_button("This is a button")
+                \t -pybox.dev_button("This is a button",style="red")
+    """
+    from .widgets import Button
+    return Button(_pybox.DevButton(text,*args,**kwargs))
+
+def dev_combobox(text : str = None,titlecell : str = None,*args,**kwargs) -> Combobox :
+    """
+    Creates a Combobox in the DevWindow.  The Combobox is automatically placed. 
+
+    A Combobox is like a list box except that it consists of a single tab that expands when activated, 
+    and rolls back up when released. 
+
+    This allows multiple listbox-style entries to take only the space of the height of one text line. 
+
+    NewCombobox returns a Combobox type object so that items may be added and deleted, and user selections retrieved. 
+
+    Parameters:
+
+    - text          \t -- [optional] Initial text in the combobox.  This text can be one line or multiple lines representing multiple entries.  See examples.
+    - titlecell     \t -- [optional] Tells the combobox to display this string int the combobox tab when no item is selected.  Otherwise the first added item is displayed.
+
+    Keywords and Pybox options can be included.  Some various options are as follows:
+
+    - Default    \t -- Default selection.  This is the index to the default selection (0 is the first selection, 1 the second, etc.)
+
+    Examples:
+
+                \t -Mypybox.dev_combobox() 
+                \t -Mypybox.dev_combobox("First Item") 
+                \t -Mypybox.dev_combobox("First Item\\nSecond Item\\nThird Item") 
+                \t -Mypybox.dev_combobox(titlecell="This is a combobox") 
+                \t -Mypybox.dev_combobox("First Item\\nSecond Item\\nThird Item",default=2) 
+                \t -Mypybox.dev_combobox("First Item\\nSecond Item\\nThird Item",opt.default(2)) 
+    """
+    from .widgets import Combobox
+    return Combobox(_pybox.DevCombobox(text,opt.cb_titlecell(titlecell),*args,**kwargs))
+
+def dev_inputbox(title : str = None,text : str = None,*args,**kwargs) -> InputBox :
+    """
+    Creates a new Input Box in the Dev Window.  The Inputbox is automatically placed.
+
+    Optional Parameters:
+
+    - title         \t -- [optional] Label of the input box (displays to the left), but can shorten the input box itself.
+    - text          \t -- [optional] This sets the starting text for the input box.  Otheriwse the input box is left blank at first. 
+
+    Keywords and Pybox options can be included.  Some various options are as follows:
+
+    - numbersOnly   \t -- Causes the input box to only accept numbers. 
+    - readOnly      \t -- Sets the input box as read only so it can be used as a way to place a large amount of text that can be copied.
+    - textColor     \t -- Sets the color of the text in the input box
+    - bgColor       \t -- Sets the background color of the text in the input box
+    - password      \t -- Causes the input box to display '*' for all text.
+    - winColors     \t -- Sets the background input box color and text color to the current window color instead of the default white-and-black colors. 
+    - thickBorder,recessed      \t -These are two different border styles that can be used.
+
+    Examples:   \t -MyDevWindow.dev_inputbox("This is the title)          
+                \t -MyDevWindow.dev_inputbox(text="This is the default text")
+                \t -MyDevWindow.dev_inputbox("this is the title,"This is the default text",wincolors=True,thickborder=True())
+    """
+    from .widgets import InputBox
+    return InputBox(_pybox.DevInputBox(title,opt.default(text),*args,**kwargs))
+
+def dev_window(title : str = None,numlines : int = None,*args,**kwargs) -> Window :
+    """
+    Creates a new Window in the Dev Window.  The window is placed automatically and may be used to put out text and 
+    other data. 
+
+    The window defaults to 10 lines but can be set to any number of lines.
+
+    Optional Parameters:
+
+    - title         \t -- [optional] Title of the window.  This displays above the window. The default is no title.
+    - numlines      \t -- [optional] Sets the number of lines for the default font in the window.  The default is 10 lines
+
+    Keywords and Pybox options can be included.  Some various options are as follows:
+
+    - font          \t -- Set the font for the window
+    - textColor     \t -- Set the text/foreground color for the window
+    - bgColor       \t -- Set the background color for the window. 
+    """
+    from .window import Window
+    return Window(_pybox.DevWindow(title,numlines,*args,**kwargs))
+
+def dev_radiobuttons(label : str,buttons : str,*args,**kwargs)  -> RadioButtonGroup  : 
+    """
+    Creates a group of Radio Buttons with an optional outer border and label.  
+
+    The Radio Button group is placed in the window automatically.
+
+    NewRadioButtons() returns a RadioButtonGroup object class where the buttons may be queried to see when pressed, and which 
+    button was pressed.
+
+    Parameters
+
+    - title                 \t - - The title/label of the radio button group.  A box is drawn around the radio buttons with the title name.
+    - buttons       \t - - The buttons to place in the checkbox group.  This can be one more more buttons, each button name separated by a a newline,
+                                \t -for example, "button" for just one button, or "button 1\\nbutton 2\\nbutton 3" for 3 radio buttons.
+
+    Keywords and Pybox options can be included.  Some various options are as follows:
+
+    - Default       \t -- Sets the default index for the highlighted button.  There can only be one active radio button.  Default sets the
+                        \t - index of the active/highlighted button (i.e. 0 = first button, 1 = second button, etc.)
+
+    Examples:        
+                    \t -pybox.dev_radio_buttons("These are radio buttons","This is the button")
+                    \t -pybox.dev_radio_buttons("These are radio buttons","button 1\\nbutton2\\nbutton 3")
+                    \t -pybox.dev_radio_buttons("These are radio buttons","button 1\\nbutton2\\nbutton 3",opt.default(1))
+
+    """
+    from .widgets import RadioButtonGroup
+    return RadioButtonGroup(_pybox.DevRadioButtons(buttons,opt.label(label),*args,**kwargs))
+
+def dev_auto_close(auto_close : bool = True) -> bool :
+    """
+    *** This function is deprecated ***\n
+    Sets the window to close automatically when there are no other windows open.
+    By default, the Dev Window is a 'primary' window and won't close when
+    functions such as wait_pending() or wait_event() are used.
+
+    When set to false (default), the window won't close until it is closed by the user. 
+    or the program exits.
+    """
+    return _pybox.DevAutoClose(auto_close)
+
+
+def dev_allow_auto_close(auto_close : bool = True) -> bool :
+    """
+    When set to False (e.g. dev_allow_auto_close(False), this will prevent the dev window closing when there are no other
+    window open.
+    
+    By Default, when the last primary window is closed, the program will exit even if a Dev Window is open.   When this is set to False \
+The dev window is left open until it is closed by the program or user.
+
+    - note: If there a dev window is open when there are no other windows open, this function is not needed. In this case, the Dev Window \
+will set itself to not close automatically since it recognized no other primary windows were open when created.
+    """
+    return _pybox.DevAllowAutoClose(auto_close)
+
+def dev_set_location(x,y) -> bool :
+    """
+    Sets the location of the Dev Window.  See dev_set_location_l() to use a list, tuple or array for the location.
+
+    Parameters
+
+    - x,y                 \t - - New location of the Dev Window
+
+    """
+    return _pybox.DevSetLocation(int(x),int(y))
+
+def dev_set_location_l(at : list) -> bool :
+    """
+    Sets the location of the Dev Window from a list, tuple or array.  See dev_set_location() to using independent x,y values.
+    
+    Parameters
+
+    - x,y                 \t - - New location of the Dev Window
+
+    """
+    return _pybox.DevSetLocation(int(at[0]),int(at[1]))
+
+
+def new_devwindow(at = None,*args,**kwargs) :
+    """
+    Creates a new Dev Controls window where you can add automatically-placed controls with one line of code. 
+
+    A Dev Window is a window made for creating, managing, adding, and deleting controls very easily and quickly. 
+
+    Sagebox has a pre-defined Dev Window that you can access with the set of Dev functions, such as Sagebox::DevButton()
+
+    new_dev_window() will create a new window where you can add more controls if the main Dev Window becomes too populated. 
+
+    Parameters:
+
+    - at            \t - [optional] Where to place the Dev Window.  When omitted, the new Dev Window is automatically placed in the window.
+
+    """
+    return DevControl(_pybox.NewDevWindow(opt.at(at),*args,**kwargs))
@@ -0,0 +1,922 @@
+"""
+Pybox Dialogs -- the dialog class, message boxes, input dialogs, file dialogs, and please-wait windows.
+"""
+
+from __future__ import annotations
+
+from ._core import _pybox
+from .options import opt
+
+class dialog :
+    """
+    pybox dialog class.
+
+    The pybox dialog class is a collection of windows-based dialog functions. 
+
+    These functions are available through the regular pybox interface, but are collected in the dialog class for
+    better visibility. 
+
+    When you enter "pybox.dialog", a list of funtions will appear.  You can use these functions int the dialog class, or
+    remove the ".dialog" and use them directly through the pybox class. 
+    
+    """
+    def img_view(bitmap,title=None,at=None,size=None,percent=None,zoombox=None,*args,**kwargs) -> _ImageView :
+        """
+        Creates an ImageView window where you can zoom and and out of the displayed image and move it around for inspection. 
+        The window can be resized and maximized.  See img_view_r() to display the image upside-down.
+
+        - This function returns an _ImageView class object where you can control the ImageView window that is created.  However, it is not
+        necessary to keep the return object or assign it to a variable. 
+        - The system menu (upper-left corner) has a number of options to bring up a Zoom Box, reset the image, etc.
+        - Use ImgZoom() to bring up a Zoom Box that can be used to navigate through the image. 
+
+        About the Zoom Box
+
+        The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+        Also see: img_zoom() -- brings up an ImageView Window with a zoom box (otherwise it can be selected from the upper-left system menu)
+        Also see: img_before_after() -- brings up a window with two images, such as before and after images, for comparison.
+
+        Parameters:
+
+        - bitmap        \t - The bitmap to display.  This can be a pybox bitmap, a general RGB array, or a text string with the path to the bitmap
+        - title         \t - This is the title of the image that will display in the title bar
+        - at            \t - Where to put the window.  If this is not used, the window is placed automatically.
+        - size          \t - Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+        - percent       \t - Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - reverse       \t -- Displays the bitmap upside-down.  Bitmaps often come updside-down. "reverse" corrects this.  Also see: img_view_r()
+        - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  Normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+        - label         \t -- This will put a text label underneath the image in a larger font for better labeling display.
+                            \t -If no Label is given with no Title, the title bar text will also be the label text.
+                          
+        About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+        or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+        The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+        """        
+        from .image_view import _ImageView
+        return _ImageView(_pybox.ImgView(bitmap,opt.title(title),opt.at(at),opt.size(size),opt.percent(percent),opt.zoombox(zoombox),*args,**kwargs))
+
+    def img_view_r(bitmap,title=None,at=None,size=None,percent=None,zoombox=None,*args,**kwargs) -> _ImageView :
+        """
+        Creates an ImageView window where you can zoom and and out of the displayed image and move it around for inspection. 
+        The window can be resized and maximized.  This image is displayed upside-down in relation to the bitmap.
+        See img_view() to display the image non-upside-down. 
+
+        - This function returns an _ImageView class object where you can control the ImageView window that is created.  However, it is not
+        necessary to keep the return object or assign it to a variable. 
+        - The system menu (upper-left corner) has a number of options to bring up a Zoom Box, reset the image, etc.
+        - Use img_zoom() to bring up a Zoom Box that can be used to navigate through the image. 
+
+        About the Zoom Box
+
+        The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+        Also see: img_zoom() -- brings up an ImageView Window with a zoom box (otherwise it can be selected from the upper-left system menu)
+        Also see: img_before_after() -- brings up a window with two images, such as before and after images, for comparison.
+
+        Parameters:
+
+        - bitmap        \t - The bitmap to display.  This can be a pybox bitmap, a general RGB array, or a text string with the path to the bitmap
+        - title         \t - This is the title of the image that will display in the title bar
+        - at            \t - Where to put the window.  If this is not used, the window is placed automatically.
+        - size          \t - Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+        - percent       \t - Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+        - label         \t -- This will put a text label underneath the image in a larger font for better labeling display.
+                            \t -If no Label is given with no Title, the title bar text will also be the label text.
+                          
+        About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+        or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+        The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+        """
+        from .image_view import _ImageView
+        return _ImageView(_pybox.ImgViewR(bitmap,opt.title(title),opt.at(at),opt.size(size),opt.percent(percent),opt.zoombox(zoombox),*args,**kwargs))
+
+    def img_zoom(bitmap,title=None,at=None,size=None,percent=None,*args,**kwargs) -> _ImageView :
+        """
+        Creates an ImageView and Zoom Box window where you can zoom and and out of the displayed image and move it around for inspection. 
+        The window can be resized and maximized.  See img_zoom_r() to display the image upside-down.
+
+        - This function is the same as ImgView() except that it creates a ZoomBox as a small window to make navigating the image easier. 
+        - This function returns an _ImageView class object where you can control the ImageView window that is created.  However, it is not
+        necessary to keep the return object or assign it to a variable. 
+        - The system menu (upper-left corner) has a number of options to bring up a Zoom Box, reset the image, etc.
+        - Use ImgZoom() to bring up a Zoom Box that can be used to navigate through the image. 
+
+        About the Zoom Box
+
+        The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+        Also see: img_zoom() -- brings up an ImageView Window with a zoom box (otherwise it can be selected from the upper-left system menu)
+        Also see: img_before_after() -- brings up a window with two images, such as before and after images, for comparison.
+
+        Parameters:
+
+        - bitmap        \t - The bitmap to display.  This can be a pybox bitmap, a general RGB array, or a text string with the path to the bitmap
+        - title         \t - This is the title of the image that will display in the title bar
+        - at            \t - Where to put the window.  If this is not used, the window is placed automatically.
+        - size          \t - Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+        - percent       \t - Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - reverse       \t -- Displays the bitmap upside-down.  Bitmaps often come updside-down. "reverse" corrects this.  Also see: ImgZoomR()
+        - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+        - label         \t -- This will put a text label underneath the image in a larger font for better labeling display.
+                            \t -If no Label is given with no Title, the title bar text will also be the label text.
+                          
+        About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+        or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+        The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+        """                
+        from .image_view import _ImageView
+        return _ImageView(_pybox.ImgView(bitmap,opt.title(title),opt.at(at),opt.size(size),opt.percent(percent),opt.zoombox(True),*args,**kwargs))
+
+    def img_zoom_r(bitmap,title=None,at=None,size=None,percent=None,*args,**kwargs) -> _ImageView :
+        """
+        Creates an ImageView and Zoom Box window where you can zoom and and out of the displayed image and move it around for inspection. 
+        The window can be resized and maximized. This displays the bitmap upside-down. See img_zoom() to display the image non-upside-down.
+
+        - This function is the same as img_view() except that it creates a ZoomBox as a small window to make navigating the image easier. 
+        - This function returns an _ImageView class object where you can control the ImageView window that is created.  However, it is not
+        necessary to keep the return object or assign it to a variable. 
+        - The system menu (upper-left corner) has a number of options to bring up a Zoom Box, reset the image, etc.
+        - Use img_zoom() to bring up a Zoom Box that can be used to navigate through the image. 
+
+        About the Zoom Box
+
+        The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+        Also see: img_zoom() -- brings up an ImageView Window with a zoom box (otherwise it can be selected from the upper-left system menu)
+        Also see: img_before_after() -- brings up a window with two images, such as before and after images, for comparison.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - bitmap        \t - The bitmap to display.  This can be a pybox bitmap, a general RGB array, or a text string with the path to the bitmap
+        - title         \t - [optional] This is the title of the image that will display in the title bar
+        - at            \t - [optional] Where to put the window.  If this is not used, the window is placed automatically.
+        - size          \t - [optional] Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+        - percent       \t - [optional] Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+        - label         \t -- This will put a text label underneath the image in a larger font for better labeling display.
+                            \t -If no Label is given with no Title, the title bar text will also be the label text.
+                          
+        About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+        or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+        The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+        """                        
+        from .image_view import _ImageView
+        return _ImageView(_pybox.ImgViewR(bitmap,opt.title(title),opt.at(at),opt.size(size),opt.percent(percent),opt.zoombox(True),*args,**kwargs))
+
+    def img_before_after(bitmap1,bitmap2,title=None,label=None,before_title=None,after_title=None,at=None,size=None,percent=None,*args,**kwargs) -> _ImageBeforeAfter :
+        """
+        Creates an ImageView window with a Before and After image, and Zoom Box window where you can zoom and and out of the displayed images and easily move them
+        around for inspection.  The window can be resized and maximized.  See img_before_after_r() to display the images upside-down.
+
+        - The system menu (upper-left corner) has a number of options.
+        - This returns an _ImageBeforeAfter class object that can be used to control the window. However, it is not necessary to save the return object. 
+            \t -with the return object, you can determine when the window is closed and can also close all open ImageView Windows, as well as many other functions.
+
+        About the Zoom Box
+
+        The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+        Parameters:
+
+        - bitmap1       \t - The 'before' bitmap to display.  This can be a pybox bitmap or a general RGB array.
+        - bitmap2       \t - The 'after' bitmap to display.  The bitmaps must be the same size, but can be different formats.
+        - title         \t - This is the title of the image that will display in the title bar
+        - before_title   \t - title/label for the 'before' bitmap.  If not specified, a default label is used
+        - after_title    \t - title/label for the 'after' bitmap.  If not specified, a default label is used
+        - at            \t - Where to put the window.  If this is not used, the window is placed automatically.
+        - size          \t - Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+        - percent       \t - Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+        - label         \t -- This will put a text label above both images.
+                            \t -If no Label is given with no Title, the title bar text will also be the label text.
+                                                
+        About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+        or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+        The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+        """                        
+        from .image_view import _ImageBeforeAfter
+        return _ImageBeforeAfter(_pybox.ImgBeforeAfter(bitmap1,bitmap2,opt.title(title),opt.str_str("BeforeTitle",before_title),opt.str_str("AfterTitle",after_title),opt.label(label),
+                                                       opt.at(at),opt.size(size),opt.percent(percent),*args,**kwargs))
+
+    def img_before_after_r(bitmap1,bitmap2,title=None,label=None,before_title=None,after_title=None,at=None,size=None,percent=None,*args,**kwargs) -> _ImageBeforeAfter :
+        """
+        Creates an ImageView window with a Before and After image, and Zoom Box window where you can zoom and and out of the displayed images and easily move them
+        around for inspection.  The window can be resized and maximized.  The images are displayed upside-down. See img_before_after() to display the images non-upside-down.
+
+        - The system menu (upper-left corner) has a number of options.
+        - This returns an _ImageBeforeAfter class object that can be used to control the window. However, it is not necessary to save the return object. 
+            \t -with the return object, you can determine when the window is closed and can also close all open ImageView Windows, as well as many other functions.
+
+        About the Zoom Box
+
+        The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+        Parameters:
+
+        - bitmap1       \t - The 'before' bitmap to display.  This can be a pybox bitmap or a general RGB array.
+        - bitmap2       \t - The 'after' bitmap to display.  The bitmaps must be the same size, but can be different formats.
+        - title         \t - This is the title of the image that will display in the title bar
+        - before_title   \t - title/label for the 'before' bitmap.  If not specified, a default label is used
+        - after_title    \t - title/label for the 'after' bitmap.  If not specified, a default label is used
+        - at            \t - Where to put the window.  If this is not used, the window is placed automatically.
+        - size          \t - Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+        - percent       \t - Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+        - label         \t -- This will put a text label above both images.
+                            \t -If no Label is given with no Title, the title bar text will also be the label text.
+                          
+        About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+        or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+        The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+        """                                
+        from .image_view import _ImageBeforeAfter
+        return _ImageBeforeAfter(_pybox.ImgBeforeAfterR(bitmap1,bitmap2,opt.title(title),opt.str_str("BeforeTitle",before_title),opt.str_str("AfterTitle",after_title),opt.label(label),
+                                                        opt.at(at),opt.size(size),opt.percent(percent),*args,**kwargs))
+
+
+    def info(text : str,*args,**kwargs) -> bool :
+        """
+        Displays a window with the given text and an "OK" button. Note: InfoWindow() and QuickButton() are the same function.
+
+        This is used to present general information in a window box. 
+
+        Parameters: 
+
+        - text          \t -- text to put into the window. 
+
+        About Dialog Box Text
+
+        The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+        If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+        Examples:
+
+                \t -pybox.dialog.info("Press OK to continue")
+                \t -pybox.dialog.info("+Information Window\nPress OK to continue")
+                \t -pybox.dialog.info("Finished Processing\nPress OK to continue")
+                \t -pybox.dialog.info("+My Process\nFinished Processing\nPress OK to continue")
+        """
+        return _pybox.InfoWindow(text,str,*args,**kwargs)
+
+    def msgbox(text : str,*args,**kwargs) -> bool :
+        """
+        Displays a window with the given text and an "OK" button. Note: InfoWindow() and QuickButton() are the same function.
+
+        This is used to present general information in a window box. 
+
+        Parameters: 
+
+        - text          \t -- text to put into the window. 
+
+        About Dialog Box Text
+
+        The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+        If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+        Examples:
+
+                \t -pybox.dialog.msgbox("Press OK to continue")
+                \t -pybox.dialog.msgbox("+Information Window\nPress OK to continue")
+                \t -pybox.dialog.msgbox("Finished Processing\nPress OK to continue")
+                \t -pybox.dialog.msgbox("+My Process\nFinished Processing\nPress OK to continue")
+        """
+        return _pybox.InfoWindow(text,str,*args,**kwargs)
+
+    def msgbox_yesno(text : str,*args,**kwargs) -> bool :
+        """
+        Displays a window with the given text and an "yes" button and a "no" button.
+
+        Parameters: 
+
+        - text          \t -- text to put into the window. 
+
+        Returns: True if "Yes" was input, or False if the No was pressed. 
+
+        About Dialog Box Text
+
+        The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+        If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+        Examples:
+
+                \t -pybox.dialog.msgbox_yesno("Would you like to continue?")
+                \t -pybox.dialog.msgbox_yesno("+Yes No Window\nWould you like to continue?")
+                \t -pybox.dialog.msgbox_yesno("Finished Processing\nWould you like to continue?")
+                \t -pybox.dialog.msgbox_yesno("+My Process\nWould you like to Continue?\nPress Yes to continue, No to quit.")
+
+        """
+        return _pybox.YesNoWindow(text,str,*args,**kwargs)
+
+    def msgbox_yesnocancel(text : str,*args,**kwargs) -> bool :
+        """
+        Displays a window with the given text and an "yes" button, "no" button, and "Cancel" button
+
+        Parameters: 
+
+        - text          \t -- text to put into the window. 
+
+        Returns: True if "Yes" was input, or False if the No was pressed. 
+                 Use "pybox.dialog.WasCancelled() or pybox.WasCancelled() to determine if the Cancel button was pressed.
+
+        About Dialog Box Text
+
+        The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+        If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+        Examples:
+
+                \t -pybox.dialog.msgbox_yesnocancel("Would you like to continue?")
+                \t -pybox.dialog.msgbox_yesnocancel("+Yes No Window\nWould you like to continue?")
+                \t -pybox.dialog.msgbox_yesnocancel("Finished Processing\nWould you like to continue?")
+                \t -pybox.dialog.msgbox_yesnocancel("+My Process\nWould you like to Continue?\nPress Yes to continue, No to quit,Cancel to Exit.")
+
+        """        
+        return _pybox.YesNoCancelWindow(text,str,*args,**kwargs)
+
+    def msgbox_okcancel(text : str,*args,**kwargs) -> bool :
+        """
+        Displays a window with the given text and an "Ok" button, and "Cancel" button
+
+        Parameters: 
+
+        - text          \t -- text to put into the window. 
+
+        Returns: True if "Ok" was input, or False if the Cancel was pressed. 
+                 Use "pybox.dialog.WasCancelled() or pybox.WasCancelled() to determine if the Cancel button was pressed.
+
+        About Dialog Box Text
+
+        The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+        If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+        Examples:
+
+                \t -pybox.dialog.msgbox_okcancel("Would you like to continue?")
+                \t -pybox.dialog.msgbox_okcancel("+Yes No Window\nWould you like to continue?")
+                \t -pybox.dialog.msgbox_okcancel("Finished Processing\nWould you like to continue?")
+                \t -pybox.dialog.msgbox_okcancel("+My Process\nWould you like to Continue?\nPress Yes to continue or Cancel to quit.")
+
+        """                
+        return _pybox.OkCancelWindow(text,str,*args,**kwargs)
+
+    def quick_button(text : str,title : str = "Quick Button",*args) -> bool :
+        """
+        Displays a window with the given text and an "OK" button. Note: InfoWindow() and QuickButton() are the same function.
+
+        This is used to present general information in a window box. 
+
+        Parameters: 
+
+        - text          \t -- text to put into the window. 
+
+        About Dialog Box Text
+
+        The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+        If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+        Examples:
+
+                \t -pybox.dialog.quick_button("Press OK to continue")
+                \t -pybox.dialog.quick_button("+Information Window\nPress OK to continue")
+                \t -pybox.dialog.quick_button("Finished Processing\nPress OK to continue")
+                \t -pybox.dialog.quick_button("+My Process\nFinished Processing\nPress OK to continue")
+        """        
+        return _pybox.InfoWindow(text,title,*args)
+
+    def please_wait(text = None,cancelok : bool = False,*args,**kwargs) -> bool :
+        """
+        Displays a please wait window in the center of the screen.
+        
+        Parameters:
+
+        - text          \t - - [optional] text to display in the Please Wait Window. If multiple lines are used, the first line displays in a larger font.
+        - cancelok      \t - - [optional] if specified, a "cancel" button.  This can be checked with PleaseWaitCanceled() in the event loop.
+
+        Pybox options can be included.  Some various options are as follows:
+
+        - ProgressBar         \t -- Adds a progress bar to the please wait window.  This can be set from 0-100% with PleaseWaitSetProgress()
+
+        Examples:
+
+                \t -pybox.dialog.please_wait()
+                \t -pybox.dialog.please_wait("Wait for process to finish")
+                \t -pybox.dialog.please_wait("Wait for process to finish\\nPress cancel to abort",True,opt.progresbar())
+        """
+        return _pybox.PleaseWaitWindow(text,opt.cancelok(cancelok),*args,**kwargs)
+
+    def close_please_wait() -> bool :
+        """
+        Closes the Please Wait window if it is open.
+        """
+        return _pybox.ClosePleaseWait()
+
+    def please_wait_set_progress(percent : int) -> bool :
+        """
+        If a Please Wait Window is open and has a progress bar, please_wait_set_progress() will set the percent complete of the progress bar.
+        
+        Parameters:
+
+        - percent          \t - - Percent (0-100) complete.
+
+        """
+        return _pybox.PleaseWaitSetProgress(percent)
+
+    def please_wait_canceled() -> bool :
+        """
+        Returns True if the "Cancel" button was pressed in a Please Wait Window, False if not or after the first True return (because it is an event)
+        
+        note: Even when the Cancel button is pressed, the program must still close the Please Wait window with close_please_wait().
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.PleaseWaitCanceled()
+
+    def was_canceled() -> bool :
+        """
+        Returns true of the last dialog box that contains a 'cancel' button was canceled. 
+
+        This can be useful in handling dialog boxes that return numbers and strings.  was_canceled() can confirm the user canceled the dialog box and is not
+        returning information.
+
+        If was_canceled() returns False, then it can be assumed that the return data is ok.
+
+        was_canceled() applies to dialog functions like GetInteger(), GetFloat(), GetString(), YesNocancel(), and other functions.
+        """
+        return _pybox.Canceled()
+
+    def get_integer(text=None,*args,**kwargs) -> int  :
+        """
+        Gets an integer value from a window that pops up with an input box.  The return value is the integer entered or default value.
+        Call pybox.was_canceled() to determine if the user canceled the input box (opt.nocancel() will disallow the ability to cancel)
+
+        Options:
+
+        text        \t - [optional] The text to put as a header in the box.  You can use multiple lines.
+                    \t - if the first line starts with '+' that line becomes the title in the title bar and subsquent lines are printed in the description.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Range         \t -Set a range for the input.  This will not allow an input outside of the range, but can allow the user to press return
+        - Default       \t -Sets the default value.  This is placed in the input box when the box first comes up.  If the user presses return on a blank line, the default is returned.
+        - NoCancel      \t -By defaut, there is a cancel button to allow the user to cancel.  You can call pybox.was_canceled() which returns True if the last input box was canceled.
+                        \t -When NoCancel is specified, the user cannot cancel or press return on an empty line and must enter a value (a control-C may be pressed to stop the program.
+
+        Examples:       \t -My Value = pybox.get_integer("Enter a number")
+                        \t -My Value = pybox.get_integer("+This is the title bar title\\nEnter a number",range=(1,100),nocancel=True)
+                        \t -My Value = pybox.get_integer("Enter a number\nNumber should be between 1 and 100,range=(1,100),default=10)
+        """    
+        return _pybox.GetInteger(text,*args,**kwargs)
+
+    def get_float(text=None,*args,**kwargs) -> float  :
+        """
+        Gets an floating-point value from a window that pops up with an input box.  The return value is the integer entered or default value.
+        Call pybox.was_canceled() to determine if the user canceled the input box (opt.nocancel() will disallow the ability to cancel)
+
+        Parameters:
+
+        - text          \t - [optional] The text to put as a header in the box.  You can use multiple lines.
+                        \t - if the first line starts with '+' that line becomes the title in the title bar and subsquent lines are printed in the description.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Range         \t -Set a range for the input.  This will not allow an input outside of the range, but can allow the user to press return
+        - Default       \t -Sets the default value.  This is placed in the input box when the box first comes up.  If the user presses return on a blank line, the default is returned.
+        - NoCancel      \t -By defaut, there is a cancel button to allow the user to cancel.  You can call pybox.was_canceled() which returns True if the last input box was canceled.
+                        \t -When NoCancel is specified, the user cannot cancel or press return on an empty line and must enter a value (a control-C may be pressed to stop the program.
+
+        Examples:       \t -My Value = pybox.get_float("Enter a number")
+                        \t -My Value = pybox.get_float("+This is the title bar title\\nEnter a number",range=(1,100),nocancel=True)
+                        \t -My Value = pybox.get_float("Enter a number\nNumber should be between 1 and 100,range=(1,100),default=10)
+        """        
+        return _pybox.GetFloat(text,*args,**kwargs)
+
+    def get_string(text=None,*args,**kwargs) -> str  :
+        """
+        Creates a window with an OK button to get a string from the user, displaying the text message above the input box. 
+
+        This function returns a string of the user-inputted text, or a blank string if nothing was entered or the input was canceled.
+
+        Use pybox.was_canceled() to determine of the input box was canceled by the user. 
+
+        Parameters:
+
+        - text          \t - [optional] The text to put as a header in the box.  You can use multiple lines.
+                        \t - if the first line starts with '+' that line becomes the title in the title bar and subsquent lines are printed in the description.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Default       \t -Sets the default text.  This is placed in the input box when the box first comes up.  If the user presses return on a blank line, the default is returned.
+        - NoCancel      \t -By defaut, there is a cancel button to allow the user to cancel.  You can call pybox.was_canceled() which returns True if the last input box was canceled.
+                        \t -When NoCancel is specified, the user cannot cancel or press return on an empty line and must enter some text (a control-C may be pressed to stop the program.
+        """
+        return _pybox.GetString(text,*args,**kwargs)
+
+    def get_open_file(filetypes : str = None) -> str     : 
+        """
+        Brings up the standard OS file selection menu where the user can select a file. 
+        See get_save_file() for a 'save' file name so that the system prompts for "overwrite" permission on existing names.
+
+        This function returns a string with the name of the file selected, or an empty string if the input was canceled.
+        Use pybox.was_canceled() to determine if the input was canceled (or check for an emptystring)
+
+        Parameters:
+
+        - filetypes     \t -- [optional] filetypes to limit display to, such as "*.bmp", "*.bmp;*.jpg", etc.  Default is no filter and will display all files
+
+        Examples: 
+                \t -pybox.get_open_file()
+                \t -pybox.get_open_file("*.bmp")
+                \t -pybox.get_open_file("*.bmp;*.png;*.jpg")
+
+        """
+        return _pybox.GetOpenFile(filetypes)
+
+    def get_save_file(filetypes : str = None) -> str     : 
+        """
+        Brings up the standard OS file selection menu where the user can select a file to save.
+        The system will prompt for "overwrite" permission for existing names, but will not alter the file.  
+        The function only returns the name selected, or an empty string.
+
+        This function returns a string with the name of the file selected, or an empty string if the input was canceled.
+        Use pybox.was_canceled() to determine if the input was canceled (or check for an emptystring)
+
+        Parameters:
+
+        - filetypes     \t -- [optional] filetypes to limit display to, such as "*.bmp", "*.bmp;*.jpg", etc.  Default is no filter and will display all files
+
+        Examples: 
+                \t -pybox.get_save_file()
+                \t -pybox.get_save_file("*.bmp")
+                \t -pybox.get_save_file("*.bmp;*.png;*.jpg")
+
+        """
+        return _pybox.GetSaveFile(filetypes)
+
+def get_integer(text=None,*args,**kwargs) -> int  :
+    """
+    Gets an integer value from a window that pops up with an input box.  The return value is the integer entered or default value.
+    Call pybox.was_canceled() to determine if the user canceled the input box (opt.nocancel() will disallow the ability to cancel)
+
+    Options:
+
+    text        \t - [optional] The text to put as a header in the box.  You can use multiple lines.
+                \t - if the first line starts with '+' that line becomes the title in the title bar and subsquent lines are printed in the description.
+
+    Keywords Pybox options can be included.  Some various options are as follows:
+
+    - Range         \t -Set a range for the input.  This will not allow an input outside of the range, but can allow the user to press return
+    - Default       \t -Sets the default value.  This is placed in the input box when the box first comes up.  If the user presses return on a blank line, the default is returned.
+    - NoCancel      \t -By defaut, there is a cancel button to allow the user to cancel.  You can call pybox.was_canceled() which returns True if the last input box was canceled.
+                    \t -When NoCancel is specified, the user cannot cancel or press return on an empty line and must enter a value (a control-C may be pressed to stop the program.
+
+    Examples:       \t -My Value = pybox.GetInteger("Enter a number")
+                    \t -My Value = pybox.GetInteger("+This is the title bar title\\nEnter a number",range=(1,100),nocancel=True)
+                    \t -My Value = pybox.GetInteger("Enter a number\nNumber should be between 1 and 100,range=(1,100),default=10)
+    """    
+    return _pybox.GetInteger(text,*args,**kwargs)
+
+def get_float(text=None,*args,**kwargs) -> float  :
+    """
+    Gets an floating-point value from a window that pops up with an input box.  The return value is the integer entered or default value.
+    Call pybox.was_canceled() to determine if the user canceled the input box (opt.nocancel() will disallow the ability to cancel)
+
+    Parameters:
+
+    - text          \t - [optional] The text to put as a header in the box.  You can use multiple lines.
+                    \t - if the first line starts with '+' that line becomes the title in the title bar and subsquent lines are printed in the description.
+
+    Keywords Pybox options can be included.  Some various options are as follows:
+
+    - Range         \t -Set a range for the input.  This will not allow an input outside of the range, but can allow the user to press return
+    - Default       \t -Sets the default value.  This is placed in the input box when the box first comes up.  If the user presses return on a blank line, the default is returned.
+    - NoCancel      \t -By defaut, there is a cancel button to allow the user to cancel.  You can call pybox.was_canceled() which returns True if the last input box was canceled.
+                    \t -When NoCancel is specified, the user cannot cancel or press return on an empty line and must enter a value (a control-C may be pressed to stop the program.
+
+    Examples:       \t -My Value = pybox.GetFloat("Enter a number")
+                    \t -My Value = pybox.GetFloat("+This is the title bar title\\nEnter a number",range=(1,100),nocancel=True)
+                    \t -My Value = pybox.GetFloat("Enter a number\nNumber should be between 1 and 100,range=(1,100),default=10)
+    """        
+    return _pybox.GetFloat(text,*args,**kwargs)
+
+def get_string(text=None,*args,**kwargs) -> str  :
+    """
+    Creates a window with an OK button to get a string from the user, displaying the text message above the input box. 
+
+    This function returns a string of the user-inputted text, or a blank string if nothing was entered or the input was canceled.
+
+    Use pybox.was_canceled() to determine of the input box was canceled by the user. 
+
+    Parameters:
+
+    - text          \t - [optional] The text to put as a header in the box.  You can use multiple lines.
+                    \t - if the first line starts with '+' that line becomes the title in the title bar and subsquent lines are printed in the description.
+
+    Keywords Pybox options can be included.  Some various options are as follows:
+
+    - Default       \t -Sets the default text.  This is placed in the input box when the box first comes up.  If the user presses return on a blank line, the default is returned.
+    - NoCancel      \t -By defaut, there is a cancel button to allow the user to cancel.  You can call pybox.was_canceled() which returns True if the last input box was canceled.
+                    \t -When NoCancel is specified, the user cannot cancel or press return on an empty line and must enter some text (a control-C may be pressed to stop the program.
+    """
+    return _pybox.GetString(text,*args,**kwargs)
+
+def get_open_file(filetypes : str = None) -> str     : 
+    """
+    Brings up the standard OS file selection menu where the user can select a file. 
+    See get_save_file() for a 'save' file name so that the system prompts for "overwrite" permission on existing names.
+
+    This function returns a string with the name of the file selected, or an empty string if the input was canceled.
+    Use pybox.was_canceled() to determine if the input was canceled (or check for an emptystring)
+
+    Parameters:
+
+    - filetypes     \t -- [optional] filetypes to limit display to, such as "*.bmp", "*.bmp;*.jpg", etc.  Default is no filter and will display all files
+
+    Examples: 
+            \t -pybox.get_open_file()
+            \t -pybox.get_open_file("*.bmp")
+            \t -pybox.get_open_file("*.bmp;*.png;*.jpg")
+
+    """
+    return _pybox.GetOpenFile(filetypes)
+
+def get_save_file(filetypes : str = None) -> str     : 
+    """
+    Brings up the standard OS file selection menu where the user can select a file to save.
+    The system will prompt for "overwrite" permission for existing names, but will not alter the file.  
+    The function only returns the name selected, or an empty string.
+
+    This function returns a string with the name of the file selected, or an empty string if the input was canceled.
+    Use pybox.was_canceled() to determine if the input was canceled (or check for an emptystring)
+
+    Parameters:
+
+    - filetypes     \t -- [optional] filetypes to limit display to, such as "*.bmp", "*.bmp;*.jpg", etc.  Default is no filter and will display all files
+
+    Examples: 
+            \t -pybox.get_save_file()
+            \t -pybox.get_save_file("*.bmp")
+            \t -pybox.get_save_file("*.bmp;*.png;*.jpg")
+
+    """
+    return _pybox.GetSaveFile(filetypes)
+
+
+def msgbox(text : str,*args,**kwargs) -> bool :
+    """
+    Displays a window with the given text and an "OK" button. Note: InfoWindow() and QuickButton() are the same function.
+
+    This is used to present general information in a window box. 
+
+    Parameters: 
+
+    - text          \t -- text to put into the window. 
+
+    About Dialog Box Text
+
+    The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+    If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+    Examples:
+
+            \t -pybox.msgbox("Press OK to continue")
+            \t -pybox.msgbox("+Information Window\nPress OK to continue")
+            \t -pybox.msgbox("Finished Processing\nPress OK to continue")
+            \t -pybox.msgbox("+My Process\nFinished Processing\nPress OK to continue")
+    """    
+    return _pybox.InfoWindow(text,str,*args,**kwargs)
+
+def msgbox_info(text : str,*args,**kwargs) -> bool :
+    """
+    Displays a window with the given text and an "OK" button. Note: InfoWindow() and QuickButton() are the same function.
+
+    This is used to present general information in a window box. 
+
+    Parameters: 
+
+    - text          \t -- text to put into the window. 
+
+    About Dialog Box Text
+
+    The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+    If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+    Examples:
+
+            \t -pybox.msgbox_info("Press OK to continue")
+            \t -pybox.msgbox_info("+Information Window\nPress OK to continue")
+            \t -pybox.msgbox_info("Finished Processing\nPress OK to continue")
+            \t -pybox.msgbox_info("+My Process\nFinished Processing\nPress OK to continue")
+    """    
+    return _pybox.InfoWindow(text,str,*args,**kwargs)
+
+def msgbox_yesno(text : str,*args,**kwargs) -> bool :
+    """
+    Displays a window with the given text and an "yes" button and a "no" button.
+
+    Parameters: 
+
+    - text          \t -- text to put into the window. 
+
+    Returns: True if "Yes" was input, or False if the No was pressed. 
+
+    About Dialog Box Text
+
+    The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+    If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+    Examples:
+
+            \t -pybox.msgbox_yesno("Would you like to continue?")
+            \t -pybox.msgbox_yesno("+Yes No Window\nWould you like to continue?")
+            \t -pybox.msgbox_yesno("Finished Processing\nWould you like to continue?")
+            \t -pybox.msgbox_yesno("+My Process\nWould you like to Continue?\nPress Yes to continue, No to quit.")
+
+    """    
+    return _pybox.YesNoWindow(text,str,*args,**kwargs)
+
+def msgbox_yesnocancel(text : str,*args,**kwargs) -> bool :
+    """
+    Displays a window with the given text and an "yes" button, "no" button, and "Cancel" button
+
+    Parameters: 
+
+    - text          \t -- text to put into the window. 
+
+    Returns: True if "Yes" was input, or False if the No was pressed. 
+                Use "pybox.dialog.WasCancelled() or pybox.WasCancelled() to determine if the Cancel button was pressed.
+
+    About Dialog Box Text
+
+    The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+    If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+    Examples:
+
+            \t -pybox.msgbox_yesnocancel("Would you like to continue?")
+            \t -pybox.msgbox_yesnocancel("+Yes No Window\nWould you like to continue?")
+            \t -pybox.msgbox_yesnocancel("Finished Processing\nWould you like to continue?")
+            \t -pybox.msgbox_yesnocancel("+My Process\nWould you like to Continue?\nPress Yes to continue, No to quit,Cancel to Exit.")
+
+    """    
+    return _pybox.YesNoCancelWindow(text,str,*args,**kwargs)
+
+def msgbox_okcancel(text : str,*args,**kwargs) -> bool :
+    """
+    Displays a window with the given text and an "Ok" button, and "Cancel" button
+
+    Parameters: 
+
+    - text          \t -- text to put into the window. 
+
+    Returns: True if "Ok" was input, or False if the Cancel was pressed. 
+                Use "pybox.dialog.WasCancelled() or pybox.WasCancelled() to determine if the Cancel button was pressed.
+
+    About Dialog Box Text
+
+    The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+    If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+    Examples:
+
+            \t -pybox.msgbox_okcancel("Would you like to continue?")
+            \t -pybox.msgbox_okcancel("+Yes No Window\nWould you like to continue?")
+            \t -pybox.msgbox_okcancel("Finished Processing\nWould you like to continue?")
+            \t -pybox.msgbox_okcancel("+My Process\nWould you like to Continue?\nPress Yes to continue or Cancel to quit.")
+
+    """
+    return _pybox.OkCancelWindow(text,str,*args,**kwargs)
+
+def quick_button(text : str,title : str = "Quick Button",*args,**kwargs) -> bool :
+    """
+    Displays a window with the given text and an "OK" button. Note: InfoWindow() and QuickButton() are the same function.
+
+    This is used to present general information in a window box. 
+
+    Parameters: 
+
+    - text          \t -- text to put into the window. 
+
+    About Dialog Box Text
+
+    The text for the dialog box can contain multiple lines.  The first line will be displayed in a larger font, with subsequent lines displayed in a smaller font. 
+    If the first line in the text starts with a '+' the text line becomes the text in the title bar window and is not placed in the dialog box itself. 
+
+    Examples:
+
+            \t -pybox.quick_button("Press OK to continue")
+            \t -pybox.quick_button("+Information Window\nPress OK to continue")
+            \t -pybox.quick_button("Finished Processing\nPress OK to continue")
+            \t -pybox.quick_button("+My Process\nFinished Processing\nPress OK to continue")
+    """
+    return _pybox.InfoWindow(text,title,*args,**kwargs)
+
+def please_wait(text = None,cancelok : bool = False,*args,**kwargs) -> bool :
+    """
+    Displays a please wait window in the center of the screen.
+        
+    Parameters:
+
+    - text         \t - - [optional] text to display in the Please Wait Window. If multiple lines are used, the first line displays in a larger font.
+    - cancelok    \t - - [optional] if specified, a "cancel" button.  This can be checked with please_wait_canceled() in the event loop.
+
+    Keywords Pybox options can be included.  Some various options are as follows:
+
+    - ProgressBar         \t -- Adds a progress bar to the please wait window.  This can be set from 0-100% with please_wait_set_progress()
+
+    Examples:
+
+            \t -pybox.please_wait()
+            \t -pybox.please_wait("Wait for process to finish")
+            \t -pybox.please_wait("Wait for process to finish\\nPress cancel to abort",True,opt.progresbar())
+    """
+    return _pybox.PleaseWaitWindow(text,opt.cancelok(cancelok),*args,**kwargs)
+
+def close_please_wait() -> bool :
+    """
+    Closes the Please Wait window if it is open.
+    """
+    return _pybox.ClosePleaseWait()
+
+def please_wait_set_progress(percent : int) -> bool :
+    """
+    If a Please Wait Window is open and has a progress bar, please_wait_set_progress() will set the percent complete of the progress bar.
+        
+    Parameters:
+
+    - percent          \t - - Percent (0-100) complete.
+
+    """
+    return _pybox.PleaseWaitSetProgress(percent)
+
+def please_wait_canceled() -> bool :
+    """
+    Returns True if the "Cancel" button was pressed in a Please Wait Window, False if not or after the first True return (because it is an event)
+        
+    note: Even when the Cancel button is pressed, the program must still close the Please Wait window with close_please_wait().
+
+    --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+    --> and will return False after the first call until the event occurs again. 
+
+        In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+    """
+    return _pybox.PleaseWaitCanceled()
+
+def color_selector(at=None,**kwargs) -> _ColorSelector :
+    """
+    Opens a Color Selector widget, as a popup window.    
+    - note: This is a standalone function and does not require creation of a window.  In this case, pybox.wait_event() can be use to poll for color_selector events \
+e.g. color_selector::value_changed(), etc.
+
+    - See Window.color_selector() for use with an existing window.
+        
+    With the color selector, you can select an RGB color using the wheel or input boxes next to the wheel itself. 
+    A color rectangle is shown with the currently selected color.
+        
+    color_selector() returns a _ColorSelector object which can be used to look at changes in the color wheel in the window's main event loop. 
+        
+    See the _ColorSelector object functions for more information.
+        
+    Parameters:
+        
+    - at          \t - Where to put the Color Selector Window.  If this is not used, the Color Selector Window is placed automatically.
+
+    Keywords usable when creating the Color Selector:
+
+    - Title         \t - Sets a title displayed in the window's top bar area, such as title="This is the window title".  Otherwise a default title is used.
+    - x,y           \t - 'x' and 'y' keywords can be used in place of using the 'at' parameter, i.e. x=500, y=200 instead of (500,200) or at=(500,200)
+  
+    examples:\t - color_sel = color_selector(at=(500,200))     --> Opens a Color Selector window as an individual window on the screen at x=500 and y=200
+        
+    - while pybox.wait_event() : if (color_sel.value_changed()) print("Color value = ",color_sel.get_rgb_value()) --> prints values as the wheel is moved.
+    """
+    from .widgets import _ColorSelector
+    return _ColorSelector(_pybox.ColorSelector(opt.at(at),**kwargs))
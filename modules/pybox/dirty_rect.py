@@ -0,0 +1,227 @@
+"""
+Pybox Dirty Rectangles -- the region of a window drawn since its last update().  See DirtyRect and
+Window.enable_dirty_tracking().
+"""
+
+from __future__ import annotations
+
+import numpy
+import inspect
+
+def _points(*points) :
+    "Bounds of a set of (x,y) points, or of an (N,2) list or array of points"
+    values = numpy.asarray(points[0] if len(points) == 1 else points,dtype=numpy.float64).reshape(-1,2)
+    if not len(values) : return None
+    (left,top),(right,bottom) = values.min(axis=0),values.max(axis=0)
+    return left,top,right,bottom
+
+def _ellipse(x,y,radius_x,radius_y) :
+    return x - radius_x,y - radius_y,x + radius_x,y + radius_y
+
+def _rect(x,y,width,height) :
+    return x,y,x + width,y + height
+
+def _bitmap_size(bitmap,size) :
+    "The displayed size of a bitmap (see Window.display_bitmap()), where a 0 in 'size' keeps the bitmap's aspect ratio"
+    width,height = (bitmap.shape[1],bitmap.shape[0]) if isinstance(bitmap,numpy.ndarray) else tuple(bitmap.size())
+    if size is None : return width,height
+    new_width,new_height = size
+    if not new_width and not new_height : return width,height
+    if not new_height : return new_width,height*new_width/max(1,width)
+    if not new_width : return width*new_height/max(1,height),new_height
+    return new_width,new_height
+
+def _bitmap(x,y,bitmap,size=None,*args,**kwargs) :
+    return _rect(x,y,*_bitmap_size(bitmap,size))
+
+def _bitmap_l(at,bitmap,size=None,*args,**kwargs) :
+    return _bitmap(at[0],at[1],bitmap,size)
+
+# Bounds of the window drawing functions (before the pen size is added), called with the function's own arguments, so they
+# take the same parameter names.  Functions that draw but are not listed here (i.e. lineto(), curves, text) mark the whole window.
+
+_DRAW_BOUNDS = {
+    "fill_quadrangle_fast"  : lambda p1,p2,p3,p4,*a,**k : _points(p1,p2,p3,p4),
+    "quadrangle_fast"       : lambda p1,p2,p3,p4,*a,**k : _points(p1,p2,p3,p4),
+    "fill_quadrangle"       : lambda p1,p2,p3,p4,*a,**k : _points(p1,p2,p3,p4),
+    "quadrangle"            : lambda p1,p2,p3,p4,*a,**k : _points(p1,p2,p3,p4),
+    "fill_triangle_fast"    : lambda p1,p2,p3,*a,**k : _points(p1,p2,p3),
+    "triangle_fast"         : lambda p1,p2,p3,*a,**k : _points(p1,p2,p3),
+    "fill_triangle"         : lambda p1,p2,p3,*a,**k : _points(p1,p2,p3),
+    "triangle"              : lambda p1,p2,p3,*a,**k : _points(p1,p2,p3),
+    "fill_rectangle_fast"   : lambda x,y,width,height,*a,**k : _rect(x,y,width,height),
+    "fill_rectangle_fast_l" : lambda at,size,*a,**k : _rect(at[0],at[1],size[0],size[1]),
+    "rectangle_fast"        : lambda x,y,width,height,*a,**k : _rect(x,y,width,height),
+    "rectangle_fast_l"      : lambda at,size,*a,**k : _rect(at[0],at[1],size[0],size[1]),
+    "fill_rectangle"        : lambda x,y,width,height,*a,**k : _rect(x,y,width,height),
+    "fill_rectangle_l"      : lambda at,size,*a,**k : _rect(at[0],at[1],size[0],size[1]),
+    "fill_rectangle_r"      : lambda size_rect,*a,**k : _rect(*size_rect[:4]),
+    "rectangle"             : lambda x,y,width,height,*a,**k : _rect(x,y,width,height),
+    "rectangle_l"           : lambda at,size,*a,**k : _rect(at[0],at[1],size[0],size[1]),
+    "rectangle_r"           : lambda size_rect,*a,**k : _rect(*size_rect[:4]),
+    "fill_ellipse_fast"     : lambda x,y,radius_x,radius_y,*a,**k : _ellipse(x,y,radius_x,radius_y),
+    "fill_ellipse_fast_l"   : lambda at,size,*a,**k : _ellipse(at[0],at[1],size[0],size[1]),
+    "ellipse_fast"          : lambda x,y,radius_x,radius_y,*a,**k : _ellipse(x,y,radius_x,radius_y),
+    "ellipse_fast_l"        : lambda at,size,*a,**k : _ellipse(at[0],at[1],size[0],size[1]),
+    "fill_ellipse"          : lambda x,y,radius_x,radius_y,*a,**k : _ellipse(x,y,radius_x,radius_y),
+    "fill_ellipse_l"        : lambda at,size,*a,**k : _ellipse(at[0],at[1],size[0],size[1]),
+    "fill_ellipse_r"        : lambda size_rect,*a,**k : _rect(*size_rect[:4]),
+    "ellipse"               : lambda x,y,radius_x,radius_y,*a,**k : _ellipse(x,y,radius_x,radius_y),
+    "ellipse_l"             : lambda at,size,*a,**k : _ellipse(at[0],at[1],size[0],size[1]),
+    "ellipse_r"             : lambda size_rect,*a,**k : _rect(*size_rect[:4]),
+    "fill_circle_fast"      : lambda x,y,radius,*a,**k : _ellipse(x,y,radius,radius),
+    "fill_circle_fast_l"    : lambda at,radius,*a,**k : _ellipse(at[0],at[1],radius,radius),
+    "circle_fast"           : lambda x,y,radius,*a,**k : _ellipse(x,y,radius,radius),
+    "circle_fast_l"         : lambda at,radius,*a,**k : _ellipse(at[0],at[1],radius,radius),
+    "circle"                : lambda x,y,radius,*a,**k : _ellipse(x,y,radius,radius),
+    "circle_l"              : lambda at,radius,*a,**k : _ellipse(at[0],at[1],radius,radius),
+    "fill_circle"           : lambda x,y,radius,*a,**k : _ellipse(x,y,radius,radius),
+    "fill_circle_l"         : lambda at,radius,*a,**k : _ellipse(at[0],at[1],radius,radius),
+    "polygon"               : lambda pos,*a,**k : _points(pos),
+    "fill_polygon"          : lambda Loc,*a,**k : _points(Loc),
+    "lines"                 : lambda pos,*a,**k : _points(pos),
+    "fill_lines"            : lambda pos,*a,**k : _points(pos),
+    "beziers"               : lambda pos,*a,**k : _points(pos),             # Bezier curves stay inside their control points
+    "fill_beziers"          : lambda pos,*a,**k : _points(pos),
+    "quad_beziers"          : lambda pos,*a,**k : _points(pos),
+    "fill_quad_beziers"     : lambda pos,*a,**k : _points(pos),
+    "bezier"                : lambda p1,p2,p3,p4,*a,**k : _points(p1,p2,p3,p4),
+    "fill_bezier"           : lambda p1,p2,p3,p4,*a,**k : _points(p1,p2,p3,p4),
+    "quad_bezier"           : lambda p1,p2,p3,*a,**k : _points(p1,p2,p3),
+    "fill_quad_bezier"      : lambda p1,p2,p3,*a,**k : _points(p1,p2,p3),
+    "arc"                   : lambda x,y,radius_x,radius_y,*a,**k : _ellipse(x,y,radius_x,radius_y),
+    "arc_l"                 : lambda pos,size,*a,**k : _ellipse(pos[0],pos[1],size[0],size[1]),
+    "fill_arc"              : lambda x,y,radius_x,radius_y,*a,**k : _ellipse(x,y,radius_x,radius_y),
+    "fill_arc_l"            : lambda pos,size,*a,**k : _ellipse(pos[0],pos[1],size[0],size[1]),
+    "pie"                   : lambda x,y,radius_x,radius_y,*a,**k : _ellipse(x,y,radius_x,radius_y),
+    "pie_l"                 : lambda pos,size,*a,**k : _ellipse(pos[0],pos[1],size[0],size[1]),
+    "fill_pie"              : lambda x,y,radius_x,radius_y,*a,**k : _ellipse(x,y,radius_x,radius_y),
+    "fill_pie_l"            : lambda pos,size,*a,**k : _ellipse(pos[0],pos[1],size[0],size[1]),
+    "line_fast"             : lambda x1,y1,x2,y2,*a,**k : _points((x1,y1),(x2,y2)),
+    "line_fast_l"           : lambda p1,p2,*a,**k : _points(p1,p2),
+    "line_segments"         : lambda Loc,*a,**k : _points(Loc),
+    "line"                  : lambda x1,y1,x2,y2,*a,**k : _points((x1,y1),(x2,y2)),
+    "line_l"                : lambda p1,p2,*a,**k : _points(p1,p2),
+    "set_pixel"             : lambda x,y,*a,**k : (x,y,x + 1,y + 1),
+    "set_pixel_l"           : lambda at,*a,**k : (at[0],at[1],at[0] + 1,at[1] + 1),
+    "set_pixels"            : lambda xs,ys,*a,**k : _points(numpy.stack([numpy.ravel(xs),numpy.ravel(ys)],axis=1)),
+    "plot_points"           : lambda points,*a,**k : _points(points),
+}
+
+# Drawing-object functions that don't draw
+
+_NOT_DRAWN = { "get_hue_color", "set_opacity", "get_opacity", "rotate_transform", "reset_transform", "translate_transform",
+               "translate_transform_l", "push_transform", "pop_transform", "set_pen_size" }
+
+# Window functions that draw.  None marks the whole window.
+
+_WINDOW_BOUNDS = {
+    "display_bitmap"        : _bitmap,
+    "display_bitmap_l"      : _bitmap_l,
+    "display_bitmap_r"      : _bitmap,
+    "display_bitmap_r_l"    : _bitmap_l,
+    "transform_bitmap"      : None,
+    "transform_bitmap_l"    : None,
+    "cls"                   : None,
+    "cls_radial"            : None,
+    "draw_vector"           : None,
+    "display_draw_groups"   : None,
+    "write"                 : None,
+    "writeln"               : None,
+    "write_xy"              : None,
+    "write_xy_l"            : None,
+}
+
+class DirtyRect :
+    """
+    Pybox Dirty Rectangle -- the bounding box of everything drawn in a window since it was last cleared.  See
+    Window.enable_dirty_tracking().
+
+    While tracking is enabled, the window's drawing functions (win.draw.*, display_bitmap(), cls(), write(), etc.) add the area
+    they draw to, including the pen size.  Areas that can't be known in Python -- shapes drawn with a transform set, text, and
+    functions without a known area -- add the whole window.
+    """
+    def __init__(self,window) :
+        self.__window   = window
+        self.__box      = None                  # (left,top,right,bottom), or None when nothing was drawn
+        self.__all      = False                 # True when the whole window is dirty
+        self.__pen_size = 1.0
+        self.__draw     = None
+
+    def __repr__(self):
+        return "pybox.DirtyRect"
+
+    def add(self,left,top,right,bottom) -> None :
+        "Adds a box (right and bottom are exclusive) to the dirty rectangle"
+        box = self.__box
+        if box is None : self.__box = (left,top,right,bottom)
+        else : self.__box = (min(box[0],left),min(box[1],top),max(box[2],right),max(box[3],bottom))
+
+    def add_window(self) -> None :
+        "Marks the whole window as dirty"
+        self.__all = True
+
+    def clear(self) -> None :
+        self.__box  = None
+        self.__all  = False
+
+    def rect(self) :
+        "Returns (x,y,width,height) of the dirty rectangle, clipped to the window, or None when nothing was drawn"
+        if not self.__all and self.__box is None : return None
+        width,height = self.__window.get_window_size()
+        if self.__all : return (0,0,int(width),int(height))
+        left,top,right,bottom = self.__box
+        left,top        = max(0,int(numpy.floor(left))),max(0,int(numpy.floor(top)))
+        right,bottom    = min(int(width),int(numpy.ceil(right))),min(int(height),int(numpy.ceil(bottom)))
+        if right <= left or bottom <= top : return None
+        return (left,top,right - left,bottom - top)
+
+    def _install(self) -> None :
+        "Wraps the window's drawing functions so they add their areas"
+        window  = self.__window
+        draw    = self.__draw = window.draw
+        for name in dir(type(draw)) :
+            if name.startswith("_") or name in _NOT_DRAWN : continue
+            function = getattr(draw,name)
+            if callable(function) : draw.__dict__[name] = self.__drawing(function,_DRAW_BOUNDS.get(name),True)
+        draw.__dict__["set_pen_size"] = self.__pen(draw.set_pen_size)
+        for name,bounds in _WINDOW_BOUNDS.items() :
+            window.__dict__[name] = self.__drawing(getattr(window,name),bounds,False)
+
+    def _uninstall(self) -> None :
+        "Removes the wrappers added by _install()"
+        for name in [name for name in self.__draw.__dict__ if not name.startswith("_")] : del self.__draw.__dict__[name]
+        for name in _WINDOW_BOUNDS : self.__window.__dict__.pop(name,None)
+
+    def __drawing(self,function,bounds,transformed : bool) :
+        "Wraps a drawing function.  'transformed' is True for functions drawn with the current transform."
+        draw        = self.__draw
+        parameters  = list(inspect.signature(function).parameters)
+        pen_index   = parameters.index("pen_size") if "pen_size" in parameters else None   # the fast functions take it in order
+        def tracked(*args,**kwargs) :
+            box = None
+            if bounds is not None and not (transformed and draw._WinDraw__transforms) :
+                try :
+                    box = bounds(*args,**kwargs)
+                except (TypeError,ValueError,IndexError,AttributeError) :
+                    box = None
+            if box is None :
+                self.__all = True
+            else :
+                pen_size = kwargs.get("pen_size")
+                if pen_size is None and pen_index is not None and pen_index < len(args) : pen_size = args[pen_index]
+                pen = max(self.__pen_size,float(pen_size or 0))/2 + 1
+                self.add(box[0] - pen,box[1] - pen,box[2] + pen,box[3] + pen)
+            return function(*args,**kwargs)
+        tracked.__name__    = function.__name__
+        tracked.__doc__     = function.__doc__
+        tracked.__wrapped__ = function
+        return tracked
+
+    def __pen(self,function) :
+        def set_pen_size(pen_size) :
+            self.__pen_size = float(pen_size)
+            return function(pen_size)
+        set_pen_size.__doc__     = function.__doc__
+        set_pen_size.__wrapped__ = function
+        return set_pen_size
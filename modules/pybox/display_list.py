@@ -0,0 +1,141 @@
+"""
+Pybox Display Lists -- see DisplayList and Window.new_display_list().
+"""
+
+from __future__ import annotations
+
+import inspect
+import itertools
+from .draw import _WinDraw
+
+_NOT_DRAWN  = { "get_hue_color", "get_opacity" }
+
+_signatures = {}
+
+def _signature(name : str) :
+    "Returns (signature without 'self', name of the **kwargs parameter or None) for a _WinDraw function"
+    found = _signatures.get(name)
+    if found is None :
+        signature   = inspect.signature(getattr(_WinDraw,name))
+        parameters  = list(signature.parameters.values())[1:]
+        var_keyword = next((p.name for p in parameters if p.kind == p.VAR_KEYWORD),None)
+        found = _signatures[name] = (signature.replace(parameters=parameters),var_keyword)
+    return found
+
+class _Item :
+    "One recorded drawing call"
+    __slots__ = ("name","bound","call")
+
+class DisplayList :
+    """
+    Pybox Display List
+
+    A DisplayList records a window's drawing calls (i.e. win.draw.fill_circle(), win.draw.line(), translate_transform(), set_opacity())
+    once, and draws them all again with one replay() call -- i.e. for the static parts of a scene that is redrawn each frame after
+    a cls().
+
+    Drawing functions are called on the DisplayList as they would be on win.draw.  Instead of drawing, each call is recorded
+    and returns a handle that can be used to change the call's values later with update(), or to remove it with remove().
+
+    Items are drawn in the order they were recorded, so transforms, opacity and pen size settings apply to the items recorded after
+    them, as they do when drawing.  Each item's arguments are bound to its drawing function's parameters when it is recorded or
+    updated, so replay() makes the calls without checking them again.
+
+    Examples:
+                \t -scene = win.new_display_list()
+                \t -for x,y in stars : scene.fill_circle(x,y,2,"white")
+                \t -sun = scene.fill_circle(400,300,50,"yellow")
+                \t -while win.vsync_wait() :
+                \t -    win.cls()
+                \t -    scene.update(sun,radius=50 + 10*math.sin(time.time()))
+                \t -    scene.replay()
+    """
+    def __init__(self,window) :
+        self.__draw     = window.draw
+        self.__items    = {}
+        self.__handles  = itertools.count(1)
+
+    def __repr__(self):
+        return "pybox.DisplayList"
+
+    def __len__(self) -> int :
+        return len(self.__items)
+
+    def __contains__(self,handle) -> bool :
+        return handle in self.__items
+
+    def __getattr__(self,name : str) :
+        if name.startswith("_") or name in _NOT_DRAWN or not callable(getattr(_WinDraw,name,None)) :
+            raise AttributeError("'DisplayList' object has no attribute '{0}'".format(name))
+        def record(*args,**kwargs) -> int :
+            return self.__record(name,args,kwargs)
+        record.__name__ = name
+        record.__doc__  = getattr(_WinDraw,name).__doc__
+        self.__dict__[name] = record        # found directly from now on
+        return record
+
+    def __record(self,name : str,args,kwargs) -> int :
+        signature,_ = _signature(name)
+        item        = _Item()
+        item.name   = name
+        item.bound  = signature.bind(*args,**kwargs)
+        item.bound.apply_defaults()
+        self.__encode(item)
+        handle = next(self.__handles)
+        self.__items[handle] = item
+        return handle
+
+    def __encode(self,item : _Item) -> None :
+        "Converts an item's values to a call"
+        item.call = (item.name,item.bound.args,item.bound.kwargs)
+
+    def update(self,handle : int,*args,**kwargs) -> bool :
+        """
+        Changes the values of a recorded drawing call.  Values that are not given keep their recorded values.
+
+        Parameters
+
+        - handle    \t -- Handle returned when the call was recorded
+        - args      \t -- New values for the first parameters of the drawing function, in order
+        - kwargs    \t -- New values for named parameters (i.e. x=100, radius=20, inside_color="red") and keywords (i.e. opacity=128)
+
+        Examples:
+                    \t -sun = scene.fill_circle(400,300,50,"yellow")
+                    \t -scene.update(sun,500,300)                 - moves the circle to (500,300)
+                    \t -scene.update(sun,inside_color="orange")   - changes its color only
+        """
+        item = self.__items.get(handle)
+        if item is None : raise KeyError("DisplayList has no item with handle {0}".format(handle))
+        signature,var_keyword = _signature(item.name)
+        changes = signature.bind_partial(*args,**kwargs).arguments
+        for key,value in changes.items() :
+            if key == var_keyword : item.bound.arguments[key] = dict(item.bound.arguments[key],**value)
+            else : item.bound.arguments[key] = value
+        self.__encode(item)
+        return True
+
+    def remove(self,handle : int) -> bool :
+        """
+        Removes a recorded drawing call.  Returns False if there is no item with the handle.
+        """
+        if self.__items.pop(handle,None) is None : return False
+        return True
+
+    def clear(self) -> bool :
+        """
+        Removes all recorded drawing calls.
+        """
+        self.__items.clear()
+        return True
+
+    def replay(self) -> bool :
+        """
+        Draws all recorded calls to the window, in the order they were recorded.
+
+        Transforms recorded in the list remain set after replay() -- record a reset_transform() at the end of the list to remove them.
+        """
+        draw = self.__draw
+        for item in self.__items.values() :
+            name,args,kwargs = item.call
+            getattr(draw,name)(*args,**kwargs)              # looked up here, so dirty tracking (see Window.enable_dirty_tracking()) sees the call
+        return True
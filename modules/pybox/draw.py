@@ -0,0 +1,3053 @@
+"""
+Pybox Window Drawing Functions -- the 'draw' object of each window (i.e. win.draw.circle()).
+
+This module is imported the first time a window's 'draw' attribute is used.
+"""
+
+from __future__ import annotations
+
+import numpy
+from ._core import RgbColor, _pybox
+from .colors import Color, _library_color, _resolved, _color_rows
+from .options import opt
+from .trail import TrailBuffer
+
+def _batch_colors(colors,count : int) :
+    """
+    Colors for the batch drawing functions: a 2-D array (or a list of RgbColors) of per-shape colors is returned as an (N,3) or (N,4)
+    uint8 array.
+    Anything else is one color for every shape, and is returned as-is.
+    """
+    if isinstance(colors,(str,RgbColor)) : return colors
+    colors = _color_rows(colors,True)
+    if numpy.ndim(colors) != 2 : return colors
+    colors = numpy.asarray(colors)
+    if colors.shape[0] != count or colors.shape[1] not in (3,4) :
+        raise ValueError("colors must be one color, or an (N,3) or (N,4) array with one color for each of the N shapes")
+    return colors if colors.dtype == numpy.uint8 else numpy.clip(colors,0,255).astype(numpy.uint8)
+
+def _blended_points(xs : numpy.ndarray,ys : numpy.ndarray,colors,blend : str,opacity : int,width : int,height : int) :
+    """
+    Blends pixels in numpy, for set_pixels() and plot_points().  Returns the (x,y) of the pixels'
+    bounding box and a [height][width][4] Red, Green, Blue, Mask image of it, whose mask is the opacity of the pixels over the window
+    (0 where there are no pixels), or None when no pixel is in the window.
+    """
+    keep = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    if isinstance(colors,numpy.ndarray) and colors.ndim == 2 :
+        rgb     = colors[keep,:3].astype(numpy.float64)
+        alpha   = colors[keep,3]/255.0 if colors.shape[1] == 4 else numpy.ones(len(rgb))
+    else :
+        from .colors import color
+        value   = color(colors)
+        count   = int(numpy.count_nonzero(keep))
+        rgb     = numpy.tile(numpy.array((value.red,value.green,value.blue),dtype=numpy.float64),(count,1))
+        alpha   = numpy.full(count,value.opacity/255.0)
+    xs,ys = xs[keep].astype(numpy.int64),ys[keep].astype(numpy.int64)
+    if not len(xs) : return None
+    left,top        = int(xs.min()),int(ys.min())
+    width,height    = int(xs.max()) + 1 - left,int(ys.max()) + 1 - top
+    order           = numpy.argsort((ys - top)*width + (xs - left),kind="stable")     # pixels grouped by location, in drawing order
+    index           = ((ys - top)*width + (xs - left))[order]
+    rgb,alpha       = rgb[order],alpha[order]
+    unique,start    = numpy.unique(index,return_index=True)
+    if blend == "replace" :
+        color,cover = rgb[numpy.append(start[1:],len(index)) - 1],numpy.ones(len(unique))     # the last pixel drawn at each location
+    else :
+        alpha = alpha*max(0,min(255,int(opacity)))/255.0
+        if blend == "add" :
+            total   = numpy.minimum(numpy.add.reduceat(rgb*alpha[:,None],start),255.0)
+            cover   = total.max(axis=1)/255.0
+        else :
+            # As with the native blending: each point has the weight alpha*(1-alpha) of the points after it, and the window the
+            # product of (1-alpha) of all of them.  The products are sums of logs within each location's group.
+
+            opaque  = alpha >= 1.0
+            logs    = numpy.log1p(-numpy.where(opaque,0.0,alpha))
+            group   = numpy.repeat(numpy.arange(len(unique)),numpy.diff(numpy.append(start,len(index))))
+            sums    = numpy.cumsum(logs[::-1])[::-1]
+            after   = sums - logs - numpy.append(sums[start[1:]],0.0)[group]
+            blocked = numpy.cumsum(opaque[::-1])[::-1] - opaque
+            blocked = blocked - numpy.append(blocked[start[1:]] + opaque[start[1:]],0)[group]
+            total   = numpy.add.reduceat(rgb*(alpha*numpy.exp(after)*(blocked == 0))[:,None],start)
+            cover   = 1.0 - numpy.exp(after[start] + logs[start])*((blocked + opaque)[start] == 0)
+        color = total/numpy.maximum(cover,1e-12)[:,None]
+    image = numpy.zeros((height*width,4),dtype=numpy.uint8)
+    image[unique,:3]    = numpy.clip(color + .5,0,255)
+    image[unique,3]     = numpy.clip(cover*255.0 + .5,0,255)
+    return left,top,image.reshape(height,width,4)
+
+# set_pixels() draws pixels with one WindowDrawPixel() call each below these counts: the fixed cost of the image, and the window
+# pixels in its bounding box for each pixel drawn -- measured against the cost of one set_pixel() call, with the image displayed
+# by the headless backend (which displays images more slowly than the Pybox library)
+
+_PIXEL_CALLS_MAX    = 128
+_PIXEL_BOX_AREA     = 64
+
+def _thin_pixels(xs : numpy.ndarray,ys : numpy.ndarray,width : int,height : int) -> bool :
+    "True when the pixels are spread so thinly over their bounding box (within the window) that drawing it costs more than one call each"
+    box_width   = min(int(xs.max()),width - 1) - max(int(xs.min()),0) + 1
+    box_height  = min(int(ys.max()),height - 1) - max(int(ys.min()),0) + 1
+    return box_width > 0 and box_height > 0 and len(xs)*_PIXEL_BOX_AREA < box_width*box_height
+
+class _WinDraw :
+    """
+    The WinDraw class contains drawing functions that can be used in pybox.  Many functions can be found in the regular window class. 
+
+    Drawing functions are collected here for easier access and so that typing "draw." after your window name will list all functions, i.e. "MyWindow.draw"
+
+    Drawing functions are split between 'fast' functions and regular drawing functions (i.e. "CircleFast" vs "Circle"). 
+
+    The 'fast' functions are about 10x faster to draw and can be useful in drawing various graphics where quality is not the largest issue.
+
+    Other functions use the GDI functions and are more compatible with the upcoming GPU-based functions.  Most of these functions support opacity levels
+    as well as transformations.
+
+    See the individual function descriptions for more information
+    """
+    def __init__(self, outer) : 
+        self.__id = outer._Window__id
+        self.__transforms   = []        # the translate_transform() and rotate_transform() calls since reset_transform(), for pop_transform()
+        self.__stack        = []
+        #self.pointer = outer._Window__pointer
+
+    #
+    # Window WinDraw class functions Class Functions
+    # 
+
+    def get_hue_color(self,deg : int) -> RgbColor :
+        """
+        Returns a bright, primary color based on the input value. 
+
+        get_hue_color() is a quick way to grab a bright color as specific value or in a random manner. 
+
+        For example, get_hue_color(0) returns a bright red, where get_hue_color(60) returns a bright magenta, and 
+        get_hue_color(120) returns a bright Blue, and so-forth.
+
+        Parameters
+
+        - deg      \t -- Input degrees, from 0-360. 
+
+        Notable Values:
+
+        - 0     \t --Red.  Same as GetHueColor(360)
+        - 60    \t --Purple / Magenta
+        - 120   \t --Blue
+        - 180   \t --Cyan
+        - 240   \t --Green
+        - 300   \t --Yellow
+
+        Returns: A pybox RgbColor object consisting of a Red, Green, and Blue value
+        """
+        from .colors import get_hue_color
+        return get_hue_color(deg)
+
+    def set_opacity(self,opacity) -> bool :
+        """
+        Sets the opacity of the drawing functions such as Circle, Ellipse, Polygon, Line, etc. 
+
+        A 100% opacity is fully opaque, where a 0% opacity is fully transparent (i.e. not visible). 
+
+        Opacity works only with regular drawing functions and not the 'fast' functions.  When set to a value, this will persist
+        for all drawing functions.
+
+        Parameters:
+
+        - opacity         \t -- Opacity from 0-100 (or 0-255 if 'byValue' is True)
+
+        """
+        return _pybox.DrawSetDrawOpacity(self.__id,opacity)
+
+    def get_opacity(self) -> int :
+        """
+        Returns the opacity value set for drawing functions such as Circle, Ellipse, Polygon, Line, etc.
+
+        The value is returned as a 0-255 value, where 0 is completely transparent and 255 is fully opaque (default).
+
+        See SetOpacity() to set the opacity of drawing functions.
+        """
+        return _pybox.DrawGetDrawOpacity(self.__id)
+
+    def rotate_transform(self,angle) -> bool :
+        """
+        Sets a rotational transform for drawing operations such as Circle, Ellipse, Polygon, Line, etc.
+
+        After set, any object drawn (i.e. circle, rectangles, etc.) will be drawn rotated to the angle specified. 
+
+        Transforms only work with regular drawing functions and not the 'fast' functions.  
+
+        Note: Transforms are additive.  You must use ResetTransform() to repeat transform blocks.  Otherwise they will 
+        add on to each other with odd results. 
+
+        Parameters
+
+        - Angle         \t -- Angle to rotate drawn objects, in degrees (0-360)
+
+        Example:
+            MyWindow.Draw.rotate_transform(60)
+            MyWindow.Draw.rectangle(x,y,width,height,color)
+            ... other drawing functions
+
+            MyWindow.Draw.reset_transform()      # remove transforms. 
+
+        """
+        self.__transforms.append((angle,))
+        return _pybox.DrawRotateTransform(self.__id,angle)
+
+    def reset_transform(self) -> bool : 
+        """
+        Resets all transforms associated with the current graphics set. 
+
+        See RotateTransform() and ResetTransform() for more information.
+        See push_transform() and pop_transform() to return to an earlier transform rather than resetting it.
+        """
+        self.__transforms = []
+        return _pybox.DrawResetTransform(self.__id)
+
+    def translate_transform(self,x,y) -> bool : 
+        """
+        Sets a translation transform for drawn objects such as a Circle, Ellipse, Polygon, Line, etc.
+        See translate_transform_l() to use a list, tuple, or array to specify the location.
+
+        This causes the point (0,0) to be translated as (x,y) value. 
+
+        This is useful when drawing multiple objects with the same relative center without the need to specify
+        different coordinates for each object.
+
+        Parameters:
+
+        - x,y         \t -- x,y coordinates of new center. 
+
+        Transforms only work with regular drawing functions and not the 'fast' functions.  
+
+        Note: Transforms are additive.  You must use ResetTransform() to repeat transform blocks.  Otherwise they will 
+        add on to each other with odd results. 
+
+        Example:
+
+        Example:
+            MyWindow.draw.translate_transform(400,200)
+            MyWindow.draw.circle(0,0,200,"red")     # draws circle at 400,200 even though 0,0 is specified.
+
+            ... other drawing functions
+
+            MyWindow.Draw.reset_transform()      # remove transforms. 
+
+        """
+        self.__transforms.append((x,y))
+        return _pybox.DrawTranslateTransform(self.__id,x,y)
+
+    def translate_transform_l(self,at : list) -> bool : 
+        """
+        Sets a translation transform for drawn objects such as a Circle, Ellipse, Polygon, Line, etc.
+        See translate_transform() specify individual values for x,y
+
+        This causes the point (0,0) to be translated as (x,y) value. 
+
+        This is useful when drawing multiple objects with the same relative center without the need to specify
+        different coordinates for each object.
+
+        Parameters:
+
+        - at         \t -- x,y coordinates of new center. 
+
+        Transforms only work with regular drawing functions and not the 'fast' functions.  
+
+        Note: Transforms are additive.  You must use ResetTransform() to repeat transform blocks.  Otherwise they will 
+        add on to each other with odd results. 
+
+        Example:
+
+        Example:
+            MyWindow.Draw.TranslateTransformL(400,200)
+            MyWindow.Draw.Circle(0,0,200,"red")     # draws circle at 400,200 even though 0,0 is specified.
+
+            ... other drawing functions
+
+            MyWindow.Draw.ResetTransform()      # remove transforms. 
+
+        """            
+        return self.translate_transform(at[0],at[1])
+
+    def push_transform(self) -> bool :
+        """
+        Saves the current transform, so it can be restored with pop_transform().  Transforms set after push_transform() are added to the
+        saved transform, and pop_transform() removes them -- nested transforms don't need reset_transform() and setting the outer
+        transforms again.
+
+        Each push_transform() must be matched with a pop_transform().
+
+        The Pybox library has no transform stack, so pop_transform() resets the transform and makes the translate_transform() and
+        rotate_transform() calls made before push_transform() again -- one library call each, as setting the outer transforms again
+        by hand would.
+
+        Example:
+            MyWindow.draw.translate_transform(600,420)                  # center of the wheel
+            for i in range(20) :
+                MyWindow.draw.push_transform()
+                MyWindow.draw.rotate_transform(i*18)
+                MyWindow.draw.translate_transform(200,0)
+                MyWindow.draw.fill_rectangle(-50,-50,100,100,"red")
+                MyWindow.draw.pop_transform()                           # back to the center of the wheel
+        """
+        self.__stack.append(list(self.__transforms))
+        return True
+
+    def pop_transform(self) -> bool :
+        """
+        Restores the transform saved by the last push_transform().  See push_transform() for more information.
+        """
+        if not self.__stack : raise ValueError("pop_transform() was called without a matching push_transform()")
+
+        # The Pybox library has no transform stack, so the transform is reset and the calls made before push_transform() are made again
+
+        transforms = self.__stack.pop()
+        if transforms == self.__transforms : return True
+        self.__transforms = transforms
+        _pybox.DrawResetTransform(self.__id)
+        for transform in self.__transforms :
+            if len(transform) == 2 : _pybox.DrawTranslateTransform(self.__id,*transform)
+            else : _pybox.DrawRotateTransform(self.__id,*transform)
+        return True
+
+    def set_pen_size(self,pen_size : int) :
+        """
+        Sets the size of the drawing pen, which is the size of lines and shape borders (i.e. circles, squares, etc.)
+
+        Parameters:
+
+        \t -- pen_size               \t -- Size of the pen.  Currently an integer value, but will accept floating-point in a future version.
+
+        Example:
+
+                MyWin.set_pen_size(10)
+                MyWin.draw.Ellipse(500,500,200,400,"yellow")
+
+                where: if set_pen_size() is not called prior to DrawEllipse(), the current pen size is used.
+
+        The default pen_size is 1.
+
+        Note: You can specify the pen size in all functions that use it, such as: 
+
+        \t -- MyWin.draw.ellipse(500,500,200,400,"yellow",10). 
+
+        set_pen_size() will set the pen size globally and will use that pen size for all functions when the pen size is omitted.
+
+        When the Pen Size is included in a function, the pen size is used only for that function.
+
+        """
+        return _pybox.WindowSetPenSize(self.__id,pen_size)
+
+    #
+    # Quadrangle Functions
+    #
+
+    def fill_quadrangle_fast(self,p1 : list, p2 : list, p3 : list,p4 : list,inside_color,border_color = 0,pen_size : int = 0) :
+        """
+        Draws a 'fast' filled Quadrangle on the screen with axis points at p1, p2, p3, and p4. 
+
+        See quadrangle_fast() to draw an open/wireframe Quadrangle vs. a filled Quadrangle. 
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        \t -- p1,p2,p3,p4     \t -- Location of the 3 axes of the quadrangle
+        \t -- inside_color     \t -- Color of the interior of the quadrangle
+        \t -- border_color     \t -- [optional] Color if the outside edge of the quadrangle (based on the current Pen Size).  When omitted, the entire quadrangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using border_color.
+        \t -- pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+            \t -p1 = (300,300)
+            \t -p2 = (200,500)
+            \t -p3 = (400,500)
+            \t -p4 = (500,600)
+
+            window.draw.fill_quadrangle_fast(p1,p2,p3,p4,"yellow","red")
+            window.draw.fill_quadrangle_fast(p1,p2,p3,p4,"yellow",6)
+
+        """
+        return _pybox.WindowDrawQuadrangleFast(self.__id,p1,p2,p3,p4,_library_color(inside_color),_library_color(border_color),pen_size,False)
+
+    def quadrangle_fast(self,p1 : list, p2 : list, p3 : list,p4 : list,color,pen_size : int = 0) :
+        """
+        Draws a 'fast' open/wireframe Quadrangle on the screen with axis points at p1, p2, p3, and p4. 
+
+        See fill_quadrangle_fast() to draw an filled Quandrangle vs. an open/wireframe Quadrangle.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        \t -- p1,p2,p3,p4     \t -- Location of the 3 axes of the quadrangle
+        \t -- inside_color     \t -- Color of the interior of the quadrangle
+        \t -- border_color     \t -- [optional] Color if the outside edge of the quadrangle (based on the current Pen Size).  When omitted, the entire quadrangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using border_color.
+        \t -- pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+            \t -p1 = (300,300)
+            \t -p2 = (200,500)
+            \t -p3 = (400,500)
+            \t -p4 = (500,600)
+
+            window.draw.quadrangle_fast(p1,p2,p3,p4,"red")
+            window.draw.quadrangle_fast(p1,p2,p3,p4,"yellow",6)
+
+        """
+        return _pybox.WindowDrawQuadrangleFast(self.__id,p1,p2,p3,p4,_library_color(color),_library_color(color),pen_size,True)
+
+    # HR Quadrangle Functions
+
+    def fill_quadrangle(self,p1 : list, p2 : list, p3 : list,p4 : list,inside_color,**kwargs) :
+        """
+        Draws a filled Quadrangle on the screen with axis points at p1, p2, p3, and p4. 
+
+        See quadrangle() to draw an open/wireframe Quadrangle vs. a filled Quadrangle. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        \t -- p1,p2,p3,p4     \t -- Location of the 3 axes of the quadrangle
+        \t -- inside_color     \t -- Color of the interior of the quadrangle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_color   \t -- Color if the outside edge of the quadrangle (based on the current Pen Size).  When omitted, the entire quadrangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using border_color.
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+            \t -p1 = (300,300)
+            \t -p2 = (200,500)
+            \t -p3 = (400,500)
+            \t -p4 = (500,600)
+
+            window.draw.fill_quadrangle(p1,p2,p3,p4,"yellow",pen_color="red")
+            window.draw.fill_quadrangle(p1,p2,p3,p4,"yellow",pen_size=6)
+
+        """
+        return _pybox.WindowDrawQuadrangle(self.__id,p1,p2,p3,p4,_library_color(inside_color),False,**kwargs)
+
+    def quadrangle(self,p1 : list, p2 : list, p3 : list,p4 : list,color,**kwargs) :
+        """
+        Draws a an open/wireframe Quadrangle on the screen with axis points at p1, p2, p3, and p4. 
+
+        See fill_quadrangle() to draw a filled Quadrangle vs an open/wireframe Quadrangle.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        \t -- p1,p2,p3,p4     \t -- Location of the 3 axes of the quadrangle
+        \t -- inside_color     \t -- Color of the interior of the quadrangle
+        \t -- pen_color     \t -- [optional] Color if the outside edge of the quadrangle (based on the current Pen Size).  When omitted, the entire quadrangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+            \t -p1 = (300,300)
+            \t -p2 = (200,500)
+            \t -p3 = (400,500)
+            \t -p4 = (500,600)
+
+            window.draw.quadrangle(p1,p2,p3,p4,"red")
+            window.draw.quadrangle(p1,p2,p3,p4,"yellow",pen_size=6)
+
+        """
+        return _pybox.WindowDrawQuadrangle(self.__id,p1,p2,p3,p4,_library_color(color),True,**kwargs)
+
+    #
+    # Triangle Functions
+    #
+
+    def fill_triangle_fast(self,p1 : list, p2 : list, p3 : list,inside_color,border_color = 0,pen_size : int = 0) :
+        """
+        Draws a 'fast' filled Triangle on the screen with axis points at p1, p2, and p3. 
+
+        See triangle_fast() to draw an open/wireframe Triangle vs. a filled Triangle. 
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        \t -- p1,p2,p3        \t -- Location of the 3 axes of the triangle
+        \t -- inside_color     \t -- Color of the interior of the triangle
+        \t -- border_color     \t -- [optional] Color if the outside edge of the triangle (based on the current Pen Size).  When omitted, the entire triangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using border_color.
+        \t -- pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+            \t -p1 = (300,300)
+            \t -p2 = (200,500)
+            \t -p3 = (400,500)
+
+            window.draw.fill_triangle_fast(p1,p2,p3,"yellow","red")
+            window.draw.fill_triangle_fast(p1,p2,p3,"yellow",6)
+
+        """
+        return _pybox.WindowDrawFilledTriangleFast(self.__id,p1,p2,p3,_library_color(inside_color),_library_color(border_color),pen_size)
+
+    def triangle_fast(self,p1 : list, p2 : list, p3 : list,color,pen_size : int = 0) :
+        """
+        Draws a 'fast' open/wireframe Triangle on the screen with axis points at p1, p2, and p3.
+
+        See fill_triangle_fast() to draw an filled Triangle vs. an open/wireframe Triangle.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        \t -- p1,p2,p3        \t -- Location of the 3 axes of the triangle
+        \t -- color           \t -- Color of the interior of the triangle
+        \t -- pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+            \t -p1 = (300,300)
+            \t -p2 = (200,500)
+            \t -p3 = (400,500)
+
+            window.draw.TriangleFast(p1,p2,p3,"red")
+            window.draw.TriangleFast(p1,p2,p3,"yellow",6)
+
+        """
+        return _pybox.WindowDrawTriangleFast(self.__id,p1,p2,p3,_library_color(color),_library_color(color),pen_size)
+
+    # HR Triangles
+
+    def fill_triangle(self,p1 : list, p2 : list, p3 : list,inside_color,**kwargs) :
+        """
+        Draws a filled Triangle on the screen with axis points at p1, p2, and p3 
+
+        See triangle() to draw an open/wireframe Triangle vs. a filled Triangle. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        \t -- p1,p2,p3        \t -- Location of the 3 axes of the triangle
+        \t -- inside_color     \t -- Color of the interior of the triangle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_color   \t -- Color if the outside edge of the triangle (based on the current Pen Size).  When omitted, the entire triangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+            \t -p1 = (300,300)
+            \t -p2 = (200,500)
+            \t -p3 = (400,500)
+
+            window.draw.fill_triangle(p1,p2,p3,"yellow",pen_color="red")
+            window.draw.fill_triangle(p1,p2,p3,"yellow",pen_size=6)
+
+        """
+        return _pybox.WindowDrawTriangle(self.__id,p1,p2,p3,_library_color(inside_color),False,**kwargs)
+    def fill_triangle_test(self,p1 : list, p2 : list, p3 : list,inside_color,**kwargs) :
+        return _pybox.WindowDrawTriangle_Test(self.pointer[0],self.pointer[1],p1,p2,p3,_library_color(inside_color),False,**kwargs)
+
+    def triangle(self,p1 : list, p2 : list, p3 : list,color,**kwargs) :
+        """
+        Draws a an open/wireframe Triangle on the screen with axis points at p1, p2, p3. 
+
+        See fill_triangle() to draw a filled Triangle vs an open/wireframe Triangle.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        \t -- p1,p2,p3        \t -- Location of the 3 axes of the triangle
+        \t -- color           \t -- Color of the interior of the triangle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+            \t -p1 = (300,300)
+            \t -p2 = (200,500)
+            \t -p3 = (400,500)
+
+            window.draw.triangle(p1,p2,p3,"red")
+            window.draw.triangle(p1,p2,p3,"yellow",pen_size=6)
+
+        """
+        return _pybox.WindowDrawTriangle(self.__id,p1,p2,p3,_library_color(color),True,**kwargs)
+
+    #
+    # Rectangle Functions
+    #
+
+    def fill_rectangle_fast(self,x : int,y : int,width : int,height : int,inside_color,border_color = 0,pen_size : int = 0) : 
+        """
+        Draws a 'fast' filled Rectangle on the screen at starting point (x,y) with a width and height of (width,height)
+
+        See rectangle_fast() to draw an open/wireframe Rectangle vs. a filled Rectangle. 
+        See fill_rectangle_fast_l() to set the Rectangle location, width, and height using a tuple, list, or array
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the rectangle in the window
+        - width                \t -- Width (in pixels) of the rectangle
+        - height               \t -- Width (in pixels) of the rectangle
+        - inside_color   \t -- Color of the interior of the rectangle
+        - border_color   \t -- [optional] Color if the outside edge of the rectangle (based on the current Pen Size).  When omitted, the entire rectangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using border_color.
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_rectangle_fast(400,200,300,100,"red") 
+                        window.draw.fill_rectangle_fast(400,200,300,100,"red","Green")       - Draws a Red rectangle with a green outer border (thickness of current pen size)
+                        window.draw.fill_rectangle_fast(400,200,300,100,PanColor.ForestGreen())
+                        window.draw.fill_rectangle_fast(400,200,300,100,MyColor,6)            - Sets a pen size of 6
+                        window.draw.fill_rectangle_fast(400,200,300,100,pybox.RgbColor(0,255,0))         
+        """
+        return _pybox.WindowDrawFilledRectangleFast(self.__id,int(x),int(y),int(width),int(height),_library_color(inside_color),_library_color(border_color),pen_size)
+
+    def fill_rectangle_fast_l(self,at : list,size : list,inside_color,border_color = 0,pen_size : int = 0) :
+        """
+        Draws a 'fast' filled Rectangle on the screen at starting point (x,y) with a width and height of (width,height)
+
+        See rectangle_fast_l() to draw an open/wireframe Rectangle vs. a filled Rectangle. 
+        See fill_rectangle_fast() to set the Rectangle location, width, and height using a separate values.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - at                \t -- (x,y) Location of the center of the rectangle in the window
+        - size              \t -- (Width, Height), in pixels, of the rectangle
+        - inside_color   \t -- Color of the interior of the rectangle
+        - border_color   \t -- [optional] Color if the outside edge of the rectangle (based on the current Pen Size).  When omitted, the entire rectangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using border_color.
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_rectangle_fast_l((400,200),(300,100),"red") 
+                        window.draw.fill_rectangle_fast_l(Location,Size,"red","Green")            - Draws a Red rectangle with a green outer border (thickness of current pen size)
+                        window.draw.fill_rectangle_fast_l((400,200),(300,100),PanColor.ForestGreen())
+                        window.draw.fill_rectangle_fast_l((400,200),(300,100),MyColor,6)            - Sets a pen size of 6
+                        window.draw.fill_rectangle_fast_l((400,200),(300,100),pybox.RgbColor(0,255,0))         
+        """
+        return _pybox.WindowDrawFilledRectangleFast(self.__id,int(at[0]),int(at[1]),int(size[0]),int(size[1]),_library_color(inside_color),_library_color(border_color),pen_size)
+
+    def rectangle_fast(self,x : int,y : int,width : int,height : int,color,pen_size : int = 0) : 
+        """
+        Draws a 'fast' open/wireframe Rectangle on the screen at starting point (x,y) with a width and height of (width,height)
+
+        See fill_rectangle_fast() to draw a filled Rectangle vs. an open/wireframe Rectangle.
+        See rectangle_fast_l() to set the Rectangle location, width, and height using a tuple, list, or array
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the rectangle in the window
+        - width                \t -- Width (in pixels) of the rectangle
+        - height               \t -- Width (in pixels) of the rectangle
+        - color             \t -- Color of the interior of the rectangle
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.rectangle_fast(400,200,300,100,"red") 
+                        window.draw.rectangle_fast(400,200,300,100,PanColor.ForestGreen())
+                        window.draw.rectangle_fast(400,200,300,100,MyColor,6)            - Sets a pen size of 6
+                        window.draw.rectangle_fast(400,200,300,100,pybox.RgbColor(0,255,0))         
+        """
+        return _pybox.WindowDrawRectangleFast(self.__id,int(x),int(y),width,height,_library_color(color),_library_color(color),pen_size)
+
+    def rectangle_fast_l(self,at : list,size : list,color,pen_size : int = 0) :
+        """
+        Draws a 'fast' open/wireframe Rectangle on the screen at starting point (x,y) with a width and height of (width,height)
+
+        See fill_rectangle_fast_l() to draw a filled Rectangle vs. an open/wireframe Rectangle.
+        See rectangle_fast() to set the Rectangle location, width, and height using independent values.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the rectangle in the window
+        - size                \t -- (Width, Height), in pixels, of the rectangle
+        - color             \t -- Color of the interior of the rectangle
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.rectangle_fast_l(400,200,300,100,"red") 
+                        window.draw.rectangle_fast_l(location,size,300,100,PanColor.ForestGreen())
+                        window.draw.rectangle_fast_l(400,200,300,100,MyColor,6)            - Sets a pen size of 6
+                        window.draw.rectangle_fast_l(400,200,300,100,pybox.RgbColor(0,255,0))         
+        """
+        return _pybox.WindowDrawRectangleFast(self.__id,int(at[0]),int(at[1]),int(size[0]),int(size[1]),_library_color(color),_library_color(color),pen_size)
+
+    # HR Rectangle Functions
+
+    def fill_rectangle(self,x : int,y : int,width : int,height : int,inside_color,**kwargs) : 
+        """
+        Draws a filled Rectangle on the screen at starting point (x,y) with a width and height of (width,height)
+
+        See rectangle() to draw an open/wireframe Rectangle vs. a filled Rectangle. 
+        See fill_rectangle_l() to set the Rectangle location, width, and height using a separate values.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the rectangle in the window
+        - width                \t -- Width (in pixels) of the rectangle
+        - height               \t -- Width (in pixels) of the rectangle
+        - inside_color   \t -- Color of the interior of the rectangle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_color   \t -- Color if the outside edge of the rectangle (based on the current Pen Size).  When omitted, the entire rectangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_rectangle(400,200,300,100,"red") 
+                        window.draw.fill_rectangle(400,200,300,100,"red",pen_color="Green")       - Draws a Red rectangle with a green outer border (thickness of current pen size)
+                        window.draw.fill_rectangle(400,200,300,100,PanColor.ForestGreen())
+                        window.draw.fill_rectangle(400,200,300,100,MyColor,pen_size=6)            - Sets a pen size of 6   
+                        window.draw.fill_rectangle(400,200,300,100,pybox.RgbColor(0,255,0))         
+        """
+        return _pybox.WindowDrawRectangle(self.__id,x,y,width,height,_library_color(inside_color),False,**kwargs)
+
+    def fill_rectangle_l(self,at : list,size : list,inside_color,**kwargs) :
+        """
+        Draws a filled Rectangle on the screen at starting point (x,y) with a width and height of (width,height)
+
+        See rectangle() to draw an open/wireframe Rectangle vs. a filled Rectangle. 
+        See fill_rectang() to set the Rectangle location, width, and height using independent values.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the rectangle in the window
+        - size                \t -- (Width, Height), in pixels, of the rectangle
+        - inside_color   \t -- Color of the interior of the rectangle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_color   \t -- Color if the outside edge of the rectangle (based on the current Pen Size).  When omitted, the entire rectangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_rectangle_l((400,200),(300,100),"red") 
+                        window.draw.fill_rectangle_l((400,200),(300,100),"red",pen_color="Green")      - Draws a Red rectangle with a green outer border (thickness of current pen size)
+                        window.draw.fill_rectangle_l(Location,Size,PanColor.ForestGreen())
+                        window.draw.fill_rectangle_l((400,200),(300,100),MyColor,pen_size=6)           - Sets a pen size of 6   
+                        window.draw.fill_rectangle_l((400,200),(300,100),pybox.RgbColor(0,255,0))         
+        """
+        return _pybox.WindowDrawRectangle(self.__id,at[0],at[1],size[0],size[1],_library_color(inside_color),False,**kwargs)
+
+    def fill_rectangle_r(self,size_rect : list,inside_color,**kwargs) :
+        """
+        Draws a filled Rectangle on the screen at starting point (x,y) with a width and height of (width,height)
+
+        See rectangle() to draw an open/wireframe Rectangle vs. a filled Rectangle. 
+        See fill_rectangle() to set the Rectangle location, width, and height using independent values.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - size_rect             \t -- (x,y,width,height) list or array specifying (x,y) and (width,height) of rectangle
+        - inside_color      \t -- Color of the interior of the rectangle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_color   \t -- Color if the outside edge of the rectangle (based on the current Pen Size).  When omitted, the entire rectangle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_rectangle_r((400,200,300,100),"red") 
+                        window.draw.fill_rectangle_r((400,200,300,100),"red",pen_color="Green")      - Draws a Red rectangle with a green outer border (thickness of current pen size)
+                        window.draw.fill_rectangle_r(my_rect,PanColor.ForestGreen())
+                        window.draw.fill_rectangle_r((400,200,300,100),MyColor,pen_size=6)           - Sets a pen size of 6   
+                        window.draw.fill_rectangle_r((400,200,300,100),pybox.RgbColor(0,255,0))         
+        """
+        return _pybox.WindowDrawRectangle(self.__id,size_rect[0],size_rect[1],size_rect[2],size_rect[3],_library_color(inside_color),False,**kwargs)
+
+    def rectangle(self,x : int,y : int,width : int,height : int,color,**kwargs) : 
+        """
+        Draws an open/wireframe Rectangle on the screen at starting point (x,y) with a width and height of (width,height)
+
+        See fill_rectangle() to draw a filled Rectangle va. an open/wireframe Rectangle.
+        See rectangle_l() to set the Rectangle location, width, and height using a separate values.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the rectangle in the window
+        - width                \t -- Width (in pixels) of the rectangle
+        - height               \t -- Width (in pixels) of the rectangle
+        - color             \t -- Color of the interior of the rectangle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.rectangle(400,200,300,100,"red") 
+                        window.draw.rectangle(400,200,300,100,PanColor.ForestGreen())
+                        window.draw.rectangle(400,200,300,100,MyColor,pen_size=6)        - Sets a pen size of 6   
+                        window.draw.rectangle(400,200,300,100,pybox.RgbColor(0,255,0))         
+        """
+        return _pybox.WindowDrawRectangle(self.__id,x,y,width,height,_library_color(color),True,**kwargs)
+
+    def rectangle_l(self,at : list,size : list,color,**kwargs) :
+        """
+        Draws an open/wireframe Rectangle on the screen at starting point (x,y) with a width and height of (width,height)
+
+        See fill_rectangle_l() to draw a filled Rectangle va. an open/wireframe Rectangle.
+        See rectangle() to set the Rectangle location, width, and height using a independent values.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the rectangle in the window
+        - size                \t -- (Width, Height), in pixels, of the rectangle
+        - color             \t -- Color of the interior of the rectangle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.rectangle_l((400,200),(300,100),"red") 
+                        window.draw.rectangle_l((400,200),(300,100),PanColor.ForestGreen())
+                        window.draw.rectangle_l(Location,Size,MyColor,pen_size=6)        - Sets a pen size of 6   
+                        window.draw.rectangle_l((400,200),(300,100),pybox.RgbColor(0,255,0))         
+        """
+        return _pybox.WindowDrawRectangle(self.__id,at[0],at[1],size[0],size[1],_library_color(color),True,**kwargs)
+
+    def rectangle_r(self,size_rect : list,color,**kwargs) :
+        """
+        Draws an open/wireframe Rectangle on the screen at starting point (x,y) with a width and height of (width,height)
+
+        See fill_rectangle_r() to draw a filled Rectangle va. an open/wireframe Rectangle.
+        See rectangle() to set the Rectangle location, width, and height using a independent values.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - size_rect             \t -- (x,y,width,height) list or array specifying (x,y) and (width,height) of rectangle
+        - color             \t -- Color of the interior of the rectangle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.rectangle_r((400,200,300,100),"red") 
+                        window.draw.rectangle_r((400,200,300,100),PanColor.ForestGreen())
+                        window.draw.rectangle_r(my_rect,MyColor,pen_size=6)        - Sets a pen size of 6   
+                        window.draw.rectangle_r((400,200,300,100),pybox.RgbColor(0,255,0))         
+        """
+        return _pybox.WindowDrawRectangle(self.__id,size_rect[0],size_rect[1],size_rect[2],size_rect[3],_library_color(color),True,**kwargs)
+
+    #
+    # Draw Ellipse Functions
+    #
+
+    def fill_ellipse_fast(self,x : int, y : int, radius_x : int, radius_y, inside_color, border_color = 0,pen_size : int = 0) :
+        """
+        Draws a 'fast' filled Ellipse on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See ellipse_fast() to draw an open/wireframe Ellipse vs. a filled Ellipse. 
+        See fill_ellipse_fast_l() to set the Ellipse location, width, and height using a tuple, list, or array
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the ellipse in the window
+        - radius_x                \t -- Width/Radius (in pixels) of the ellipse in the X direction
+        - radius_y               \t -- Height/Radius (in pixels) of the ellipse in the Y direction
+        - inside_color   \t -- Color of the interior of the ellipse
+        - border_color   \t -- [optional] Color if the outside edge of the ellipse (based on the current Pen Size).  When omitted, the entire ellipse is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using border_color.
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_ellipse_fast(400,200,300,100,"red") 
+                        window.draw.fill_ellipse_fast(400,200,300,100,"red","Green")       - Draws a Red ellipse with a green outer border (thickness of current pen size)
+                        window.draw.fill_ellipse_fast(400,200,300,100,PanColor.ForestGreen())
+                        window.draw.fill_ellipse_fast(400,200,300,100,MyColor,6)            - Sets a pen size of 6
+                        window.draw.fill_ellipse_fast(400,200,300,100,pybox.RgbColor(0,255,0))         
+        """          
+        return _pybox.WindowDrawEllipseFast(self.__id,int(x),int(y),int(radius_x),int(radius_y),_library_color(inside_color),_library_color(border_color),pen_size,False)
+
+    def fill_ellipse_fast_l(self,at : list, size : list, inside_color, border_color = 0,pen_size : int = 0) :
+        """
+        Draws a 'fast' filled Ellipse on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See ellipse_fast() to draw an open/wireframe Ellipse vs. a filled Ellipse. 
+        See fill_ellipse_fast() to set the Ellipse location, width, and height using independent values.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the rectangle in the window
+        - size                \t -- (Width, Height), in pixels, of the rectangle
+        - inside_color   \t -- Color of the interior of the ellipse
+        - border_color   \t -- [optional] Color if the outside edge of the ellipse (based on the current Pen Size).  When omitted, the entire ellipse is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using border_color.
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_ellipse_fast_l((400,200),(300,100),"red") 
+                        window.draw.fill_ellipse_fast_l((400,200),(300,100),"red","Green")       - Draws a Red ellipse with a green outer border (thickness of current pen size)
+                        window.draw.fill_ellipse_fast_l(Location,Size,PanColor.ForestGreen())
+                        window.draw.fill_ellipse_fast_l((400,200),(300,100),MyColor,6)            - Sets a pen size of 6
+                        window.draw.fill_ellipse_fast_l((400,200),(300,100),pybox.RgbColor(0,255,0))         
+        """          
+        return _pybox.WindowDrawEllipseFast(self.__id,int(at[0]),int(at[1]),int(size[0]),int(size[1]),_library_color(inside_color),_library_color(border_color),pen_size,False)
+
+    def ellipse_fast(self,x : int, y : int, radius_x : int, radius_y, color,pen_size : int = 0) :
+        """
+        Draws a 'fast' open/wireframe Ellipse on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See fill_ellipse_fast() to draw a filled Ellipse vs. an open/wireframe Ellipse
+        See ellipse_fast_l() to set the Ellipse location, width, and height using a tuple, list, or array
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the ellipse in the window
+        - radius_x                \t -- Width/Radius (in pixels) of the ellipse in the X direction
+        - radius_y               \t -- Height/Radius (in pixels) of the ellipse in the Y direction
+        - color                 \t -- Color of the ellipse
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.ellipse_fast(400,200,300,100,"red") 
+                        window.draw.ellipse_fast(400,200,300,100,PanColor.ForestGreen())
+                        window.draw.ellipse_fast(400,200,300,100,MyColor,6)            - Sets a pen size of 6
+                        window.draw.ellipse_fast(400,200,300,100,pybox.RgbColor(0,255,0))         
+        """               
+        return _pybox.WindowDrawEllipseFast(self.__id,int(x),int(y),int(radius_x),int(radius_y),_library_color(color),0,pen_size,True)
+
+    def ellipse_fast_l(self,at : list, size : list, color,pen_size : int = 0) :
+        """
+        Draws a 'fast' open/wireframe Ellipse on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See fill_ellipse_fast_l() to draw a filled Ellipse vs. an open/wireframe Ellipse
+        See ellipse_fast() to set the Ellipse location, width, and height using independent values.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the rectangle in the window
+        - size                \t -- (Width, Height), in pixels, of the rectangle
+        - color                 \t -- Color of ellipse
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.ellipse_fast_l((400,200),(300,100),"red") 
+                        window.draw.ellipse_fast_l((400,200),(300,100),PanColor.ForestGreen())
+                        window.draw.ellipse_fast_l(Location,Size,MyColor,6)            - Sets a pen size of 6
+                        window.draw.ellipse_fast_l((400,200),(300,100),pybox.RgbColor(0,255,0))         
+        """                  
+        return _pybox.WindowDrawEllipseFast(self.__id,int(at[0]),int(at[1]),int(size[0]),int(size[1]),_library_color(color),0,pen_size,True)
+
+    # HR Ellipse Functions
+
+    def fill_ellipse(self,x, y, radius_x, radius_y, inside_color, **kwargs) :
+        """
+        Draws a filled Ellipse on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See ellipse() to draw an open/wireframe Ellipse vs. a filled Ellipse. 
+        See fill_ellipse_l() to set the Ellipse location, width, and height using a tuple, list, or array
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the ellipse in the window
+        - radius_x                \t -- Width/Radius (in pixels) of the ellipse in the X direction
+        - radius_y               \t -- Height/Radius (in pixels) of the ellipse in the Y direction
+        - inside_color   \t -- Color of the interior of the ellipse
+        - pen_color   \t -- [optional] Color if the outside edge of the ellipse (based on the current Pen Size).  When omitted, the entire ellipse is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_color   \t -- Color if the outside edge of the ellipse (based on the current Pen Size).  When omitted, the entire ellipse is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_ellipse(400,200,300,100,"red") 
+                        window.draw.fill_ellipse(400,200,300,100,"red",pen_color="Green")       - Draws a Red ellipse with a green outer border (thickness of current pen size)
+                        window.draw.fill_ellipse(400,200,300,100,pen_color=PanColor.ForestGreen())
+                        window.draw.fill_ellipse(400,200,300,100,MyColor,pen_size=6)            - Sets a pen size of 6
+                        window.draw.fill_ellipse(400,200,300,100,pybox.RgbColor(0,255,0))         
+        """               
+        return _pybox.WindowDrawEllipse(self.__id,x,y,radius_x,radius_y,_library_color(inside_color),False,**kwargs)
+
+    def fill_ellipse_l(self,at : list, size : list, inside_color, **kwargs) :
+        """
+        Draws a filled Ellipse on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See ellipse_l() to draw an open/wireframe Ellipse vs. a filled Ellipse. 
+        See fill_ellipse() to set the Ellipse location, width, and height using independent values.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the ellipse in the window
+        - size                \t -- (Width, Height), in pixels, of the ellipse
+        - inside_color   \t -- Color of the interior of the ellipse
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_color   \t -- Color if the outside edge of the ellipse (based on the current Pen Size).  When omitted, the entire ellipse is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_ellipse_l((400,200),(300,100),"red") 
+                        window.draw.fill_ellipse_l((400,200),(300,100),PanColor.ForestGreen())
+                        window.draw.fill_ellipse_l(Location,Size,MyColor,pen_size=6)            - Sets a pen size of 6
+                        window.draw.fill_ellipse_l((400,200),(300,100),pybox.RgbColor(0,255,0))         
+        """               
+        return _pybox.WindowDrawEllipse(self.__id,at[0],at[1],size[0],size[1],_library_color(inside_color),False,**kwargs)
+
+    def fill_ellipse_r(self,size_rect : list, inside_color, **kwargs) :
+        """
+        Draws a filled Ellipse on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See ellipse_r() to draw an open/wireframe Ellipse vs. a filled Ellipse. 
+        See fill_ellipse() to set the Ellipse location, width, and height using independent values.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - size_rect             \t -- (x,y,width,height) list or array specifying (x,y) and (radius X ,radius Y) of ellipse
+        - inside_color   \t -- Color of the interior of the ellipse
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_color   \t -- Color if the outside edge of the ellipse (based on the current Pen Size).  When omitted, the entire ellipse is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_ellipse_r(400,200,300,100),"red") 
+                        window.draw.fill_ellipse_r(400,200,300,100),PanColor.ForestGreen())
+                        window.draw.fill_ellipse_r(my_sizerect,Size,MyColor,pen_size=6)            - Sets a pen size of 6
+                        window.draw.fill_ellipse_r(400,200,300,100),pybox.RgbColor(0,255,0))         
+        """               
+        return _pybox.WindowDrawEllipse(self.__id,size_rect[0],size_rect[1],size_rect[2],size_rect[3],_library_color(inside_color),False,**kwargs)
+
+    def ellipse(self,x, y, radius_x, radius_y, color,**kwargs) :
+        """
+        Draws an open/wireframe Ellipse on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See fill_ellipse() to draw a filled Ellipse vs. an open/wireframe Ellipse
+        See ellipse_l() to set the Ellipse location, width, and height using a tuple, list, or array
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the ellipse in the window
+        - radius_x                \t -- Width/Radius (in pixels) of the ellipse in the X direction
+        - radius_y               \t -- Height/Radius (in pixels) of the ellipse in the Y direction
+        - color             \t -- Color of the ellipse
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.ellipse(400,200,300,100,"red") 
+                        window.draw.ellipse(400,200,300,100,PanColor.ForestGreen())
+                        window.draw.ellipse(400,200,300,100,MyColor,pen_size=6)            - Sets a pen size of 6
+                        window.draw.ellipse(400,200,300,100,pybox.RgbColor(0,255,0))         
+        """             
+        return _pybox.WindowDrawEllipse(self.__id,x,y,radius_x,radius_y,_library_color(color),True,**kwargs)
+
+    def ellipse_l(self,at : list, size : list, color,**kwargs) :
+        """
+        Draws an open/wireframe Ellipse on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See fill_ellipse_l() to draw a filled Ellipse vs. an open/wireframe Ellipse
+        See ellipse() to set the Ellipse location, width, and height using independent values
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the ellipse in the window
+        - size                \t -- (Width, Height), in pixels, of the ellipse
+        - color             \t -- Color of the ellipse
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.ellipse_l((400,200),(300,100),"red") 
+                        window.draw.ellipse_l((400,200),(300,100),PanColor.ForestGreen())
+                        window.draw.ellipse_l((Location,Size,MyColor,pen_size=6)            - Sets a pen size of 6
+                        window.draw.ellipse_l((400,200),(300,100),pybox.RgbColor(0,255,0))         
+        """                    
+        return _pybox.WindowDrawEllipse(self.__id,at[0],at[1],size[0],size[1],_library_color(color),True,**kwargs)     
+
+    def ellipse_r(self,size_rect : list, color,**kwargs) :
+        """
+        Draws an open/wireframe Ellipse on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See fill_ellipse_r() to draw a filled Ellipse vs. an open/wireframe Ellipse
+        See ellipse() to set the Ellipse location, width, and height using independent values
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - size_rect             \t -- (x,y,width,height) list or array specifying (x,y) and (radius X ,radius Y) of ellipse
+        - color             \t -- Color of the ellipse
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.ellipse_r(400,200,300,100),"red") 
+                        window.draw.ellipse_r(400,200,300,100),PanColor.ForestGreen())
+                        window.draw.ellipse_r(my_size_rect,Size,MyColor,pen_size=6)            - Sets a pen size of 6
+                        window.draw.ellipse_r(400,200,300,100),pybox.RgbColor(0,255,0))         
+        """                    
+        return _pybox.WindowDrawEllipse(self.__id,size_rect[0],size_rect[1],size_rect[2],size_rect[3],_library_color(color),True,**kwargs)     
+
+    #
+    # Draw Circle Functions
+    #
+
+    def fill_circle_fast(self,x : int, y : int, radius : int, inside_color, border_color = 0,pen_size : int = 0) :
+        """
+        Draws a 'fast' filled Circle on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See circle_fast_l() to draw an open/wireframe Circle vs. a filled Circle. 
+        See fill_circle_fast_l() to set the Circle location, width, and height using a tuple, list, or array
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the circle in the window
+        - radius                \t -- Radius (in pixels) of the circle.
+        - inside_color   \t -- Color of the interior of the circle
+        - border_color   \t -- [optional] Color if the outside edge of the circle (based on the current Pen Size).  When omitted, the entire circle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using border_color.
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_circle_fast(400,200,100,"red") 
+                        window.draw.fill_circle_fast(400,200,100,"red","Green")       - Draws a Red circle with a green outer border (thickness of current pen size)
+                        window.draw.fill_circle_fast(400,200,100,PanColor.ForestGreen())
+                        window.draw.fill_circle_fast(400,200,100,MyColor,6)            - Sets a pen size of 6
+                        window.draw.fill_circle_fast(400,200,100,pybox.RgbColor(0,255,0))         
+        """          
+        return _pybox.WindowDrawFilledCircleFast(self.__id,int(x),int(y),int(radius),_library_color(inside_color),_library_color(border_color),pen_size)
+
+    def fill_circle_fast_l(self,at : list, radius : int, inside_color, border_color = 0,pen_size : int = 0) :
+        """
+        Draws a 'fast' filled Circle on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See circle_fast_l() to draw an open/wireframe Circle vs. a filled Circle. 
+        See fill_circle_fast() to set the Circle location, width, and height using independent values.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the circle in the window
+        - radius                \t -- Radius (in pixels) of the circle.
+        - inside_color   \t -- Color of the interior of the circle
+        - border_color   \t -- [optional] Color if the outside edge of the circle (based on the current Pen Size).  When omitted, the entire circle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using border_color.
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_circle_fast_l((400,200),100,"red") 
+                        window.draw.fill_circle_fast_l((400,200),100,"red","Green")       - Draws a Red circle with a green outer border (thickness of current pen size)
+                        window.draw.fill_circle_fast_l(Location,Size,PanColor.ForestGreen())
+                        window.draw.fill_circle_fast_l((400,200),100,MyColor,6)            - Sets a pen size of 6
+                        window.draw.fill_circle_fast_l((400,200),100,pybox.RgbColor(0,255,0))         
+        """          
+        return _pybox.WindowDrawFilledCircleFast(self.__id,int(at[0]),int(at[1]),int(radius),_library_color(inside_color),_library_color(border_color),pen_size)
+
+    def circle_fast(self,x : int, y : int, radius : int, color,pen_size : int = 0) :
+        """
+        Draws a 'fast' open/wireframe Circle on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See fill_circle_fast() to draw a filled Circle vs. an open/wireframe Circle
+        See circle_fast_l() to set the Circle location, width, and height using a tuple, list, or array
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the circle in the window
+        - radius                \t -- Radius (in pixels) of the circle.
+        - color                 \t -- Color of the circle
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.circle_fast(400,200,100,"red") 
+                        window.draw.circle_fast(400,200,100,PanColor.ForestGreen())
+                        window.draw.circle_fast(400,200,100,MyColor,6)            - Sets a pen size of 6
+                        window.draw.circle_fast(400,200,100,pybox.RgbColor(0,255,0))         
+        """               
+        return _pybox.WindowDrawCircleFast(self.__id,int(x),int(y),radius,_library_color(color),_library_color(color),pen_size)
+
+    def circle_fast_l(self,at : list, radius : int, color,pen_size : int = 0) :
+        """
+        Draws a 'fast' open/wireframe Circle on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See fill_circle_fast_l() to draw a filled Circle vs. an open/wireframe Circle
+        See circle_fast() to set the Circle location, width, and height using independent values.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the circle in the window
+        - radius                \t -- Radius (in pixels) of the circle.
+        - color                 \t -- Color of circle
+        - pen_size         \t -- [optional] Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.circle_fast_l((400,200),100,"red") 
+                        window.draw.circle_fast_l((400,200),100,PanColor.ForestGreen())
+                        window.draw.circle_fast_l(Location,Size,MyColor,6)            - Sets a pen size of 6
+                        window.draw.circle_fast_l((400,200),100,pybox.RgbColor(0,255,0))         
+        """                  
+        return _pybox.WindowDrawCircleFast(self.__id,int(at[0]),int(at[1]),radius,_library_color(color),_library_color(color),pen_size)
+
+    # HR Draw Circle Functions
+
+    def circle(self,x, y, radius, color,**kwargs) :
+        """
+        Draws an open/wireframe Circle on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See fill_circle() to draw a filled Circle vs. an open/wireframe Circle
+        See circle_l() to set the Circle location, width, and height using a tuple, list, or array
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the circle in the window
+        - radius                \t -- Radius (in pixels) of the circle.
+        - color             \t -- Color of the circle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+       - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.circle(400,200,100,"red") 
+                        window.draw.circle(400,200,100,PanColor.ForestGreen())
+                        window.draw.circle(400,200,100,MyColor,pen_size=6)            - Sets a pen size of 6
+                        window.draw.circle(400,200,100,pybox.RgbColor(0,255,0))         
+        """             
+        return _pybox.WindowDrawCircle(self.__id,x,y,radius,_library_color(color),True,**kwargs)
+
+    def circle_l(self,at, radius, color,**kwargs) :
+        """
+        Draws an open/wireframe Circle on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See fill_circle_l() to draw a filled Circle vs. an open/wireframe Circle
+        See circle() to set the Circle location, width, and height using independent values
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the circle in the window
+        - radius                \t -- Radius (in pixels) of the circle.
+        - color             \t -- Color of the circle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.circle_l((400,200),100,"red") 
+                        window.draw.circle_l((400,200),100,PanColor.ForestGreen())
+                        window.draw.circle_l((Location,Size,MyColor,pen_size=6)            - Sets a pen size of 6
+                        window.draw.circle_l((400,200),100,pybox.RgbColor(0,255,0))         
+        """                    
+        return _pybox.WindowDrawCircle(self.__id,at[0],at[1],radius,_library_color(color),True,**kwargs)
+
+    def fill_circle(self,x , y , radius, inside_color, **kwargs) :
+        """
+        Draws a filled Circle on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See circle() to draw an open/wireframe Circle vs. a filled Circle. 
+        See fill_circle_l() to set the Circle location, width, and height using a tuple, list, or array
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - x,y                   \t -- Location of the center of the circle in the window
+        - radius                \t -- Radius (in pixels) of the circle.
+        - inside_color   \t -- Color of the interior of the circle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_color   \t -- Color if the outside edge of the circle (based on the current Pen Size).  When omitted, the entire circle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+                        window.draw.fill_circle(400,200,100,"red") 
+                        window.draw.fill_circle(400,200,100,"red","Green")       - Draws a Red circle with a green outer border (thickness of current pen size)
+                        window.draw.fill_circle(400,200,100,PanColor.ForestGreen())
+                        window.draw.fill_circle(400,200,100,MyColor,pen_size=6)            - Sets a pen size of 6
+                        window.draw.fill_circle(400,200,100,pybox.RgbColor(0,255,0))         
+        """               
+        return _pybox.WindowDrawCircle(self.__id,x,y,radius,_library_color(inside_color),False,**kwargs)
+
+    def fill_circle_l(self,at, radius, inside_color, **kwargs) :
+        """
+        Draws a filled Circle on the screen at starting point (x,y) with a width and height of (radius_x, radius_y)
+
+        See circle_l() to draw an open/wireframe Circle vs. a filled Circle. 
+        See fill_circle() to set the Circle location, width, and height using independent values.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters
+
+        - at                   \t -- (x,y) Location of the center of the circle in the window
+        - radius                \t -- Radius (in pixels) of the circle.
+        - inside_color   \t -- Color of the interior of the circle
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_color   \t -- Color if the outside edge of the circle (based on the current Pen Size).  When omitted, the entire circle is drawn the color
+                                \t -of the inside_color.  See: set_pen_size() to set the thickness of the border when using pen_color.
+        - pen_size         \t -- Pen size for the border color if specified.  If the pen_size is not specified, the current default pen size is used.
+                                \t -See set_pen_size() to set the default pen size (the default is 1) 
+        Examples:
+                        window.draw.fill_circle_l((400,200),100,"red") 
+                        window.draw.fill_circle_l((400,200),100,PanColor.ForestGreen())
+                        window.draw.fill_circle_l(Location,Size,MyColor,pen_size=6)            - Sets a pen size of 6
+                        window.draw.fill_circle_l((400,200),100,pybox.RgbColor(0,255,0))         
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """               
+        return _pybox.WindowDrawCircle(self.__id,at[0],at[1],radius,_library_color(inside_color),False,**kwargs)
+
+    def polygon(self, pos : list,color,**kwargs) :
+        """
+        Draws an open/wireframe polygon on the screen using clockwise points in the list.
+
+        Example: 
+
+        my_list = [(400,400),(500,500),(500,600),(300,600),(300,500)]
+        window.draw.polygon(my_list,"green",pen_size=5) # draws a green polygon with a pen size of 5 that looks like a house. 
+
+        See fill_polygon() to draw a filled polygon vs. an open/wireframe polygon. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        At least 3 points must be given to draw a polygon.  
+
+        Parameters
+
+        - pos           \t -- List or array of clockwise polygon points.
+        - color         \t -- Color of the polygon
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the color if specified.  If the pen_size is not specified, the current default pen size is used.
+                            \t -See set_pen_size() to set the default pen size (the default is 1) 
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.polygon(my_list,"yellow")
+            window.draw.polygon(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.polygon(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.polygon(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+            window.draw.polygon(my_list,"red,blue",pen_size=6)           # Specifies gradient color
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)
+
+        """
+        _pybox.WindowDrawPolygon(self.__id,pos,_library_color(color),0,**kwargs)
+
+    def fill_polygon(self, Loc : list,color,**kwargs) :
+        """
+        Draws an filled Polygon on the screen using clockwise points in the list.
+
+        Example: 
+
+        my_list = [(400,400),(500,500),(500,600),(300,600),(300,500)]
+        window.draw.fill_polygon(my_list,"green") # draws a filled green polygon with a pen size of 5 that looks like a house. 
+
+        See polygon() to draw an open/wireframe polygon vs. a filled polygon. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        At least 3 points must be given to draw a polygon. 
+
+        Parameters
+
+        - pos           \t -- List or array of clockwise polygon points.
+        - color         \t -- Color of the interior of the polygon
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the color if specified, which will draw a border around the polygon.  
+                            \t If the pen_size is not specified, the current default pen size is used.
+                            \t - See set_pen_size() to set the default pen size (the default is 1) 
+        - pen_color         \t -- Sets the  color of the border pen.  If no pen size is specified, the default/current pen size is used.
+
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.fill_polygon(my_list,"yellow")
+            window.draw.fill_polygon(my_list,"yellow(128)",pen_size=6,,pen_color="red")        # Sets an opacity of 128 for the yellow
+            window.draw.fill_polygon(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.fill_polygon(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+            window.draw.fill_polygon(my_list,"red,blue",pen_size=6)           # Specifies gradient color
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)
+
+        """
+        _pybox.WindowDrawPolygon(self.__id,Loc,_library_color(color),1,**kwargs)
+
+    def lines(self, pos : list,color,**kwargs) :
+        """
+        Draws an open/wireframe set of lines on the screen using points in the list.
+        ** note: This function is essentially the same as "draw.polygon".  The only difference is that the last point is not connected to the
+        first point (i.e. it is an open set of lines vs. a polygon)
+
+        Example: 
+
+        my_list = [(400,400),(500,500),(500,600),(300,600),(300,500)]
+        window.draw.lines(my_list,"green",pen_size=5) # draws a green set of lines with a pen size of 5. 
+
+        See fill_lines() to draw a filled set of lines vs. an open/wireframe set of lines. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        Parameters
+
+        - pos           \t -- List or array of line points.
+        - color         \t -- Color of the set of lines
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t -- Pen size for the color if specified.  If the pen_size is not specified, the current default pen size is used.
+                        \t -See set_pen_size() to set the default pen size (the default is 1) 
+        - linecaps      \t - Sets the 'cap' type for the bezier curve.  By default these are round and the size of the line itself.
+
+                        \t Possible linecap values are "flat" (no caps),"round","diamond","square" and "arrow".  use "default" to set default cap type.
+                        \t Add "anchor" to make caps larger, e.g. "round anchor","arrow anchor", etc.  ("flat" has no "anchor")
+
+                        \t This sets both cap types unless a ',' is used, such as "round,square anchor".  
+                        \t using a blank for the cap type sets the default, such as ",arrow anchor" or "arrow anchor,", which sets only the
+                        \t end cap and beginning cap to "anchor arrow", respectively, leaving the other cap type as the default. 
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.lines(my_list,"yellow")
+            window.draw.lines(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.lines(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.lines(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+            window.draw.lines(my_list,"yellow",line_caps="round anchor,arrow anchor")       # Adds a round circle and arrow to beginning & end
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)
+
+        """
+        _pybox.WindowDrawPolygon(self.__id,pos,_library_color(color),10,**kwargs)
+
+    def fill_lines(self, pos : list,color,**kwargs) :
+        """
+        Draws a filled set of lines on the screen using points in the list.
+        ** note: This function is essentially the same as "draw.fill_polygon".  The only difference is that the last point is not connected to the
+        first point when a pen (i.e. border) is used. (i.e. it is an open set of lines vs. a polygon)
+
+        Without using a pen, fill_lines() is functionally equivalent to fill_polygon()
+        Example: 
+
+        my_list = [(400,400),(500,500),(500,600),(300,600),(300,500)]
+        window.draw.fill_lines(my_list,"green",pen_size=5,pen_color="yellow") # draws a green set of lines with a pen size of 5. 
+
+        See lines() to draw an open/wireframe set of lines vs. a filled set of lines. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        Parameters
+
+        - pos           \t -- List or array of line points.
+        - color         \t -- Color of the set of lines
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t -- Pen size for the color if specified.  If the pen_size is not specified, the current default pen size is used.
+                        \t -See set_pen_size() to set the default pen size (the default is 1) 
+        - pen_color     \t -- Sets the  color of the border pen.  If no pen size is specified, the default/current pen size is used.
+        - line_caps     \t - Line caps may be used when a pen is used as a border.  See lines() for more information.
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.fill_lines(my_list,"yellow")
+            window.draw.fill_lines(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.fill_lines(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.fill_lines(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+            window.draw.fill_lines(my_list,"yellow",pen_color="cyan")       # sets border color to cyan (default is white)
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)
+
+        """
+        _pybox.WindowDrawPolygon(self.__id,pos,_library_color(color),11,**kwargs)  
+
+
+    #
+    # Bezier and Spline Curve Functions
+    #
+
+    def beziers(self, pos : list,color,**kwargs) :
+        """
+        Draws an open/wireframe sequence of connected Cubic Bezier splines. There are two control points between each two points, such as 
+        <p1,c1,c2,p2,c3,c4,p3>, in this case, using 4 control points, 2 each between the three points. 
+
+        - This function draws a 'Cubic Bezier Spline', requiring two control points between every two points.
+        See QuadBeziers() (i.e. Quadratic Bezier vs. cubic) for the Bezier Spline format that requires only one control point between each set of points.
+
+        - See fill_beziers() function to draw filled beziers. vs. open/wireframe beziers.
+
+        Example (draws a sine-wave like bezier with 3 points and 4 control points between points 1 and 3): 
+
+        my_list = [(50,400),(110,200),(170,600),(230,400),(290,200),(350,600),(410,400)]
+        window.draw.beziers(my_list,"green",pen_size=5)
+
+        See fill_beziers() to draw filled beziers vs. open/wireframe beziers. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        Parameters
+
+        - pos           \t -- List or array of bezier points and control points.
+        - color         \t -- Color of the beziers curve
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size         \t -- Pen size for the color if specified.  If the pen_size is not specified, the current default pen size is used.
+                            \t -See set_pen_size() to set the default pen size (the default is 1) 
+        - pen_size      \t - Sets the thickness of the bezier curve.  Otherwise defaults to current Pen Size (which is usually 1)
+        - linecaps      \t - Sets the 'cap' type for the bezier curve.  By default these are round and the size of the bezier line itself.
+
+                        \t Possible linecap values are "flat" (no caps),"round","diamond","square" and "arrow".  use "default" to set default cap type.
+                        \t Add "anchor" to make caps larger, e.g. "round anchor","arrow anchor", etc.  ("flat" has no "anchor")
+
+                        \t This sets both cap types unless a ',' is used, such as "round,square anchor".  
+                        \t using a blank for the cap type sets the default, such as ",arrow anchor" or "arrow anchor,", which sets only the
+                        \t end cap and beginning cap to "anchor arrow", respectively, leaving the other cap type as the default. 
+
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.beziers(my_list,"yellow")
+            window.draw.beziers(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.beziers(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.beziers(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+            window.draw.beziers(my_list,"yellow",line_caps="anchor round, anchor arrow")   # Adds a round circle and arrow to beginning & end
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)
+
+        """            
+        _pybox.WindowDrawPolygon(self.__id,pos,_library_color(color),2,**kwargs)
+
+    def fill_beziers(self, pos : list,color,**kwargs) :
+        """
+        Draws a filled sequence of connected Cubic Bezier splines. There are two control points between each two points, such as 
+        <p1,c1,c2,p2,c3,c4,p3>, in this case, using 4 control points, 2 each between the three points. The filled area is generally 
+        along the axis line between the first and last points.
+
+        - This function draws a 'Cubic Bezier Spline', requiring two control points between every two points.
+        See QuadBeziers() (i.e. Quadratic Bezier vs. cubic) for the Bezier Spline format that requires only one control point between each set of points.
+
+        - See beziers() function to draw open/wireframe beziers vs. filled
+
+        Example (draws a sine-wave like bezier with 3 points and 4 control points between points 1 and 3): 
+
+        my_list = [(50,400),(110,200),(170,600),(230,400),(290,200),(350,600),(410,400)]
+        window.draw.beziers(my_list,"green",pen_size=5,pen_color="yellow")  # draws green interior with yellow border of 5 pixels.
+
+        See fill_beziers() to draw filled beziers vs. open/wireframe beziers. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        Parameters
+
+        - pos           \t -- List or array of bezier points and control points.
+        - color         \t -- Interior color of the beziers curve
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the bezier x=curve.  Otherwise defaults to current Pen Size (which is usually 1)
+        - pen_color     \t -- Sets the  color of the border pen.  If no pen size is specified, the default/current pen size is used.
+        - line_caps     \t - Sets the 'cap' type for the bezier curve.  By default these are round and the size of the bezier line itself.
+
+                        \t Possible linecap values are "flat" (no caps),"round","diamond","square" and "arrow".  use "default" to set default cap type.
+                        \t Add "anchor" to make caps larger, e.g. "round anchor","arrow anchor", etc.  ("flat" has no "anchor")
+
+                        \t This sets both cap types unless a ',' is used, such as "round,square anchor".  
+                        \t using a blank for the cap type sets the default, such as ",arrow anchor" or "arrow anchor,", which sets only the
+                        \t end cap and beginning cap to "anchor arrow", respectively, leaving the other cap type as the default. 
+
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.beziers(my_list,"yellow")
+            window.draw.beziers(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.beziers(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.beziers(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+            window.draw.beziers(my_list,"yellow",line_caps="anchor round, anchor arrow")   # Adds a round circle and arrow to beginning & end
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)           
+        """
+        _pybox.WindowDrawPolygon(self.__id,pos,_library_color(color),3,**kwargs)
+
+    def quad_beziers(self, pos : list,color,**kwargs) :
+        """
+        Draws a sequence of connected Quadratic Bezier splines. There is one control point between each two points, such as 
+        <p1,c1,p2,c2,p3>, in this case, using 2 control points, 1 each between the three points. 
+
+        - This function draws a 'Quadratic Bezier Spline', requiring one control point between every two points.
+        - See beziers() (i.e. Cubic Bezier vs. quadratic) for the Bezier Spline format that requiress two control points between each set of points, for more control.
+        - See fill_quad_beziers() function to draw filled quadratic beziers. vs. open/wireframe quadratic beziers.
+
+        Example (draws a S-Curve Quadratic Bezier with 3 points and 2 control points between points 1 and 2): 
+
+        my_list = [(590,277),(347,310),(556,374),(726,433),(453,480)]
+        window.draw.quad_beziers(my_list,"green",pen_size=5) # draws a green, S-shaped Quadratic Bezier Curve size of 5. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        Parameters
+
+        - pos           \t -- List or array of bezier points and control points.
+        - color         \t -- Color of the beziers curve
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the bezier curve.  Otherwise defaults to current Pen Size (which is usually 1)
+        - linecaps      \t - Sets the 'cap' type for the bezier curve.  By default these are round and the size of the bezier line itself.
+
+                        \t Possible linecap values are "flat" (no caps),"round","diamond","square" and "arrow".  use "default" to set default cap type.
+                        \t Add "anchor" to make caps larger, e.g. "round anchor","arrow anchor", etc.  ("flat" has no "anchor")
+
+                        \t This sets both cap types unless a ',' is used, such as "round,square anchor".  
+                        \t using a blank for the cap type sets the default, such as ",arrow anchor" or "arrow anchor,", which sets only the
+                        \t end cap and beginning cap to "anchor arrow", respectively, leaving the other cap type as the default. 
+
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.quad_beziers(my_list,"yellow")
+            window.draw.quad_beziers(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.quad_beziers(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.quad_beziers(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+            window.draw.quad_beziers(my_list,"yellow",line_caps="anchor round, anchor arrow")   # Adds a round circle and arrow to beginning & end
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)
+
+        """
+        _pybox.WindowDrawPolygon(self.__id,pos,_library_color(color),4,**kwargs)   
+
+    def fill_quad_beziers(self, pos : list,color,**kwargs) :
+        """
+        Draws a sequence of connected Quadratic Bezier splines. There is one control point between each two points, such as 
+        <p1,c1,p2,c2,p3>, in this case, using 2 control points, 1 each between the three points. 
+
+        - The filled area is generally along the axis line between the first and last points.
+        - This function draws a 'Quadratic Bezier Spline', requiring one control point between every two points.
+        - See fill_beziers() (i.e. Cubic Bezier vs. quadratic) for the Bezier Spline format that requiress two control points between each set of points, for more control.
+        - See quad_beziers() function to draw open/wireframe quadratic beziers vs. filled quadratic beziers.
+
+        Example (draws a filled S-Curve Quadratic Bezier with 3 points and 2 control points between points 1 and 2): 
+
+        my_list = [(590,277),(347,310),(556,374),(726,433),(453,480)]
+        window.draw.quad_beziers(my_list,"green",pen_size=5,pen_color=yellow) # draws a green Quadratic Bezier Curve, with yellow border of size of 5. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        Parameters
+
+        - pos           \t -- List or array of bezier points and control points.
+        - color         \t -- Interior color of the beziers curve
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the bezier x=curve.  Otherwise defaults to current Pen Size (which is usually 1)
+        - pen_color     \t -- Sets the  color of the border pen.  If no pen size is specified, the default/current pen size is used.
+        - line_caps     \t - Line caps may be used when a pen is used as a border.  See quad_beziers() for more information.
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.fill_quad_beziers(my_list,"yellow")
+            window.draw.fill_quad_beziers(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.fill_quad_beziers(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.fill_quad_beziers(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)           
+        """
+        _pybox.WindowDrawPolygon(self.__id,pos,_library_color(color),5,**kwargs)   
+
+    def curve(self, Loc : list,color,**kwargs) :
+        """
+        Draws an open/wireframe Spline Curve of connected points. 
+
+        A cardinal spline is a sequence of individual curves joined to form a larger curve. The spline is specified 
+        by an array of points and a tension parameter. A cardinal spline passes smoothly through each point in the array; 
+        there are no sharp corners and no abrupt changes in the tightness of the curve.
+
+        - See beziers() and quad_beziers() for bezier-type curves.
+        - See fill_curve() function to draw a filled spline curve. vs. open/wireframe spline curve.
+        - See closed_curve() function to draw a closed spline curve (last point connects to first point)
+
+        Example (Draws a sine-wave-like curve with 4 curve points):
+
+        my_list = [(200,500),(278,333),(386,640),(465,486)]
+        window.draw.curve(my_list,"green",pen_size=5) # draws a green curve with a pen size of 5. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        Parameters
+
+        - pos           \t -- List or array of spline curve points.
+        - color         \t -- Color of the spline curve
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - tension       \t - Sets the tension. By default the tension is .5.  
+                        \t - Using smaller numbers (e.g. .1) makes the curves appear more and more like bent straight lines.
+                        \t - Using numbers > .5, e.g. 1.5, 2.0, etc. make the 'tension' on the curve higher, causing the curves to take longer to bend around to fit the curve.
+        - pen_size      \t - Sets the thickness of the spline curve.  Otherwise defaults to current Pen Size (which is usually 1)
+        - linecaps      \t - Sets the 'cap' type for the spline curve.  By default these are round and the size of the spline curve line itself.
+
+                        \t Possible linecap values are "flat" (no caps),"round","diamond","square" and "arrow".  use "default" to set default cap type.
+                        \t Add "anchor" to make caps larger, e.g. "round anchor","arrow anchor", etc.  ("flat" has no "anchor")
+
+                        \t This sets both cap types unless a ',' is used, such as "round,square anchor".  
+                        \t using a blank for the cap type sets the default, such as ",arrow anchor" or "arrow anchor,", which sets only the
+                        \t end cap and beginning cap to "anchor arrow", respectively, leaving the other cap type as the default. 
+
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.curve(my_list,"yellow")
+            window.draw.curve(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.curve(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.curve(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+            window.draw.curve(my_list,"yellow",line_caps="anchor round, anchor arrow")   # Adds a round circle and arrow to beginning & end
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)                       
+        """
+        _pybox.WindowDrawPolygon(self.__id,Loc,_library_color(color),6,**kwargs)   
+
+    def fill_curve(self, Loc : list,color,**kwargs) :
+        """
+        Draws a filled Spline Curve of connected points. 
+
+        A cardinal spline is a sequence of individual curves joined to form a larger curve. The spline is specified 
+        by an array of points and a tension parameter. A cardinal spline passes smoothly through each point in the array; 
+        there are no sharp corners and no abrupt changes in the tightness of the curve.
+
+        - The filled area is generally along the axis line between the first and last points.
+        - See fill_beziers() and fill_quad_beziers() for bezier-type curves.
+        - See curve() function to draw an open/wireframe spline curve. vs. a filled spline curve.
+        - See fill_closed_curve() function to draw a closed spline curve (last point connects to first point)
+
+        Example (Draws a sine-wave-like curve with 4 curve points):
+
+        my_list = [(200,500),(278,333),(386,640),(465,486)]
+        window.draw.fill_curve(my_list,"green",pen_size=5,pen_color="yellow") # draws a filled green curve with a yellow border of size of 5. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        Parameters
+
+        - pos           \t -- List or array of spline curve points.
+        - color         \t -- Color of the spline curve
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - tension       \t - Sets the tension. By default the tension is .5.  
+                        \t - Using smaller numbers (e.g. .1) makes the curves appear more and more like bent straight lines.
+                        \t - Using numbers > .5, e.g. 1.5, 2.0, etc. make the 'tension' on the curve higher, causing the curves to take longer to bend around to fit the curve.
+        - pen_size      \t - Sets the thickness of the spline curve.  Otherwise defaults to current Pen Size (which is usually 1)
+        - pen_color     \t -- Sets the  color of the border pen.  If no pen size is specified, the default/current pen size is used.
+        - line_caps     \t - Line caps may be used when a pen is used as a border.  See curve() for more information.
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.fill_curve(my_list,"yellow")
+            window.draw.fill_curve(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.fill_curve(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.fill_curve(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)                       
+        """
+        _pybox.WindowDrawPolygon(self.__id,Loc,_library_color(color),7,**kwargs)   
+
+    def closed_curve(self, Loc : list,color,**kwargs) :
+        """
+        Draws an closed open/wireframe Spline Curve of connected points. See curve() function to draw non-closed spline curve.
+
+        A cardinal spline is a sequence of individual curves joined to form a larger curve. The spline is specified 
+        by an array of points and a tension parameter. A cardinal spline passes smoothly through each point in the array; 
+        there are no sharp corners and no abrupt changes in the tightness of the curve.
+
+        - See beziers() and quad_beziers() for bezier-type curves.
+        - See fill_closed_curve() function to draw a filled closed spline curve. vs. open/wireframe closed spline curve.
+        - See curve() function to draw a non-closed spline curve.
+
+        Example (Draws a sideways figure-8/infinity symbol curve with 4 curve points):
+
+        my_list = [(441,510),(432,377),(218,510),(227,377)]
+        window.draw.closed_curve(my_list,"green",pen_size=5) # draws a green curve with a pen size of 5. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        Parameters
+
+        - pos           \t -- List or array of spline curve points.
+        - color         \t -- Color of the spline curve
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - tension       \t - Sets the tension. By default the tension is .5.  
+                        \t - Using smaller numbers (e.g. .1) makes the curves appear more and more like bent straight lines.
+                        \t - Using numbers > .5, e.g. 1.5, 2.0, etc. make the 'tension' on the curve higher, causing the curves to take longer to bend around to fit the curve.
+        - pen_size      \t - Sets the thickness of the spline curve.  Otherwise defaults to current Pen Size (which is usually 1)  
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.closed_curve(my_list,"yellow")
+            window.draw.closed_curve(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.closed_curve(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.closed_curve(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+            window.draw.closed_curve(my_list,"yellow",line_caps="anchor round, anchor arrow")   # Adds a round circle and arrow to beginning & end
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)                       
+        """
+        _pybox.WindowDrawPolygon(self.__id,Loc,_library_color(color),8,**kwargs)   
+
+    def fill_closed_curve(self, Loc : list,color,**kwargs) :
+        """
+        Draws a closed filled Spline Curve of connected points.  See fill_curve() to draw non-closed spline curve.
+
+        A cardinal spline is a sequence of individual curves joined to form a larger curve. The spline is specified 
+        by an array of points and a tension parameter. A cardinal spline passes smoothly through each point in the array; 
+        there are no sharp corners and no abrupt changes in the tightness of the curve.
+
+        - The filled area is generally along the axis line between the first and last points.
+        - See fill_beziers() and fill_quad_beziers() for bezier-type curves.
+        - See closed_curve() function to draw an open/wireframe spline curve. vs. a filled spline curve.
+        - See fill_curve() function to draw a non-closed spline curve
+
+        Example (Draws a sideways figure-8/infinity symbol curve with 4 curve points, with a green/blue gradient):
+
+        my_list = [(200,500),(278,333),(386,640),(465,486)]
+        window.draw.fill_closed_curve(my_list,"green,blue",pen_size=5,pen_color="yellow") # draws a filled green-to-blue curve with a yellow border of size of 5. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+
+        Parameters
+
+        - pos           \t -- List or array of spline curve points.
+        - color         \t -- Color of the spline curve
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - tension       \t - Sets the tension. By default the tension is .5.  
+                        \t - Using smaller numbers (e.g. .1) makes the curves appear more and more like bent straight lines.
+                        \t - Using numbers > .5, e.g. 1.5, 2.0, etc. make the 'tension' on the curve higher, causing the curves to take longer to bend around to fit the curve.
+        - pen_size      \t - Sets the thickness of the spline curve.  Otherwise defaults to current Pen Size (which is usually 1)
+        - pen_color     \t -- Sets the  color of the border pen.  If no pen size is specified, the default/current pen size is used.
+
+        Other useful keywords: angle, join_type, gradient_angle, set_gradient, set_center, opacity
+
+        Examples:
+
+            window.draw.fill_closed_curve(my_list,"yellow")
+            window.draw.fill_closed_curve(my_list,"yellow,blue")
+            window.draw.fill_closed_curve(my_list,"yellow(128)",pen_size=6)        # Sets an opacity of 128 for the yellow
+            window.draw.fill_closed_curve(my_list,"{255,255,0}",pen_size=6)        # Another way to express yellow.
+            window.draw.fill_closed_curve(my_list,"{255,255,0,128}",pen_size=6)    # Another way to express yellow with opacity = 128
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen", or 3-4 element arrays such as [0,255,255]. 
+
+        Opacity values may also be used on most functions, which can be specified in text by adding (opacity), e.g. "cyan(170)" for an opacity of 170
+        (opacity ranges from 0-255)                       
+        """
+        _pybox.WindowDrawPolygon(self.__id,Loc,_library_color(color),9,**kwargs)   
+
+    def bezier(self,p1 : list, p2 : list, p3 : list,p4 : list,color,**kwargs) :
+        """
+        Draws an open/wireframe simple 4-point Cubic Bezier curve.  
+
+        See fill_bezier() to draw a simple 4-point filled bezier curve vs. open/wireframe
+
+        ** This function is included for compatibility with Windows GDI functions.
+        ** See: beziers() function for information on usage of bezier functions.
+
+        Example (Draws a simple 4-point Cubic Bezier Curve in the shape of a horse-shoe curve)
+
+        window.draw.bezier((200,500),(200,225),(500,225),(500,500),"green",pen_size=5) # draws a green set of lines with a pen size of 5. 
+        """
+        return _pybox.WindowDrawBezier(self.__id,p1,p2,p3,p4,_library_color(color),True,**kwargs)
+
+    def fill_bezier(self,p1 : list, p2 : list, p3 : list,p4 : list,color,**kwargs) :
+        """
+        Draws a filled simple 4-point Cubic Bezier curve.  
+
+        See bezier() to draw a simple 4-point open/wireframe bezier curve vs. filled
+
+        ** This function is included for compatibility with Windows GDI functions.
+        ** See: fill_beziers() function for information on usage of bezier functions.
+
+        Example (Draws a simple filled 4-point Cubic Bezier Curve in the shape of a horse-shoe curve)
+
+        window.draw.fill_bezier((200,500),(200,225),(500,225),(500,500),"green,blue",pen_size=5,pen_color="yellow")
+
+        --> The above draws a curve with a green and blue gradient, and a yellow border of 5 pixels.
+        """
+        return _pybox.WindowDrawBezier(self.__id,p1,p2,p3,p4,_library_color(color),False,**kwargs)
+
+    def quad_bezier(self,p1 : list, p2 : list, p3 : list,color,**kwargs) :
+        """
+        Draws an open/wireframe simple 3-point Quadratic Bezier curve.  
+
+        See fill_quad_bezier() to draw a simple 4-point filled quadratic Bezier curve vs. open/wireframe
+
+        ** This function is included for compatibility with Windows GDI functions.
+        ** See: quad_beziers() function for information on usage of bezier functions.
+
+        Example (Draws a simple 3-point Qaudratic Bezier Curve)
+
+        window.draw.quad_bezier((200,500),(296,247),(400,500),"green",pen_size=5) # draws a green set of lines with a pen size of 5.  
+        """
+        return _pybox.WindowDrawQuadBezier(self.__id,p1,p2,p3,_library_color(color),True,**kwargs)
+
+    def fill_quad_bezier(self,p1 : list, p2 : list, p3 : list,color,**kwargs) :
+        """
+        Draws a filled simple 3-point Quadratic Bezier curve.  
+
+        See quad_bezier() to draw a simple 4-point open/wireframe bezier curve vs. filled
+
+        ** This function is included for compatibility with Windows GDI functions.
+        ** See: fill_quad_beziers() function for information on usage of bezier functions.
+
+        Example (Draws a simple filled 3-point Quadratic Bezier Curve in the shape of a horse-shoe curve)
+
+        window.draw.fill_quad_bezier((200,500),(296,247),(400,500),"green,blue",pen_size=5,pen_color="yellow")
+
+        --> The above draws a curve with a green and blue gradient, and a yellow border of 5 pixels.
+        """
+        return _pybox.WindowDrawQuadBezier(self.__id,p1,p2,p3,_library_color(color),False,**kwargs)
+
+    #
+    # Arc and Pie Functions
+    #
+
+    def arc(self,x ,y , radius_x, radius_y, start_angle, sweep_angle , arc_color, **kwargs) :
+        """
+        Draws an open/wireframe Arc in the window.  An 'Arc' is a partial ellipse.  
+        The same parameters of Width and Height (or RadiusX and RadiusY) are given. Input angles are in degrees. 
+
+        - See arc_l() to use list/array/tuple for (x,y) and (radiusx,radiusy) values.            
+        - See fill_arc() to draw filled arc. vs. an open/wireframe
+
+        Parameters: 
+
+        - x,y           \t -- Location of the center of the ellipse in the window
+        - radius_x      \t -- Width/Radius (in pixels) of the ellipse in the X direction
+        - radius_y      \t -- Height/Radius (in pixels) of the ellipse in the Y direction
+        - start_angle   \t -- Where to start drawing the ellipse.   0 degrees is directly right on the X-Axis, with a counter-clockwise rotation (i.e. 90 degrees is top, -90 is bottom)
+        - sweep_angle   \t -- How many degrees in a circle to draw the ellipse. 
+
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the arc.  Otherwise defaults to current Pen Size (which is usually 1), e.g. arc(x,y,rx,ry,"red",pen_size=10)
+        - join_type     \t - Used to set how angles on lines are joined.  Default is "miter" can be sharp.  Setting join_type="round" (or "bevel") can make edges softer.
+        - line_caps      \t - Sets the 'cap' type for the arc.  By default these are round and the size of the arc line itself.
+
+                        \t Possible linecap values are "flat" (no caps),"round","diamond","square" and "arrow".  use "default" to set default cap type.
+                        \t Add "anchor" to make caps larger, e.g. "round anchor","arrow anchor", etc.  ("flat" has no "anchor")
+
+                        \t This sets both cap types unless a ',' is used, such as "round,square anchor".  
+                        \t using a blank for the cap type sets the default, such as ",arrow anchor" or "arrow anchor,", which sets only the
+                        \t end cap and beginning cap to "anchor arrow", respectively, leaving the other cap type as the default. 
+
+        Example: 
+
+        draw.arc(200,200,400,50,90,-180,"red") -- Draws an arc based on an ellipse of RadiusX=400, RadiusY = 400.  The 90 starts at the top of the axis. The -180 sweeps from
+        this point, creating an arc from the top of the ellipse, rotating clockwise (because the sweep angle is negative) to draw the ellipse down to the bottom of the ellipse.
+        """               
+        return _pybox.WindowDrawArc(self.__id,x,y,radius_x,radius_y,start_angle,sweep_angle,_library_color(arc_color),0,**kwargs)
+
+    def arc_l(self,pos : list, size : list, start_angle, sweep_angle, arc_color, **kwargs) :
+        """
+        Draws an open/wireframe Arc in the window.  An 'Arc' is a partial ellipse.  The same parameters of Width and Height (or RadiusX and RadiusY) are given. Input angles are in degrees. 
+
+        - See arc() to use individual x,y,radius_x and radius_y values instead of list/array/tuple.            
+        - See fill_arc() to draw filled arc. vs. an open/wireframe
+
+        Parameters: 
+
+        - pos           \t -- (x,y) Location of the center of the ellipse in the window
+        - size          \t -- (Width, Height), in pixels, of the ellipse
+        - start_angle   \t -- Where to start drawing the ellipse.   0 degrees is directly right on the X-Axis, with a counter-clockwise rotation (i.e. 90 degrees is top, -90 is bottom)
+        - sweep_angle   \t -- How many degrees in a circle to draw the ellipse. 
+
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the arc.  Otherwise defaults to current Pen Size (which is usually 1), e.g. arc(x,y,rx,ry,"red",pen_size=10)
+        - join_type     \t - Used to set how angles on lines are joined.  Default is "miter" can be sharp.  Setting join_type="round" (or "bevel") can make edges softer.
+        - line_caps     \t - Sets the 'cap' type for the arc.  By default these are round and the size of the arc line itself.
+
+                        \t Possible linecap values are "flat" (no caps),"round","diamond","square" and "arrow".  use "default" to set default cap type.
+                        \t Add "anchor" to make caps larger, e.g. "round anchor","arrow anchor", etc.  ("flat" has no "anchor")
+
+                        \t This sets both cap types unless a ',' is used, such as "round,square anchor".  
+                        \t using a blank for the cap type sets the default, such as ",arrow anchor" or "arrow anchor,", which sets only the
+                        \t end cap and beginning cap to "anchor arrow", respectively, leaving the other cap type as the default. 
+
+
+        Example: 
+
+        draw.arc_l((200,200),(400,50),90,-180,"red") -- Draws an arc based on an ellipse of RadiusX=400, RadiusY = 400.  The 90 starts at the top of the axis. The -180 sweeps from
+        this point, creating an arc from the top of the ellipse, rotating clockwise (because the sweep angle is negative) to draw the ellipse down to the bottom of the ellipse.
+        """               
+        return _pybox.WindowDrawArc(self.__id,pos[0],pos[1],size[0],size[1],start_angle,sweep_angle,_library_color(arc_color),0,**kwargs)
+
+    def fill_arc(self,x , y , radius_x, radius_y, start_angle, sweep_angle , arc_color, **kwargs) :
+        """
+        Draws an filled Arc in the window.  An 'Arc' is a partial ellipse.  
+        The same parameters of Width and Height (or RadiusX and RadiusY) are given. Input angles are in degrees. 
+
+        - The filled area is the area between the ends of the arc.
+        - See fill_arc_l() to use list/array/tuple for (x,y) and (radiusx,radiusy) values.            
+        - See arc() to draw an open/wireframe arc vs. a filled arc.
+
+        Parameters: 
+
+        - x,y           \t -- Location of the center of the ellipse in the window
+        - radius_x      \t -- Width/Radius (in pixels) of the ellipse in the X direction
+        - radius_y      \t -- Height/Radius (in pixels) of the ellipse in the Y direction
+        - start_angle   \t -- Where to start drawing the ellipse.   0 degrees is directly right on the X-Axis, with a counter-clockwise rotation (i.e. 90 degrees is top, -90 is bottom)
+        - sweep_angle   \t -- How many degrees in a circle to draw the ellipse. 
+
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the arc.  Otherwise defaults to current Pen Size (which is usually 1), e.g. arc(x,y,rx,ry,"red",pen_size=10)
+        - join_type     \t - Used to set how angles on lines are joined (if a border/pen is used).  
+                        \t   Default is "miter" can be sharp.  Setting join_type="round" (or "bevel") can make edges softer.
+        - line_caps     \t - Line caps may be used when a pen is used as a border.  See arc() for more information.
+
+        Example: 
+
+        draw.fill_arc(200,200,400,50,90,-180,"red") -- Draws an arc based on an ellipse of RadiusX=400, RadiusY = 400.  The 90 starts at the top of the axis. The -180 sweeps from
+        this point, creating an arc from the top of the ellipse, rotating clockwise (because the sweep angle is negative) to draw the ellipse down to the bottom of the ellipse.
+        """               
+        return _pybox.WindowDrawArc(self.__id,x,y,radius_x,radius_y,start_angle,sweep_angle,_library_color(arc_color),1,**kwargs)
+
+    def fill_arc_l(self,pos : list, size : list, start_angle, sweep_angle, arc_color, **kwargs) :
+        """
+        Draws a filled arc in the window.  An 'Arc' is a partial ellipse.  The same parameters of Width and Height (or RadiusX and RadiusY) are given. Input angles are in degrees. 
+
+        - The filled area is the area between the ends of the arc.
+        - See fill_arc() individual values for x,y,radius_x and radius_y, instead of list/array/tuple.           
+        - See arc_l() to draw an open/wireframe arc vs. a filled arc.
+
+        Parameters: 
+
+        - pos           \t -- (x,y) Location of the center of the ellipse in the window
+        - size          \t -- (Width, Height), in pixels, of the ellipse
+        - start_angle   \t -- Where to start drawing the ellipse.   0 degrees is directly right on the X-Axis, with a counter-clockwise rotation (i.e. 90 degrees is top, -90 is bottom)
+        - sweep_angle   \t -- How many degrees in a circle to draw the ellipse. 
+
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the arc.  Otherwise defaults to current Pen Size (which is usually 1), e.g. arc(x,y,rx,ry,"red",pen_size=10)
+        - join_type     \t - Used to set how angles on lines are joined (if a border/pen is used).  
+                        \t   Default is "miter" can be sharp.  Setting join_type="round" (or "bevel") can make edges softer.
+        - line_caps     \t - Line caps may be used when a pen is used as a border.  See arc() for more information.
+
+
+        Example: 
+
+        draw.fill_arc_l((200,200),(400,50),90,-180,"red") -- Draws an arc based on an ellipse of RadiusX=400, RadiusY = 400.  The 90 starts at the top of the axis. The -180 sweeps from
+        this point, creating an arc from the top of the ellipse, rotating clockwise (because the sweep angle is negative) to draw the ellipse down to the bottom of the ellipse.
+        """               
+        return _pybox.WindowDrawArc(self.__id,pos[0],pos[1],size[0],size[1],start_angle,sweep_angle,_library_color(arc_color),1,**kwargs)
+
+    def pie(self,x , y , radius_x, radius_y, start_angle, sweep_angle , arc_color, **kwargs) :
+        """
+        Draws an open/wireframe pie chart slice, from the center of the ellipse described by RadiusX and RadiusY, from the start angle, for duration of the sweep angle.
+
+        - See pie_l() to use list/array/tuple for (x,y) and (radiusx,radiusy) values.            
+        - See fill_pie() to draw filled pie slice. vs. an open/wireframe
+
+        Example:
+
+        window.draw.pie(200,300,400,400,-75,150,"red") 
+
+        This example draws a Pie-Chart slice centered at (200,200), with radius_x and radius_y of 400 (i.e. a circle),
+        with a start angle of -75 degrees, for a duration of 150 degrees.
+
+        0 Degrees starts directly to the right of the center of the ellipse/circle and moves in a clockwise direction.  
+        In the example above, this will draw a pie slice from the center of the circle, to the upper-right starting at -75 degrees, extending 
+        the same amount below the Y axis (since it is 150 degrees in length). 
+
+        Parameters: 
+
+        - x,y           \t -- Location of the center of the ellipse in the window
+        - radius_x      \t -- Width/Radius (in pixels) of the ellipse in the X direction
+        - radius_y      \t -- Height/Radius (in pixels) of the ellipse in the Y direction
+        - start_angle   \t -- Where to start drawing the ellipse.   0 degrees is directly right on the X-Axis, with a counter-clockwise rotation (i.e. 90 degrees is top, -90 is bottom)
+        - sweep_angle   \t -- How many degrees in a circle to draw the ellipse. 
+
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the pie slice.  Otherwise defaults to current Pen Size (which is usually 1).
+        - join_type     \t - Used to set how angles on lines are joined.  Default is "miter" can be sharp.  Setting join_type="round" (or "bevel") can make edges softer.
+        - line_caps      \t - Sets the 'cap' type for the pie slice.  By default these are round and the size of the pie slice line itself.
+
+                        \t Possible linecap values are "flat" (no caps),"round","diamond","square" and "arrow".  use "default" to set default cap type.
+                        \t Add "anchor" to make caps larger, e.g. "round anchor","arrow anchor", etc.  ("flat" has no "anchor")
+
+                        \t This sets both cap types unless a ',' is used, such as "round,square anchor".  
+                        \t using a blank for the cap type sets the default, such as ",arrow anchor" or "arrow anchor,", which sets only the
+                        \t end cap and beginning cap to "anchor arrow", respectively, leaving the other cap type as the default. 
+          """               
+        return _pybox.WindowDrawArc(self.__id,x,y,radius_x,radius_y,start_angle,sweep_angle,_library_color(arc_color),2,**kwargs)
+
+    def pie_l(self,pos : list, size : list, start_angle, sweep_angle, arc_color, **kwargs) :
+        """
+        Draws an open/wireframe pie chart slice, from the center of the ellipse described by RadiusX and RadiusY, from the start angle, for duration of the sweep angle.
+
+        - See pie() to use individual values for x,y,radius_x, and radius_y, instead of list/array/tuple.       
+        - See fill_pie_l() to draw filled pie slice. vs. an open/wireframe
+
+        Example:
+
+        window.draw.pie_l((200,300),(400,400),-75,150,"red") 
+
+        This example draws a Pie-Chart slice centered at (200,200), with radius_x and radius_y of 400 (i.e. a circle),
+        with a start angle of -75 degrees, for a duration of 150 degrees.
+
+        0 Degrees starts directly to the right of the center of the ellipse/circle and moves in a clockwise direction.  
+        In the example above, this will draw a pie slice from the center of the circle, to the upper-right starting at -75 degrees, extending 
+        the same amount below the Y axis (since it is 150 degrees in length). 
+
+        Parameters: 
+
+        - pos           \t -- (x,y) Location of the center of the ellipse in the window
+        - size          \t -- (Width, Height), in pixels, of the ellipse
+        - start_angle   \t -- Where to start drawing the ellipse.   0 degrees is directly right on the X-Axis, with a counter-clockwise rotation (i.e. 90 degrees is top, -90 is bottom)
+        - sweep_angle   \t -- How many degrees in a circle to draw the ellipse. 
+
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the pie slice.  Otherwise defaults to current Pen Size (which is usually 1).
+        - join_type     \t - Used to set how angles on lines are joined.  Default is "miter" can be sharp.  Setting join_type="round" (or "bevel") can make edges softer.
+        - line_caps      \t - Sets the 'cap' type for the pie slice.  By default these are round and the size of the pie slice line itself.
+
+                        \t Possible linecap values are "flat" (no caps),"round","diamond","square" and "arrow".  use "default" to set default cap type.
+                        \t Add "anchor" to make caps larger, e.g. "round anchor","arrow anchor", etc.  ("flat" has no "anchor")
+
+                        \t This sets both cap types unless a ',' is used, such as "round,square anchor".  
+                        \t using a blank for the cap type sets the default, such as ",arrow anchor" or "arrow anchor,", which sets only the
+                        \t end cap and beginning cap to "anchor arrow", respectively, leaving the other cap type as the default. 
+        """               
+        return _pybox.WindowDrawArc(self.__id,pos[0],pos[1],size[0],size[1],start_angle,sweep_angle,_library_color(arc_color),2,**kwargs)
+
+    def fill_pie(self,x , y , radius_x, radius_y, start_angle, sweep_angle , arc_color, **kwargs) :
+        """
+        Draws an filled pie chart slice, from the center of the ellipse described by RadiusX and RadiusY, from the start angle, for duration of the sweep angle.
+
+        - See fill_pie() to use list/array/tuple for x,y,radius_x, and radius_y, rather than invidual values.       
+        - See pie() to draw an open/wireframe pie slice vs. a filled pie slice.
+
+        Example:
+
+        window.draw.fill_pie(200,300,400,400,-75,150,"red") 
+
+        This example draws a Pie-Chart slice centered at (200,200), with radius_x and radius_y of 400 (i.e. a circle),
+        with a start angle of -75 degrees, for a duration of 150 degrees.
+
+        0 Degrees starts directly to the right of the center of the ellipse/circle and moves in a clockwise direction.  
+        In the example above, this will draw a pie slice from the center of the circle, to the upper-right starting at -75 degrees, extending 
+        the same amount below the Y axis (since it is 150 degrees in length). 
+
+        Parameters: 
+
+        - x,y           \t -- Location of the center of the ellipse in the window
+        - radius_x      \t -- Width/Radius (in pixels) of the ellipse in the X direction
+        - radius_y      \t -- Height/Radius (in pixels) of the ellipse in the Y direction
+        - start_angle   \t -- Where to start drawing the ellipse.   0 degrees is directly right on the X-Axis, with a counter-clockwise rotation (i.e. 90 degrees is top, -90 is bottom)
+        - sweep_angle   \t -- How many degrees in a circle to draw the ellipse. 
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the pie slice.  Otherwise defaults to current Pen Size (which is usually 1).
+        - join_type     \t - Used to set how angles on lines are joined (if a border/pen is used).  
+                        \t   Default is "miter" can be sharp.  Setting join_type="round" (or "bevel") can make edges softer.
+        - line_caps     \t - Line caps may be used when a pen is used as a border.  See pie() for more information.
+        """               
+        return _pybox.WindowDrawArc(self.__id,x,y,radius_x,radius_y,start_angle,sweep_angle,_library_color(arc_color),3,**kwargs)
+
+    def fill_pie_l(self,pos : list, size : list, start_angle, sweep_angle, arc_color, **kwargs) :
+        """
+        Draws an filled pie chart slice, from the center of the ellipse described by RadiusX and RadiusY, from the start angle, for duration of the sweep angle.
+
+        - See fill_pie() to use individual values for x,y,radius_x, and radius_y, rather than list/array/tuple values     
+        - See pie_l() to draw an open/wireframe pie slice vs. a filled pie slice.
+
+        Example:
+
+        window.draw.fill_pie_l((200,300),(400,400),-75,150,"red") 
+
+        This example draws a Pie-Chart slice centered at (200,200), with radius_x and radius_y of 400 (i.e. a circle),
+        with a start angle of -75 degrees, for a duration of 150 degrees.
+
+        0 Degrees starts directly to the right of the center of the ellipse/circle and moves in a clockwise direction.  
+        In the example above, this will draw a pie slice from the center of the circle, to the upper-right starting at -75 degrees, extending 
+        the same amount below the Y axis (since it is 150 degrees in length). 
+
+        Parameters: 
+
+        - pos           \t -- (x,y) Location of the center of the ellipse in the window
+        - size          \t -- (Width, Height), in pixels, of the ellipse
+        - start_angle   \t -- Where to start drawing the ellipse.   0 degrees is directly right on the X-Axis, with a counter-clockwise rotation (i.e. 90 degrees is top, -90 is bottom)
+        - sweep_angle   \t -- How many degrees in a circle to draw the ellipse. 
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Sets the thickness of the pie slice.  Otherwise defaults to current Pen Size (which is usually 1).
+        - join_type     \t - Used to set how angles on lines are joined (if a border/pen is used).  
+                        \t   Default is "miter" can be sharp.  Setting join_type="round" (or "bevel") can make edges softer.
+        - line_caps     \t - Line caps may be used when a pen is used as a border.  See pie() for more information.
+        """               
+        return _pybox.WindowDrawArc(self.__id,pos[0],pos[1],size[0],size[1],start_angle,sweep_angle,_library_color(arc_color),3,**kwargs)
+
+
+    #
+    # Draw Line Functions
+    #
+
+    def line_fast(self,x1 : int,y1 : int,x2 : int,y2 : int,color,pen_size : int = 0) : 
+        """
+        Draws a 'fast' line in the window from (x1,y1) to (x2,y2).  See DrawLine_l() to use list/array/tuple for (x,y) coordinates. 
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters:
+
+        - color         \t -- Color to use for drawing the line
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """
+        return _pybox.WindowDrawLineFast(self.__id,int(x1),int(y1),int(x2),int(y2),_library_color(color),pen_size)    
+
+    def line_fast_l(self,p1 : list, p2 : list,color,pen_size : int = 0) : 
+        """
+        Draws a 'fast' line in the window from (x1,y1) to (x2,y2).  See DrawLine() to use individual x,y coordinates.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters:
+
+        - color         \t -- Color to use for drawing the line
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """
+        return _pybox.WindowDrawLineFast(self.__id,int(p1[0]),int(p1[1]),int(p2[0]),int(p2[1]),_library_color(color),pen_size)
+
+
+    def lineto_fast(self,x1 : int,y1 : int,color,pen_size : int = 0) : 
+        """
+        Draws a 'fast' line in the window from the current point (last line or Set Point).  See DrawLineToL() to use list, tuple, or array for x,y starting point.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters:
+
+        - color         \t -- Color to use for drawing the line
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """
+        return _pybox.WindowDrawLineToFast(self.__id,int(x1),int(y1),_library_color(color),pen_size)
+
+    def lineto_fast_l(self,p1 : list,color,pen_size : int = 0) : 
+        """
+        Draws a 'fast' line in the window from the current point (last line or Set Point).  See DrawLineTo() to use individual x,y coordinates.
+
+        This drawing function is a 'fast' function that does not use anti-aliasing and is about 10x faster than
+        non-fast drawing functions.  These functions are useful for general drawing and do not respond to opacity or transformations.
+
+        Parameters:
+
+        - color         \t -- Color to use for drawing the line
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """        
+        return _pybox.WindowDrawLineToFast(self.__id,int(p1[0]),int(p1[1]),_library_color(color),pen_size)
+
+    # HR Draw Line Functions
+
+    def line_segments(self,Loc : list, color = None, pen_size = None,array_size : int = 0) -> bool : 
+        """
+        Draws multiple line segments with one color or one color for each line segment.
+
+        Loc may also be a pybox.TrailBuffer, which is drawn from its oldest point to its newest, with its transform (see TrailBuffer.set_transform()). 
+        When color is omitted, the TrailBuffer's colors are used.
+
+        - There must be at least two line segments to draw
+        - There can be 0 and 1 line segments specified.  If so, the function is ignored.
+
+        Parameters
+
+        - Loc           \t -- A list or array of line segments in (x,y) form.  x and y values may be integer or floating-point values.
+        - color         \t -- A single color of color for each line segment (endpoint segment color is used)
+        - array_size     \t -- [optional] When given, this is the size of the array to use.  color and Loc must be of at least ArraySize (when ArraySize is specified).
+                        \t - When ArraySize is specified, the size of Loc and Color are used (Loc and Color must be of the exact same size when ArraySize is not specified).
+        - pen_size       \t - [optional] Pen Size to use for every line.  This is a static value and does not currently support arrays. When omitted, the current pen size is used.
+                            \t -See draw.set_pen_size() to set a general pen size rather than specifying it in the function.
+
+        """
+        if isinstance(Loc,TrailBuffer) :
+            if color is None : color = Loc.colors
+            Loc = Loc.points if Loc.transform is None else Loc._transformed()
+            array_size = 0
+        if color is None : raise ValueError("line_segments() needs a color, or a TrailBuffer with colors")
+        return _pybox.WindowDrawLineSegments(self.__id,Loc,_library_color(color),array_size,pen_size)
+
+    def line(self,x1,y1,x2,y2,color,**kwargs) : 
+        """
+        Draws a line in the window from (x1,y1) to (x2,y2).  See DrawLineL() to use list/array/tuple for (x,y) coordinates. 
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters:
+
+        - x1,y1         \t -- x,y start (x,y) point
+        - x2,y2         \t -- x,y end (x,y) point
+        - color         \t -- Color to use for drawing the line
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Pen Size to use for every line. When omitted, the current pen size is used. See draw.set_pen_size() to set a general pen size rather than specifying it in the function. This value may be integer or floating-point.
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """
+        return _pybox.WindowDrawLine(self.__id,x1,y1,x2,y2,_library_color(color),**kwargs)    
+
+    def line_l(self,p1 : list, p2 : list,color,**kwargs) : 
+        """
+        Draws a line in the window from (x1,y1) to (x2,y2).  See DrawLine() to use individual x,y coordinates.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters:
+
+        - p1            \t -- list, array, or tuple of start (x,y) point
+        - p2            \t -- list, array, or tuple of end (x,y) point
+        - color         \t -- Color to use for drawing the line
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Pen Size to use for every line. When omitted, the current pen size is used. See draw.set_pen_size() to set a general pen size rather than specifying it in the function. This value may be integer or floating-point.
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """
+        return _pybox.WindowDrawLine(self.__id,p1[0],p1[1],p2[0],p2[1],_library_color(color),**kwargs)
+
+    def lineto(self,x1,y1,color,**kwargs) : 
+        """
+        Draws a line in the window from the current point (last line or Set Point).  See DrawLineToL() to use list, tuple, or array for x,y starting point.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters:
+
+        - x1,y1         \t -- x,y end point of line.
+        - color         \t -- Color to use for drawing the line
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Pen Size to use for every line. When omitted, the current pen size is used. See draw.set_pen_size() to set a general pen size rather than specifying it in the function. This value may be integer or floating-point.
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """
+        return _pybox.WindowDrawLineTo(self.__id,x1,y1,_library_color(color),**kwargs)
+
+    def lineto_l(self,p1 : list,color,**kwargs) : 
+        """
+        Draws a line in the window from the current point (last line or Set Point).  See DrawLineTo() to use individual x,y coordinates.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters:
+
+        - p1            \t -- list, array, or tuple of end (x,y) point
+        - color         \t -- Color to use for drawing the line
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Pen Size to use for every line. When omitted, the current pen size is used. See draw.set_pen_size() to set a general pen size rather than specifying it in the function. This value may be integer or floating-point.
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """        
+        return _pybox.WindowDrawLineTo(self.__id,p1[0],p1[1],_library_color(color),**kwargs)
+
+    def lineto_ex(self,first,x1,y1,color,**kwargs) : 
+        """
+        Draws a line in the window from the current point (last line or Set Point).  See DrawLineToL() to use list, tuple, or array for x,y starting point.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters:
+
+        - first         \t -- [int or bool] When false (or 0 when an integer), the Line is drawn as a LineTo to the point given
+                            \t - when true (or non-zero when an integer), the point is set as the first point, but not drawn.
+        - x1,y1         \t -- x,y end point of line.
+        - color         \t -- Color to use for drawing the line
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Pen Size to use for every line. When omitted, the current pen size is used. See draw.set_pen_size() to set a general pen size rather than specifying it in the function. This value may be integer or floating-point.
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """
+        return _pybox.WindowDrawLineToEx(self.__id,first,x1,y1,_library_color(color),**kwargs)
+
+    def lineto_ex_l(self,first,p1 : list,color,**kwargs) : 
+        """
+        Draws a line in the window from the current point (last line or Set Point).  See DrawLineTo() to use individual x,y coordinates.
+
+        This drawing function responds to current opacity and transformations and will anti-alias output results.
+        Hint: use an odd-size pen_size for sharper edges.
+
+        Parameters:
+
+        - first         \t -- [int or bool] When false (or 0 when an integer), the Line is drawn as a LineTo to the point given
+                            \t - when true (or non-zero when an integer), the point is set as the first point, but not drawn.
+        - p1            \t -- list, array, or tuple of end (x,y) point
+        - color         \t -- Color to use for drawing the line
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - pen_size      \t - Pen Size to use for every line. When omitted, the current pen size is used. See draw.set_pen_size() to set a general pen size rather than specifying it in the function. This value may be integer or floating-point.
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+        """        
+        return _pybox.WindowDrawLineToEx(self.__id,first,p1[0],p1[1],_library_color(color),**kwargs)
+
+    def draw_grid(self,spacing : int = 25,**kwargs) -> bool :
+        """
+        Draws a grid of lines in the X and Y axis to create a graph on the screen.
+
+        The "spacing" parameter controls how many pixels are between each set of lines.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - color                       \t -Sets the color of the grid, i.e. "white","red","45,67,123", etc. Default color is RGB(42,42,42) (i.e. dark gray)
+
+        The default for the "spacing" parameter is 25 pixels.
+
+        Examples:
+
+        \t -MyWindow.draw_grid()                \t -- Draws default grid
+        \t -MyWindow.write(50)                  \t -- Draws a grid with spacing of 50 pixels 
+        \t -MyWindow.write("green")             \t -- Draws a grid with the color green
+        \t -MyWindow.write(50,"0,255,255")      \t -- Draws a grid with spacing of 50 and an RGB color of (0,255,255) or "cyan"
+        """
+        return _pybox.WindowDrawGrid(self.__id,spacing,**kwargs)
+
+    def vector(self,p1 : list, p2 : list,line_size,color,**kwargs) : 
+        """
+        Draws a vector from point p1 to p2.  A vector is the same thing as a line, but with some differences and a number of controls that 
+        can be used to modify its behavior and appearance.
+
+        The vector also has beginning and end 'caps'.  The default is for the beginning of the line to have a round shape (e.g. round cap), and
+        the end of the line to have a larger arrow shape (known as an 'arrow' cap, but because it's larger it's known as an 'arrow anchor')
+
+        The default behavior for draw_vector is to draw the vector in a white color, with a round beginning cap and an 'arrow anchor' ending cap.
+
+        Input
+
+        - p1,p2             - Beginning and End Points of the line, such as (100,400),(600,700) or (x1,y1),(x2,y2), etc.
+        - line_size         -size of the line in pixels.
+        - color             - color of vector line.
+
+        Example of simple usage: window.draw_vector(p1,p2,10) or draw_vector((x1,y1),(x2,y2),10)
+
+        Text, colors, and many others may be assign through the following keywords
+
+        - title         - Sets the title to display on the vector line, e.g. title="This is a vector.  Default behavior is no title.
+        - opacity       - Sets the opacity to draw the line.  Range is 0-255, with 0 transparent and 255 fully opaque. Default is 255 (fully opaque).
+        - angle         - Rotates the vector at its center by the angle specified.  "angle" is in degrees.  "AngleDeg" may also be used to specify degrees
+        - angle_rad     - Same as "angle", but uses radians instead of degrees, e.g. angle_rad = 1.57 (for 90 degrees)
+        - text_size     - Sets the relative font size of the label.  The default font varies in size based on line thickness. 
+                          text_size values can me "xxsmall","xsmall","small","medium","large,"xlarge", "xxlarge".  Default is "small".  "default" may also be used as an option.
+
+        - label_font (or "font")    - Sets a specific font size or type for the vector line.  The font will not change based on line thickness when set in this manner.
+                                      Fonts may be set with just a size, such as a number, e.g. font=25 (for default font Arial at 25 points), or a full font name, e.g. font="time new roman,25"
+
+        - label_just (or "just")    - Sets the justification of the vector label text.  Default is "top-left".  
+                                      Options are: "top-left","top-left-center","top-center","top-right-center","top-right".  "bottom" and "middle" may be used instead of top to specify the 
+                                      bottom of the vector line or middle of the line (vertically), respectively.  Example: just="bottom-right"
+
+        - capsize       - Sets the beginning and end cap of the vector to a multiple of the capsize specified.  This is useful only for 'anchor' cap types
+                          such as 'round achor', 'arrow anchor',etc.  The anchor types grow and shrink based on line thickness.
+                          using "capsize" can make the beginning and end caps smaller or larger.
+                          example capize=2 makes any anchor cap 2x larger.  see "begcapsize" and "endcapsize" to control cap sizes individually.
+
+        - begcap_size (or "begcap")   - Sets the begininng cap size if the begnining cap is an 'anchor' cap type.  See documentation on 'capsize', which will set both
+                                        beginning and end cap together.
+
+        - endcap_size (or "endcap")  - Sets the end cap size if the end cap is an 'anchor' cap type.  See documentation on 'capsize', which will set both
+                                       beginning and end cap together.
+
+        - begcap_type       - Sets the beginning cap type.  by default, the cap type for the begining of the vector is "round"
+                              possible types are "round","diamond","arrow","square","flat","round anchor","diamond anchor","arrow anchor","diamond anchor"
+                              "anchor" types are larger and can be made smaller or larger with "capsize" or "begcap_size"
+
+        - endcap_type       - Sets the ending cap type.  by default, the cap type for the enf of the vector is "arrow anchor"
+                              possible types are "round","diamond","arrow","square","flat","round anchor","diamond anchor","arrow anchor","diamond anchor"
+                              "anchor" types are larger and can be made smaller or larger with "capsize" or "begcap_size"
+        - begcap_color      - Sets the color of the beginning cap of the vector.  This is useful for "anchor" cap types which are larger.  
+                              Example: begcap_color="yellow"                             
+        - endcap_color      - Sets the color of the ending cap of the vector.  This is useful for "anchor" cap types which are larger.  
+                              By default, the begining and end caps are the same color as the vector line itself.  Example: endcap_color="red"  
+        - label_pad_x (or "pad_x")  - Sets extra spacing on the left or right of the label on the vector.  Positive values move the title to the right
+                                      (as formed by p1-p2), with negative values moving the title to the left.
+        - label_pad_y (or "pad_y")  - Sets extra spacing on the top or bottom of the label on the vector.  Positive values move the title upwards
+                                      (as formed by p1-p2), with negative values moving the title downward.
+        - label_opacity     - Sets the opacity of the vector's label.  By default, the opacity of the vector label is the same as the line, either by default or
+                              when the line opacity is specifically specified.  Using label_opacity will cause the label's opacity to use this value.
+        - label_color   - Sets the color of the vector label, e.g. label_color="red".  By default, the label's color is white, regardless of the line color.
+        - label_angle   - Sets the label of the angle with 3 options: "horizontal" (default), "vertical", or "vertical 180".  "vertical" and vertical 180" make the label
+                          appear sideways on the line, with "vertial 180" reversing it's direction, with the start of the text appearing away from the line.
+                          Add the term "static" to keep the label the exact orientation regardless of line angle, e.g. 'label_angle="horizontal,static"' will cause
+                          the text to display at 0 degrees relative to the screen rather than the line itself.
+
+        - label_up      - Keeps the vector's label right-side up. As the vector rotates and the label's orientation, using "label_up=True" will keep the label
+                          right-side up when the label's angle is such that the label would otherwise appear upside-down.
+        - set_center    - Sets the center of the vector, regardless of p1 and p2.  This calculates the relative center of the vector (i.e. (p1+p2)/2-p1), and
+                          places the center of the vector at the new (x,y) coordinates.  Example set_center=(500,200) or set_center=(x,y)
+                          This is useful in simply specifying a length in the draw_vector call as p1 and p2, such as draw_vector((0,0),(0,x),...) then
+                          setting the center and angle of the vector with "set_canter" and "angle" keywords, respectively/
+        - show_center   - puts a circle in the center of the vector.  This is for purely diagnostic purposes, showing the center is where it should be based on 
+                          the calling's functions calculation.  Use "show_center=True" to show the circle in cyan.  
+                          Use "show_center=<color>" to set the color, e.g. 'show_center="black"'
+        """
+        return _pybox.WindowDrawVector(self.__id,p1[0],p1[1],p2[0],p2[1],line_size,_library_color(color),**kwargs)
+
+    def set_pixel(self,x : int, y : int, color : any) :
+        """
+        Draws a single RGB pixel in the window at point specified by x,y
+
+        see: set_pixel_l() to use list, tuples, or arrays for the x,y location
+
+        Parameters
+
+        x,y   \t- location to place pixel inside of window
+        color \t- RGB color of pixel 
+
+        Color may be 3-value integer or float in a list, tuple, or array,
+        e.g. (255,255,0) for yellow, etc.
+
+        note: Colors using strings such as "yellow", "green", etc. may cause slowness when outputting numerous pixels.
+              \t Use pybox.color() to resolve a color string once, i.e. yellow = pybox.color("yellow")
+        """
+        return _pybox.WindowDrawPixel(self.__id,x,y,_library_color(color))
+
+    def set_pixel_l(self,at, color : any) :
+        """
+        Draws a single RGB pixel in the window at point specified by x,y
+
+        see: set_pixel() to use individual x,y values instead of tuple/list/array
+
+        Parameters
+
+        at  \t- location to place pixel inside of window
+        color \t- RGB color of pixel 
+
+        About Colors
+
+        Color may be 3-value integer or float in a list, tuple, or array, e.g. (255,255,0) for yellow, etc.
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        note: Colors using strings such as "yellow", "green", etc. may cause slowness when outputting numerous pixels.
+              \t Use pybox.color() to resolve a color string once, i.e. yellow = pybox.color("yellow")
+        """
+        return _pybox.WindowDrawPixel(self.__id,at[0],at[1],_library_color(color))
+
+    def set_pixels(self,xs, ys, colors) :
+        """
+        Draws a set of RGB pixels with one call -- i.e. for per-pixel algorithms such as a Mandelbrot, where calling set_pixel() for
+        each pixel would take much longer than drawing them.
+
+        The pixels are drawn in order, with the same results as calling set_pixel() for each pixel: pixels outside of the window are
+        not drawn, and where pixels repeat, the last one drawn is shown.
+
+        The pixels are placed in a Red, Green, Blue, Mask image of their bounding box, which is drawn with one display_bitmap().
+        A few pixels, or pixels spread thinly over a large box, are drawn with one set_pixel() call each instead, which then costs
+        less than making and displaying the image -- so set_pixels() is never slower than the loop of set_pixel() calls.
+
+        Parameters
+
+        - xs,ys         \t -- Lists or arrays of the pixels' x and y locations, of the same size (i.e. from numpy.nonzero() or numpy.meshgrid())
+        - colors        \t -- One color for every pixel, or an (N,3) array of (r,g,b) colors, one for each pixel.  An array with the
+                        \t    shape of xs and a last dimension of 3 (i.e. [height][width][3]) can also be used.
+
+        Examples:
+                        window.draw.set_pixels(xs,ys,palette[counts % 16])           - palette is a (16,3) numpy array
+                        window.draw.set_pixels(xs,ys,"yellow")
+        """
+        xs,ys   = numpy.asarray(xs).ravel(),numpy.asarray(ys).ravel()
+        if len(xs) != len(ys) : raise ValueError("set_pixels() needs the same number of x and y values (got {0} and {1})".format(len(xs),len(ys)))
+        xs,ys   = xs.astype(numpy.int32,copy=False),ys.astype(numpy.int32,copy=False)      # integer locations, as with set_pixel()
+        if numpy.ndim(colors) > 2 : colors = numpy.asarray(colors).reshape(-1,numpy.shape(colors)[-1])
+        colors  = _batch_colors(colors,len(xs))
+        return self.__display_points(xs,ys,colors,"replace",255)
+
+    def __display_points(self,xs,ys,colors,blend : str,opacity : int) -> bool :
+        """
+        Draws pixels blended in numpy (see _blended_points()) with one display of their bounding box -- or, for "replace", with one
+        WindowDrawPixel() call each when there are too few of them for the size of the box to gain from the image.
+        """
+        if blend == "replace" and len(xs) < _PIXEL_CALLS_MAX : return self.__draw_pixels(xs,ys,colors)
+        width,height = _pybox.WindowGetWindowSize(self.__id)
+        if blend == "replace" and _thin_pixels(xs,ys,width,height) : return self.__draw_pixels(xs,ys,colors)
+        blended = _blended_points(xs,ys,colors,blend,opacity,width,height)
+        if blended is None : return True
+        left,top,image = blended
+        return _pybox.WindowDisplayBitmap(self.__id,image,opt.at(left,top))
+
+    def __draw_pixels(self,xs,ys,colors) -> bool :
+        if isinstance(colors,numpy.ndarray) and colors.ndim == 2 :
+            for x,y,color in zip(xs.tolist(),ys.tolist(),colors[:,:3].tolist()) : _pybox.WindowDrawPixel(self.__id,x,y,color)
+        else :
+            color = _library_color(colors)
+            for x,y in zip(xs.tolist(),ys.tolist()) : _pybox.WindowDrawPixel(self.__id,x,y,color)
+        return True
+
+    def plot_points(self,points, colors, blend : str = "replace", opacity : int = 255) :
+        """
+        Plots a set of points as single pixels with one call, with optional blending -- i.e. for point clouds, where many points can
+        fall on the same pixel.
+
+        Each point is drawn at the pixel that contains it (points are not anti-aliased).  Points outside of the window are not drawn.
+        As with set_pixel(), the current opacity and transforms are not used.
+
+        Parameters
+
+        - points        \t -- (N,2) list or array of (x,y) points
+        - colors        \t -- One color for every point, or an (N,3) or (N,4) array of (r,g,b) or (r,g,b,opacity) colors, one for each point
+        - blend         \t -- [optional] How points are combined with the window and with each other:
+                        \t -- "replace" -- the point's color replaces the pixel (the last point drawn on a pixel is shown)
+                        \t -- "add"     -- the point's color, times its opacity, is added to the pixel, i.e. to show the density of a cloud
+                        \t -- "alpha"   -- the point is blended over the pixel with its opacity, in the order the points are given
+        - opacity       \t -- [optional] Opacity (0-255) for all points, multiplied with each point's opacity (ignored with "replace")
+
+        The points are blended with numpy and drawn with one display_bitmap() of their bounding box, whose mask is the opacity of
+        the points (with "replace", few points are drawn as with set_pixels()).  The Pybox library can't read the window back, so
+        "add" draws the sum of the points over the window with the sum's brightest channel as its opacity -- the same as adding them
+        on a black background.
+
+        Examples:
+                        window.draw.plot_points(stars,"white")
+                        window.draw.plot_points(samples,(40,80,255),blend="add",opacity=32)
+                        window.draw.plot_points(particles,colors,blend="alpha")                - colors is an (N,4) numpy array
+        """
+        if blend not in ("replace","add","alpha") : raise ValueError("blend must be \"replace\", \"add\" or \"alpha\", not {0!r}".format(blend))
+        points  = numpy.asarray(points,dtype=numpy.float64).reshape(-1,2)
+        colors  = _batch_colors(colors,len(points))
+        pixels  = numpy.floor(points).astype(numpy.int64)
+        return self.__display_points(pixels[:,0],pixels[:,1],colors,blend,opacity)
@@ -0,0 +1,91 @@
+"""
+Pybox Draw Groups -- see DrawGroup and Window.new_draw_group().
+"""
+
+from __future__ import annotations
+
+from .window import Window
+
+class DrawGroup :
+    """
+    Pybox DrawGroup
+
+    A DrawGroup is a function that draws a static part of a window's scene -- i.e. a cls_radial() background with a grid drawn over
+    it -- and that Window.display_draw_groups() calls, in order, in place of cls() and the drawing calls at the start of a frame.
+
+    The group is not kept as an image of its own.  display_draw_groups() clears the window and calls the groups' functions, then sets
+    the window's display as its cls() bitmap with use_win_as_cls().  When the same groups are displayed again, unchanged, the
+    functions are not called and the window is cleared to its cls() bitmap with cls().  Whenever that bitmap is replaced -- cls() with
+    colors, cls_radial(), set_cls_bitmap() or use_win_as_cls() -- or a group is changed, the functions are called again.
+
+    A group's function is called with the window: function(window).  It draws into the window with any of the window's functions
+    (cls_radial(), draw_grid(), draw.fill_circle(), write(), display_bitmap(), etc.).  Call set_unchanged(False) when the function
+    would draw something different (i.e. after the window's size changes), so that it is called again the next time it is displayed.
+
+    Examples:
+                \t -def background(win) :
+                \t -    win.cls_radial("darkblue,black")
+                \t -    win.draw_grid()
+                \t -
+                \t -background = win.new_draw_group(background)
+                \t -while win.vsync_wait() :
+                \t -    background.display()                          - replaces win.cls() and drawing the background
+                \t -    win.draw.fill_circle(x,y,20,"yellow")
+    """
+    def __init__(self,window : Window,function) :
+        if not callable(function) : raise TypeError("A DrawGroup needs a function that draws into its window, i.e. function(window)")
+        self.__window   = window
+        self.__function = function
+        self.__changed  = True
+
+    def __repr__(self):
+        return "pybox.DrawGroup"
+
+    @property
+    def window(self) -> Window :
+        "The window the group draws into"
+        return self.__window
+
+    def display(self) -> bool :
+        """
+        Clears the window and draws the group -- see Window.display_draw_groups() to draw several groups one over the other.
+        """
+        return self.__window.display_draw_groups(self)
+
+    def is_unchanged(self) -> bool :
+        """
+        Returns True when the group's function will not be called the next time it is displayed, i.e. the window's cls() bitmap
+        still holds what it drew.
+        """
+        return not self.__changed
+
+    def set_unchanged(self,unchanged : bool = True) -> bool :
+        """
+        Sets the group's unchanged status.
+
+        - set_unchanged(False)  \t -- Marks the group as changed, so that its function is called the next time it is displayed
+        - set_unchanged()       \t -- Marks the group as unchanged
+        """
+        self.__changed = not unchanged
+        return True
+
+    def _draw(self) -> None :
+        self.__function(self.__window)
+        self.__changed = False
+
+def _display_draw_groups(window : Window,groups : tuple,displayed : tuple) -> tuple :
+    """
+    Window.display_draw_groups(): clears the window to its cls() bitmap when the same groups were displayed last and are unchanged,
+    or calls the groups' functions in order and sets the window's display as its cls() bitmap.  Returns the groups drawn in the
+    cls() bitmap.
+    """
+    if any(not isinstance(group,DrawGroup) or group.window is not window for group in groups) :
+        raise ValueError("display_draw_groups() needs draw groups created for this window with new_draw_group()")
+    if groups == displayed and all(group.is_unchanged() for group in groups) :
+        window.cls()
+        return displayed
+    window.use_win_as_cls(False)
+    window.cls()
+    for group in groups : group._draw()
+    window.use_win_as_cls()
+    return groups
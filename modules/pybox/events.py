@@ -0,0 +1,179 @@
+"""
+Pybox Events -- event loop, event callback, and exit functions.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+from ._core import _pybox
+
+def event_pending(peek = None) :
+    """
+    """
+    return _pybox.EventPending(peek)
+def get_event() : 
+    """
+    get_event() waits for an event to occur in your main body of code. 
+
+    - Events are any events such as a mouse move, click, keyboard press, etc. 
+    - Events are also caused by any control change such as moving a slider, pressing a button, or pressing return in an input box. 
+    - Events can also be a window closing, a window moving or changing size -- basically anything happening in the system sends a message
+
+    Until an event occurs, the program is sleeping and not using any CPU time.  Pybox wakes up the program when an event happens. 
+
+    In the event loop, you can check for events.  
+
+    get_event() returns true until all main windows are closed. 
+
+    Example:
+
+
+            my_button = pybox.dev_button("Press Me")
+            my_slider = pybox.def_slider()
+
+            while pybox.get_event() :
+                if my_button.pressed() : print("My Button was Pressed")
+                if my_slider.moved()   : print("Range Slider is now at position",my_slider.get_pos())
+
+    In this example, the program sleeps until an event occurs, and then the program checks to see if an event occured with a button or a slider movement. 
+
+    Events are typically one-time:  Event-based functions report "True" on the first call, and then fals afterwards until another event of the same type happens. 
+        
+    You can also use a callback to retrieve events.  Though this is not recommended or useful for most programs, it can be useful for some specific purposes.
+    See set_event_callback() for more information.
+    """
+    return _pybox.GetEvent()
+
+def wait_event() : 
+    """
+    wait_event() waits for an event to occur in your main body of code. 
+
+    - Events are any events such as a mouse move, click, keyboard press, etc. 
+    - Events are also caused by any control change such as moving a slider, pressing a button, or pressing return in an input box. 
+    - Events can also be a window closing, a window moving or changing size -- basically anything happening in the system sends a message
+
+    Until an event occurs, the program is sleeping and not using any CPU time.  Pybox wakes up the program when an event happens. 
+
+    In the event loop, you can check for events.  
+
+    wait_event() returns true until all main windows are closed. 
+
+    Example:
+
+
+            my_button = pybox.dev_button("Press Me")
+            my_slider = pybox.def_slider()
+
+            while pybox.wait_event() :
+                if my_button.pressed() : print("My Button was Pressed")
+                if my_slider.moved()   : print("Range Slider is now at position",my_slider.get_pos())
+
+    In this example, the program sleeps until an event occurs, and then the program checks to see if an event occured with a button or a slider movement. 
+
+    Events are typically one-time:  Event-based functions report "True" on the first call, and then fals afterwards until another event of the same type happens. 
+        
+    You can also use a callback to retrieve events.  Though this is not recommended or useful for most programs, it can be useful for some specific purposes.
+    See set_event_callback() for more information.
+    """
+    return _pybox.GetEvent()
+
+def set_event_callback(callback : Callable[[None],None]) -> bool :
+    """
+    Use set_event_callback() to have a function called for every pybox event that occurs. See: reset_event_callback() to remove the callback.
+
+        The callback will received all events that cause wait_event() to wake up, such as mouse movement, button presses, or any control movement, window size changes, etc.
+        The code inside of the EventCallback() can act the same as the code in the wait_event() loop. 
+
+        Note: The code in the Event Callback is in the main Windows/OS message loop and, therefore, can't take a lot of time with loops or processing -- this type of code needs to be in the main,
+        procedural loop or as a new thread.  The code in the Event Callback is meant to process data and return, as it is holding up the window messaging while it is processing.
+
+        The wait_event() loop is passive and does not share the same concern. 
+
+    - How to define the EventCallback   \t -- Define the EventCallback as a simple function with no parameters and no return value, i.e. "MyFunction()". See example below.     
+    - Handle Events Where you Want      \t -- You can choose which events to handle in the Event Callback.  For example, handle only those necessary, and the rest in the wait_event loop.
+    - Using the wait_event() loop is easier and is not less efficient than using a callback.
+
+    When to use the Event Callback vs. the wait_event() loop
+
+        However, there are times when using an Event Callback can be useful.
+        An example may be to set a signal for another process, such as responding to a button press and cancelling a process in the main wait_event loop.
+        
+        Any event that you want to handle while the main process is occupied (such as in a loop, dialog box etc.) can be handled in the EventCallback, and you don't
+        have to worry about where the code will be excuted.
+
+        While the code in the wait_event loop must be handled consciously by the program, the Event Callback is *always* called no matter what is happening in the system (unless it's alread in the Event Callback)
+
+    Example:
+
+        def event_calback() : 
+            global button
+            if button.pressed()     : qf.win.write("{y}Button Pressed\\ n")
+
+        button = pybox.dev_button("Press me")
+        pybox.set_event_callback(MyCallback)
+
+        while pybox.wait_event() : pass      # You can still handle events here when a callback is established (this example ignores them and wait for window close)
+    """
+    return _pybox.SetEventCallback(callback)
+
+def reset_event_callback() -> bool : 
+    "Removes a pybox EventCallback if one has been set up with SetEventCallback()"
+    return _pybox.ResetEventCallback()
+
+def exit_button(Message = None) : 
+    """
+    exit_button() comes up with a message and an "OK" button. 
+    
+    exit_button() is quick way to let the user know that the program has ended.
+
+    See win.exit_button() to put an exit button at the bottom of a window.
+    Parameters
+
+    - Message       \t -- [optional].  Message to put in the window above the button.  If not specified, a default "program is finished" message is place in the window.
+
+    About exit_button() and Displays using Windows and Graphics
+
+    The exit_button() gives a way to pause the program before it ends so that the Windows and Graphics displaying don't suddenly disappear. 
+
+    Whether Python, C++, or other languages, the Console Window is not part of the running application.  It is a separate application to which the running program is a client.
+    When the program closes down, this other application (a separate process entirely) simply lets you know the program has ended.
+
+    When windows and graphics are displayed in your program, and the program ends, it all disappears suddenly.  In a program with a Console Mode box, this will show a "program has ended"
+    message in the box.  In a Windows application, the program will just "disappear"
+
+    You can use exit_button() as a nice, quick method to pause and let the user know the program is ending in a GUI/graphical method.
+    
+    """
+    _pybox.ExitButton(Message)                      
+def wait_pending() : 
+    """
+    Waits for all open windows to close before continuing. 
+
+    wait_pending() only waits for 'main' windows, such as program-created windows, ImageViewWindows, and DevWindows. 
+    wait_pending() does not wait for widget windows to close, such as color selections windows, or any other windows classified as a widget.
+    """
+    return _pybox.WaitPending()
+
+def wait_close_any() : 
+    """
+    Waits for any main window to close and returns. 
+
+    wait_close_any() only waits for 'main' windows, such as program-created windows, ImageViewWindows, and DevWindows. 
+    wait_close_any() does not wait for widget windows to close, such as color selections windows, or any other windows classified as a widget.
+    """
+    return _pybox.WaitCloseAny()
+
+
+def vsync_startthread() -> bool :
+    """
+    Starts a vertical sync thread that is triggered on the vertical resync, allowing pybox to send vertical sync events to the message thread or event loop.
+
+    Use vsync_ready() to determine of the vertical sync has occured. 
+    """
+    return _pybox.VSyncStartThread()
+
+def vsync_endthread() -> bool :
+    """
+    If a vertical sync thread has been started, VsyncEndThread() will end the thread.
+    """
+    return _pybox.VSyncEndThread()
@@ -0,0 +1,98 @@
+"""
+Pybox Quick Form -- see quick_form() and CQuickForm.
+"""
+
+from __future__ import annotations
+
+from ._core import _pybox
+from .options import opt
+
+                       
+class CQuickForm :
+    """
+    Pybox Quick Form Class
+
+    This class provices the windows for the Quick Form Window. 
+
+    A Quick form Window is a set of 3 windows to allow controls and a canvas-style window to function together in an organized, unifed window. 
+
+    The Windows provided are as follows: 
+
+    - main      \t -- The main window is the top-level window that hold the two (or more) innerwindows, label window, etc. 
+                    \t - The main window can be used to check for window closure (of the main window), or to move and set the size of the overall window, as
+                    \t - as well as other functions.
+
+    - win       \t -- This is the main 'blank' or 'canvas' window that acts as a normal window.  Items can be drawn in this window, and other window can be embedded within
+                    \t - this window (i.e. ChildWindow()).  Any regular window function is available in this window -- it's simply a regular window embedded into the Main window
+
+    - dev       \t -- This is a Dev Controls Window that is embedded in the main window, typically to the left of the 'Win' window.   With this window, you can easily add controls
+                    \t - such as buttons, sliders, small window, list boxes, text widgets, etc. -- all with one line of code. 
+
+    See: pybox.QuickForm() to start a Quick Form Window.  Also see pybox.NewWindow() to create a standalone window, as well as the pybox Dev functions to create standalone controls
+    pybox.DevButton("Press Me!")
+
+    """
+    def __init__(self,qf_id,main_id,win_id,dev_id) :
+        from .dev import DevControl
+        from .window import Window
+        self.qf_id = qf_id
+        self.main = Window(main_id)
+        self.win = Window(win_id)
+        self.dev = DevControl(dev_id)
+        
+    def __del__(self) :
+        """
+        __del__() TBD until during the beta period. 
+        Currently (for now), Hides the window to remove it from view.
+        """
+        self.main.hide();
+    
+def quick_form(type : str = None, title : str = None, size=None,*args,**kwargs) -> CQuickForm :
+    """
+    Creates a "QuickForm" window consisting of a Main Window, Application Window (i.e. Canvas), and a Dev Controls window for controls. 
+
+    - A QuickForm Window puts a Dev Window and General Window together in a unified window to organize using controls and using graphics in the main window. 
+    - this functions returns a CQuickForm object that can be used to access and control the created windows.
+    - The functions pybox.NewWindow() and pybox.NewDevWindow() are effectively called with each window blended in the upper-main window. 
+    - Note: Other QuickForm-type windows with user-designed controls will be available when the "UI Designer" is released to provide a forms-like interface for more up-front, intentional design.
+
+    Windows Created 
+
+        - main      \t -- The main window is the top-level window that hold the two (or more) innerwindows, label window, etc. 
+        - win       \t -- This is the main 'blank' or 'canvas' window that acts as a normal window.  Items can be drawn in this window, and other window can be embedded within
+                        \t - this window (i.e. ChildWindow()).  Any regular window function is available in this window -- it's simply a regular window embedded into the Main window
+        - dev       \t -- This is a Dev Controls Window that is embedded in the main window, typically to the left of the 'Win' window.   With this window, you can easily add controls
+                        \t - such as buttons, sliders, small window, list boxes, text widgets, etc. -- all with one line of code. 
+    Parameters:
+
+        - type      \t -- [optional] A String with type information about the QuickForm. Separate different values with ','
+                        \t -- Filled      \t - (default) Sets the Window and Dev Window next to each other with no borders
+                        \t -- Borders     \t - Puts a border around the application window
+                        \t -- Plain       \t - Does not include the Dev Window.  When a title is not used, this is the same as using NewWindow()
+
+    Additional Keyword parameters (i.e. QuickForm("label='MyLabel',ResizeOk") or QuickForm(label="MyLabel",resizeok=true)
+
+        - Label     \t -- Sets a label that will appear in the Main Window above the application window. i.e. (Label="this is my program")
+        - ResizeOk  \t -- [optional] Allows the Main window to be resized by dragging the borders.  It can also be maximized. Otherwise, the window cannot be resized by the user.
+        - RealTime  \t -- [optional] Sets the main Quick form canvas window as a Realtime window intended to be used for real-time graphics. 
+                        \t - see opt.realtime() for more information
+        - Hidden    \t -- [optional] Tells QuickForm() to keep the window hidden when it is created.  The program then must call Main.Show() to show the window.  
+                        \t -The default is to show the window on creation.
+        - NoPadding \t -- [optional] for "filled" (default) window type, this removes the few pixels of space between the Win and Dev windows to merge them together with no break.
+                        \t - This can be useful when changing the Win background color to a color other than the Main window background color.
+        - NoAutoUpdate  \t - This will cause the Application Window (i.e. Win) to not update.  The program must then use the Win.Update() function to update any graphics sent to the window.    
+        - <more options>    \t - See QuickForm documentation for more options available.
+
+    Examples: 
+         
+        \t -qf = pybox.quick_form()
+        \my_button = qf.dev.new_button("Press Me")
+        \t -qf.win.Write("Hello World")
+        \t -qf.main.create_menu("File,Save,About,Save")
+
+        qf = pybox.quick_form(opt.label("This is the label in the window"))
+        qf = pybox.quick_form("resizeok,grayblue","This is the window title",hidden=True)
+
+    """
+    qf = _pybox.QuickForm(type,opt.title(title),opt.size(size),*args,**kwargs)
+    return CQuickForm(qf[0],qf[1],qf[2],qf[3])
@@ -0,0 +1,190 @@
+"""
+Pybox Frame Statistics -- see FrameStats and Window.enable_frame_stats().
+"""
+
+from __future__ import annotations
+
+import numpy
+import time
+from ._core import _pybox
+
+class FrameStats :
+    """
+    Pybox Frame Statistics
+
+    Tracks frame timing for a window's render loop, from within Window.vsync_wait() and Window.update(), so loops do not
+    need their own timer() calls.  See Window.enable_frame_stats().
+
+    For each frame, the following are kept in a ring buffer of the most recent frames:
+
+    - interval  \t -- Time from the end of the previous frame to the end of this frame
+    - draw      \t -- Time spent in the program between frames (i.e. calculating and drawing the frame)
+    - present   \t -- Time spent in vsync_wait() and update() (waiting for the vertical sync and displaying the frame)
+
+    A frame ends with each vsync_wait() call.  For loops that use update() without vsync_wait(), a frame ends with each update() call.
+
+    A frame with an interval longer than 1.5 vertical sync periods (at the target fps) is a missed frame -- missed_vsyncs() returns the number
+    of vertical syncs missed by these frames.
+
+    When 'overlay' is True, a small frame-time graph with the rolling fps, p95/p99 frame times and missed vsync count is drawn in the upper-left
+    corner of the window before each frame is displayed.  Bars are green when the frame met the target rate, yellow when it was late, and red
+    when a vertical sync was missed.
+    """
+    def __init__(self,capacity : int = 300,target_fps : float = 60.0,overlay : bool = False) :
+        self.target_fps     = float(target_fps)
+        self.overlay        = overlay
+        self.__capacity     = max(2,int(capacity))
+        self.__intervals    = numpy.zeros(self.__capacity)
+        self.__draw         = numpy.zeros(self.__capacity)
+        self.__present      = numpy.zeros(self.__capacity)
+        self.__uses_vsync   = False
+        self.reset()
+
+    def __repr__(self):
+        return "pybox.FrameStats"
+
+    def reset(self) -> None :
+        """
+        Clears all frame statistics.  The next frame starts with the next vsync_wait() or update() call.
+        """
+        self.__count        = 0
+        self.__index        = 0
+        self.__frames       = 0
+        self.__missed       = 0
+        self.__late_frames  = 0
+        self.__frame_end    = None
+        self.__mark         = None
+        self.__draw_time    = 0.0
+        self.__present_time = 0.0
+        self.__enter        = 0.0
+
+    def _begin_present(self,window,vsync : bool) :
+        if vsync : self.__uses_vsync = True
+        if self.overlay : self._draw_overlay(window)
+        self.__enter = time.perf_counter()
+        if self.__mark is not None : self.__draw_time += self.__enter - self.__mark
+
+    def _end_present(self,vsync : bool) :
+        now = time.perf_counter()
+        self.__present_time += now - self.__enter
+        self.__mark = now
+        if not vsync and self.__uses_vsync : return
+        if self.__frame_end is not None :
+            interval = now - self.__frame_end
+            i = self.__index
+            self.__intervals[i] = interval
+            self.__draw[i]      = self.__draw_time
+            self.__present[i]   = self.__present_time
+            self.__index = (i + 1) % self.__capacity
+            self.__count = min(self.__count + 1,self.__capacity)
+            self.__frames += 1
+            period = 1.0/self.target_fps
+            if interval > period*1.5 :
+                self.__late_frames += 1
+                self.__missed += max(1,int(round(interval/period)) - 1)
+        self.__frame_end = now
+        self.__draw_time = self.__present_time = 0.0
+
+    def __recent(self,values : numpy.ndarray,frames : int = 0) -> numpy.ndarray :
+        "Returns the most recent frames (oldest first), or all frames in the buffer when frames is 0"
+        n = self.__count if frames <= 0 else min(frames,self.__count)
+        if n == 0 : return values[:0]
+        return numpy.roll(values,-self.__index)[self.__capacity-n:] if self.__count == self.__capacity else values[self.__index-n:self.__index]
+
+    def intervals(self,frames : int = 0) -> numpy.ndarray :
+        "Returns the most recent frame intervals (in seconds), oldest first.  When frames is 0, all intervals in the buffer are returned."
+        return self.__recent(self.__intervals,frames)
+
+    def draw_times(self,frames : int = 0) -> numpy.ndarray :
+        "Returns the most recent draw times (in seconds), oldest first."
+        return self.__recent(self.__draw,frames)
+
+    def present_times(self,frames : int = 0) -> numpy.ndarray :
+        "Returns the most recent present times (in seconds), oldest first."
+        return self.__recent(self.__present,frames)
+
+    def frames(self) -> int :
+        "Returns the total number of frames measured since the last reset()"
+        return self.__frames
+
+    def fps(self,frames : int = 60) -> float :
+        """
+        Returns the frame rate over the most recent frames (default 60).  Returns 0 until a frame has completed.
+        """
+        recent = self.intervals(frames)
+        total  = recent.sum()
+        return float(len(recent)/total) if total > 0 else 0.0
+
+    def percentile(self,percent : float,which : str = "interval") -> float :
+        """
+        Returns a percentile (0-100) of the frame times in the buffer, in milliseconds.
+
+        - which     \t -- "interval" (default), "draw", or "present"
+        """
+        values = { "interval" : self.intervals, "draw" : self.draw_times, "present" : self.present_times }[which]()
+        return float(numpy.percentile(values,percent))*1000.0 if len(values) else 0.0
+
+    def p95(self) -> float :
+        "Returns the 95th percentile frame time (interval) in milliseconds"
+        return self.percentile(95)
+
+    def p99(self) -> float :
+        "Returns the 99th percentile frame time (interval) in milliseconds"
+        return self.percentile(99)
+
+    def missed_vsyncs(self) -> int :
+        "Returns the number of vertical syncs missed since the last reset()"
+        return self.__missed
+
+    def late_frames(self) -> int :
+        "Returns the number of frames that missed at least one vertical sync since the last reset()"
+        return self.__late_frames
+
+    def histogram(self,bins : int = 20,max_ms : float = None) -> tuple :
+        """
+        Returns a histogram of the frame times in the buffer as (counts, bin_edges_ms), as with numpy.histogram().
+
+        - bins      \t -- Number of bins
+        - max_ms    \t -- Upper edge of the last bin, in milliseconds.  The default is 3 vertical sync periods.
+                    \t - Frame times above this are counted in the last bin.
+        """
+        max_ms = max_ms or 3000.0/self.target_fps
+        values = numpy.minimum(self.intervals()*1000.0,max_ms)
+        return numpy.histogram(values,bins=bins,range=(0.0,max_ms))
+
+    def report(self) -> dict :
+        """
+        Returns the frame statistics as a dictionary: fps, frame/draw/present p50, p95 and p99 times (ms), missed vsyncs, late frames and frames.
+        """
+        result = { "fps" : self.fps(), "frames" : self.__frames, "missed_vsyncs" : self.__missed, "late_frames" : self.__late_frames }
+        for which in ("interval","draw","present") :
+            name = "frame" if which == "interval" else which
+            for p in (50,95,99) : result["{0}_p{1}_ms".format(name,p)] = self.percentile(p,which)
+        return result
+
+    def write(self) -> str :
+        """
+        Writes a one-line summary to the debug window (see debug_write()) and returns the text written.
+        """
+        r = self.report()
+        text = "Frames: {0}  {1:.1f} fps  frame p95/p99 {2:.2f}/{3:.2f} ms  draw p95 {4:.2f} ms  present p95 {5:.2f} ms  missed vsyncs {6}\n".format(
+                    r["frames"],r["fps"],r["frame_p95_ms"],r["frame_p99_ms"],r["draw_p95_ms"],r["present_p95_ms"],r["missed_vsyncs"])
+        _pybox.DebugWrite(text)
+        return text
+
+    _OVERLAY_BARS = 100
+
+    def _draw_overlay(self,window) :
+        win_id  = window._Window__id
+        period  = 1.0/self.target_fps
+        x,y     = 10,10
+        width   = self._OVERLAY_BARS*2 + 10
+        height  = 60
+        _pybox.WindowDrawFilledRectangleFast(win_id,x,y,width,height + 22,"black",0,0)
+        _pybox.WindowDrawLineFast(win_id,x + 5,y + height - height//2,x + width - 5,y + height - height//2,"gray",1)      # target frame time
+        for i,interval in enumerate(self.intervals(self._OVERLAY_BARS)) :
+            bar   = min(height - 4,int(interval/period*height/2))
+            color = "green" if interval <= period*1.1 else ("yellow" if interval <= period*1.5 else "red")
+            _pybox.WindowDrawFilledRectangleFast(win_id,x + 5 + i*2,y + height - bar,2,bar,color,0,0)
+        _pybox.WindowWriteXY(win_id,x + 5,y + height + 2,"{0:.1f} fps  p95 {1:.1f}  p99 {2:.1f} ms  missed {3}".format(
+                                self.fps(),self.p95(),self.p99(),self.__missed),font=11,fgcolor="white")
@@ -0,0 +1,284 @@
+"""
+Pybox Image Files -- read_image_file_async(), prefetch_image_files(), and the cache of decoded image files.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import functools
+import collections
+import concurrent.futures
+import numpy
+from ._core import _pybox, Bitmap
+
+_lock       = threading.Lock()
+_cache      = collections.OrderedDict()     # (path,mtime,size,options) -> read-only [height][width][3] pixels, least recently used first
+_pending    = {}                            # (path,mtime,size,options) -> Future of the pixels, for files being decoded
+_stats      = collections.Counter()
+_cache_size = { "bytes" : 0, "max_bytes" : 256*1024*1024 }
+_workers    = min(4,os.cpu_count() or 1)
+_executor   = None
+_NATIVE     = object()                      # the result of a read that left decoding to the Pybox library, on the caller's thread
+
+def _key(filename,kwargs : dict) :
+    "The cache key of a file read with the keywords -- (path,mtime,size,options) -- or None when the file can't be found"
+    path = os.path.abspath(os.fspath(filename))
+    try :
+        info = os.stat(path)
+    except OSError :
+        return None
+    return (path,info.st_mtime_ns,info.st_size,repr(sorted(kwargs.items())))
+
+@functools.lru_cache(maxsize=None)
+def _decoder() :
+    """
+    A function that decodes an image file into [height][width][3] Blue, Green, Red pixels without the Pybox library, so that it can run
+    on the image reader threads -- PIL, or OpenCV -- or None when neither is installed.  The function returns None for files it can't
+    decode as the library would -- images with a mask (which the library attaches to the bitmap), images with more than 8 bits per
+    channel and, with PIL, images with an EXIF orientation -- so that the library decodes them.
+    """
+    try :
+        from PIL import Image
+        def decode(path : str) :
+            with Image.open(path) as image :
+                if image.mode not in ("RGB","L","P") or "transparency" in image.info or image.getexif().get(0x0112,1) != 1 : return None
+                return numpy.ascontiguousarray(numpy.asarray(image.convert("RGB"))[:,:,::-1])
+        return decode
+    except ImportError :
+        pass
+    try :
+        import cv2
+        def decode(path : str) :
+            pixels = cv2.imread(path,cv2.IMREAD_UNCHANGED)              # as stored: without applying an EXIF orientation
+            if pixels is None or pixels.dtype != numpy.uint8 : return None
+            if pixels.ndim == 2 : return cv2.cvtColor(pixels,cv2.COLOR_GRAY2BGR)
+            return pixels if pixels.shape[2] == 3 else None
+        return decode
+    except ImportError :
+        return None
+
+def _pool() -> concurrent.futures.ThreadPoolExecutor :
+    global _executor
+    if _executor is None : _executor = concurrent.futures.ThreadPoolExecutor(max_workers=_workers,thread_name_prefix="pybox-image")
+    return _executor
+
+def _done(value) -> concurrent.futures.Future :
+    future = concurrent.futures.Future()
+    future.set_result(value)
+    return future
+
+def _then(future : concurrent.futures.Future,function) -> concurrent.futures.Future :
+    "A future for function(result) of a future, called on the thread that completes it"
+    result = concurrent.futures.Future()
+    def chain(done) :
+        try :
+            result.set_result(function(done.result()))
+        except BaseException as error :
+            result.set_exception(error)
+    future.add_done_callback(chain)
+    return result
+
+def _store(key : tuple,pixels : numpy.ndarray) -> None :
+    "Adds decoded pixels to the cache, removing the least recently used images to keep it within its size.  Called with _lock held."
+    if pixels.nbytes > _cache_size["max_bytes"] or key in _cache : return
+    while _cache and _cache_size["bytes"] + pixels.nbytes > _cache_size["max_bytes"] :
+        _,old = _cache.popitem(last=False)
+        _cache_size["bytes"] -= old.nbytes
+        _stats["evictions"] += 1
+    _cache[key] = pixels
+    _cache_size["bytes"] += pixels.nbytes
+
+def _decode(key : tuple,decode) :
+    """
+    Decodes an image file on an image reader thread.  Returns its read-only pixels, or _NATIVE when the decoder could not read it, so
+    that result() reads it with the Pybox library, as read_image_file() does.
+    """
+    try :
+        try :
+            pixels = decode(key[0])
+        except Exception :
+            pixels = None
+        if pixels is None or pixels.ndim != 3 or pixels.shape[2] != 3 or pixels.size == 0 : return _NATIVE
+        pixels = numpy.ascontiguousarray(pixels,dtype=numpy.uint8)
+        pixels.flags.writeable = False
+        with _lock : _store(key,pixels)
+        return pixels
+    finally :
+        with _lock : _pending.pop(key,None)
+
+def _load(path : str) :
+    "Reads a file from the disk on an image reader thread, so that decoding it with the Pybox library later does not wait for the disk"
+    try :
+        with open(path,"rb") as file :
+            while file.read(1 << 20) : pass
+    except OSError :
+        return None
+    return _NATIVE
+
+def _read_pixels(key : tuple,kwargs : dict) -> concurrent.futures.Future :
+    "A future of a file's pixels: from the cache, from a read already started for the file, or from a new read"
+    if key is None :
+        with _lock : _stats["misses"] += 1
+        return _done(None)
+    with _lock :
+        pixels = _cache.get(key)
+        if pixels is not None :
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return _done(pixels)
+        future = _pending.get(key)
+        if future is not None :
+            _stats["hits"] += 1                                         # decoded once, for both reads
+            return future
+        _stats["misses"] += 1
+        decode = None if kwargs else _decoder()                         # keywords are options of the Pybox image reader
+        if decode is None : return _pool().submit(_load,key[0])
+        future = _pending[key] = _pool().submit(_decode,key,decode)
+        return future
+
+def _bitmap(pixels,key : tuple,filename,kwargs : dict) -> Bitmap :
+    """
+    A new Bitmap with a file's pixels, or an empty Bitmap (as read_image_file() returns) when the file could not be read.  Called on the
+    thread that asked for the Bitmap, as the Pybox library reads image files and creates bitmaps.
+    """
+    if pixels is None : return Bitmap(0)
+    if pixels is not _NATIVE :
+        try :
+            return Bitmap.from_array(pixels)
+        except NotImplementedError :                                    # the library only returns copies of bitmap memory
+            pass
+    bitmap = Bitmap(_pybox.ReadImageFile(os.fspath(filename),**kwargs))
+    if pixels is _NATIVE and bitmap.is_valid() :
+        pixels = numpy.array(numpy.asarray(bitmap))                     # without the bitmap's row padding
+        pixels.flags.writeable = False
+        with _lock : _store(key,pixels)
+    return bitmap
+
+class _BitmapFuture(concurrent.futures.Future) :
+    """
+    The Future returned by read_image_file_async().  The file is decoded on an image reader thread, and result() creates the Bitmap,
+    on the thread that calls it.  result() returns the same Bitmap each time.
+    """
+    def __init__(self,pixels : concurrent.futures.Future,key : tuple,filename,kwargs : dict) :
+        super().__init__()
+        self.__read     = (key,filename,kwargs)
+        self.__bitmap   = None
+        self.__lock     = threading.Lock()
+        pixels.add_done_callback(self.__decoded)
+
+    def __decoded(self,pixels : concurrent.futures.Future) :
+        try :
+            self.set_result(pixels.result())
+        except BaseException as error :
+            self.set_exception(error)
+
+    def result(self,timeout=None) -> Bitmap :
+        pixels = super().result(timeout)
+        with self.__lock :
+            if self.__bitmap is None : self.__bitmap = _bitmap(pixels,*self.__read)
+        return self.__bitmap
+
+def read_image_file_async(filename,**kwargs) -> concurrent.futures.Future :
+    """
+    Reads an image file on an image reader thread, and returns a concurrent.futures.Future of the Bitmap -- future.result() waits for
+    the file and returns the Bitmap, as read_image_file() would.
+
+    Decoded files are kept in a cache (see set_image_cache()), so reading the same file again -- or a file read earlier with
+    prefetch_image_files() -- does not decode it again.  Files are found in the cache by their path, modification time and size, and
+    the keywords given, so a file that was changed is read again.
+
+    Files are decoded on the image reader threads with PIL or OpenCV, when one of them is installed.  Otherwise -- and for files read
+    with keywords, which are options of the Pybox image reader, and files PIL or OpenCV can't read as the library would -- the reader
+    threads only read the file from the disk, and the file is decoded by result() with the Pybox library.  The Bitmap is always
+    created by result(), on the thread that calls it, with the same pixels as read_image_file().
+
+    Each Bitmap returned is a new Bitmap that can be changed and deleted, also when it came from the cache.
+
+    Parameters
+
+    - filename      \t -- Filename of the image
+
+    Examples:
+                \t -next_image = pybox.read_image_file_async(files[index + 1])
+                \t -...
+                \t -win.display_bitmap(0,0,next_image.result())
+    """
+    key = _key(filename,kwargs)
+    return _BitmapFuture(_read_pixels(key,kwargs),key,filename,kwargs)
+
+def prefetch_image_files(filenames,**kwargs) -> list :
+    """
+    Starts reading image files into the cache on the image reader threads (see set_image_cache()), in order, so that reading them
+    later with read_image_file_async() or read_image_file(cached=True) does not wait for them to be decoded.  Files already in the
+    cache or being read are not read again.
+
+    Without PIL or OpenCV, the files are only read from the disk ahead of time, and are decoded and added to the cache when they are
+    read -- see read_image_file_async().
+
+    Returns a list with a concurrent.futures.Future for each file, whose result is True when the file was read, or False when it
+    could not be read.
+
+    Examples:
+                \t -pybox.prefetch_image_files(files[index + 1:index + 6])       - the next 5 images of a slideshow
+    """
+    return [_then(_read_pixels(_key(filename,kwargs),kwargs),lambda pixels : pixels is not None) for filename in filenames]
+
+def set_image_cache(max_mb : float = 256,workers : int = None) -> bool :
+    """
+    Sets the size of the cache of decoded image files used by read_image_file_async(), prefetch_image_files() and
+    read_image_file(cached=True), and the number of image reader threads.
+
+    The least recently used images are removed when the cache reaches its size.
+
+    Parameters
+
+    - max_mb        \t -- Size of the cache in megabytes (default 256).  0 turns the cache off and frees its memory.
+    - workers       \t -- [optional] Number of image reader threads (the default is up to 4, depending on the number of processors).
+                    \t    Reads already started are finished by the previous threads.
+
+    Examples:
+                \t -pybox.set_image_cache(1024,workers=8)       - 1 GB of images, 8 reader threads
+
+    See image_cache_stats() for the number of cache hits and misses
+    """
+    global _workers,_executor
+    if workers is not None and int(workers) < 1 : raise ValueError("set_image_cache() needs at least 1 worker, not {0}".format(workers))
+    with _lock :
+        _cache_size["max_bytes"] = max(0,int(max_mb*1024*1024))
+        while _cache and _cache_size["bytes"] > _cache_size["max_bytes"] :
+            _,old = _cache.popitem(last=False)
+            _cache_size["bytes"] -= old.nbytes
+            _stats["evictions"] += 1
+        if workers is not None and int(workers) != _workers :
+            _workers = int(workers)
+            if _executor is not None : _executor.shutdown(wait=False)
+            _executor = None
+    return True
+
+def image_cache_stats(reset : bool = False) -> dict :
+    """
+    Returns the statistics of the image file cache (see set_image_cache()) as a dictionary:
+
+    - hits, misses      \t -- Number of reads that used a cached (or already started) read of the file, and reads that read the file
+    - evictions         \t -- Number of images removed to keep the cache within its size
+    - entries, bytes    \t -- Number of images in the cache, and their size in bytes
+    - max_bytes         \t -- Size of the cache (0 when the cache is off)
+    - pending           \t -- Number of files being decoded
+    - workers           \t -- Number of image reader threads
+
+    Parameters
+
+    - reset         \t -- [optional] Sets the hits, misses and evictions back to 0 after returning them
+    """
+    with _lock :
+        stats = { "hits" : _stats["hits"], "misses" : _stats["misses"], "evictions" : _stats["evictions"], "entries" : len(_cache),
+                  "bytes" : _cache_size["bytes"], "max_bytes" : _cache_size["max_bytes"], "pending" : len(_pending), "workers" : _workers }
+        if reset : _stats.clear()
+    return stats
+
+def clear_image_cache() -> None :
+    "Removes all images from the image file cache (see set_image_cache()).  Files being read are still added when they are read."
+    with _lock :
+        _cache.clear()
+        _cache_size["bytes"] = 0
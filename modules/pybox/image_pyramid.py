@@ -0,0 +1,269 @@
+"""
+Pybox Image Pyramids -- tiled, multi-resolution views of very large images, rendered into windows (the viewers show an overview).
+See ImagePyramid.
+"""
+
+from __future__ import annotations
+
+import os
+import math
+import hashlib
+import collections
+import numpy
+from .bitmap_convert import convert_bitmap, _layout
+
+class ImagePyramid :
+    """
+    Pybox Image Pyramid
+
+    An ImagePyramid shows a very large image (i.e. a 20000x20000 microscopy or satellite image) a piece at a time.  The image is
+    divided into square tiles, at full size (level 0) and at each half size (level 1 is 1/2 size, level 2 is 1/4 size, etc.) down to
+    a level that fits in one tile.  Views of the image read only the tiles that are visible, at the level closest to the zoom.
+
+    Tiles are made when they are first needed and kept in a cache of the most recently used tiles -- the whole image is never
+    converted or held in memory at once.  The source can be a numpy.memmap (or the name of a .npy file, which is memory-mapped), so
+    images larger than memory can be viewed.  With cache_dir, tiles are also saved to disk and read from there the next time.
+
+    render() returns a view to display in a window (i.e. with Window.display_bitmap()) as the user zooms and moves around the image.
+    img_view(), img_zoom() and img_before_after() take an ImagePyramid in place of a bitmap, but only show its overview() at up to
+    4096x4096.  Zooming into a pyramid in these viewers is not supported -- they zoom the overview's pixels, as the Pybox library's
+    viewers show whole images and can't read the tiles of the area zoomed into.
+
+    Examples:
+                \t -image   = numpy.load("slide.npy",mmap_mode="r")                   - 20000x20000 uint8 [height][width][3]
+                \t -pyramid = pybox.ImagePyramid(image,cache_dir="tile_cache")
+                \t -pybox.img_zoom(pyramid,"Slide 12")                               - the overview only, at up to 4096x4096
+                \t -view    = pyramid.render(8000,6000,1200,800,scale=0.25)          - a 4800x3200 area at 1/4 size
+    """
+    def __init__(self,source,tile_size : int = 512,cache_tiles : int = 256,cache_dir : str = None,cache_key : str = None,
+                 normalized : bool = False) :
+        """
+        Parameters
+
+        - source        \t -- [height][width] or [height][width][1, 3 or 4] numpy array or numpy.memmap (any type converted by
+                        \t    convert_bitmap()), a Pybox Bitmap, or the file name of a .npy file.  As with display_bitmap(), [3] is
+                        \t    Blue, Green, Red and [4] is Red, Green, Blue, Mask.
+        - tile_size     \t -- [optional] Width and height of the tiles (default 512)
+        - cache_tiles   \t -- [optional] Number of tiles kept in memory (default 256, or 192 MB with 512x512 tiles)
+        - cache_dir     \t -- [optional] Directory for an on-disk tile cache, kept between runs
+        - cache_key     \t -- [optional] Name of the image in the disk cache.  Memory-mapped images are named by their file, its size
+                        \t    and its modification time; other images need a cache_key to use cache_dir.
+        - normalized    \t -- [optional] True when a floating-point image's values are 0-1 rather than 0-255
+        """
+        if isinstance(source,(str,os.PathLike)) :
+            if not os.fspath(source).lower().endswith(".npy") :
+                raise ValueError("ImagePyramid reads .npy files (memory-mapped) -- read other image files with read_image_file()")
+            source = numpy.load(source,mmap_mode="r")
+        elif not isinstance(source,numpy.ndarray) :
+            source = numpy.asarray(source)                              # i.e. a Bitmap, as a view of its memory
+        _layout(source)
+        if int(tile_size) < 16 : raise ValueError("ImagePyramid tile_size must be at least 16, not {0}".format(tile_size))
+        self.__source       = source
+        self.__tile_size    = int(tile_size)
+        self.__normalized   = bool(normalized)
+        self.__capacity     = max(1,int(cache_tiles))
+        self.__tiles        = collections.OrderedDict()                 # (level,tx,ty) -> tile, least recently used first
+        self.__stats        = collections.Counter()
+        self.__sizes        = [(source.shape[1],source.shape[0])]
+        while max(self.__sizes[-1]) > self.__tile_size :
+            w,h = self.__sizes[-1]
+            self.__sizes.append(((w + 1)//2,(h + 1)//2))
+        self.__cache_dir    = None
+        if cache_dir is not None :
+            self.__cache_dir = os.path.join(cache_dir,self.__source_key(cache_key))
+            os.makedirs(self.__cache_dir,exist_ok=True)
+
+    def __repr__(self):
+        return "pybox.ImagePyramid"
+
+    def __source_key(self,cache_key) -> str :
+        "Names the image in the disk cache, so that a changed source file or tile size does not use old tiles"
+        if cache_key is not None :
+            parts = [str(cache_key)]
+        else :
+            filename = getattr(self.__source,"filename",None)
+            if filename is None : raise ValueError("ImagePyramid needs a cache_key to cache an image that is not memory-mapped on disk")
+            info  = os.stat(filename)
+            parts = [os.path.abspath(filename),info.st_size,info.st_mtime_ns,getattr(self.__source,"offset",0)]
+        parts += [self.__source.shape,self.__source.dtype.str,self.__tile_size,self.__normalized,"bgr"]          # tiles are Blue, Green, Red
+        return hashlib.sha1(repr(parts).encode()).hexdigest()[:20]
+
+    @property
+    def width(self) -> int :
+        return self.__sizes[0][0]
+
+    @property
+    def height(self) -> int :
+        return self.__sizes[0][1]
+
+    @property
+    def tile_size(self) -> int :
+        return self.__tile_size
+
+    @property
+    def levels(self) -> int :
+        "The number of levels, from full size (0) to the level that fits in one tile"
+        return len(self.__sizes)
+
+    def level_size(self,level : int) -> tuple :
+        "(width,height) of a level"
+        return self.__sizes[level]
+
+    def level_for(self,scale : float) -> int :
+        "The level used to show the image at a scale, i.e. level 2 (1/4 size) for scale 0.3"
+        if scale >= 1 : return 0
+        return max(0,min(self.levels - 1,int(math.floor(math.log2(1.0/scale) + 1e-9))))
+
+    def tile(self,level : int,tx : int,ty : int) -> numpy.ndarray :
+        """
+        Returns a tile as a read-only uint8 [height][width][3] array.  Tiles are tile_size x tile_size, except at the right and bottom
+        edges of the level.  tile(level,tx,ty) covers the level's pixels from (tx*tile_size,ty*tile_size).
+        """
+        key  = (level,tx,ty)
+        tile = self.__tiles.get(key)
+        if tile is not None :
+            self.__tiles.move_to_end(key)
+            self.__stats["hits"] += 1
+            return tile
+        width,height = self.__sizes[level]
+        if not (0 <= tx*self.__tile_size < width and 0 <= ty*self.__tile_size < height) :
+            raise ValueError("Level {0} has no tile ({1},{2})".format(level,tx,ty))
+        tile = self.__read_tile(key)
+        if tile is None :
+            tile = self.__make_tile(level,tx,ty)
+            self.__stats["built"] += 1
+            self.__write_tile(key,tile)
+        tile.flags.writeable = False
+        self.__tiles[key] = tile
+        if len(self.__tiles) > self.__capacity :
+            self.__tiles.popitem(last=False)
+            self.__stats["evicted"] += 1
+        return tile
+
+    def __make_tile(self,level : int,tx : int,ty : int) -> numpy.ndarray :
+        size = self.__tile_size
+        if level == 0 :
+            part = self.__source[ty*size:(ty + 1)*size,tx*size:(tx + 1)*size]
+            tile = convert_bitmap(part,normalized=self.__normalized,swap_channels=part.ndim == 3 and part.shape[2] == 4)     # Red, Green, Blue, Mask
+            return tile.copy() if tile is part or not tile.flags.c_contiguous else tile
+        width,height = self.__sizes[level - 1]                          # 2x2 average of the four tiles below it
+        x0,y0   = 2*tx*size,2*ty*size
+        block_w = min(2*size,width - x0)
+        block_h = min(2*size,height - y0)
+        block   = numpy.empty((block_h + (block_h & 1),block_w + (block_w & 1),3),dtype=numpy.uint16)
+        for dy in (0,1) :
+            for dx in (0,1) :
+                if (dx*size < block_w) and (dy*size < block_h) :
+                    child = self.tile(level - 1,2*tx + dx,2*ty + dy)
+                    block[dy*size:dy*size + child.shape[0],dx*size:dx*size + child.shape[1]] = child
+        if block_h & 1 : block[-1] = block[-2]                          # odd edges repeat their last row or column
+        if block_w & 1 : block[:,-1] = block[:,-2]
+        total = block[0::2,0::2] + block[1::2,0::2]
+        total += block[0::2,1::2]
+        total += block[1::2,1::2]
+        total += 2
+        total >>= 2
+        return total.astype(numpy.uint8)
+
+    def __tile_path(self,key : tuple) -> str :
+        return os.path.join(self.__cache_dir,"{0}_{1}_{2}.npy".format(*key))
+
+    def __read_tile(self,key : tuple) :
+        if self.__cache_dir is None : return None
+        try :
+            tile = numpy.load(self.__tile_path(key))
+        except (OSError,ValueError) :
+            return None
+        self.__stats["disk_hits"] += 1
+        return tile
+
+    def __write_tile(self,key : tuple,tile : numpy.ndarray) -> None :
+        if self.__cache_dir is None : return
+        path = self.__tile_path(key)
+        temp = "{0}.{1}.tmp".format(path,os.getpid())
+        try :
+            with open(temp,"wb") as f : numpy.save(f,tile)
+            os.replace(temp,path)                                       # readers never see a partly written tile
+        except OSError :
+            if os.path.exists(temp) : os.remove(temp)
+
+    def __sampling(self,x : float,y : float,width : int,height : int,scale : float) :
+        "The level, and the level's columns and rows sampled by each pixel of a view"
+        level   = self.level_for(scale)
+        step    = 1.0/(scale*(1 << level))
+        cols    = numpy.floor(x/(1 << level) + (numpy.arange(width) + 0.5)*step).astype(numpy.int64)
+        rows    = numpy.floor(y/(1 << level) + (numpy.arange(height) + 0.5)*step).astype(numpy.int64)
+        return level,cols,rows
+
+    def __runs(self,indices : numpy.ndarray,limit : int) :
+        "Splits sorted level pixel indices into runs in the same tile: (tile,first,last) output positions"
+        inside = numpy.flatnonzero((indices >= 0) & (indices < limit))
+        if len(inside) == 0 : return []
+        tiles  = indices[inside]//self.__tile_size
+        starts = numpy.flatnonzero(numpy.diff(tiles)) + 1
+        bounds = numpy.concatenate(([0],starts,[len(inside)]))
+        return [(int(tiles[a]),int(inside[a]),int(inside[b - 1]) + 1) for a,b in zip(bounds[:-1],bounds[1:])]
+
+    def visible_tiles(self,x : float,y : float,width : int,height : int,scale : float = 1.0) -> list :
+        "The (level,tx,ty) tiles read by render() for a view"
+        level,cols,rows = self.__sampling(x,y,int(width),int(height),scale)
+        level_w,level_h = self.__sizes[level]
+        return [(level,tx,ty) for ty,_,_ in self.__runs(rows,level_h) for tx,_,_ in self.__runs(cols,level_w)]
+
+    def render(self,x : float,y : float,width : int,height : int,scale : float = 1.0,out : numpy.ndarray = None) -> numpy.ndarray :
+        """
+        Returns a view of the image as a uint8 [height][width][3] array, reading only the visible tiles.  Areas outside of the image
+        are black.
+
+        Parameters
+
+        - x,y           \t -- Position in the full-size image shown at the upper-left of the view
+        - width,height  \t -- Size of the view, in pixels
+        - scale         \t -- [optional] Size of the view's pixels in image pixels, i.e. 0.25 shows the image at 1/4 size
+        - out           \t -- [optional] uint8 [height][width][3] array to render into, i.e. to reuse the memory for each view
+        """
+        width,height = int(width),int(height)
+        if scale <= 0 : raise ValueError("ImagePyramid.render() scale must be greater than 0, not {0}".format(scale))
+        if out is None : out = numpy.empty((height,width,3),dtype=numpy.uint8)
+        elif out.shape != (height,width,3) or out.dtype != numpy.uint8 :
+            raise ValueError("out must be a uint8 array of shape {0}, not {1} {2}".format((height,width,3),out.dtype.name,out.shape))
+        out[...] = 0
+        level,cols,rows = self.__sampling(x,y,width,height,scale)
+        level_w,level_h = self.__sizes[level]
+        size     = self.__tile_size
+        col_runs = self.__runs(cols,level_w)
+        for ty,r0,r1 in self.__runs(rows,level_h) :
+            tile_rows = rows[r0:r1] - ty*size
+            for tx,c0,c1 in col_runs :
+                tile      = self.tile(level,tx,ty)
+                tile_cols = cols[c0:c1] - tx*size
+                if scale*(1 << level) == 1 :                            # pixel for pixel
+                    out[r0:r1,c0:c1] = tile[tile_rows[0]:tile_rows[-1] + 1,tile_cols[0]:tile_cols[-1] + 1]
+                else :
+                    out[r0:r1,c0:c1] = tile[tile_rows[:,None],tile_cols]
+        return out
+
+    def overview(self,max_size : int = 2048) -> numpy.ndarray :
+        "Returns the largest level whose width and height are at most max_size, as one uint8 [height][width][3] array"
+        level = next((n for n,size in enumerate(self.__sizes) if max(size) <= max_size),self.levels - 1)
+        width,height = self.__sizes[level]
+        return self.render(0,0,width,height,1.0/(1 << level))
+
+    def cache_stats(self) -> dict :
+        """
+        Returns the tile cache statistics, as a dictionary:
+
+        - "hits"        \t -- Tiles found in memory
+        - "disk_hits"   \t -- Tiles read from the disk cache
+        - "built"       \t -- Tiles made from the image (or from the tiles of the level above)
+        - "evicted"     \t -- Tiles removed from memory to make room for newer ones
+        - "tiles"       \t -- Tiles in memory
+        - "bytes"       \t -- Memory used by the tiles in memory
+        """
+        return { "hits" : self.__stats["hits"], "disk_hits" : self.__stats["disk_hits"], "built" : self.__stats["built"],
+                 "evicted" : self.__stats["evicted"], "tiles" : len(self.__tiles),
+                 "bytes" : sum(tile.nbytes for tile in self.__tiles.values()) }
+
+    def clear_cache(self) -> None :
+        "Removes the tiles kept in memory (the disk cache is kept)"
+        self.__tiles.clear()
@@ -0,0 +1,457 @@
+"""
+Pybox Image Viewers -- img_view(), img_zoom(), img_before_after() and related functions.
+"""
+
+from __future__ import annotations
+
+import sys
+import warnings
+import numpy
+from ._core import _pybox
+from .options import opt
+
+def _is_pyramid(bitmap) -> bool :
+    module = sys.modules.get(__package__ + ".image_pyramid")                   # not loaded: bitmap can't be an ImagePyramid
+    return module is not None and isinstance(bitmap,module.ImagePyramid)
+
+def _pyramids(bitmaps : tuple,args : tuple,kwargs : dict) :
+    "Returns an ImagePyramid for each image, and the keywords without normalize/normalized (applied to the pyramids made here)"
+    from .image_pyramid import ImagePyramid
+    from .bitmap_convert import _display_options
+    pyramids = []
+    for bitmap in bitmaps :
+        if not isinstance(bitmap,ImagePyramid) :
+            bitmap = numpy.asarray(bitmap)
+            normalized,_ = _display_options(bitmap,args,kwargs)
+            bitmap = ImagePyramid(bitmap,normalized=normalized)
+        pyramids.append(bitmap)
+    kwargs = { key : value for key,value in kwargs.items() if key not in ("normalize","normalized") }
+    return pyramids,kwargs
+
+def _overview(pyramid) -> numpy.ndarray :
+    "An ImagePyramid's image for a viewer: its largest level that is at most 4096 pixels wide and high, with a warning when that is downsampled"
+    image = pyramid.overview(4096)
+    if image.shape[:2] != (pyramid.height,pyramid.width) :
+        warnings.warn("The Pybox viewers show whole images, so the {0}x{1} ImagePyramid is shown at {2}x{3}, and zooming in does not show more detail".format(
+                        pyramid.width,pyramid.height,image.shape[1],image.shape[0]),RuntimeWarning,stacklevel=4)
+    return image
+
+def _pyramid_images(bitmaps : tuple,args : tuple,kwargs : dict) :
+    """
+    Returns the images a viewer shows when any of bitmaps is an ImagePyramid, and the keywords without normalize/normalized.
+
+    The Pybox library's viewers show whole images, so each image is shown as its pyramid's overview (see _overview()) -- the viewers
+    can't read the pyramid's tiles as they zoom.  Images given
+    with an ImagePyramid are made into pyramids, so that both images of a before & after view are shown at the same size.
+    """
+    pyramids,kwargs = _pyramids(bitmaps,args,kwargs)
+    before = pyramids[0]
+    for after in pyramids[1:] :
+        if (before.width,before.height) != (after.width,after.height) :
+            raise ValueError("img_before_after() images must be the same size, not {0}x{1} and {2}x{3}".format(
+                                before.width,before.height,after.width,after.height))
+    return [_overview(pyramid) for pyramid in pyramids],kwargs
+
+class _ImageBeforeAfter :
+    "ImageBeforeAfter class.  This class allows you to control a window popped up with pybox.ImageBeforeAfter()"
+    def __init__(self,_id) : self.id = _id
+#    def __del__(self) : TBD
+    def closed(self) -> bool :
+        """
+        Returns True if the Window has been closed by the user (or some othe process).  Returns False if the window is open or hidden.
+
+        See closed_event() to get the event at the time the window is closed. 
+        """
+        return _pybox.ImgBeforeAfterWindowClosed(self.id)
+    def close_window(self) -> bool :
+        "Closes the Before & After window."
+        return _pybox.ImgBeforeAfterCloseWindow(self.id)
+
+    def close_event(self) -> bool :
+        """
+        Returns True once (i.e. as an event) if the ImageView Window has been closed, and false after the first call.  See closed() for non-event version.
+       
+        Also see closed() --> Once the window is closed, closed() will return True continuously, and not just once.
+
+        This is used as an event so a message loop can react to it just once.  See Closed() for a non-event version.
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.ImgBeforeAfterWindowCloseEvent(self.id)
+
+    def wait_for_close(self) -> bool : 
+        """
+        Waits for the window to close (by the user or some other process)
+
+        See wait_close_all() and wait_close_any()
+        """
+        return _pybox.ImgBeforeAfterWaitforClose(self.id)
+    def show_instructions(self) -> None :
+        """
+        Shows the Image_view() and img_before_after() instructions in a window on the screen. 
+        The window has an OK button that will close when pressed.
+
+        This is the same window that appears when "show instructions" is chosen from the
+        system menu im the image_view() window.
+        """
+        return _pybox.ShowImgViewInstructions()
+   
+
+class _ImageView :
+    "--comment--"
+    def __init__(self,_id) : self.id = _id
+#    def __del__(self) : TBD
+    def closed(self) -> bool :
+        """
+        Returns True if the Window has been closed by the user (or some othe process).  Returns False if the window is open or hidden.
+
+        See closed_event() to get the event at the time the window is closed. 
+        """
+        return _pybox.ImgViewWindowClosed(self.id)
+
+    def window_count(self = None) -> int :
+        "Returns the number of open ImageView windows on the desktop."
+        return _pybox.ImgViewWindowWindowCount(0)
+
+    def close_event(self) -> bool :
+        """
+        Returns True once (i.e. as an event) if the ImageView Window has been closed, and false after the first call.  See closed() for non-event version.
+       
+        Also see closed() --> Once the window is closed, closed() will return True continuously, and not just once.
+
+        This is used as an event so a message loop can react to it just once.  See Closed() for a non-event version.
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.ImgViewWindowCloseEvent(self.id)
+
+    def wait_close(self) -> bool : 
+        """
+        Waits for the window to close. Other open ImageView windows are not affected.
+
+        See wait_close_all() and wait_close_any()
+        """
+        return _pybox.ImgViewWaitforClose(self.id)
+        
+    def wait_close_all(self = None) -> bool : 
+        """
+        Waits for the user to close all visible ImageView type windows. 
+
+        If there are no visible ImageView Windows, WaitforCloseAll() returns immediately.
+        """
+        return _pybox.ImgViewWaitforCloseAll(self.id)
+
+    def wait_close_any(self = None) -> bool : 
+        """
+        Waits for the user to close any open ImageView Window and returns.
+        This is useful when assuming any closure represents closing all windows.
+
+        If there are no open or visible windows WaiforCloseAny() returns immediately.
+        """
+        return _pybox.ImgViewWaitforCloseAny(self.id)
+
+    def close_all(self = None) -> bool :
+         """
+         Closes and deletes all open ImageView Windows.
+         """
+         return _pybox.ImgViewCloseAll(0)
+    def show_instructions(self) -> None :
+        """
+        Shows the Image_view() and image_before_after() instructions in a window on the screen. 
+        The window has an OK button that will close when pressed.
+
+        This is the same window that appears when "show instructions" is chosen from the
+        system menu im the image_view() window.
+        """
+        return _pybox.ShowImgViewInstructions()
+    def close_window(self) -> bool :
+        "Closes the image view window."
+        return _pybox.ImgViewCloseWindow(self.id)
+
+def img_view(bitmap,title=None,at=None,size=None,percent=None,zoombox=None,*args,**kwargs) -> _ImageView :
+    """
+    Creates an ImageView window where you can zoom and and out of the displayed image and move it around for inspection. 
+    The window can be resized and maximized.  See img_view_r() to display the image upside-down.
+
+    - This function returns an _ImageView class object where you can control the ImageView window that is created.  However, it is not
+        \t -necessary to keep the return object or assign it to a variable. 
+    - The system menu (upper-left corner) has a number of options to bring up a Zoom Box, reset the image, etc.
+    - Use img_zoom() to bring up a Zoom Box that can be used to navigate through the image. 
+
+    About the Zoom Box
+
+    The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+    Also see: img_zoom() -- brings up an ImageView Window with a zoom box (otherwise it can be selected from the upper-left system menu)
+    Also see: img_before_after() -- brings up a window with two images, such as before and after images, for comparison.
+
+    Parameters:
+
+    - bitmap        \t - The bitmap to display.  This can be a pybox bitmap, a general RGB array, or a text string with the path to the bitmap
+    - title         \t - This is the title of the image that will display in the title bar
+    - at            \t - Where to put the window.  If this is not used, the window is placed automatically.
+    - size          \t - Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+    - percent       \t - Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+    Pybox options can be included.  Some various options are as follows:
+
+    - reverse       \t -- Displays the bitmap upside-down.  Bitmaps often come updside-down. "reverse" corrects this.  Also see: image_view_r
+    - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+    - label         \t -- This will put a text label underneath the image in a larger font for better labeling display.
+                        \t -If no Label is given with no Title, the title bar text will also be the label text.
+                          
+    About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+    or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+    The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+
+    Very large images: an ImagePyramid is shown as one downsampled overview, its largest level that is at most 4096x4096, with a warning
+    when that is smaller than the image.  Zooming into a pyramid is not supported: the viewer zooms the overview's pixels, and can't
+    read the pyramid's full-resolution tiles.  Display ImagePyramid.render() views in a window to show parts of the image at full
+    resolution.  Arrays, including a numpy.memmap, are shown at full resolution.
+    """
+    if _is_pyramid(bitmap) :
+        (bitmap,),kwargs = _pyramid_images((bitmap,),args,kwargs)
+    return _ImageView(_pybox.ImgView(bitmap,opt.title(title),opt.at(at),opt.size(size),opt.percent(percent),opt.zoombox(zoombox),*args,**kwargs))
+
+def img_view_r(bitmap,title=None,at=None,size=None,percent=None,zoombox=None,*args,**kwargs) -> _ImageView :
+    """
+    Creates an ImageView window where you can zoom and and out of the displayed image and move it around for inspection. 
+    The window can be resized and maximized.  This image is displayed upside-down in relation to the bitmap.
+    See img_view() to display the image non-upside-down. 
+
+    - This function returns an _ImageView class object where you can control the ImageView window that is created.  However, it is not
+    necessary to keep the return object or assign it to a variable. 
+    - The system menu (upper-left corner) has a number of options to bring up a Zoom Box, reset the image, etc.
+    - Use img_zoom() to bring up a Zoom Box that can be used to navigate through the image. 
+
+    About the Zoom Box
+
+    The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+    Also see: img_zoom() -- brings up an ImageView Window with a zoom box (otherwise it can be selected from the upper-left system menu)
+    Also see: img_before_after() -- brings up a window with two images, such as before and after images, for comparison.
+
+    Parameters:
+
+    - bitmap        \t - The bitmap to display.  This can be a pybox bitmap, a general RGB array, or a text string with the path to the bitmap
+    - title         \t - This is the title of the image that will display in the title bar
+    - at            \t - Where to put the window.  If this is not used, the window is placed automatically.
+    - size          \t - Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+    - percent       \t - Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+    Pybox options can be included.  Some various options are as follows:
+
+    - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+    - label         \t -- This will put a text label underneath the image in a larger font for better labeling display.
+                        \t -If no Label is given with no Title, the title bar text will also be the label text.
+                          
+    About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+    or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+    The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+
+    Very large images: an ImagePyramid is shown as one downsampled overview, its largest level that is at most 4096x4096, with a warning
+    when that is smaller than the image.  Zooming into a pyramid is not supported: the viewer zooms the overview's pixels, and can't
+    read the pyramid's full-resolution tiles.  Display ImagePyramid.render() views in a window to show parts of the image at full
+    resolution.  Arrays, including a numpy.memmap, are shown at full resolution.
+    """    
+    if _is_pyramid(bitmap) :
+        (bitmap,),kwargs = _pyramid_images((bitmap,),args,kwargs)
+    return _ImageView(_pybox.ImgViewR(bitmap,opt.title(title),opt.at(at),opt.size(size),opt.percent(percent),opt.zoombox(zoombox),*args,**kwargs))
+
+def img_zoom(bitmap,title=None,at=None,size=None,percent=None,*args,**kwargs) -> _ImageView :
+    """
+    Creates an ImageView and Zoom Box window where you can zoom and and out of the displayed image and move it around for inspection. 
+    The window can be resized and maximized.  See img_zoom_r() to display the image upside-down.
+
+    - This function is the same as img_view() except that it creates a ZoomBox as a small window to make navigating the image easier. 
+    - This function returns an _ImageView class object where you can control the ImageView window that is created.  However, it is not
+    necessary to keep the return object or assign it to a variable. 
+    - The system menu (upper-left corner) has a number of options to bring up a Zoom Box, reset the image, etc.
+    - Use img_zoom() to bring up a Zoom Box that can be used to navigate through the image. 
+
+    About the Zoom Box
+
+    The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+    Also see: img_zoom() -- brings up an ImageView Window with a zoom box (otherwise it can be selected from the upper-left system menu)
+    Also see: img_before_after() -- brings up a window with two images, such as before and after images, for comparison.
+
+    Parameters:
+
+    - bitmap        \t - The bitmap to display.  This can be a pybox bitmap, a general RGB array, or a text string with the path to the bitmap
+    - title         \t - This is the title of the image that will display in the title bar
+    - at            \t - Where to put the window.  If this is not used, the window is placed automatically.
+    - size          \t - Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+    - percent       \t - Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+    Pybox options can be included.  Some various options are as follows:
+
+    - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+    - reverse       \t -- Displays the bitmap upside-down.  Bitmaps often come updside-down. "reverse" corrects this.  Also see: ImgZoomR()
+    - label         \t -- This will put a text label underneath the image in a larger font for better labeling display.
+                        \t -If no Label is given with no Title, the title bar text will also be the label text.
+                          
+    About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+    or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+    The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+
+    Very large images: an ImagePyramid is shown as one downsampled overview, its largest level that is at most 4096x4096, with a warning
+    when that is smaller than the image.  Zooming into a pyramid is not supported: the viewer zooms the overview's pixels, and can't
+    read the pyramid's full-resolution tiles.  Display ImagePyramid.render() views in a window to show parts of the image at full
+    resolution.  Arrays, including a numpy.memmap, are shown at full resolution.
+    """      
+    if _is_pyramid(bitmap) :
+        (bitmap,),kwargs = _pyramid_images((bitmap,),args,kwargs)
+    return _ImageView(_pybox.ImgView(bitmap,opt.title(title),opt.at(at),opt.size(size),opt.percent(percent),opt.zoombox(True),*args,**kwargs))
+
+def img_zoom_r(bitmap,title=None,at=None,size=None,percent=None,*args,**kwargs) -> _ImageView :
+    """
+    Creates an ImageView and Zoom Box window where you can zoom and and out of the displayed image and move it around for inspection. 
+    The window can be resized and maximized. This displays the bitmap upside-down. See img_zoom() to display the image non-upside-down.
+
+    - This function is the same as img_view() except that it creates a ZoomBox as a small window to make navigating the image easier. 
+    - This function returns an _ImageView class object where you can control the ImageView window that is created.  However, it is not
+    necessary to keep the return object or assign it to a variable. 
+    - The system menu (upper-left corner) has a number of options to bring up a Zoom Box, reset the image, etc.
+    - Use img_zoom() to bring up a Zoom Box that can be used to navigate through the image. 
+
+    About the Zoom Box
+
+    The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+    Also see: img_zoom() -- brings up an ImageView Window with a zoom box (otherwise it can be selected from the upper-left system menu)
+    Also see: img_before_after() -- brings up a window with two images, such as before and after images, for comparison.
+
+    Parameters:
+
+    - bitmap        \t - The bitmap to display.  This can be a pybox bitmap, a general RGB array, or a text string with the path to the bitmap
+    - title         \t - [optional] This is the title of the image that will display in the title bar
+    - at            \t - [optional] Where to put the window.  If this is not used, the window is placed automatically.
+    - size          \t - [optional] Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+    - percent       \t - [optional] Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+    Pybox options can be included.  Some various options are as follows:
+
+    - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+    - label         \t -- This will put a text label underneath the image in a larger font for better labeling display.
+                        \t -If no Label is given with no Title, the title bar text will also be the label text.
+                          
+    About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+    or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+    The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+
+    Very large images: an ImagePyramid is shown as one downsampled overview, its largest level that is at most 4096x4096, with a warning
+    when that is smaller than the image.  Zooming into a pyramid is not supported: the viewer zooms the overview's pixels, and can't
+    read the pyramid's full-resolution tiles.  Display ImagePyramid.render() views in a window to show parts of the image at full
+    resolution.  Arrays, including a numpy.memmap, are shown at full resolution.
+    """    
+    if _is_pyramid(bitmap) :
+        (bitmap,),kwargs = _pyramid_images((bitmap,),args,kwargs)
+    return _ImageView(_pybox.ImgViewR(bitmap,opt.title(title),opt.at(at),opt.size(size),opt.percent(percent),opt.zoombox(True),*args,**kwargs))
+
+def img_before_after(bitmap1,bitmap2,title=None,label=None,before_title=None,after_title=None,at=None,size=None,percent=None,*args,**kwargs) -> _ImageView :
+    """
+    Creates an ImageView window with a Before and After image, and Zoom Box window where you can zoom and and out of the displayed images and easily move them
+    around for inspection.  The window can be resized and maximized.  See img_before_after_r() to display the images upside-down.
+
+    - The system menu (upper-left corner) has a number of options.
+    - This returns an _ImageBeforeAfter class object that can be used to control the window. However, it is not necessary to save the return object. 
+        \t -with the return object, you can determine when the window is closed and can also close all open ImageView Windows, as well as many other functions.
+
+    About the Zoom Box
+
+    The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+    Parameters:
+
+    - bitmap1       \t - The 'before' bitmap to display.  This can be a pybox bitmap or a general RGB array.
+    - bitmap2       \t - The 'after' bitmap to display.  The bitmaps must be the same size, but can be different formats.
+    - title         \t - This is the title of the image that will display in the title bar
+    - before_title   \t - title/label for the 'before' bitmap.  If not specified, a default label is used
+    - after_title    \t - title/label for the 'after' bitmap.  If not specified, a default label is used
+    - at            \t - Where to put the window.  If this is not used, the window is placed automatically.
+    - size          \t - Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+    - percent       \t - Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+    Pybox options can be included.  Some various options are as follows:
+
+    - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+    - label         \t -- This will put a text label above both images.
+                        \t -If no Label is given with no Title, the title bar text will also be the label text.
+                                                
+    About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+    or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+    The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+
+    Very large images: an ImagePyramid is shown as one downsampled overview, its largest level that is at most 4096x4096, with a warning
+    when that is smaller than the image.  Zooming into a pyramid is not supported: the viewer zooms the overview's pixels, and can't
+    read the pyramid's full-resolution tiles.  Display ImagePyramid.render() views in a window to show parts of the image at full
+    resolution.  Arrays, including a numpy.memmap, are shown at full resolution.
+    """
+    if _is_pyramid(bitmap1) or _is_pyramid(bitmap2) :
+        (bitmap1,bitmap2),kwargs = _pyramid_images((bitmap1,bitmap2),args,kwargs)
+    return _ImageBeforeAfter(_pybox.ImgBeforeAfter(bitmap1,bitmap2,opt.title(title),opt.str_str("BeforeTitle",before_title),opt.str_str("AfterTitle",after_title),opt.label(label),
+                                                   opt.at(at),opt.size(size),opt.percent(percent),*args,**kwargs))
+def img_before_after_r(bitmap1,bitmap2,title=None,label=None,before_title=None,after_title=None,at=None,size=None,percent=None,*args,**kwargs) -> _ImageView :
+    """
+    Creates an ImageView window with a Before and After image, and Zoom Box window where you can zoom and and out of the displayed images and easily move them
+    around for inspection.  The window can be resized and maximized.  The images are displayed upside-down. See img_before_after() to display the images non-upside-down.
+
+    - The system menu (upper-left corner) has a number of options.
+    - This returns an _ImageBeforeAfter class object that can be used to control the window. However, it is not necessary to save the return object. 
+        \t -with the return object, you can determine when the window is closed and can also close all open ImageView Windows, as well as many other functions.
+
+    About the Zoom Box
+
+    The Zoom box as a small window that works with all ImgView images.  Multiple images can be displayed, and the Zoom Box will update to the currently selected image.
+
+    Parameters:
+
+    - bitmap1       \t - The 'before' bitmap to display.  This can be a pybox bitmap or a general RGB array.
+    - bitmap2       \t - The 'after' bitmap to display.  The bitmaps must be the same size, but can be different formats.
+    - title         \t - This is the title of the image that will display in the title bar
+    - before_title   \t - title/label for the 'before' bitmap.  If not specified, a default label is used
+    - after_title    \t - title/label for the 'after' bitmap.  If not specified, a default label is used
+    - at            \t - Where to put the window.  If this is not used, the window is placed automatically.
+    - size          \t - Size of the window box.  The Image will be adjust accordingly based on the size given.  The default is for ImgView() to choose automatically.
+    - percent       \t - Desired size of the image in percent to show on initial launch.  This can be useful for specifying thumbnail images with a smaller size.
+
+    Pybox options can be included.  Some various options are as follows:
+
+    - normalize     \t -- Use this when the bitmap ranges from 0.0-1.0.  normalize=True will convert the image to a displayable bitmap i.e. 0-255 on each channel)
+    - label         \t -- This will put a text label above both images.
+                        \t -If no Label is given with no Title, the title bar text will also be the label text.
+                          
+    About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+    or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+    The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+
+    Very large images: an ImagePyramid is shown as one downsampled overview, its largest level that is at most 4096x4096, with a warning
+    when that is smaller than the image.  Zooming into a pyramid is not supported: the viewer zooms the overview's pixels, and can't
+    read the pyramid's full-resolution tiles.  Display ImagePyramid.render() views in a window to show parts of the image at full
+    resolution.  Arrays, including a numpy.memmap, are shown at full resolution.
+    """    
+    if _is_pyramid(bitmap1) or _is_pyramid(bitmap2) :
+        (bitmap1,bitmap2),kwargs = _pyramid_images((bitmap1,bitmap2),args,kwargs)
+    return _ImageBeforeAfter(_pybox.ImgBeforeAfterR(bitmap1,bitmap2,opt.title(title),opt.str_str("BeforeTitle",before_title),opt.str_str("AfterTitle",after_title),opt.label(label),
+                                                    opt.at(at),opt.size(size),opt.percent(percent),*args,**kwargs))
+
+def show_imgview_instructions() -> None :
+    """
+    Shows the Image_view() and image_before_after() instructions in a window on the screen. 
+    The window has an OK button that will close when pressed.
+
+    This is the same window that appears when "show instructions" is chosen from the
+    system menu im the image_view() window.
+    """
+    return _pybox.ShowImgViewInstructions()
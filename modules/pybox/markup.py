@@ -0,0 +1,197 @@
+"""
+Pybox Markup -- parses the {} markup used by write(), conio.write(), debug.write() and text widgets.  See compile().
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+
+Span = collections.namedtuple("Span","text fg bg font bold italic underline x line_bg marks")
+Span.__doc__ = """
+A run of text with one style, from a compiled markup (see compile()):
+
+- text              \t -- The text, without markup
+- fg, bg            \t -- Text and background colors ({red}, {bg=blue}), as written in the markup, or None for the writer's colors
+- font              \t -- Font size ({30}) as an int, a font name ({Courier New,20}), or None
+- bold, italic      \t -- {bold}/{bld}, {italic}/{i} and {bolditalic}/{bi}
+- underline         \t -- {u}
+- x                 \t -- Write position set with {x=N} before the text, or None
+- line_bg           \t -- Background color of the whole line ({lbg=color}), or None
+- marks             \t -- Other controls before the text, in order (i.e. "div", "vl", "_")
+"""
+
+_PLAIN = Span("",None,None,None,False,False,False,None,None,())
+
+_MARKS = { "div", "vl", "vr", "ht", "hb", "_" }
+
+class Markup :
+    """
+    Pybox Compiled Markup
+
+    A Markup is text with {} markup, parsed once into a list of styled spans (see Span), as returned by compile() -- i.e. to find
+    the colors, fonts and positions of a text, or the slots of a template (see TextBlock).
+
+    The Pybox library has no function to write spans, and parses the markup of the text it is given, so a Markup is written as its
+    text, i.e. win.write(markup.text).
+
+    Templates can have named slots, written as {$name} or {$name:format} (i.e. {$value:.3f}), whose spans are empty -- see slots
+    and parts.
+
+    Examples:
+                \t -title = pybox.markup.compile("{30}{cyan}Results{}\\n")
+                \t -[span.fg for span in title.spans]          - ["cyan"]
+    """
+    __slots__ = ("__spans","__text","__slots","__parts")
+
+    def __init__(self,spans : tuple,text : str,slots : tuple = (),parts : tuple = ()) :
+        self.__spans    = spans
+        self.__text     = text
+        self.__slots    = slots             # (span index, name, format spec) for each slot
+        self.__parts    = parts             # the text between the slots, with its markup
+
+    def __repr__(self):
+        return "pybox.Markup({0!r})".format(self.__text)
+
+    def __str__(self) -> str :
+        return self.__text
+
+    def __eq__(self,other) -> bool :
+        return isinstance(other,Markup) and other.__text == self.__text and other.spans == self.spans
+
+    def __hash__(self) -> int :
+        return hash(self.__text)
+
+    @property
+    def spans(self) -> tuple :
+        "The styled spans of the text, in order (see Span)"
+        return self.__spans
+
+    @property
+    def text(self) -> str :
+        "The text with its markup, as it is written"
+        return self.__text
+
+    @property
+    def plain(self) -> str :
+        "The text without markup"
+        return "".join(span.text for span in self.spans)
+
+    @property
+    def slots(self) -> tuple :
+        "The template's slots, in order, as (span index, name, format spec) -- the span index is the span that shows the slot's value"
+        return self.__slots
+
+    @property
+    def parts(self) -> tuple :
+        "The text of the template between its slots, with its markup -- one more part than there are slots, or () without slots"
+        return self.__parts
+
+    @property
+    def names(self) -> tuple :
+        "The names of the template's slots, in order"
+        return tuple(dict.fromkeys(name for _,name,_ in self.__slots))
+
+def _escape(text : str) -> str :
+    "Text written as it is within markup, with its braces escaped as {{ and }}"
+    if "{" in text or "}" in text : return text.replace("{","{{").replace("}","}}")
+    return text
+
+def _tag_style(tag : str,style : dict) -> None :
+    "Applies one {} control to the current style"
+    low = tag.strip().lower()
+    if low == "" :
+        style.update(fg=None,bg=None,font=None,bold=False,italic=False,underline=False)
+    elif low.isdigit() :
+        style["font"] = int(low)
+    elif low.startswith("x=") :
+        x = tag.strip()[2:]
+        style["x"] = int(x) if x.isdigit() else x
+    elif low.startswith("bg=") :
+        style["bg"] = tag.strip()[3:]
+    elif low.startswith("lbg=") :
+        style["line_bg"] = tag.strip()[4:]
+    elif low in ("bold","bld") :
+        style["bold"] = True
+    elif low in ("italic","i") :
+        style["italic"] = True
+    elif low in ("bolditalic","bi") :
+        style["bold"] = style["italic"] = True
+    elif low == "u" :
+        style["underline"] = True
+    elif low in _MARKS :
+        style["marks"] = style["marks"] + (low,)
+        if low == "_" : style.update(fg=None,bg=None,font=None,bold=False,italic=False,underline=False)
+    elif "," in tag :
+        style["font"] = tag.strip()
+    else :
+        style["fg"] = tag.strip()
+
+@functools.lru_cache(maxsize=1024)
+def compile(text : str) -> Markup :
+    """
+    Compiles text with {} markup into a Markup -- a list of spans of text with their style.  The Pybox library parses the markup
+    of the text it writes, so the text is written as it is (see Markup).
+
+    Compiled markups are cached, so compiling the same text again returns the same Markup.
+
+    Text can have named slots for values, written as {$name} or {$name:format}, which TextBlock fills in.
+
+    Markup controls:
+
+    - {color}           \t -- Text color, i.e. {red}, {r}, {forestgreen}
+    - {}                \t -- Ends the colors, font and style set before it
+    - {bg=color}        \t -- Background color
+    - {lbg=color}       \t -- Background color of the whole line
+    - {x=N}             \t -- Moves the write position to N
+    - {N}               \t -- Font size, i.e. {30}, or a font, i.e. {Courier New,20}
+    - {bold}, {italic}, {bolditalic}, {u}   \t -- Bold, italic, bold italic and underlined text
+    - {div}, {vl}, {vr}, {ht}, {hb}, {_}    \t -- Dividing line, box lines, and end of block (console and debug output)
+    - {{, }}            \t -- A { or } written as it is
+
+    Examples:
+                \t -title  = pybox.markup.compile("{30}{cyan}Results{}\\n")
+                \t -title.plain                            - "Results\\n"
+                \t -row    = pybox.markup.compile("{x=10}{$name}{x=200}{g}{$value:.4f}\\n")
+                \t -row.names                              - ("name","value")
+    """
+    text    = str(text)
+    spans   = []
+    slots   = []
+    parts   = []                                # the text between slots
+    pending = []                                # text up to an escaped {, which is part of the next span
+    style   = dict(_PLAIN._asdict())
+    pos     = part = 0
+    def add(run : str) :
+        if pending :
+            run = "".join(pending) + run
+            pending.clear()
+        if "}}" in run : run = run.replace("}}","}")
+        if not run and style["x"] is None and not style["marks"] and style["line_bg"] is None : return
+        spans.append(Span(**dict(style,text=run)))
+        style.update(x=None,marks=(),line_bg=None)
+    while True :
+        start = text.find("{",pos)
+        if start >= 0 and text.startswith("{{",start) :
+            pending.append(text[pos:start+1])
+            pos = start + 2
+            continue
+        end   = text.find("}",start) if start >= 0 else -1
+        if end < 0 :
+            add(text[pos:])
+            break
+        if start > pos or pending : add(text[pos:start])
+        tag = text[start+1:end]
+        if tag.startswith("$") :
+            name,_,spec = tag[1:].partition(":")
+            spans.append(Span(**dict(style,text="")))
+            style.update(x=None,marks=(),line_bg=None)
+            slots.append((len(spans)-1,name,spec))
+            parts.append(text[part:start])
+            part = end + 1
+        else :
+            _tag_style(tag,style)
+        pos = end + 1
+    if not slots : return Markup(tuple(spans),text)
+    parts.append(text[part:])
+    return Markup(tuple(spans),"".join(parts),tuple(slots),tuple(parts))
@@ -0,0 +1,832 @@
+"""
+Pybox Mouse Regions -- see MouseRegion.
+"""
+
+from __future__ import annotations
+
+from ._core import _pybox
+
+class MouseRegion :
+    def __init__(self,_id)  : 
+        self.id = _id
+        self.win = _pybox.GetMouseRegionWindowControlID(self.id,1)
+       
+
+    def set_pos(self,index : int,x,y) :
+        """
+        Sets the current positon of the mouse region/point.
+
+        - This does not change the size or shape of the region or point, and only sets it's position.
+        - This does not change the display order of the region/point.
+        - For point-type mouse regions, this sets the center point.  For region-type mouse regions, this sets the upper-left corner of the region.
+        - See set_pos_l() to set position with a list/array/tuple element instead of individual values.
+        
+        Parameters:
+        
+        index  \t - index of mouse region/point
+        x,y    \t - new x,y position
+        """
+        return _pybox.MouseRegionSetPos(self.id,index,x,y)
+    
+    def set_pos_l(self,index : int,pos : list) :
+        """
+        Sets the current positon of the mouse region/point.
+
+        - This does not change the size or shape of the region or point, and only sets it's position.
+        - This does not change the display order of the region/point.
+        - For point-type mouse regions, this sets the center point.  For region-type mouse regions, this sets the upper-left corner of the region.
+        - See set_pos() to set position with individual (x,y) values instead of list/array/tuple.
+        
+        Parameters:
+        
+        index  \t - index of mouse region/point
+        x,y    \t - new x,y position
+        """
+        return _pybox.MouseRegionSetPos(self.id,index,pos[0],pos[1])
+    
+    def set_point(self,index : int,x,y,width,height) :
+        """
+        Sets the point-type region location and size.  See set_region() to change a region-type mouse region.
+
+        - This does not change the display order of the region/point.
+        - The location sets the center point, with width/height the radius in each direction.  See set_region() to set a region-type mouse region.  
+        - See set_point_l() to use list/tuple/array for (x,y) and (width,height)
+        - See set_point_r() to use list/tuple/array for (x,y,width,height) together
+
+        ** note:  set_region() and set_point() can be used with any type of mouse point or region. The 'point'- or 'region'-type status will be adjusted accordingly.  
+
+        Parameters
+        
+        - index         \t-- Index of mouse region/point to change.
+        - x,y           \t-- New location of mouse region/point
+        - width,height  \t-- New Size of mouse region/point.
+        """
+        return _pybox.MouseRegionSetPoint(self.id,index,x,y,width,height,True)
+    
+    def set_point_l(self,index : int,pos : list, size : list) :
+        """
+        Sets the point-type region location and size.  See set_region_l() to change a region-type mouse region.
+
+        - This does not change the display order of the region/point.
+        - The location sets the center point, with width/height the radius in each direction.  See set_region() to set a region-type mouse region.  
+        - See set_point() to use individual values for x,y,width and height rather than list/tuple/array.
+        - See set_point_r() to use list/tuple/array for (x,y,width,height) together
+
+        ** note:  set_region() and set_point() can be used with any type of mouse point or region. The 'point'- or 'region'-type status will be adjusted accordingly.  
+
+        Parameters
+        
+        - index         \t-- Index of mouse region/point to change.
+        - pos           \t-- New location of mouse region/point
+        - size          \t-- New Size of mouse region/point.
+        """
+        return _pybox.MouseRegionSetPoint(self.id,index,pos[0],pos[1],size[0],size[1],True)
+    
+    def set_point_r(self,index : int,size_rect : list) :
+        """
+        Sets the point-type region location and size.  See set_region_r() to change a region-type mouse region.
+
+        - This does not change the display order of the region/point.
+        - The location sets the center point, with width/height the radius in each direction.  See set_region() to set a region-type mouse region.  
+        - See set_point() to use individual values for x,y,width and height rather than list/tuple/array.
+        - See set_point_l() to use list/tuple/array for (x,y) and (width,height)
+
+        ** note:  set_region() and set_point() can be used with any type of mouse point or region. The 'point'- or 'region'-type status will be adjusted accordingly.  
+
+        Parameters
+        
+        - index         \t-- Index of mouse region/point to change.
+        - size_rect     \t-- New location and size of mouse region/point (i.e. (x,y,width,height))
+        """
+        return _pybox.MouseRegionSetPoint(self.id,index,size_rect[0],size_rect[1],size_rect[2],size_rect[3],True)
+    
+    
+    def set_region(self,index : int,x,y,width,height) :
+        """
+        Sets the region-type region location and size.  See set_point() to change a point-type mouse region.
+
+        - This does not change the display order of the region/point.
+        - The location given sets the upper-left of the region (see set_point() to set a point-type center location) 
+        - See set_region_l() to use list/tuple/array for (x,y) and (width,height)
+        - See set_region_r() to use list/tuple/array for (x,y,width,height) together
+
+        ** note:  set_region() and set_point() can be used with any type of mouse point or region. The 'point'- or 'region'-type status will be adjusted accordingly.  
+
+        Parameters
+        
+        - index         \t-- Index of mouse region/point to change.
+        - x,y           \t-- New location of mouse region/point
+        - width,height  \t-- New Size of mouse region/point.
+        """
+        return _pybox.MouseRegionSetPoint(self.id,index,x,y,width,height,False)
+    
+    def set_region_l(self,index : int,pos : list,size : list) :
+        """
+        Sets the region-type region location and size.  See set_point() to change a point-type mouse region.
+
+        - This does not change the display order of the region/point.
+        - The location given sets the upper-left of the region (see set_point() to set a point-type center location) 
+        - See set_region() to use individual values for x,y,width and height rather than list/tuple/array.
+        - See set_region_r() to use list/tuple/array for (x,y,width,height) together
+
+        ** note:  set_region() and set_point() can be used with any type of mouse point or region. The 'point'- or 'region'-type status will be adjusted accordingly.  
+
+        Parameters
+        
+        - index         \t-- Index of mouse region/point to change.
+        - pos           \t-- New location of mouse region/point
+        - size          \t-- New Size of mouse region/point.
+        """
+        return _pybox.MouseRegionSetPoint(self.id,index,pos[0],pos[1],size[0],size[1],False)
+
+    def set_region_r(self,index : int,size_rect : list) :
+        """
+        Sets the region-type region location and size.  See set_point() to change a point-type mouse region.
+
+        - This does not change the display order of the region/point.
+        - The location given sets the upper-left of the region (see set_point() to set a point-type center location) 
+        - See set_region() to use individual values for x,y,width and height rather than list/tuple/array.
+        - See set_region_l() to use list/tuple/array for (x,y) and (width,height)
+
+        ** note:  set_region() and set_point() can be used with any type of mouse point or region. The 'point'- or 'region'-type status will be adjusted accordingly.  
+
+        Parameters
+        
+        - index         \t-- Index of mouse region/point to change.
+        - size_rect     \t-- New location and size of mouse region/point (i.e. (x,y,width,height))
+        """
+        return _pybox.MouseRegionSetPoint(self.id,index,size_rect[0],size_rect[1],size_rect[2],size_rect[3],False)
+    
+    
+    def add_point(self,x,y,width,height,**kwargs) : 
+        """
+        Adds a singular point-type Mouse Region point to the Mouse Region.  
+        
+        A Point-Type Mouse Region uses a center point (x,y) with width and height used as the radius in the X and Y directions, respectively.
+        
+        - See add_region() for a Region-Type Mouse Region where a specific rectangular region is described.
+        - See add_point_l() to use list/array/tuple values for (x,y) and (width,height)
+        - See add_point_r() to use a single list/array/tuple value for (x,y,width,height) together.
+        - Index values are in the order added, with the first index starting at 0. 
+
+        Example: add_point(x,y,5,5) 
+        
+        This sets a point at (x,y) with a mouse-region/point area extending 5 pixels in both directions in the X and Y axes, respectively, for a total
+        size of (10,10) with (x,y) in the center.
+        
+        Parameters
+        
+        - x,y               \t -- location of new point
+        - width,height      \t -- size of mouse point area in X and Y dimensions, respectively x2 (i.e. width and height are radius values)
+
+        Optional Keywords
+        
+        - auto_draw         \t -- Sets the "auto draw" characteristics of the auto_draw() function output for specific to this point.
+                            \t For example, auto_draw="red,circle" sets a red circle for display when auto_draw() is called. 
+        - id                \t -- Sets a numeric 'user id' for the element that can be used to get its index as points are added and removed.
+                            \t Indexes are in order of additions, with deleted points changing indexes of the point below, accordingly.
+                            \t 'id' (e.g. id=123) can be used with get_id_index() to retrieve the Mouse Region index based on the user ID. 
+        """
+        return _pybox.MouseRegionAddPoint(self.id,x,y,width,height,True,**kwargs)
+    
+    def add_point_l(self,pos : list,size : list,**kwargs) : 
+        """
+        Adds a singular point-type Mouse Region point to the Mouse Region.  
+        
+        A Point-Type Mouse Region uses a center point (x,y) with width and height used as the radius in the X and Y directions, respectively.
+        
+        Example: add_point(x,y,5,5) 
+        
+        This sets a point at (x,y) with a mouse-region/point area extending 5 pixels in both directions in the X and Y axes, respectively, for a total
+        size of (10,10) with (x,y) in the center.
+        
+        - See add_region() for a Region-Type Mouse Region where a specific rectangular region is described.
+        - See add_point() to use individual values for x,y,width,height
+        - See add_point_r() to use a single list/array/tuple value for (x,y,width,height) together.
+        - If a point or region is removed, the index values are adjusted accordingly
+        
+        Parameters
+        
+        - pos       \t -- location of new point
+        - size      \t -- size of mouse point area in X and Y dimensions, respectively x2 (i.e. width and height are radius values)
+
+        Optional Keywords
+        
+        - auto_draw         \t -- Sets the "auto draw" characteristics of the auto_draw() function output for specific to this point.
+                            \t For example, auto_draw="red,circle" sets a red circle for display when auto_draw() is called. 
+        - id                \t -- Sets a numeric 'user id' for the element that can be used to get its index as points are added and removed.
+                            \t Indexes are in order of additions, with deleted points changing indexes of the point below, accordingly.
+                            \t 'id' (e.g. id=123) can be used with get_id_index() to retrieve the Mouse Region index based on the user ID. 
+        """
+        return _pybox.MouseRegionAddPoint(self.id,pos[0],pos[1],size[0],size[1],True,**kwargs)
+    
+    def add_point_r(self,size_rect : list,**kwargs) : 
+        """
+        Adds a singular point-type Mouse Region point to the Mouse Region.  
+        
+        A Point-Type Mouse Region uses a center point (x,y) with width and height used as the radius in the X and Y directions, respectively.
+        
+        Example: add_point(x,y,5,5) 
+        
+        This sets a point at (x,y) with a mouse-region/point area extending 5 pixels in both directions in the X and Y axes, respectively, for a total
+        size of (10,10) with (x,y) in the center.
+        
+        - See add_region() for a Region-Type Mouse Region where a specific rectangular region is described.
+        - See add_point() to use individual values for x,y,width,height
+        - See add_point_l() to use list/array/tuple values for (x,y) and (width,height)
+        - If a point or region is removed, the index values are adjusted accordingly
+        
+        Parameters
+        
+        - size_rect      \t -- x,y,width,height of new point (e.g. (x,y,width,height))
+
+        Optional Keywords
+        
+        - auto_draw         \t -- Sets the "auto draw" characteristics of the auto_draw() function output for specific to this point.
+                            \t For example, auto_draw="red,circle" sets a red circle for display when auto_draw() is called. 
+        - id                \t -- Sets a numeric 'user id' for the element that can be used to get its index as points are added and removed.
+                            \t Indexes are in order of additions, with deleted points changing indexes of the point below, accordingly.
+                            \t 'id' (e.g. id=123) can be used with get_id_index() to retrieve the Mouse Region index based on the user ID. 
+        """
+        return _pybox.MouseRegionAddPoint(self.id,size_rect[0],size_rect[1],size_rect[2],size_rect[3],True,**kwargs)
+    
+    def add_region(self,x,y,width,height,**kwargs) : 
+        """
+        Adds a singular region-type Mouse Region point to the Mouse Region.  
+        
+        A Region-Type Mouse Region specifies a rectangular region with (x,y) as the upper-left corner of the rectangle, with width and height specifying
+        the size of the rectangle in each X-Y axes, respectively.
+        
+        - See add_point() for a Point-Type Mouse Region where a specific point with a radius in each X-Y axes is specified.
+        - See add_region_l() to use list/array/tuple values for (x,y) and (width,height)
+        - See add_region_r() to use a single list/array/tuple value for (x,y,width,height) together.
+        - Index values are in the order added, with the first index starting at 0. 
+
+        Parameters
+        
+        - x,y               \t -- upper-left location of new region
+        - width,height      \t -- width and height of the rectangular region.
+
+        Optional Keywords
+        
+        - auto_draw         \t -- Sets the "auto draw" characteristics of the auto_draw() function output for specific to this point.
+                            \t For example, auto_draw="red,circle" sets a red circle for display when auto_draw() is called. 
+        - id                \t -- Sets a numeric 'user id' for the element that can be used to get its index as points are added and removed.
+                            \t Indexes are in order of additions, with deleted points changing indexes of the point below, accordingly.
+                            \t 'id' (e.g. id=123) can be used with get_id_index() to retrieve the Mouse Region index based on the user ID. 
+        """
+        return _pybox.MouseRegionAddPoint(self.id,x,y,width,height,False,**kwargs)
+    
+    def add_region_l(self,pos : list,size : list,**kwargs) : 
+        """
+        Adds a singular region-type Mouse Region point to the Mouse Region.  
+        
+        A Region-Type Mouse Region specifies a rectangular region with (x,y) as the upper-left corner of the rectangle, with width and height specifying
+        the size of the rectangle in each X-Y axes, respectively.
+        
+        - See add_point() for a Point-Type Mouse Region where a specific point with a radius in each X-Y axes is specified.
+        - See add_region() to use individual values for x,y,width,height
+        - See add_region_r() to use a single list/array/tuple value for (x,y,width,height) together.
+        - Index values are in the order added, with the first index starting at 0. 
+
+        Parameters
+        
+        - pos       \t -- upper-left location of new region
+        - size      \t -- width and height of the rectangular region.
+
+        Optional Keywords
+        
+        - auto_draw         \t -- Sets the "auto draw" characteristics of the auto_draw() function output for specific to this point.
+                            \t For example, auto_draw="red,circle" sets a red circle for display when auto_draw() is called. 
+        - id                \t -- Sets a numeric 'user id' for the element that can be used to get its index as points are added and removed.
+                            \t Indexes are in order of additions, with deleted points changing indexes of the point below, accordingly.
+                            \t 'id' (e.g. id=123) can be used with get_id_index() to retrieve the Mouse Region index based on the user ID. 
+        """
+        return _pybox.MouseRegionAddPoint(self.id,pos[0],pos[1],size[0],size[1],False,**kwargs)
+    
+    def add_region_r(self,size_rect,**kwargs) : 
+        """
+        Adds a singular region-type Mouse Region point to the Mouse Region.  
+        
+        A Region-Type Mouse Region specifies a rectangular region with (x,y) as the upper-left corner of the rectangle, with width and height specifying
+        the size of the rectangle in each X-Y axes, respectively.
+        
+        - See add_point() for a Point-Type Mouse Region where a specific point with a radius in each X-Y axes is specified.
+        - See add_region() to use individual values for x,y,width,height
+        - See add_region_l() to use list/array/tuple values for (x,y) and (width,height)
+        - Index values are in the order added, with the first index starting at 0. 
+
+        Parameters
+        
+        - size_rect     \t -- (x,y) upper-left location of new region and size (w,h) of rectangle (i.e. (x,y,w,h))
+
+        Optional Keywords
+        
+        - auto_draw         \t -- Sets the "auto draw" characteristics of the auto_draw() function output for specific to this point.
+                            \t For example, auto_draw="red,circle" sets a red circle for display when auto_draw() is called. 
+        - id                \t -- Sets a numeric 'user id' for the element that can be used to get its index as points are added and removed.
+                            \t Indexes are in order of additions, with deleted points changing indexes of the point below, accordingly.
+                            \t 'id' (e.g. id=123) can be used with get_id_index() to retrieve the Mouse Region index based on the user ID. 
+        """
+        return _pybox.MouseRegionAddPoint(self.id,size_rect[0],size_rect[1],size_rect[2],size_rect[3],False,**kwargs)
+    
+    
+    def set_bound_box(self,index : int,x,y,width,height,**kwargs) : 
+        """
+        Sets the bounding box for the mouse region or point.
+
+        - When a bounding box is used, the mouse point or region cannot exceed the boundaries set inside the box.
+        - With a Point-type index (i.e. add_point() was used), the center x,y value is restricted to the bounding box, allowing the radiusX and radiusY
+          width/height to exceed the bounding box by width/2 and height/2, respectively.  
+          Reduce the Bounding Box as needed to include these values with Point-type indexes. 
+
+        - See: set_boundbox_l() to use list/array/tuple values for (x,y) and (width,height)
+        - See: set_boundbox_r() to use list/array/tuple values for (x,y,width,height) together.
+          
+        Parameters
+        
+        - index         \t -- index of mouse point/region.
+        - x,y           \t -- (x,y) location of region/point (for region-type, upper-left.  For point-type, center x,y)
+        - width,height  \t -- width and height of region/point (for point-type, these act as radius values from the center x,y point)
+        """
+        return _pybox.MouseRegionSetBoundBox(self.id,index,x,y,width,height,**kwargs)
+
+    def set_bound_box_l(self,index : int,pos : list,size : list,**kwargs) : 
+        """
+        Sets the bounding box for the mouse region or point.
+
+        - When a bounding box is used, the mouse point or region cannot exceed the boundaries set inside the box.
+        - With a Point-type index (i.e. add_point() was used), the center x,y value is restricted to the bounding box, allowing the radiusX and radiusY
+          width/height to exceed the bounding box by width/2 and height/2, respectively.  
+          Reduce the Bounding Box as needed to include these values with Point-type indexes. 
+
+        - See: set_boundbox() to use individul values for x,y,width and height
+        - See: set_boundbox_r() to use list/array/tuple values for (x,y,width,height) together.
+          
+        Parameters
+        
+        - index         \t -- index of mouse point/region.
+        - pos           \t -- (x,y) location of region/point (for region-type, upper-left.  For point-type, center x,y)
+        - size          \t -- width and height of region/point (for point-type, these act as radius values from the center x,y point)
+        """
+        return _pybox.MouseRegionSetBoundBox(self.id,index,pos[0],pos[1],size[0],size[1],**kwargs)
+    
+    def set_bound_box_r(self,index : int,size_rect : list,**kwargs) : 
+        """
+        Sets the bounding box for the mouse region or point.
+
+        - When a bounding box is used, the mouse point or region cannot exceed the boundaries set inside the box.
+        - With a Point-type index (i.e. add_point() was used), the center x,y value is restricted to the bounding box, allowing the radiusX and radiusY
+          width/height to exceed the bounding box by width/2 and height/2, respectively.  
+          Reduce the Bounding Box as needed to include these values with Point-type indexes. 
+
+        - See: set_boundbox_l() to use list/array/tuple values for (x,y) and (width,height)
+        - See: set_boundbox_r() to use list/array/tuple values for (x,y,width,height) together.
+          
+        Parameters
+        
+        - index         \t -- index of mouse point/region.
+        - size_rect     \t -- (x,y) location of region/point (for region-type, upper-left) and (w,h) of region, i.e. (x,y,w,h) as one array/tuple/list.
+        """
+        return _pybox.MouseRegionSetBoundBox(self.id,index,size_rect[0],size_rect[1],size_rect[2],size_rect[3],**kwargs)
+
+    def auto_draw(self,index = None) :
+        """
+        Draws all points or regions to the window. The program may handle the display of points itself by processing events, which can be much more flexible.
+
+        auto_draw() is provided as a way to quickly display the mouse points/regions as they are used, moved, highlighted, etc.
+        
+        - auto_draw() can be used for most programs. However, as programs grow and require more extensive display, auto_draw() can be omitted. 
+        
+        Also, individual points/regions can be set to off, allowing some to use auto_draw() and others to be bypassed so that the program can draw the point itself.
+        example: set_auto_draw(index,"off");
+        
+        ** note ** - Documentation for this feature is still in development.  See various example for usage information.
+        """
+        return _pybox.MouseRegionAutoDraw(self.id,index)
+    
+    def auto_draw_index(self,index : int) :
+        """
+        Calls the auto_draw() function for only the index provided.
+        
+        Where auto_draw() updates all Mouse Region elements in the Auto-Draw display, auto_draw() updates only the indexed element provided.
+        
+        This allows some control over the output, allowing for text and other additives to the auto-draw display before moving to the next
+        element.
+        
+        See auto_draw() documentation for more information.
+        
+        Parameters:
+        
+        - index         \t - Index of element to auto-draw.
+        """
+        return _pybox.MouseRegionAutoDraw(self.id,index)
+    
+    def update_points(self) :
+        """
+        *** Note: This function is currently unnecessary and is provided for future use. 
+        *** This function is not used when using a mouse region obtained with window.get_mouse_region()
+        *** with Mouse Regions obtained from window.get_mouse_region() this function is called automatically.
+
+        This looks at the current mouse status to update the current Mouse Region status for all points / regions.
+
+        This is used to update the movement, highlight, selection of points/regions based on what has happened to the mouse since the last time it was called.
+        
+        - update_points() must be called for every wait_event() to update the mouse points, and should be called in the main event loop
+        before looking for updated events or values from the Mouse Region.
+        
+        - This function is best called directly after a wait_event() call.
+        """
+        return _pybox.MouseRegionUpdatePoints(self.id,1)
+        
+    def event_ready(self) :
+        """
+        Returns True if an event is ready to be processed, such as a Mouse Drag event, etc. 
+        
+        - This is an Event-type function, which will return False once a 'true' is returned for the same event, and until another event is ready
+        
+        The event status is only for the event_ready() call itself and not any of the Mouse Region events that have occurred.
+        
+        Looking for specific events (e.g. Mouse Drag Event) will return true or false for their respective event, even if event_ready() has been called.
+        
+        event_ready() can be useful to only process Mouse Regions if there is a reason to do so (i.e. a Mouse Region event has occurred). 
+        This can be useful in separating mouse events from Mouse Region events, to allow using the mouse in areas not within mouse region points/regions.
+        """
+        return _pybox.MouseRegionEventReady(self.id,1)
+        
+    def reset_points(self) :
+        """
+        Clears all points/regions from the Mouse Region object, leaving 0 points/regions.
+        Once cleared, new additions start at index 0 and forward.
+        """
+        return _pybox.MouseRegionResetPoints(self.id,1)
+        
+    def mouse_drag_event(self) -> bool :
+        """
+        Returns True if there is a mouse point or region that is being moved by the mouse, or the mouse has otherwise clicked on the region/point
+        while not yet releasing the mouse button (i.e. the mouse buttin is pressed on the object).
+        
+        When mouse_drag_event() returns true, get_last_selected() can be used to retrieve the index of the Mouse Region element that has changed.
+        
+        - This is an Event-type function, which will return False once a 'true' is returned for the same event, and until another event is ready
+        """
+        return _pybox.MouseRegionMouseDragEvent(self.id,1)
+    
+    def mouse_drag_ended(self) -> bool :
+        """
+        Returns True if a mouse/region being dragged by the mouse (or was clicked upon) has been released. 
+
+        A Drag Event ends when the mouse is released from a selected region/point.
+        
+        When mouse_drag_ended() returns true, get_last_selected() can be used to retrieve the index of the Mouse Region element that has changed.
+        
+        - This is an Event-type function, which will return False once a 'true' is returned for the same event, and until another event is ready
+        """
+        return _pybox.MouseRegionMouseDragEnded(self.id,1)
+        
+    def remove_bound_box(self,index : int) :
+        """
+        Removes a bounding box constraint from a mouse region or point.
+
+        See: set_bound_box() to set a bounding box for a mouse region or point. Or use bound_box as a keyword when adding a point to add a bound box to a point/region.
+        
+        Parameters
+        
+        - index         \t -- index of mouse point/region.
+        """
+        return _pybox.MouseRegionRemoveBoundBox(self.id,index)
+ 
+    def reset_selected(self) :
+        """
+        Resets the last selected point value to -1.
+        The 'last selected point' can be used to keep a static value for selected point, even after it has been released from being moved or selected with the mouse.
+
+        - The 'selected point' (i.e. get_current_selection()) is the point that is being moved or otherwise the mouse has clicked on without yet unclicking the button.
+        - This resets last selected point (i.e. get_last_selected())
+        - reset_selected() also resets the last highlighted index (i.e. get_last_highlighted())
+        
+        ** Note: Once the mouse is released from a selection, this value is stored as the 'last selected point' for later reference.  
+        This 'last selected' value remains the same until a new region or point is selected, or reset_selected() is called to reset it to -1 (no selection)
+
+        See: get_last_selected() to get the last selected item (vs. get_current_selection())
+        """
+        return _pybox.MouseRegionResetSelected(self.id,1)
+    
+    def get_current_selection(self) -> int :
+        """
+        Returns the index of the currently selected item. 
+
+        - Note: The currently selected item is active only if the mouse is currently moving a point or region, or has clicked on a point or region and
+        the mouse button has not yet been unclicked.  Once the mouse is unclicked, the item is no longer selected and -1 is returned.
+
+        - See get_last_selected() to return the value of the most recently selected item even after the mouse has been released.
+
+        - Note: When there is no selected item or the mouse is no in contact with the mouse region/point, a -1 is returned to indicate there is no currently selected item.
+
+        Returns:
+        
+        If the mouse is currently moving or otherwise has clicked on an object (without having unclicked the mous yet, whether it is moving the region/point or not),
+        the index of the point/region is returned. Otherwise -1 is returned to indicate there is no selected item.
+        """
+        return _pybox.MouseRegionGetCurrentSelection(self.id,1)
+
+    def get_last_selected(self) -> int :
+        """
+        Returns the index of the last selected item (or the currently selected item of the mouse is moving or otherwise pressed on a region/point).
+
+        - Note: get_last_selected() returns the last selected item, which also includes an item that is currently selected (i.e. currently being moved by the mouse)
+        
+        get_last_selected() returns the last item that was selected (or -1 if there is no previous selection).  This differs from get_current_selection() which only
+        returns an index value if the mouse is currently pressed on a selected item (which then returns to -1 when the mouse button is released).
+
+        - get_last_selected() will return the value of the last selection, unless reset_selected() is called or there has not yet been a selected item. 
+        This is also useful when using auto_draw().
+        """
+        return _pybox.MouseRegionGetLastSelected(self.id,1)
+    
+    def get_current_highlight(self) -> int :
+        """
+        Returns the index of the currently highlighted item. 
+
+        The currently highlighted item is the item that the mouse is currently over or has selected. 
+
+        - Note: When there is no highlighted item or the mouse is no longer over the previous item, a -1 is returned to indicate there is no current highlight.
+        - See: get_last_highlighted() to get the last and/or current highlighted item. 
+        
+        Returns:
+        
+        If the mouse is currently within a region (whether it is moving the region/point or not), the index of the mouse region/point is returned.
+        Otherwise -1 is returned to indicate there is no highlighted item.
+        """
+        return _pybox.MouseRegionGetCurrentHighlight(self.id,1)
+    
+    def get_last_highlighted(self) -> int :
+        """
+        Returns the index of the last highlighted item (or the currently highlighted item of the mouse is currently over a region/point).
+
+        - Note: get_last_highlighted() returns the last highlighted item, which also includes an item that is currently highlighted (i.e. mouse is currently over).
+        
+        get_last_highlighted() returns the last index that was highlighted (or -1 if there is no previously highlighted item).  
+        This differs from get_current_highlight() which only returns an index value if the mouse is currently over a mouse point/region 
+        (which then returns to -1 when the mouse is no longer over the item).
+
+        - get_last_highlighted() will return the value of the last highlighted item, unless reset_selected() is called or there has not yet been a highlighted item. 
+        This is also useful when using auto_draw().
+        """
+        return _pybox.MouseRegionGetLastHighlight(self.id,1)
+    
+    def selection_changed(self) -> bool :
+        """
+        Returns true of the selection changed since the last call to selection_changed(), or a new selection has occurred.
+
+        - The selection occurs when the mouse clicked on region or point.  The selection value remains active while the point/region is being moved. 
+        See get_last_selected() to get the last selected item even after it is no longer being moved.
+
+        - Use get_last_selected() to obtain the index of the mouse point/region that is referenced by this event.
+        - note: -1 as an index value may be returned if the selection changed to no selection.
+        
+        - This is an Event-type function, which will return False once a 'true' is returned for the same event, and until another selection_changed() event is ready
+        """
+        return _pybox.MouseRegionSelectionChanged(self.id,1)
+    
+    def highlight_changed(self) -> bool :
+        """
+        Returns true of the highlight index changed since the last call to highlight_changed(), or a new highlight index has occurred.
+
+        - The highlight occurs when the mouse is over a region or point.  The highlight value remains active while the mouse is over the point/region. 
+        See get_last_highlighted() to get the last highlighted item even after it is no longer being moved.
+
+        - Use get_last_highlighted() to obtain the index of the mouse point/region that is referenced by this event.
+        - note: -1 as an index value may be returned if the selection changed to no selection.
+        
+        - This is an Event-type function, which will return False once a 'true' is returned for the same event, and until another highlight_changed() event is ready
+        """
+        return _pybox.MouseRegionHighlightChanged(self.id,1)
+    
+    def add_points(self, size_rect : list,**kwargs) :
+        """
+        Adds an array, list, or tuple set of point-type Mouse Region point to the Mouse Region.  
+        
+        A Point-Type Mouse Region uses a center point (x,y) with width and height used as the radius in the X and Y directions, respectively.
+        
+        - See add_regions() for a Region-Type Mouse Region where a specific rectangular region is described vs. (x,y) point with surrounding radius values.
+        - Index values are in the order added, with the first index starting at 0. 
+
+        
+        Example: 
+        
+        my_points = [(200,500,50,50),(300,500,50,50),(400,500,50,50),(500,500,50,50),(600,500,50,50)], 
+        mr.add_points(my_list) 
+        
+        This sets 5 points at (x,y) with a mouse-region/point area extending 50 pixels in both directions in the X and Y axes, respectively, for a total
+        size of (100,100) with (x,y) in the center.
+        
+        Parameters
+        
+        - size_rect         \t -- list of points in (x,y,w,h) list, tuple, or array
+
+        Optional Keywords
+        
+        - auto_draw         \t -- Sets the "auto draw" characteristics of the auto_draw() function output for specific to this point.
+                            \t For example, auto_draw="red,circle" sets a red circle for display when auto_draw() is called. 
+        - id                \t -- Sets a numeric 'user id' for the element that can be used to get its index as points are added and removed.
+                            \t Indexes are in order of additions, with deleted points changing indexes of the point below, accordingly.
+                            \t 'id' (e.g. id=123) can be used with get_id_index() to retrieve the Mouse Region index based on the user ID. 
+        """
+        return _pybox.MouseRegionAddPoints(self.id,size_rect,True,**kwargs)
+   
+    def add_regions(self, Loc : list,**kwargs) :
+        """
+        Adds an array, list, or tuple set of region-type Mouse Region point to the Mouse Region.  
+        
+        A Region-Type Mouse Region specifies a rectangular region with (x,y) as the upper-left corner of the rectangle, with width and height specifying
+        the size of the rectangle in each X-Y axes, respectively.
+        
+        - See add_points() for a Point-Type Mouse Region where a specific point with a radius in each X-Y axes is specified.
+        - Index values are in the order added, with the first index starting at 0. 
+
+        
+        Example: 
+        
+        my_points = [(200,500,50,50),(300,500,50,50),(400,500,50,50),(500,500,50,50),(600,500,50,50)], 
+        mr.add_regions(my_list) 
+        
+        This sets 5 rectangle regions at with upper-left (x,y) and width/height of 50 in each direction.
+        
+        Parameters
+        
+        - size_rect         \t -- list of regions in (x,y,w,h) list, tuple, or array
+
+        Optional Keywords
+        
+        - auto_draw         \t -- Sets the "auto draw" characteristics of the auto_draw() function output for specific to this point.
+                            \t For example, auto_draw="red,circle" sets a red circle for display when auto_draw() is called. 
+        - id                \t -- Sets a numeric 'user id' for the element that can be used to get its index as points are added and removed.
+                            \t Indexes are in order of additions, with deleted points changing indexes of the point below, accordingly.
+                            \t 'id' (e.g. id=123) can be used with get_id_index() to retrieve the Mouse Region index based on the user ID. 
+        """
+        return _pybox.MouseRegionAddPoints(self.id,Loc,False,**kwargs)
+   
+    def set_options(self,**kwargs) :
+        """
+        Sets keyword-based options for the Mouse Region object. This can be useful to change options when using different or new sets of points. 
+        This function can be useful when re-using the Mouse Region obtained from the window (e.g. win.GetMouseRegion()), when using mouse points for different
+        types of processes in the same window.  (you can also create a new and separate MouseRegion by declaring a MouseRegion object).
+
+        Keywords:
+        
+        - auto_draw         \t -- Sets the "auto draw" characteristics of the auto_draw() function output for all current and new mouse regions/points.
+                            \t For example, auto_draw="red,circle" sets a red circle for all elements for display when auto_draw() is called. 
+        """
+        return _pybox.MouseRegionSetOptions(self.id,1,**kwargs)
+   
+    def set_auto_draw_index(self,index : int,auto_draw_string : str) :
+        """
+        Sets the auto_draw() characteristics of the given index.
+
+        Use auto_draw() with no index to set the characteristics of all points or regions simultaneously.  
+        When using the index value, the changes only affect the current index's auto_draw() characteristics.
+
+        ** Note ** -- Documentation for this feature is still in development.  See various example for usage information. ---
+        """
+        return _pybox.MouseRegionSetAutoDraw(self.id,index,auto_draw_string)
+   
+    def set_auto_draw(self,auto_draw_string : str) :
+        """
+        Sets the auto_draw() characteristics of all points/regions simultaneously.  This also sets the default AutoDraw characteristics of new point/regions added 
+        after this function call.
+
+        Use auto_draw() with an index to set the AutoDraw characteristics of a single point or region.
+        
+        ** Note ** -- Documentation for this feature is still in development.  See various example for usage information. ---
+        """
+        return _pybox.MouseRegionSetAutoDraw(self.id,-20000,auto_draw_string)
+   
+    def get_display_index(self,index : int) -> int :
+        """
+        Gets the display index iteratively, in the display order.
+        
+        - When Mouse Region items are selected, they are moved to the top of the display order (unless the keyword dont_promote is used to prevent it).
+          Thus, the index order vs. the display order may not be the same. 
+
+        To iterate through the display order, GetDisplayIndex() can be called until a -1 is returned to signal there are no more display items:
+        
+        Example:
+        
+        index = -1
+        while (index := GetDisplayIndex(index)) >= 0) : perform_display_operation_on_index()
+        
+        Parameters:
+        
+        - index     \t -- index of current iterative display item (** this must start with -1)
+        
+        Returns"
+        
+        Index Value of display item.  A return of -1 means there are no more items to display.
+        """
+        return _pybox.MouseRegionGetDisplayIndex(self.id,index)
+    
+    def get_num_indexes(self) -> int :
+        """
+        Returns the number of points and regions in the Mouse Region object.
+        """
+        return _pybox.MouseRegionGetNumIndexes(self.id,1)
+    
+    def get_kill_passed_events(self, kill_events : bool = True) :
+        """
+        By default, mouse movements, clicks, unclicks, are not passed as general events when the Mouse Region has determined a Mouse Region event has 
+        occured.
+
+        For example, if the main event loop looks for mouse movements or clicks, these will not be reported if the mouse is over or is currently
+        moving a mouse point or region.
+        
+        This helps to react only to mouse events not within mouse regions.
+        
+        Sometimes it may be useful to get the mouse events as regions are being moved or highlighted. 
+        
+        Using get_kill_passed_events(False) will pass these events through, so the same mouse events that Mouse Region used will also be available to the main
+        event loop. 
+        
+        Parameters:
+        
+        - kill_events       \t - True to not pass Mouse Region mouse events to the main event loop (default behavior).  
+                            \t   False to pass the events for use with the main event loop.
+        """
+        return _pybox.MouseRegionKillPassedEvents(self.id,kill_events)
+    
+    def get_userid_index(self, userid : int) :
+        """
+        Returns the mouse region/point index corresponding to the user ID as set with the "id" keyword when the point/region was added.
+       (e.g. add_point(my_point,id=123)
+
+        -1 is returned if no valid index was found
+        
+        Parameters:
+
+        - user_id       \t - User ID as given with "id" keyword on point creation
+        
+        Returns:
+        
+        Index of point that has this user ID.  
+        -1 is returned if no point was found.
+        """
+        return _pybox.MouseRegionGetUserIDIndex(self.id,userid,True)
+    
+    def get_index_userid(self, index : int) :
+        """
+        Returns userID corresponding to the mouse region/point index given as input.
+        
+        If the point/region was not specified the "id" keyword when the point/region was added, the user ID is 0 for that point/region.
+        
+        -1 is returned if the index was not a valid mouse region/point index.
+
+        Parameters :
+        
+        - index     \t - index of the mouse region/point from which to obtain its user ID
+        
+        Returns
+        
+        
+        User ID of the mouse point/region if ID was established with the 'id' keyword when the point/region was created.
+        If no user id was established via the 'id' keyword, 0 is returned
+        
+        -1 is returned if the index given was invalid.
+        """
+        return _pybox.MouseRegionGetUserIDIndex(self.id,index,False)
+
+    class Point :
+        def __init__(self) :
+            index = 0
+            cur = ( 0,0 )
+            cur_oob = ( 0, 0 )
+            valid = False 
+            
+    class Region :
+        def __init__(self) :
+            index = 0
+            region = ( 0,0,0,0 )
+            region_oob = ( 0, 0, 0, 0 )
+            valid = False 
+            
+    def get_point(self,index : int) -> Point :
+        """
+        """
+        l = _pybox.MouseRegionGetPoint(self.id,index)
+        p = MouseRegion.Point()
+        p.index = l[0]
+        p.cur = (l[1],l[2])
+        p.cur_oob = (l[3],l[4])
+        p.valid = bool(l[5])
+        return p
+        
+    def get_region(self,index : int) -> Region :
+        """
+        """
+        l = _pybox.MouseRegionGetRegion(self.id,index)
+        p = MouseRegion.Region()
+        p.index = l[0]
+        p.region = (l[1],l[2],l[3],l[4])
+        p.region_oob = (l[5],l[6],l[3],l[4])
+        p.valid = bool(l[7])
+        
+        return p
@@ -0,0 +1,587 @@
+"""
+Pybox Options -- the opt class used to pass options to pybox functions.
+"""
+
+from __future__ import annotations
+
+import functools
+import numpy
+
+class opt :
+    """
+    Pybox option, i.e. opt.at(10,20) or opt.title("My Window").
+
+    Each option holds its option string (i.e. ',LocX=10,LocY=20,').  Options made by at(), size(), range(), default(), font() and
+    cancelok() also hold their values as ((key,value),...) fields, so backends that read the fields don't need to parse the string.
+    These options are interned -- i.e. calling opt.at(10,20) again returns the same option without formatting it again.
+    """
+    def __init__(self,text,fields : tuple = None) :
+        self.__text     = "{}".format(text)
+        self.__fields   = fields
+    def __add__(self,other) :
+        "Combines two options.  Use OptionSet to combine many options, which builds the option string once."
+        fields = None
+        if self.__fields is not None and other.__fields is not None and len(self.__fields) + len(other.__fields) <= _ADD_FIELDS :
+            fields = self.__fields + other.__fields
+        return opt("{}{}".format(self.__text,other.__text),fields)
+    def interact() : 
+        "Add this to a pybox.NewWindow() call in interactive mode for a window that comes up to the right and stays on top of the interactive session."
+        return opt(",Interactive,")
+    def fgcolor(color)      :
+        "Sets the foreground or text color of a control or object"
+        return opt(",fgColor={},".format(color))
+    def bgcolor(color)      :
+        "Sets the background or text color of a control or object"
+        return opt(",bgColor={},".format(color))
+    def textcolor(color)    :
+        "Sets the foreground or text color of a control or object"
+        return opt(",TextColor={},".format(color))
+    def valuecolor(color)    :
+        "Sets the foreground or text color of the value of a control (i.e. a slider)"
+        return opt(",ValueColor={},".format(color))
+    def color(color)        :
+        "Sets the color of an object.  Usually the textcolor, but depends on context.  See fgColor() and TextColor() for more specific options."
+        return opt(",Color={},".format(color))
+    def font(font)          :
+        """
+        Sets the font.  If a number is used, it sets the font to the font size in the default font.
+        Otherwise, specific fonts may be given, such as:
+            Font("Arial,40)
+            Font("Arial,35,italic")
+        
+        Always include the font size.
+        """
+        if isinstance(font,opt) : return font
+        return _single_opt("Font","{}".format(font))
+    def labelfont(font)          :
+        """
+        Sets the label font.  If a number is used, it sets the font to the font size in the default font.
+        Otherwise, specific fonts may be given, such as:
+            labelfont("Arial,40)
+            labelfont("Arial,35,italic")
+        
+        Always include the font size.
+        """
+        if isinstance(font,opt) : return font
+        return opt(",LabelFont=\"{}\",".format(font))
+    def title(title)        :
+        "Sets the title of the control or window being created."
+        if isinstance(title,opt) : return title                                 # return width as itself it is already an option
+        if not isinstance(title,str) : return
+        return opt(",Title=\"{}\",".format(title))
+
+    def label(label)        :
+        "Sets the label of the control or window being created."
+        if isinstance(label,opt) : return label                                 # return width as itself it is already an option
+        if not isinstance(label,str) : return
+        return opt(",Label=\"{}\",".format(label))
+    def label_right(label)        :
+        "--comment--"
+        if isinstance(label,opt) : return label                                 # return width as itself it is already an option
+        if not isinstance(label,str) : return
+        return opt(",LabelRight=\"{}\",".format(label))
+    def label_left(label)        :
+        "--comment--"
+        if isinstance(label,opt) : return label                                 # return width as itself it is already an option
+        if not isinstance(label,str) : return
+        return opt(",LabelLeft=\"{}\",".format(label))
+    def label_top(label)        :
+        "--comment--"
+        if isinstance(label,opt) : return label                                 # return width as itself it is already an option
+        if not isinstance(label,str) : return
+        return opt(",LabelTop=\"{}\",".format(label))
+    def label_bottom(label)        :
+        "--comment--"
+        if isinstance(label,opt) : return label                                 # return width as itself it is already an option
+        if not isinstance(label,str) : return
+        return opt(",LabelBottom=\"{}\",".format(label))
+    def label_color(color)    :
+        "Sets the foreground or text color of a label of a control"
+        return opt(",LabelColor={},".format(color))
+    def horz()        :
+        "Sets the title of the control or window being created."
+        "--comment--"
+        return opt(",Horz,")
+
+    def textcenter_x()   :
+        "--comment--"
+        return opt(",TextCenterX,")
+    def textcenter()   :
+        "--comment--"
+        return opt(",TextCenterX,")
+    def textcenter_y()   :
+        "--comment--"
+        return opt(",TextCenteYX,")
+    def just_bottom_center() :
+        "--comment--"
+        return opt(",JustBottomCenter,")
+    def just_bottom_left() :
+        "--comment--"
+        return opt(",JustBottomLeft,")
+    def just_bottom_right() :
+        "--comment--"
+        return opt(",JustBottomRight,")
+    def just_top_center() :
+        "--comment--"
+        return opt(",JustTopCenter,")
+    def just_top_left() :
+        "--comment--"
+        return opt(",JustTopLeft,")
+    def just_top_right() :      
+        "--comment--"
+        return opt(",JustTopRight,")
+    def center_x()   :
+        "--comment--"
+        return opt(",CenterX,")
+    def center_y()   :
+        "--comment--"
+        return opt(",CenterY,")
+    def center_xy()          :
+        "Sets the text or control being created in the center of the Window."
+        return opt(",CenterXY,")
+    def multiline()          :
+        "Sets an input box to accept multiple lines."
+        return opt(",MultiLine,")
+    def password()          :
+        "Sets an input box to display '*' for all text."
+        return opt(",Password,")
+    def readonly()          :
+        "Sets an input box to be read only text."
+        return opt(",ReadOnly,")
+    def wantreturn()          :
+        "Tells a multi-line input box to send a 'Pressed Return' message when the return key is pressed.  Otherwise, returns are accepted as input into the input box."
+        return opt(",WantReturn,")
+    def noautoupdate()   :
+        "--comment--"
+        return opt(",NoAutoUpdate,")
+    def noresize()   :
+        "--comment--"
+        return opt(",NoResize,")
+    def sageicon()   :
+        "--comment--"
+        return opt(",SageIcon=0,")
+    def __as_float() :
+        "Sets a slider as a floating-point slider.   Internal use."
+        return opt(",AsFloat,")
+
+    def wait_for_close() :
+        """
+        Tells a windowed function (such as img_view()) to not return until the user closes the window.
+
+        This allows the function to pause until completed.
+
+        For example:
+            
+            img_view(my_image)      - this will display the image and return immediately
+            img_view(my_image,opt.wait_for_close())     - this will wait for the user to close the window
+            img_view(my_image,wait_for_close=True))   - this is the same thing using keyword format
+        """
+        return opt(",wait_for_close,")
+
+    def realtime()   :
+        """
+        When creating a Window with NewWindow() the "RealTime" option sets the window for real-time display usage, typically
+        on the Vertical Resync. 
+
+        This sets the high-resolution timer and other factors to help the display run as fast and smooth as possible.
+
+        Also see DirectDraw(), which sets the same values and also draws directly to the window rather than a buffer.
+
+        - This will set auto updates off.  Update() must be used manually to update the window.
+        - This does not need to be used with the vertical resync.  However, see pybox.VSyncWait() for more information
+        - This is prelminary and will also work with GPU functions and components of Sagebox & Pybox when ready.
+
+        """
+        return opt(",RealTime,")
+    def direct_draw()   :
+        """
+        When creating a Window with NewWindow() the "DirectDraw" option sets the window for direction, real-time display usage, typically
+        on the Vertical Resync. 
+
+        About Direct Draw
+
+        - Direct Draw will draw directly to the screen instead of a buffer.  Default usage (i.e. without DirectDraw)
+            \t -is to write to a separate bitmap and then send the bitmap to the window when an update occurs.
+        - With Direct Draw On, output to the window will be written to the window immediately.  This can be faster and
+            \t -work better with real-time display. 
+
+        This sets the high-resolution timer and other factors to help the display run as fast and smooth as possible.
+
+        Also see DirectDraw(), which sets the same values and also draws directly to the window rather than a buffer.
+
+        Other notes:
+
+        - All output will immediately display to the window.
+        - The Window will not repaint when the system sends a PAINT event.  This must be taken care of by the program
+            \t -However, typicaly usage is real-time, so PAINT events shouldn't matter, as the window is continuously updating.
+        - This will set auto updates off, since output is now directly written to the window immediately.
+        - This does not need to be used with the vertical resync.  However, see pybox.VSyncWait() for more information
+        - This is prelminary and will also work with GPU functions and components of Sagebox & Pybox when ready.
+
+        """
+        return opt(",DirectDraw,")
+    def resizeok()   :
+        "--comment--"
+        return opt(",ResizeOK,")
+    def numbersonly(numbersonly : bool = True)          :
+        "Tells an input box control to only accept numbers."
+        if numbersonly : return opt(f",NumbersOnly,")
+
+
+    def border()          :
+        "Sets a border for a control such as an Input box, Listbox, etc."
+        return opt(",Border,")
+    def noborder()          :
+        "Turns off a border for a control with a default border, such as an Input box or Listbox so it will blend into the window more seamlessly."
+        return opt(",NoBorder,")
+    def thickborder()          :
+        "Sets a thicker border for controls such as Input Boxes, List Boxes, etc."
+        return opt(",ThickBorder,")
+    def recessed()          :
+        "Sets a Recessed border for controls such as Input Boxes, List Boxes, etc.  This is the same as RecessedBorder()."
+        return opt(",Recessed,")
+    def recessedborder()          :
+        "Sets a Recessed border for controls such as Input Boxes, List Boxes, etc.  This is the same as Recessed()."
+        return opt(",Recessed,")
+    def vscroll()          :
+        "Adds a vertical scroll bar on controls such as Input Boxes and List Boxes"
+        return opt(",VScroll,")
+    def hscroll()          :
+        "Adds a horizontal Control for controls such as Input Boxes and List Boxes"
+        return opt(",HScroll,")
+    def wincolors() :
+        """
+        Sets colors for a control to either use the current window color for background and text colors, or to use brigher 'Windows-default colors. 
+        This is dependent on the control.  See the documentation for specific controls.
+        """
+        return opt(",WinColors,")
+
+    def iconinfo()          :
+        "--comment--"
+        return opt(",IconInfo,")
+    def iconstop()          :
+        "--comment--"
+        return opt(",IconStop,")
+    def iconwarning()          :
+        "--comment--"
+        return opt(",IconWarning,")
+
+    def str(litstr) :
+        "--comment--"
+        if (isinstance(litstr,str)) : return opt(",{},".format(litstr))      # Convert to option
+        if (isinstance(litstr,opt)) : return litstr                        # Return as is
+        return                                                              # do nothing 
+    def str_str(string,definition) :
+        "--comment--"
+        if not isinstance(string,str) or not isinstance(definition,str) : return
+        if isinstance(string,opt) : return string
+        return opt(",{}=\"{}\",".format(string,definition))
+
+
+    def range(_min,_max=None)      :
+        "Sets the range of a control, such as a slider."
+        if isinstance(_min,opt) : return _min                                 # return min as itself it is already an option
+        if isinstance(_min,list) or isinstance(_min,tuple) :
+            return _pair_opt("MinValue",_min[0],"MaxValue",_min[1])             # list or tuple
+        if isinstance(_min,numpy.ndarray) and _min.ndim >= 1 and _min.shape[0] >= 2 : # min is an array
+            return _pair_opt("MinValue",_min[0],"MaxValue",_min[1])
+        return _pair_opt("MinValue",_min,"MaxValue",_max)
+    def default(default)    :
+        "Sets the default value for a control or widget.  i.e. Default(true), in the case of on/off, or Default(<value>), etc."      
+        if isinstance(default,opt) : return default         # return default as itself it is already an option
+        if default is not None : return _single_opt("Default",default)
+    def percent(percent)    :
+        "--comment--"
+        if isinstance(percent,opt) : return percent
+        if percent is not None : return opt(",Percent={},".format(int(percent)))
+
+    def padx(pad)    :
+        "--comment--"
+        if isinstance(pad,opt) : return pad
+        if pad is not None : return opt(",PadX={},".format(int(pad)))
+    def pady(pad)    :
+        "--comment--"
+        if isinstance(pad,opt) : return pad
+        if pad is not None : return opt(",PadY={},".format(int(pad)))
+    def zoombox(zoomBox : bool = True)    :
+        "--comment--"
+        if zoomBox is None : return
+        if isinstance(zoomBox,opt) : return zoomBox
+        return opt(",ZoomBox={},".format(zoomBox))
+
+    def cb_titlecell(titlecell : str)    :
+        "--comment--"
+        if titlecell is None : return
+        if isinstance(titlecell,opt) : return titlecell
+        return opt(f",cbTitleCell=\"{titlecell}\"")
+
+    def style(style : str)    :
+        "--comment--"
+        if style is None : return
+        if isinstance(style,opt) : return style
+        return opt(f",Style=\"{style}\"")
+    def arrowbox(arrowbox : bool = True) :
+        "--comment--"
+        return opt(f",ArrowBox={arrowbox}")
+    def reversed(reversed : bool = True)    :
+        "--comment--"
+        if reversed is None : return
+        if isinstance(reversed,opt) : return reversed
+        return opt(",Reversed={},".format(reversed))
+    def reverse(reversed : bool = True)    :
+        "--comment--"
+        if reversed is None : return
+        if isinstance(reversed,opt) : return reversed
+        return opt(",Reversed={},".format(reversed))
+    def noblanks(noblanks : bool = True)    :
+        "--comment--"
+        if noblanks is None : return
+        if isinstance(noblanks,opt) : return noblanks
+        return opt(",noblanks={},".format(noblanks))
+    def nocancel(nocancel : bool = True)    :
+        "--comment--"
+        if nocancel is None : return
+        if isinstance(nocancel,opt) : return nocancel
+        return opt(",nocancel={},".format(nocancel))
+    def cancelok(cancelok : bool = True)    :
+        "--comment--"
+        if cancelok is None : return
+        if isinstance(cancelok,opt) : return cancelok
+        return _single_opt("CancelOk",cancelok)
+    def progresbar(progressbar : bool = True)    :
+        "--comment--"
+        if progressbar is None : return
+        if isinstance(progressbar,opt) : return progressbar
+        return opt(",ProgressBar={},".format(progressbar))
+    def maximize(maximize : bool = True)    :
+        "--comment--"
+        if maximize is None : return
+        if isinstance(maximize,opt) : return maximize
+        return opt(",Maximize={},".format(maximize))
+
+    def size(width = None,height : int = None)  :
+        """
+        Set size of a control or window.
+
+        Input:
+
+        width,height\t\t -- Width & Height (both must be integers)
+        list\t\t -- Use a list with 2 values as width,height
+        tuple\t -- Use a tuple as 2 values as width,height
+
+        Examples: 
+
+        opt.size(10,100)\t -- Set 10,100 as size
+
+        size=(10,100)
+        opt.size(size)\t -- Set tuple loc as size (i.e. 10x100)
+        """
+        if isinstance(width,opt) : return width                                 # return width as itself it is already an option
+        if isinstance(width,list) or isinstance(width,tuple) or isinstance(width,numpy.ndarray):
+            return _pair_opt("SizeX",int(width[0]),"SizeY",int(width[1]))                # list or tuple
+
+        if height is None : height = 0
+        if width is not None :                   # width & height are integers
+            return _pair_opt("SizeX",int(width),"SizeY",int(height))
+        return                                                      # if all fails, pass through and do nothing
+    def at(x = None,y : int = None)  :                              # convert various types to option format
+        """
+        Set (X,Y) location of a control or window.
+
+        Input:
+
+        x,y\t\t -- X,Y location (both must be integers)
+        list\t\t -- Use a list with 2 values as X,Y
+        tuple\t -- Use a tuple as 2 values as X,Y
+
+        Examples: 
+
+        opt.at(10,100)\t -- Set 10,100 as location
+
+        loc=(10,100)
+        opt.at(loc)\t -- Set tuple loc as location (i.e. 10,100)
+        """
+        if isinstance(x,opt) : return x                             # return x as itself it is already an option
+        if isinstance(x,list) or isinstance(x,tuple) :
+            return _pair_opt("LocX",x[0],"LocY",x[1])                # list or tuple
+        if isinstance(x,int) and isinstance(y,int) :                # x & y are integers
+            return _pair_opt("LocX",x,"LocY",y)
+        if isinstance(x,float) and isinstance(y,float) :            # x & y are float
+            return _pair_opt("LocX",x,"LocY",y)
+        if isinstance(x,numpy.ndarray) and x.ndim >= 1 and x.shape[0] >= 2 : # x is an array
+            return _pair_opt("LocX",x[0],"LocY",x[1])
+        return                                                      # if all fails, pass through and do nothing
+    def hide() :
+        return opt(",Hide,")
+    def best_fit(width,height) :
+        "--comment--"
+        return opt(",FitWidth={},FitHeight={},".format(width,height))
+    def best_fit_exact(width,height) :
+        "--comment--"
+        return opt(",FitExact,FitWidth={},FitHeight={},".format(width,height))
+    def width(width) :
+        "--comment--"
+        return opt(",SizeX={},".format(width))
+    def height(height) :
+        "--comment--"
+        return opt(",SizeY={},".format(height))
+    def fullscreen() :
+        "--comment--"
+        return opt(",Fullscreen,")
+    def popup() :
+        "--comment--"
+        return opt(",Popup,")
+    def normalized() : 
+        """
+        When displaying bitmaps in img_view() and img_before_after(), this will let the functions know that
+        a floating-point-based image is normalized to 0-1.0
+
+        Otherwise the image is assumed to have values between 0.0-255.0
+        """
+        return opt(",Normalized,")
+    def noerror() :
+        """
+        Tells a function to not print errors and stop the program. 
+        The program than can check if the function succeeded.
+
+        For example, when reading a bitmap with read_image_file, the default
+        behavior is to stop the program if the bitmap did not exist or otherwis
+        did not load.
+
+        using "noerror" will cause the function to continue, and the returns bitmap can be
+        checked for an error, such as
+
+        my_image = read_image_file("test.jpg",'noerror')
+
+        if my_image.is_empty() : 
+                << handle error case here >>
+        """
+        return opt(",NoError,")
+
+# Structured options.  Options with the same keys and values (of the same types, so 1 and 1.0 stay different) are interned,
+# keeping the most recently used.
+
+_INTERNED   = 4096
+_ADD_FIELDS = 8                                     # longer opt + opt chains keep only the option string (see OptionSet)
+
+def _fields_opt(*fields) -> opt :
+    "Returns an opt with ((key,value),...) fields, and the option string for them (string values are quoted)"
+    text = ",".join(('{0}="{1}"' if isinstance(value,str) else "{0}={1}").format(key,value) for key,value in fields)
+    return opt(",{0},".format(text),fields)
+
+@functools.lru_cache(maxsize=_INTERNED,typed=True)
+def _interned_single(key : str,value) -> opt :
+    return _fields_opt((key,value))
+
+@functools.lru_cache(maxsize=_INTERNED,typed=True)
+def _interned_pair(key1 : str,value1,key2 : str,value2) -> opt :
+    return _fields_opt((key1,value1),(key2,value2))
+
+def _single_opt(key : str,value) -> opt :
+    try :
+        return _interned_single(key,value)
+    except TypeError :                              # unhashable value, i.e. a list
+        return _fields_opt((key,value))
+
+def _pair_opt(key1 : str,value1,key2 : str,value2) -> opt :
+    try :
+        return _interned_pair(key1,value1,key2,value2)
+    except TypeError :
+        return _fields_opt((key1,value1),(key2,value2))
+
+# OptionSet
+
+def _norm_key(key : str) -> str :
+    return key.replace("_","").lower()
+
+def _split_options(text : str) -> list :
+    "Splits an option string (i.e. ',LocX=10,Font=\"Arial,20\",') into its items, keeping commas inside quotes"
+    parts = text.split(",")
+    if '"' in text :                                # rejoin the parts of quoted values
+        items,current = [],None
+        for part in parts :
+            current = part if current is None else current + "," + part
+            if current.count('"') % 2 == 0 :
+                items.append(current)
+                current = None
+        if current is not None : items.append(current)
+        parts = items
+    return [item.strip() for item in parts if item.strip()]
+
+class OptionSet(opt) :
+    """
+    A set of options that is built up one option at a time, i.e. for generated forms with many options.
+
+    Adding options to an OptionSet only stores them -- the option string is built once, when the OptionSet is passed to a
+    pybox function, instead of each time two options are added with '+'.  When the same option is given more than once
+    (i.e. two opt.at() options), the last one is used.
+
+    An OptionSet can be used anywhere an option can.
+
+    Examples:
+                \t -options = pybox.OptionSet(opt.at(10,20),opt.title("My Window"))
+                \t -options += opt.size(400,300)
+                \t -options.add(opt.font(20),opt.bgcolor("black"))
+                \t -win = pybox.new_window(options)
+    """
+    def __init__(self,*options) :
+        self.__options  = []
+        self.__built    = None
+        self.add(*options)
+
+    def add(self,*options) -> OptionSet :
+        """
+        Adds options (opt objects, option strings, or other OptionSets) to the set.  None values are skipped, so functions
+        such as opt.title() that return None for missing values can be added directly.  Returns the OptionSet.
+        """
+        for option in options :
+            if option is None : continue
+            if isinstance(option,OptionSet) : self.__options.extend(option.__options)
+            elif isinstance(option,(opt,str)) : self.__options.append(option)
+            else : raise TypeError("OptionSet.add() takes opt objects, option strings, or OptionSets")
+        self.__built = None
+        return self
+
+    def __iadd__(self,other) -> OptionSet :
+        return self.add(other)
+
+    def __add__(self,other) -> OptionSet :
+        return OptionSet(self,other)
+
+    def __radd__(self,other) -> OptionSet :
+        return OptionSet(other,self)
+
+    def __len__(self) -> int :
+        return len(self.__options)
+
+    def __build(self) -> tuple :
+        "Returns (option string,fields or None), with the last of any repeated options"
+        items   = {}
+        fields  = {}
+        for option in self.__options :
+            option_fields = None if isinstance(option,str) else option._opt__fields
+            if option_fields is None :
+                fields = None
+                for item in _split_options(option if isinstance(option,str) else option._opt__text) :
+                    key = _norm_key(item.partition("=")[0].strip())
+                    items.pop(key,None)
+                    items[key] = item
+            else :
+                for key,value in option_fields :
+                    norm = _norm_key(key)
+                    items.pop(norm,None)
+                    items[norm] = ('{0}="{1}"' if isinstance(value,str) else "{0}={1}").format(key,value)
+                    if fields is not None :
+                        fields.pop(norm,None)
+                        fields[norm] = (key,value)
+        text = ",{0},".format(",".join(items.values())) if items else ""
+        self.__built = (text,None if fields is None else tuple(fields.values()))
+        return self.__built
+
+    @property
+    def _opt__text(self) -> str :
+        return (self.__built or self.__build())[0]
+
+    @property
+    def _opt__fields(self) -> tuple :
+        return (self.__built or self.__build())[1]
@@ -0,0 +1,134 @@
+"""
+Pybox Settings -- debug, defaults file, and timer settings.
+"""
+
+from __future__ import annotations
+
+from ._core import _pybox
+
+ #       print("reached __del__ for quickform")
+     
+        
+    
+#
+# Top-Level Pybox Functions
+#
+
+def was_canceled() -> bool :
+    """
+    Returns true of the last dialog box that contains a 'cancel' button was canceled. 
+
+    This can be useful in handling dialog boxes that return numbers and strings.  was_canceled() can confirm the user canceled the dialog box and is not
+    returning information.
+
+    If was_canceled() returns False, then it can be assumed that the return data is ok.
+
+    was_canceled() applies to dialog functions like GetInteger(), GetFloat(), GetString(), YesNocancel(), and other functions.
+    """    
+    return _pybox.Canceled()
+
+#def set_debug(mode : int = 3) -> bool :
+#    """
+#    Sets the debug mode for pybox and all pybox widgets.
+#
+#    When ON, debug messages will appear in the console window showing the module, function and informational or debug message.
+#    
+#    Debug Modes:
+#    
+#    - 0     \t -- Debug Off (default)
+#    - 1     \t -- Info -> Prints informational items to know about, but not errors per-se.
+#    - 2     \t -- Error -> In addition to informational messages, this will also show internal error messages if a call fails and aborts the program.
+#    - 3     \t -- Debug -> (experimental) Shows all Info & Error messages, as well as internal development debug messages. 
+#
+#    Any debug level will also show Fatal errors (errors such as parameter errors that cause program termination).
+#
+#    Examples:
+#
+#    pybox.set_debug(2)  --> Show all Info and Error messages
+#    pybox.set_debug(0)  --> Set debug OFF (default)
+#    """
+#    _pybox.SetDebug(mode)
+
+def set_debug(mode : str) -> bool :
+    """
+    Sets the debug mode for pybox and all pybox widgets.
+
+    When ON, debug messages will appear in the console window showing the module, function and informational or debug message.
+    
+    Debug Modes:
+    
+    - "off"         \t - Debug Off (default)
+    - "Info"        \t - Info -> Prints informational items to know about, but not errors per-se.
+    - "Verbose"     \t - Info -> Prints informational items to know about, with more details.
+    - "Warnings"    \t - Warnings -> In addition to informational messages, this will also show warning messages if a call fails and aborts the program.
+    - "Error"       \t - Error -> In addition to informational messages, this will also show internal error messages if a call fails and aborts the program.
+    - "_debug"      \t - Debug (note the "_" in "_debug) -> (experimental) Shows all Info & Error messages, as well as internal development debug messages. 
+
+    Any debug level will also show Fatal errors (errors such as parameter errors that cause program termination).
+
+    Examples:
+
+    pybox.set_debug("Info")  --> Show all Info and Error messages
+    pybox.set_debug("off")  --> Set debug OFF (default)
+    pybox.set_debug("_debug")  --> Set debug to "_debug", which prints everything, including internal debug information.
+    """
+    _pybox.SetDebugStr(mode)
+
+def set_defaults_file(file : str) -> bool :
+    """
+    ** This function to be documented in more detail at a later time **
+
+    The default file can set the clear screen style, colors, or bitmap; the dev window bitmap backhground, as well as a number of other
+    settings that can change the default display and behavior as Sagebox initializes windows and controls.
+    
+    This function sets the primary default file. If Sagebox has not yet been initialized, this filename is placed as the first
+    file search as the default ini file.
+
+    If Sagebox has already been initialized, the new file is read immediately and replaces any current defaults.
+    
+    ** note: file must contain path to ini file including the ini file name, e.g. "c:\mypath\subdir\defaults.ini", etc.
+    
+    Paramaters: 
+    
+    file - full-path name of file to use as defaults file.
+    """
+    return _pybox.SetDefaultsFile(file)
+    
+def disable_defaults() -> None :
+    """
+    Disables processing of any default files that Sagebox may load. 
+    
+    ** note:  That can be called at any time, but should be performed before opening any windows or controls. 
+    """
+    return _pybox.DisableDefaults()
+
+def display_default_paths() :
+    """
+    Displays to the console window the default paths that Sagebox will search for Sagebox Defaults Ini information.
+
+    The default filename is "SageDefaults.ini", which can be explicitly specified with SetDefaultFile()
+    
+    Sagebox will search any explicit directories set, and added by a subsystem (such as C#), the current directory, module/executable directory, in this order. 
+    
+    --> Use disable_defaults() to disable any loading of default .ini files. 
+    """
+    _pybox.DisplayDefaultPaths()
+        
+def set_win_timer_update_ms(update_ms : int) -> bool :
+    """
+    Sets the timer delay on "timer" or "ontime" window updates, which update any needed windows on a timer set through the OS, instead of
+    the default update, which is performed when graphics functions are used and it is time to update the window.
+    
+    --> This can be set to a value between 22ms (default) and 10000 (10 seconds). 
+    --> This function can be useful to set a longer delay on update with buys graphics routines, to show constant updates but also 
+    slow the updates down (e.g. 50ms, 1000ms, etc.) to keep the refresh rate lower, using less cpu time.
+
+    Parameters:
+    
+    update_ms - milliseconds to set for update frequency for "ontime"/"timer" auto-update type
+    
+    Returns:
+   
+    True if successful.  False is returned if the millisecond value is out of range.
+    """
+    return _pybox.SetWinTimerUpdateMs(update_ms)
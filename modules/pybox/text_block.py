@@ -0,0 +1,118 @@
+"""
+Pybox Text Blocks -- see TextBlock and Window.new_text_block().
+"""
+
+from __future__ import annotations
+
+from .options import opt
+from .markup import Markup, compile as _compile, _escape
+
+class _Slot :
+    "A named value in a TextBlock template"
+    __slots__ = ("spec","value","text","markup","spans")
+    def __init__(self,spec : str) :
+        self.spec   = spec
+        self.value  = None
+        self.text   = ""
+        self.markup = ""                    # the text as written within the block's markup (see markup._escape())
+        self.spans  = []                    # index of each span of the template that shows the value
+
+class TextBlock :
+    """
+    Pybox Text Block
+
+    A TextBlock writes a block of text with values that change, i.e. a readout of values that is written each frame.  The text is
+    given once as a template, with named slots for the values:
+
+                \t -"Mass 1:{x=130}{g}{$mass1:.2f}\\nAngle 1:{x=130}{c}{$angle1:.4f}"
+
+    Slots are written as {$name} or {$name:format}, where the format is a Python format specification (i.e. .2f).  The rest of the
+    template is the same as text given to Window.write(), including {} markup for colors, fonts and positions.
+
+    The template is compiled once, when the TextBlock is created (see pybox.markup.compile()).  draw() writes the whole block's text
+    with one write() call on each call -- the same call as write() with the text from str.format(), and about as fast.  A TextBlock
+    keeps the template and its slots in one place; it does not write less text, or write faster, than str.format() and write().
+
+    Examples:
+                \t -values = win.new_text_block("Mass 1:{x=130}{g}{$mass1:.2f}\\nZoom:{x=130}{g}{$zoom:.2f}%",at=(10,10))
+                \t -while win.vsync_wait() :
+                \t -    win.cls()
+                \t -    values.set(mass1=pend.mass[0],zoom=pend.zoom*100)
+                \t -    values.draw()
+    """
+    def __init__(self,window,template : str,at=None,*args,**kwargs) :
+        self.__window   = window
+        self.__args     = ((opt.at(at),) if at is not None else ()) + args
+        self.__kwargs   = kwargs
+        template        = _compile(str(template))
+        self.__spans    = list(template.spans)
+        self.__parts    = template.parts or (template.text,)                # the text between the slots, with its markup
+        self.__order    = []                # the slot of each {$name} in the template, in order
+        self.__slots    = {}
+        for index,name,spec in template.slots :
+            slot = self.__slots.get(name)
+            if slot is None : slot = self.__slots[name] = _Slot(spec)
+            slot.spans.append(index)
+            self.__order.append(slot)
+        self.__markup   = None              # the Markup written by draw(), made again after a value changes
+
+    def __repr__(self):
+        return "pybox.TextBlock"
+
+    def __current(self) -> Markup :
+        if self.__markup is None :
+            pieces = [self.__parts[0]]
+            for slot,part in zip(self.__order,self.__parts[1:]) : pieces += (slot.markup,part)
+            self.__markup = Markup(tuple(self.__spans),"".join(pieces))
+        return self.__markup
+
+    @property
+    def names(self) -> tuple :
+        "The names of the slots in the template, in order"
+        return tuple(self.__slots)
+
+    @property
+    def text(self) -> str :
+        "The text written by draw(), with the current values and the template's markup"
+        return self.__current().text
+
+    @property
+    def markup(self) -> Markup :
+        "The compiled Markup written by draw(), with the current values"
+        return self.__current()
+
+    def set(self,**values) -> bool :
+        """
+        Sets the values of one or more slots, i.e. block.set(mass1=1.5,zoom=100).  Values that are not given keep their last value,
+        and a slot set to None is left empty.
+
+        Returns True when the text changed.
+        """
+        changed = False
+        for name,value in values.items() :
+            slot = self.__slots.get(name)
+            if slot is None : raise KeyError("TextBlock has no slot named '{0}'".format(name))
+            if value is slot.value and slot.value is not None : continue
+            slot.value = value
+            text = "" if value is None else format(value,slot.spec)
+            if text != slot.text :
+                slot.text,slot.markup = text,_escape(text)
+                for index in slot.spans : self.__spans[index] = self.__spans[index]._replace(text=text)
+                changed = True
+        if changed : self.__markup = None
+        return changed
+    def __setitem__(self,name : str,value) :
+        self.set(**{name : value})
+
+    def __getitem__(self,name : str) :
+        slot = self.__slots.get(name)
+        if slot is None : raise KeyError("TextBlock has no slot named '{0}'".format(name))
+        return slot.value
+
+    def draw(self,**values) -> bool :
+        """
+        Writes the block to the window, at the position given when the TextBlock was created (or at the current write position).
+        Values can be given to set them first, as with set().
+        """
+        if values : self.set(**values)
+        return self.__window.write(self.__current().text,*self.__args,**self.__kwargs)
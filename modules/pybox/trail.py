@@ -0,0 +1,136 @@
+"""
+Pybox Trails -- see TrailBuffer.
+"""
+
+from __future__ import annotations
+
+import numpy
+from .colors import _color_rows
+
+class TrailBuffer :
+    """
+    Pybox Trail Buffer
+
+    A TrailBuffer keeps the most recent points of a moving object (i.e. the trail of a pendulum bob) for drawing with
+    draw.line_segments(), without copying the trail each frame.
+
+    Points are stored twice in preallocated storage of twice the capacity, so the trail is always one contiguous array from the
+    oldest point to the newest.  append() writes the new point (over the oldest one when the trail is full) and moves the start
+    of the trail -- nothing else is copied.
+
+    Colors can be:
+
+    - by age        \t -- colors given when the TrailBuffer is created (or with set_colors()) are used from the oldest point to
+                    \t    the newest, i.e. a trail that fades to black at its end.
+    - per point     \t -- colors given with append() stay with their point, in a color ring kept with the points.
+
+    A transform (scale and offset) can be set with set_transform(), i.e. to draw a trail kept in model coordinates at the window's zoom
+    and center.  It is applied when the trail is drawn.
+
+    Examples:
+                \t -trail = pybox.TrailBuffer(300,colors=[(255*i/300,50*i/300,0) for i in range(300)])
+                \t -trail.set_transform(zoom,center)
+                \t -while win.vsync_wait() :
+                \t -    trail.append(bob_position)
+                \t -    win.draw.line_segments(trail,pen_size=4)
+    """
+    def __init__(self,capacity : int,colors=None,per_point_colors : bool = False) :
+        self.__capacity     = max(2,int(capacity))
+        self.__points       = numpy.zeros((2*self.__capacity,2))
+        self.__point_colors = numpy.zeros((2*self.__capacity,3),dtype=numpy.uint8) if per_point_colors else None
+        self.__age_colors   = None
+        self.__scratch      = None                  # the transformed points, written when the trail is drawn
+        self.__scale        = None
+        self.__offset       = None
+        self.__start        = 0
+        self.__count        = 0
+        if colors is not None : self.set_colors(colors)
+
+    def __repr__(self):
+        return "pybox.TrailBuffer"
+
+    def __len__(self) -> int :
+        return self.__count
+
+    @property
+    def capacity(self) -> int :
+        return self.__capacity
+
+    def append(self,point,color=None) -> None :
+        """
+        Adds a point to the end of the trail, removing the oldest point when the trail is full.
+
+        Parameters
+
+        - point     \t -- (x,y) of the new point
+        - color     \t -- Color of the new point, for a TrailBuffer created with per_point_colors=True (RgbColor or (r,g,b) values).
+                    \t    When omitted, the new point has the color of the point before it (white for the first point).
+        """
+        if self.__count < self.__capacity :
+            index = self.__count
+            self.__count += 1
+        else :
+            index = self.__start
+            self.__start = (index + 1) % self.__capacity
+        points = self.__points
+        points[index,0] = points[index + self.__capacity,0] = point[0]
+        points[index,1] = points[index + self.__capacity,1] = point[1]
+        colors = self.__point_colors
+        if colors is not None :
+            if color is None : color = colors[(index - 1) % self.__capacity] if self.__count > 1 else (255,255,255)
+            colors[index] = colors[index + self.__capacity] = tuple(color)
+
+    def clear(self) -> None :
+        "Removes all points (the colors and transform are kept)"
+        self.__start = self.__count = 0
+
+    @property
+    def points(self) -> numpy.ndarray :
+        "The points of the trail, from the oldest to the newest, as an (N,2) view of the storage (valid until the next append())"
+        return self.__points[self.__start:self.__start + self.__count]
+
+    @property
+    def colors(self) :
+        """
+        The colors of the trail's points, from the oldest to the newest -- the per-point colors, or the first N colors by age.
+        None when the TrailBuffer has no colors.
+        """
+        if self.__point_colors is not None : return self.__point_colors[self.__start:self.__start + self.__count]
+        if self.__age_colors is not None : return self.__age_colors[:self.__count]
+        return None
+
+    def set_colors(self,colors) -> None :
+        """
+        Sets the colors by age, from the color of the oldest point to the newest, as a list or (capacity,3) array of (r,g,b) values.
+        """
+        colors = numpy.clip(numpy.asarray(_color_rows(colors),dtype=numpy.float64).reshape(-1,3),0,255).astype(numpy.uint8)
+        if len(colors) < self.__capacity : raise ValueError("TrailBuffer.set_colors() needs a color for each of the {0} points".format(self.__capacity))
+        self.__age_colors = colors[:self.__capacity]
+
+    def set_transform(self,scale = 1.0,offset = (0,0)) -> None :
+        """
+        Sets the transform used when the trail is drawn: each point is drawn at point*scale + offset.
+
+        Parameters
+
+        - scale     \t -- Scale, as one value or (scale x,scale y)
+        - offset    \t -- (x,y) added after scaling, i.e. the center of the drawing in the window
+        """
+        scale   = numpy.broadcast_to(numpy.asarray(scale,dtype=numpy.float64),(2,)).copy()
+        offset  = numpy.array([float(offset[0]),float(offset[1])])
+        identity = (scale == 1).all() and (offset == 0).all()
+        self.__scale,self.__offset = (None,None) if identity else (scale,offset)
+
+    @property
+    def transform(self) :
+        "The transform set with set_transform() as a 2x3 affine matrix, or None"
+        if self.__scale is None : return None
+        return numpy.array([[self.__scale[0],0.0,self.__offset[0]],[0.0,self.__scale[1],self.__offset[1]]])
+
+    def _transformed(self) -> numpy.ndarray :
+        "The points with the transform applied, in preallocated storage"
+        if self.__scratch is None : self.__scratch = numpy.empty((self.__capacity,2))
+        out = self.__scratch[:self.__count]
+        numpy.multiply(self.points,self.__scale,out=out)
+        numpy.add(out,self.__offset,out=out)
+        return out
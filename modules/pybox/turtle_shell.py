@@ -0,0 +1,262 @@
+"""
+Pybox Turtle Shell Graphics -- see TurtleShell.
+"""
+
+from __future__ import annotations
+
+from ._core import _pybox
+from .colors import _library_color
+
+class TurtleShell :
+    """
+    TurtleShell operates the same as Turtle Graphics in most ways.  The functions are the same, with some additions for opacities and gradients, as well as other functions.
+    
+    - TurtleShell does not display each segment drawing, showing each segment after it is drawn.  
+    - As with Turtle Graphics, the speed can be set to show each element drawing.
+    
+    - Setting a speed to zero will allow for real-time graphics. 
+    - TurtleShell is meant to be a Turtle Graphics environmemt with some additions to allow more functionality than original turtle graphics.
+    - TurtleShell is a prototype at the moment, and the idea is to bring more functions into it, including GPU-based and 3-D Turtle Graphics.
+    
+    See various examples and documentation on TurtleShell functions for more information.
+    """
+    def __init__(self,_id) : self.id = _id
+    def pen_up(self) -> bool :
+        """
+        Lifts the pen up.  Any actions performed with the pen up will not draw..
+        When the pen is up, no graphics are drawn the the screen, allowing for positioning without graphic output.
+        Use pen_down() to put graphic output to the window (lines, circles, etc.) 
+        """
+        return _pybox.WinTurtleGenBool(self.id,0)
+
+    def pen_down(self) -> bool :
+        """
+        the pen down.  This causes any graphic output function (e.g. circle, forward, etc.) to draw grahics to the screen.
+        the pen is up (e.g. pen_up() function), no graphics are drawn the the screen, allowing for positioning without graphic output.
+        """
+        return _pybox.WinTurtleGenBool(self.id,1)
+
+    def end_fill(self) -> bool :
+        """
+        When a fill is in-progress after starting it with begin_fill(), calling end_fill() fills the area defined by all drawing calls called after begin_fill().
+        See begin_fill() for more information.
+        """
+        return _pybox.WinTurtleGenBool(self.id,3)
+
+    def right(self,angle) -> bool :
+        """
+        Rotates the current heading clockwise (i.e. right) the number of degrees in input angle.
+
+        Angle is in degrees.
+        """
+        return _pybox.WinTurtleGenMixedValue(self.id,0,angle)
+    
+    def left(self,angle) -> bool :
+        """
+        Rotates the current heading counter-clockwise (i.e. left) the number of degrees in input angle.
+
+        Angle is in degrees.
+        """
+        return _pybox.WinTurtleGenMixedValue(self.id,1,angle)
+    
+    def pen_size(self,pen_size) -> bool :
+        """
+        Sets the pen radius size for all drawing operations.  The default is 2 pixels.
+        
+        Example: 
+        
+        pen_size(10) sets the thickness for all drawing functions to a radius of 10 pixels.
+        
+        Input Parameters:
+        
+        - pen_size  \t- New pen radius
+        """
+        return _pybox.WinTurtleGenMixedValue(self.id,2,pen_size)
+    
+    def set_heading(self,heading) -> bool :
+        """
+        Sets the current heading for draw operations (i.e. heading of the turtle).
+
+        Functions such as right(), left(), circle(), etc. adjust the heading accordingly.
+
+        set_heading() sets a specific heading (value is in degrees)
+        
+        Input Parameters:
+        
+        -angle      \t - Angle (in degrees) of new heading.
+        """
+        return _pybox.WinTurtleGenMixedValue(self.id,3,heading)
+    
+    def set_speed(self,speed) -> bool :
+        """
+        Sets the speed of drawing operations.  Unlike classical Turtle Graphics, Turtle Shell currently draws entire elements at a time, such as a line, circle, etc.
+
+        The input value sets the delay between showing drawn values in milliseconds.
+
+        For example, setting speed(20) sets 20ms between showing drawn output.
+
+        Setting speed(.5) sets half a millisecond.
+        
+        - note: speed(0) is a special case and will not show any drawing operations, relying on the program to update the window itself.  
+        - This can be used for real-time drawing, to display the entirety of the results all at one time, not using time to display partial results.
+        - Use window.set_realtime() (or set kw::Realtime() as a keyword when creating a window) to set Realtime() status for a window, for smoother real-time output. 
+        """
+        return _pybox.WinTurtleGenMixedValue(self.id,4,speed)
+    
+    def forward(self,num_pixels) -> bool :
+        """
+        Moves the current location forward at the angle of the current heading, the number of pixels specified.
+        
+        If the pen is down, a line is drawn from the current point to the next point.
+        
+        See pen_up() to move forward without using the pen.
+        
+        Also see: move_to(), which moves directly to a specified point.
+        """
+        return _pybox.WinTurtleGenMixedValue(self.id,5,num_pixels)
+    
+    def begin_fill(self,color,opacity : int = None) -> bool :
+        """
+        Starts a filled area enclosed by subsequent drawing functions.
+        After begin_fill() is called, drawing functions are drawn and remembered.
+        When end_fill() is called, the area enclosed by the drawing functions is filled with the color.
+        the 'color' value sets the color for the fill. This color may jave an opacity, e.g. "red" (full opacity, the same as "red(255)") or "red(128)" (half-transparent)
+
+        Input Parameters
+        
+        - Color         \t - Color to fill the enclosed area when end_fill() is called, e.g. "green", "green(128)", MyColor value, etc.
+        - opacity       \t - [optional] opacity of color.  This can be used to add an opacity to a color if it doesn't already have an opacity value.
+                              \t For example, "red(128)" already has an opacity value of 128.  However, for a calculated color, it can be easier to add an opacity with this parameter.
+        """
+        return _pybox.WinTurtleGenColorValue(self.id,0,_library_color(color),opacity)
+    
+    def set_color(self,color) -> bool :
+        """
+        Sets the color for subsequent drawing operations. 
+        
+        Example:
+        
+        t.forward(100)  # draw 100 pixels in current heading in current color
+        t.color("red")  # Set color to "red"
+        t.forward(100)  # draws 100 pixels in current heading in color "red"
+        
+        ** note: color() and set_color() are the same function
+        """
+        return _pybox.WinTurtleGenColorValue(self.id,1,_library_color(color),0)
+    
+    def color(self,color) -> bool :
+        """
+        Sets the color for subsequent drawing operations. 
+        
+        Example:
+        
+        t.forward(100)  # draw 100 pixels in current heading in current color
+        t.color("red")  # Set color to "red"
+        t.forward(100)  # draws 100 pixels in current heading in color "red"
+        
+        ** note: color() and set_color() are the same function
+        """
+        return _pybox.WinTurtleGenColorValue(self.id,1,_library_color(color),0)
+    
+    def set_pos(self,x : int,y : int) -> bool :
+        """
+        Sets the position of the current pointer (or turtle).
+        
+        The if the pen is down, a line will be drawn from the current position to the new position. The heading will not change.
+        
+        - See set_pos_l() to use a list or array for (x,y) values.
+        - note: move_to() and set_pos() are the same function.
+        
+        Use pen_up() to move to a position without drawing a line. 
+        
+        Input Parameters:
+        
+        - x         \t- x position of new location
+        - y         \t- y position of new location
+        """
+        return _pybox.WinTurtleSetPos(self.id,x,y)
+    
+    def set_pos_l(self,pos : list) -> bool :
+        """
+        Sets the position of the current pointer (or turtle).
+        
+        The if the pen is down, a line will be drawn from the current position to the new position. The heading will not change.
+        
+        - See set_pos() to use individual values for position (i.e. x and y vs. a list)
+        - note: move_to_l() and set_pos_l() are the same function.
+        
+        Use pen_up() to move to a position without drawing a line. 
+        
+        This function is the same as move_to().
+        
+        Input Parameters:
+        
+        - pos         \t- position of new location
+        """
+        return _pybox.WinTurtleSetPos(self.id,pos[0],pos[1])
+    
+    def move_to(self,x : int,y : int) -> bool :
+        """
+        Sets the position of the current pointer (or turtle).
+        
+        The if the pen is down, a line will be drawn from the current position to the new position. The heading will not change.
+        
+        - See move_to_l() to use a list or array for (x,y) values.
+        - note: move_to() and set_pos() are the same function.
+        
+        Use pen_up() to move to a position without drawing a line. 
+        
+        Input Parameters:
+        
+        - x         \t- x position of new location
+        - y         \t- y position of new location
+        """
+        return _pybox.WinTurtleSetPos(self.id,x,y)
+    
+    def move_to_l(self,pos : list) -> bool :
+        """
+        Sets the position of the current pointer (or turtle).
+        
+        The if the pen is down, a line will be drawn from the current position to the new position. The heading will not change.
+        
+        - See move_to() to use individual values for position (i.e. x and y vs. a list)
+        - note: move_to_l() and set_pos_l() are the same function.
+        
+        Use pen_up() to move to a position without drawing a line. 
+        
+        This function is the same as move_to().
+        
+        Input Parameters:
+        
+        - pos         \t- position of new location
+        """
+        return _pybox.WinTurtleSetPos(self.id,pos[0],pos[1])
+    
+    def circle(self,radius,sweep_angle = 360,steps : int = 0) -> bool :
+        """
+        Draws a circle, arc, polygon or polygonal-arc, depending on input values.
+        
+        The heading is change from the current heading to the angle of the output of the circle or last polygonal line.
+        
+        If no Sweep Angle is entered, a full circle is drawn. Otherwise in arc is drawn.
+        
+        The "Steps" value, draws the circle as a polygon with sides equal to the "Steps" value, drawing lines from point to point, rather than a circle.
+
+        Input Parameters:
+        
+        - radius        \t- Radius of Circle (or partial circle/arc)
+        - sweep_angle   \t- Angle to cover in circle (blank is 360, or a full circle)
+        - steps         \t- Number of segments to draw for circle or arc (no value or 0 draws a circle or arc without segment lines)        """
+        return _pybox.WinTurtleCircle(self.id,radius,sweep_angle,steps)
+    
+    def get_heading(self) -> float :
+        """
+        Returns the current heading of the 'turtle'
+        """
+        return _pybox.WinTurtleGetFloat(self.id,0)
+    
+    def get_pos(self) -> list :
+        """
+        Returns the current position of the 'turtle' relative to the center of the window.
+        """
+        return _pybox.WinTurtleGetFloatList(self.id,0)
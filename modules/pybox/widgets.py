@@ -0,0 +1,903 @@
+"""
+Pybox Controls and Widgets -- sliders, buttons, list boxes, combo boxes, input boxes, text widgets, and color selectors.
+"""
+
+from __future__ import annotations
+
+import numpy
+from ._core import RgbColor, _pybox
+from .options import opt
+
+   
+
+
+class Slider :
+    """
+    Pybox Slider Class.  See functions such as NewSlider and DevSlider.
+    """
+    def __init__(self,_id)  : self.id = _id
+    def moved(self)         -> bool :
+        """
+        Returns a True value if the slider has been moved, False if it has not or in subsequent calls until the next event. 
+        Use GetPos() to retreive the current value of the slider.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.SliderMoved(self.id)       
+
+    def get_pos(self)        -> int  :
+        """
+        Returns the current position of the slider based on its range.
+        Use get_pos() for default sliders, and get_pos_f() for floating-pointer sliders
+        (floating-point sliders are created with new_slider_f() and dev_slider_f() forms).
+
+        The default range is (0-100), but this can be set through the Range() option when creating the slider.
+        """ 
+        return _pybox.SliderGetPos(self.id)      
+
+    def get_pos_f(self)        -> int  :
+        """
+        Returns the current position of the floating-pointer slider based on its range.
+        Use get_pos() for default sliders, and get_pos_f() for floating-pointer sliders
+        (floating-point sliders are created with new_slider_f() and dev_slider_f() forms).
+
+        The default range is (0-100), but this can be set through the Range() option when creating the slider.
+        """ 
+        return _pybox.SliderGetPosf(self.id)     
+    
+    def set_pos(self,pos)    -> bool : 
+        """
+        Sets the position of the slider within the slider's range.
+        Use set_pos() for default sliders, and set_pos_f() for floating-pointer sliders
+        (floating-point sliders are created with new_slider_f() and dev_slider_f() forms).
+
+        The default range is (0-100), but this can be set through the Range() option when creating the slider.
+        """
+        return _pybox.SliderSetPos(self.id,pos)  
+
+    def set_pos_f(self,pos)    -> bool : 
+        """
+        Sets the position of the floating-point slider within the slider's range.
+        Use set_pos() for default sliders, and set_pos_f() for floating-pointer sliders
+        (floating-point sliders are created with new_slider_f() and dev_slider_f() forms).
+
+
+        The default range is (0-100), but this can be set through the Range() option when creating the slider.
+        """
+        return _pybox.SliderSetPosf(self.id,pos)  
+
+class Listbox :
+    "Pybox Listbox class.  See function such as NewListbox() or DevListbox()"
+    def __init__(self,_id)   : self.__id = _id
+    def add_item(self,item : str) -> bool :
+        "Adds the text to the listbox as a new item."
+        return _pybox.ListboxAddItem(self.__id,item)
+
+    def item_selected(self,*args) -> bool :
+        """
+        returns True is an item has been selected in the listbox, False if not or in subsequent calls until the next event.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.ListboxItemSelected(self.__id,*args)
+
+    def get_selection(self) -> int :
+        "Returns the positional value of the currently selected item."
+        return _pybox.ListboxGetSelection(self.__id)
+
+    def set_selection(self,selection : int) -> bool :
+        "Sets and highlights the current selection in the listbox"
+        return _pybox.ListboxSetSelection(self.__id,int(selection))
+
+    def get_num_items(self) -> int :
+        "Returns the number of items in the listbox."
+        return _pybox.ListboxGetNumItems(self.__id)
+
+    def clear_list(self) -> bool :
+        "Clears the current listbox."
+        return _pybox.ListboxClearList(self.__id)
+
+    def set_location(self,x, y = None) -> bool :
+        """
+        Sets the window location of the listbox.
+
+        Setlocation(width,height) may be used, as well as a list or tuple: 
+        SetLocation(Location), where location = (width,height)
+
+        """
+        if (isinstance(x,list) or isinstance(x,tuple)) :
+            y = x[1]
+            x = x[0]
+        if y is None: y = 0
+        return _pybox.ListboxSetLocation(self.__id,int(x),int(y))
+
+class Combobox :
+    "Pybox ComboBox functions.  See functions such as NewCombobox or DevCombobox()"
+    def __init__(self,_id)   : self.__id = _id
+
+    def add_item(self,item : str) -> bool :
+        "Adds the text to the combobox as a new item."
+        return _pybox.ComboboxAddItem(self.__id,item)
+    
+    def item_selected(self,*args) -> bool :
+        """
+        returns True is an item has been selected in the combobox, False if not or in subsequent calls until the next event.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """        
+        return _pybox.ComboboxItemSelected(self.__id,*args)
+
+    def get_selection(self) -> int :
+        "Returns the positional value of the currently selected item."
+        return _pybox.ComboboxGetSelection(self.__id)
+
+    def set_selection(self,selection : int) -> bool :
+        "Sets and highlights the current selection in the listbox"
+        return _pybox.ComboboxSetSelection(self.__id,int(selection))
+
+    def get_num_items(self) -> int :
+        "Returns the number of items in the combobox."
+        return _pybox.ComboboxGetNumItems(self.__id)
+
+    def clear_list(self) -> bool :
+        "Clears the current combobox."
+        return _pybox.ComboboxClearList(self.__id)
+
+    def set_location(self,x, y = None) -> bool :
+        """
+        Sets the window location of the combobox.
+
+        Setlocation(width,height) may be used, as well as a list or tuple: 
+        SetLocation(Location), where location = (width,height)
+
+        """
+        if (isinstance(x,list) or isinstance(x,tuple)) :
+            y = x[1]
+            x = x[0]
+        if y is None: y = 0
+        return _pybox.ComboboxSetLocation(self.__id,int(x),int(y))
+
+class InputBox:
+    "Pybox InputBox class.  See functions such as NewInputBox() or DevInputBox()"
+    def __init__(self,_id)   : self.__id = _id
+    def return_pressed(self,peek = None,*args) -> bool :
+        """
+        Returns True if the user pressed Return in the input box False if not or subsequently until the next event.
+
+        Using ReturnPressed() is the best way to determine if a user has signaled end of input to an input box.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.InputBoxReturnPressed(self.__id,peek,*args)
+
+    def get_text(self) -> str :
+        "Returns the text of the current Input box.  Returns an empty string if there is no input."
+        return _pybox.InputBoxGetText(self.__id)
+
+    def get_float(self) -> float : 
+        """
+        Returns the number in the input box as a floating-point value.
+
+        If there is no value in the input box (or it is not a number) 0 is returned. 
+        You can use set_range() or set_range_f() to ensure only numbers are allowed in the input box.
+        """
+        return _pybox.InputBoxGetFloat(self.__id)
+    def get_integer(self) -> int : 
+        """
+        Returns the number in the input box as an integer value.
+
+        If there is no value in the input box (or it is not a number) 0 is returned. 
+        You can use SetRange() or SetRangef() to ensure only numbers are allowed in the input box.
+        """        
+        return _pybox.InputBoxGetInteger(self.__id)
+
+    def set_text(self, text : str) -> bool :
+        """
+        Sets the text in the input box, replacing any current text.
+
+        The input value can be text, a number, or anything that can be converted to text.
+
+        --> Note SetValue() and SetText() are the same function
+        """
+        if not isinstance(text,str) : text = "{}".format(text)
+        return _pybox.InputBoxSetText(self.__id,text)
+    def set_value(self, text : str) -> bool :
+        """
+        Sets the text in the input box, replacing any current text.
+
+        The input value can be text, a number, or anything that can be converted to text.
+
+        --> Note SetValue() and SetText() are the same function
+        """        
+        if not isinstance(text,str) : text = "{}".format(text)
+        return _pybox.InputBoxSetText(self.__id,text)
+    def show(self,show : bool = True) -> bool :
+        "Shows (or Hides) the input box (i.e. makes it appear or disappear entirely)."
+        return _pybox.InputBoxShow(self.__id,show)
+    def hide(self,hide : bool = True) -> bool :
+        "Hides (or Shows) the input box (i.e. makes it appear or disappear entirely)."
+        return _pybox.InputBoxHide(self.__id,hide)
+    def enable(self,enable : bool = True) -> bool :
+        "Enables (or disables) the input box.  When disabled, no input will be allowed into the input box."
+        return _pybox.InputBoxEnable(self.__id,enable)
+    def disable(self,disable : bool = True) -> bool :
+        "Disables (or enables) the input box.  When disabled, no input will be allowed into the input box."
+        return _pybox.InputBoxDisable(self.__id,disable)
+
+    def clear_text(self) -> bool :
+        "Clears all text from the input box."
+        return _pybox.InputBoxClearText(self.__id)
+
+    def mouse_wheel_moved(self,peek = None,*args) -> bool :
+        """
+        returns True of the MouseWheel was moved in the input box, False if not or until the next event.
+
+        The MouseWheel can be used to increase or decrease values in the input box. 
+        See SetMouseWheel() to do this automatically.
+
+        See GetMouseWheelValue() to get the value, which is a positive integer (ususally -1 or 1) to determine the direction.
+        If the mousewheel is moved quickly, 2 or 3 (or -2,-3) may be returned to reflect the speed of mousewheel movement.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.InputBoxMouseWheelMoved(self.__id,peek,*args)
+
+    def get_mouse_wheel_value(self) -> int :
+        """
+        Returns the value of the last mouse wheel movement (-1 or 1 usually).  See mouse_wheel_moved() to check when the event occurs.
+
+        This returns the results of the last event and will return the same value until a new event occurs. 
+
+        Usually the value is -1 or 1 to indicate direction, and can be higher (such as -2 or 2) to reflect a mousewheel that has moved very quickly.
+
+        This value can be used to multiply against an increase or decrease in value, such as:
+
+        if MyInputBox.MouseWheelMoved() : MyValue += Increment*GetMouseWheelValue() 
+        """
+        return _pybox.InputBoxGetMouseWheelValue(self.__id)
+
+    def set_mouse_wheel(self,add,sub = None,min = None,max = None) -> bool :
+        """
+        Sets the mousewheel to automatically increase & decrease the value entered in the input box. 
+
+        --> This also sets the values for an arrowbox() when placed to the right of the input box.  See add_arrow_box() for more information
+
+        add = number to add when the mousewhwwl is moved in the positive direction.
+        sub = number to add when the mousewheel is moved in the negative direction (note: this must be a NEGATIVE value, as it is the value subtracted)
+        min,max = minimum and maximum values 
+
+        Example: InputBox.set_mouse_wheel(1,-1,-10,10)
+            This sets the mousewheel to subtract 1 (i.e. add -1) and add 1 on mousewheel movement with a minimum value of -10 and maximum value of 10
+
+        Integer and Float values can be used. To ensure floating point, you can cast to a float() value, such as:
+            InputBox.SetMouseWheel(float(1),-1,-10,10)
+            note: only one float value is required - any float value converts the input box to a floating-point input box.
+
+        floating-point example: InputBox.set_mouse_wheel(1.5,-1.5,10,10) 
+
+        See: set_mouse_wheel_f() to specifically set floating-point values
+        """
+        _pybox.InputBoxSetMouseWheel(self.__id,add,sub,min,max)
+
+    def set_mouse_wheel_f(self,add,sub = None,min = None,max = None) -> bool :
+        """
+        Sets the mousewheel to automatically increase & decrease the value entered in the input box, setting the input box to a floating-point box, even
+        when integer values are used in the function call. 
+
+        --> This also sets the values for an arrowbox() when placed to the right of the input box.  See add_arrow_box() for more information
+
+        add = number to add when the mousewhwwl is moved in the positive direction.
+        sub = number to add when the mousewheel is moved in the negative direction (note: this must be a NEGATIVE value, as it is the value subtracted)
+        min,max = minimum and maximum values 
+
+        Example: InputBox.set_mouse_wheel_f(1,-1,-10,10)
+            This sets the mousewheel to subtract 1 (i.e. add -1) and add 1 on mousewheel movement with a minimum value of -10 and maximum value of 10, but 
+            also allows floating-point values to be entered manually.
+
+        Example: InputBox.set_mouse_wheel_f(1.5,-1.5,10,10) 
+
+        See: set_mouse_wheel() to use integer or floating point values.
+        """        
+        _pybox.InputBoxSetMouseWheel(self.__id,float(add),sub,min,max)
+
+    def set_range(self,min = None,max = None) -> bool :
+        """
+        Sets the range of the input box
+
+        If any floating-point valued are used, this sets the status of the input box to an integer input box.
+        Otherwise, it allows floating-point values. 
+
+        See: set_range_f() to explicitly set floating-point values, even if integer values are used in the function call. 
+
+        Example: InputBox.SetRange(-100,100)
+
+        To specify floating-point, only one floating-point value needs to be used.
+
+        Example: InputBox.set_range(float(-100),100)
+        Example: InputBox.set_range(-100.0,100)
+        Example: InputBox.set_range(-50.5,50.5)
+        """
+        _pybox.InputBoxSetRange(self.__id,min,max)
+
+    def set_range_f(self,min = None,max = None) -> bool :
+        """
+        Sets the range of the input box, setting the input box as a floating-point box so that floating-point values
+        can be also typed in manually.
+
+
+        See: set_range() to set either integer or float, depending on the type of input values used for the function.
+
+        Example: InputBox.set_range_f(-100,100)
+        Example: InputBox.set_range_f(float(-100),100)
+        Example: InputBox.set_range_f(-100.0,100)
+        Example: InputBox.set_range_f(-50.5,50.5)
+
+        All of the above functions set the input box as a floating-point input box.
+        """
+        _pybox.InputBoxSetRange(self.__id,float(min),float(max))
+
+    def set_min(self,_min) -> bool :
+        """
+        Sets the minimum value of the input box.  
+
+        When a minimum is set, there can be no maximum.
+
+        If a floating-point value is used, the input box is set to a floating-point box, otherwise it is set to an Integer box.
+
+        Use set_minf() to explicitly set a floating-point value regardless of input type to the function:
+
+        See: SetRange() to set the minimum and maximum values together.
+
+        Examples:
+            set_min(-10) -> Set minimum to -10
+            set_min(float(-10) -> set minimum to -10, but as floating-point
+            set_min(-10.0)   -> Set minimum to -10 as floating-point
+            set_min(-10.5)   -> Set minimum to -10.5 as floating-point
+
+        """
+        _pybox.InputBoxSetMin(self.__id,_min)
+
+    def set_max(self,_max) -> bool :
+        """
+        Sets the maximum value of the input box.  
+
+        When a maximum is set, there can be no minimum.
+
+        See: SetRange() to set the minimum and maximum values together.
+
+        If a floating-point value is used, the input box is set to a floating-point box, otherwise it is set to an Integer box.
+
+        Use set_maxf() to explicitly set a floating-point value regardless of input type to the function:
+
+        Examples:
+            set_max(10) -> Set maximum to 10
+            set_max(float(10) -> set maximum to 10, but as floating-point
+            set_max(10.0)   -> Set maximum to 10 as floating-point
+            set_max(10.5)   -> Set maximum to 10.5 as floating-point
+
+        """        
+        _pybox.InputBoxSetMax(self.__id,_max)
+
+    def set_min_f(self,min) -> bool :
+        """
+        Sets the minimum value of the input box, setting the box as a floating-point box regardless of the min value type..  
+
+        When a minimum is set, there can be no maximum.
+
+        If a floating-point value is used, the input box is set to a floating-point box, otherwise it is set to an Integer box.
+
+        Use set_min() to set an integer or float minimum, depending on the type of the min value.
+
+        See: set_range() to set the minimum and maximum values together.
+
+        Examples:
+            set_min_f(-10) -> Set minimum to -10
+            set_min_f(-10.0)   -> Set minimum to -10 
+            set_min_f(-10.5)   -> Set minimum to -10.5
+
+        """ 
+        _pybox.InputBoxSetMin(self.__id,float(min))
+
+    def set_max_f(self,max) -> bool :
+        """
+        Sets the maximum value of the input box.  
+
+        When a maximum is set, there can be no minimum.
+
+        See: set_range() to set the minimum and maximum values together.
+
+        If a floating-point value is used, the input box is set to a floating-point box, otherwise it is set to an Integer box.
+
+        Use set_max() to set an integer or float maximum, depending on the type of the min value.
+
+        Examples:
+            set_max_f(10) -> Set maximum to 10
+            set_max_f(float(10) -> set maximum to 10, but as floating-point
+            set_max_f(10.0)   -> Set maximum to 10 as floating-point
+            set_max_f(10.5)   -> Set maximum to 10.5 as floating-point
+
+        """                
+        _pybox.InputBoxSetMax(self.__id,float(max))
+    
+    def add_arrowbox(self) -> bool :
+        """
+        Adds an arrow box to the right of the input box with an UP and DOWN arrow button.
+
+        When these buttons are pressed, the value in the input box is moved up and down depending on the add & subtraction value set for the input box.
+
+        The default values are 1 and -1. 
+
+        Use set_mouse_wheel() to change the up/down values, as they pair with the MouseWheel values.
+        """
+        return _pybox.InputBoxAddArrowBox(self.__id)
+
+class Button:
+    """
+    Pybox Button Class.  See functions such as NewButton(), NewCheckbox(), DevButton(), and DevCheckbox()
+
+    Pybox Button Class covers a range of button types: Buttons, Checkboxes, and Radiobuttons
+
+    Typically RadioButtons are accessed through a ButtonGroup() since there are always more than Radio Buttons at a time. 
+    Buttons and Checkboxes can also be in a Button Group for easier access, but are usually access by their individual object names.
+    """
+    def __init__(self,_id)   : self.__id = _id
+    def pressed(self,peek = None) -> bool : 
+        """
+        Returns true of the button has been pressed.  Returns false afterwards until pressed again (i.e. this is an event)
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.ButtonPressed(self.__id)
+
+    def unpressed(self,peek = None) -> bool : 
+        """
+        Returns true of the button has been unpressed.  Returns false afterwards until unpressed again (i.e. this is an event)
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.ButtonUnpressed(self.__id)
+
+    def checked(self) -> bool : 
+        """
+        Returns true of the checkbox is currently checked.  False if it is not checked or until next event occurs.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.ButtonChecked(self.__id)
+
+    def show(self,show : bool = True) -> bool :
+        "Shows (or hides) the button (i.e. appears or disappears from view altogether)"
+        return _pybox.ButtonShow(self.__id,show)
+
+    def hide(self,hide : bool = True) -> bool :
+        "Hides (or dhows) the button (i.e. appears or disappears from view altogether)"
+        return _pybox.ButtonShow(self.__id,not hide)
+
+    def set_text(self,text : str) -> bool :
+        "Sets the text of the button.  The size of the button will change in relation to the next text unless the Width was explicitly set on button creation."
+        return _pybox.ButtonSetText(self.__id,text)
+
+    def set_location(self,x, y = None) -> bool :
+        """
+        Sets the window location of the button.
+
+        set_location(width,height) may be used, as well as a list or tuple: 
+        set_location(Location), where location = (width,height)
+        """
+        if (isinstance(x,list) or isinstance(x,tuple)) :
+            y = x[1]
+            x = x[0]
+        if y is None: y = 0
+        return _pybox.ButtonSetLocation(self.__id,int(x),int(y))
+
+    def set_location_l(self,pos : list) -> bool :
+        """
+        Sets the window location of the button from a list, tuple, or array. i.e. SetLocationL((x,y)) 
+        """
+        return _pybox.ButtonSetLocation(self.__id,int(pos[0]),int(pos[1]))
+
+class RadioButtonGroup:
+    """ 
+    Pybox Radio Button Group Class.  See functions such as NewRadioButtons() or DevRadioButtons()
+
+    A Radio Button Group contains multiple Radiop Buttons so that they do not need to be tracked, created or 
+    stored independently.
+
+    With a Radio Button Group you can specify the radio button by position (i.e. order created) and manage them all in one group.
+
+    Example:    if (radiobotton.pressed) : buttonpressed = radiobutton.GetCheckedButton()
+    
+    checks if any of the radio buttons were pressed. If so, then button pressed is assigned to the button that was pressed.
+    """
+    def __init__(self,_id)   : self.id = _id
+
+    def pressed(self,peek = None) -> bool : 
+        """
+        Returns true of a button in the button group was pressed.  Returns false afterwards until pressed again (i.e. this is an event)
+        
+        Use GetCheckedButton() to get the index of the button pressed
+            example: PressedButton = MyRadioButtons.GetCheckedButton())
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox._ButtonGroupPressed(self.id,peek)
+
+    def get_checked_button(self) -> int :
+        "Returns the zero-based index of the currently checked (i.e. highlighted) radio button."
+        return _pybox._ButtonGroupGetChecked(self.id)
+
+    def get_checked_button_text(self) -> str :
+        "Returns the ascii-text name of the currently highlighted radio button."
+        return _pybox._ButtonGroupGetCheckedText(self.id)
+
+    def get_button_text(self,id) -> str:
+        "Returns the ascii-text name of the currently highlighted radio button. The ID is the zero-based index of the radio button."
+        return _pybox._ButtonGroupGetText(self.id,id)
+
+class CTextWidget :
+    """
+    Sagebox Widget Class. Provides a Text Widget for a window. See functions such as NewTextWidget() or DevText()
+
+    Sagebox widgets are peristent text boxes on the screen.  They are usually transparent (i.e. only the text displays, but not
+    the background) and blend in with the window.  
+
+    As opposed to using the Window.Write() function, When output is put to the window or the window changes, the text widget remains.
+
+    For a single-text item, you can use Text Widgets in a fire-and-forget fashion (i.e. you don't need to keep the returned object).
+
+    For text that can change or to hide/show the widget, you can keep the object and use the Write() function. 
+
+    """
+    def __init__(self,_id) : self.__id = _id
+
+    def write(self,text : str,*args,**kwargs) : 
+        """
+        Writes text to the widget.
+
+        Text text is written to the widget based on the widget settings, such as centered or right-justified text. 
+        The text is written in the color, background color, and font specified when the widget was created, unless options
+        are added to the write function call.
+
+        As with window.write, different fonts and colors may be used and mixed with the text. 
+
+        Example:    widget.write("This is the widget text)
+                    widget.write("This is the {r}widget{} text")    -> Writes the word "widget" in read
+                    widget.write(f"This is count #{count})          -> Writes the variable <count> with the string
+                    widget.write(f"This is count #{{g}}{count}")    -> Writes the variable count in green
+                    widget.write(f"{{10}}This is count #{{}}{{g}}{count}")
+                        --> this writes the text "This is count" in a smaller font sized 10, with Count in the text widgets default font to look bigger.
+
+            Note: In formatted strings an extra "{" and "}" must be used to specify controls, i.e. {r} becomes {{r}} and {} becomes {{}}.  This allows
+            the passing of control items through Python formatted strings.
+
+           Available Embedded controls in the text:
+
+           - {<color>}      -> Sets a text color, i.e. {r} or {red}, {blue} or {b}, {forestgreen}, <defined color with MakeColor())>
+                                Example: "this {r}string{} is in the color red"
+            - {fontsize}    -> Sets a font size
+                                Example: "this {20}string{} is written in size 20 font"
+                                note:  The text widget must be created with the largest fonts size needed.
+            - {x=<value>}   -> Sets the write position.
+                                Example: "Value: {x=50}is at location 50"
+
+            A limited set of pybox options and/or keywords can also be used, such as opt.bgcolor,opt.font, etc. 
+            See Window.write() for more information about options.  Typically, fgColor(), bgColor(), font() can be used rather then using the {} formatting.          
+        """
+        return _pybox.TextWidgetWrite(self.__id,text,*args,**kwargs)
+
+class _ColorSelector :
+    """    
+    Color Selector widget, either in the current window or as a popup window. 
+        
+    With the color selector, you can select an RGB color using the wheel or input boxes next to the wheel itself. 
+    A color rectangle is shown with the currently selected color.
+        
+    color_selector returns a _ColorSelector object which can be used to look at changes in the color wheel in the window's main event loop. 
+        
+    See the _ColorSelector object functions for more information.
+        
+    Parameters:
+        
+    - at          \t - Where to put the Color Selector (in the window or as a popup).  If this is not used, the Color Selector is placed automatically.
+
+    Keywords usable when creating the Color Selector:
+
+    - Popup         \t - When true (i.e. Popup=True), the window pops up as a separate window.  Otherwise, it is placed in the current window at the location specified
+    - Title         \t - Sets a title displayed in the window's top bar area, such as title="This is the window title".  Otherwise a default title is used.
+    - x,y           \t - 'x' and 'y' keywords can be used in place of using the 'at' parameter, i.e. x=500, y=200 instead of (500,200) or at=(500,200)
+  
+    examples:\t - color_sel = mywin.color_selector(at=(500,200),popup=True)     --> Opens a Color Selector window as an individual window on the screen at x=500 and y=200
+    - color_sel = mywin.color_selector(at=(500,200))     --> Opens a Color Selector window inside the window 'mywin, at window location x=500 and y=200
+    - color_sel = pybox.color_selector(at=500,200)  --> Opens the same type of window, but as a pybox function without a parent window.
+        
+    - while mywin.wait_event() : if (color_sel.value_changed()) print("Color value = ",color_sel.get_rgb_value()) --> prints values as the wheel is moved.
+    """
+    def __init__(self,_id) : self.__id = _id
+    
+    def value_changed(self,**kwargs) -> bool :
+        """
+        Returns true of the value has changed since the last time called (i.e. the Mouse Wheel was moved, or a value entered in the input boxes)
+      
+        Useful Keywords:
+        
+        - Peek         \t - When true (i.e. Peek=True), the 'value changed' status is not reset and will always read 'true' (when a change has occurred) until a call occurs without the 'Peek' keyword set to True
+        
+        example: if color_sel.value_changed() : new_color = color_sel.get_rgb_value();
+        """
+        return _pybox.ColorSelector_ValueChanged(self.__id,**kwargs)
+    
+    def get_rgb_value(self) -> RgbColor :
+        """
+        Returns the current selected color in the Color Selector as an RgbColor value. 
+        
+        This can be used after checking for a value change, such as: 
+        
+        \t -if color_sel.value_changed() : new_color = color_sel.get_rgb_value();
+        
+        - See: get_array_value() to return the value as a numpy integer array rather than an RgbColor value. 
+        """
+        value = _pybox.ColorSelector_GetRGBValue(self.__id);
+        return RgbColor(value[0],value[1],value[2]);   
+
+    def get_array_value(self) -> numpy.ndarray :
+        """
+        Returns the currently selected color in the Color Selector as an numpy integer array. 
+        
+        This can be used after checking for a value change, such as: 
+        
+        \t -if color_sel.value_changed() : new_color = color_sel.get_array_value();
+        
+        - See: get_rgb_value() to return the value as an RgbColor value rather than a numpy integer array. 
+        """
+        value = _pybox.ColorSelector_GetRGBValue(self.__id);
+        return numpy.array(value);
+
+    def set_rgb_value(self,RgbValue) -> bool :
+        """
+        Sets the RGB value of the currently color selection in the Color Selector.
+        
+        When set_rgb_value() sets an RGB value, the color wheel, input boxes, and color rectangle in the Color Selector Window will change accordingly.
+        
+        - Color values may be RgbColor values, lists, tuples, or numpy arrays with 3 values representing red, green and blue (from 0-255)
+        
+        Examples:\t - color_sel.set_rgb_value((0,255,0)) --> Set Green
+        - color_sel.set_rgb_value(PanColor.ForestGreen()) --> Set forestgreen  (example used with previous "from pybox import PanColor")
+        """
+        return _pybox.ColorSelector_SetRGBValue(self.__id,RgbValue);
+
+    def set_location(self,at = None,**kwargs) -> bool :
+        """
+        Set the physical location of the Color Selector. 
+        
+        When the Color Selector window is a popup, this sets the popup window to the coordinates given.
+        When the Color Selector window is embedded in the window, the location will be set within the window.
+        
+        Examples:\t - color_sel.SetLocation((500,200))
+        - color_sel.SetLocation(x=500,y=200)
+        """
+        return _pybox.ColorSelector_SetLocation(self.__id,opt.at(at),**kwargs);
+
+    def show(self,show : bool = True) -> bool :
+        """
+        Shows (or Hides) the Color Selector. 
+        
+        If the Color Selector is hidden from view, Show() will re-show the window. 
+        
+        If the Color Selector is a popup window, the entire window disappears.
+        If the Color Selected is not a popup window, the color selector disappears from the window until shown again.
+        
+        - The 'show' parameter may be set to 'False' (i.e. color_sel.show(False) to reverse the command and hide the window instead)
+        """
+        return _pybox.ColorSelector_Show(self.__id,show);
+
+    def hide(self,hide : bool = True) -> bool :
+        """
+        Hides (or Shows) the Color Selector. 
+        
+        If the Color Selector is visible, Hide() will hide it from view.
+        
+        If the Color Selector is a popup window, the entire window reappear.
+        If the Color Selected is not a popup window, the color selector resappears embedded in the window in its current/previous location
+        
+        - The 'hide' parameter may be set to 'True' (i.e. color_sel.show(True) to reverse the command and show the window instead)
+        """
+        return _pybox.ColorSelector_Hide(self.__id,hide);
+
+    def ok_pressed(self,**kwargs) -> bool :
+        """
+        Returns True if the OK button was pressed (popup-window mode only). 
+        
+        This can be used in an event-loop to determine when the OK button is pressed vs. the Cancel button or a general window closure.
+        
+        - Also see: cancel_pressed() and window_closed() 
+        
+        Useful Keywords:
+        
+        - Peek         \t - When true (i.e. Peek=True), the 'ok_pressed' status is not reset and will always read 'True' (when a change has occurred) until a call occurs without the 'Peek' keyword set to True
+        
+        Example: if color_sel.ok_pressed() : print("Ok button was pressed")
+        
+        """
+        return _pybox.ColorSelector_OkPressed(self.__id,**kwargs);
+
+    def cancel_pressed(self,**kwargs) -> bool :
+        """
+        Returns True if the Cancel button was pressed (popup-window mode only). 
+        
+        This can be used in an event-loop to determine when the Cancel button is pressed or the Window was closed (by presing the upper-right 'x' button, or ALT-F4).
+        
+        - Also see: ok_pressed() and window_closed()
+        - note: cancel_pressed() can be used to check when the window is closed by pressing Alt-F4 or by using the 'X' button (in the upper-right).\
+ In this case, a cancel is issued to the window, resulting in cancel_pressed() returning true as the window is closed.
+        
+        Useful Keywords:
+        
+        - Peek         \t - When true (i.e. Peek=True), the 'ok_pressed' status is not reset and will always read 'True' (when a change has occurred) until a call occurs without the 'Peek' keyword set to True
+        
+        Example: if color_sel.cancel_pressed() : print("Cancel button was pressed or Window was closed.")
+        
+        """
+        return _pybox.ColorSelector_CancelPressed(self.__id,**kwargs);
+
+    def window_closed(self,**kwargs) -> bool :
+        """
+        Returns True if the Window was closed (popup-window mode only). 
+        
+        This can be used in an event-loop to determine if the window was closed by the user.  When window_closed() returns True, this means the window was closed \
+without pressing any of the buttons, representing a cancel button press at the same time.
+        
+        - Also see: ok_pressed() and cancel_pressed()
+        - note: cancel_pressed() can be used to check when the window is closed by pressing Alt-F4 or by using the 'X' button (in the upper-right).\
+ In this case, a cancel is issued to the window, resulting in cancel_pressed() returning true as the window is closed.
+        
+        Useful Keywords:
+        
+        - Peek         \t - When true (i.e. Peek=True), the 'ok_pressed' status is not reset and will always read 'True' (when a change has occurred) until a call occurs without the 'Peek' keyword set to True
+        
+        Example: if color_sel.window_closed() : print("Window was closed by the user.")
+        
+        """
+        return _pybox.ColorSelector_WindowClosed(self.__id,**kwargs);
+
+    def disable_close(self,disable : bool = True) -> bool :
+        """
+        This disables the ability to close the Color Selector Window (popup-window mode only) by pressing ALT-F4 or pressing the 'X' close button in the upper-right of the window.
+        
+        By default, the user can close the window by pressing the ALT-F4 or upper-right 'X' button.
+        
+        - The window can be restored by using the Show() function if it is closed by the user.
+        - When closed by the user without pressing the Ok or Cancel button, a window_closed() and cancel_pressed() will both return True
+        - When close is disabled, no actions are taken when the user attempts to close the window and the window remains open
+        - use diable_close(False) to re-enable the ability for the user to close the window manually.
+        """
+        return _pybox.ColorSelector_DisableClose(self.__id,disable);
+
+class _ColorWheel :
+    """    
+    Color Wheel widget, put into the existing window as a single color wheel with no other controls but the wheel itself. 
+        
+    With the color selector, you can select an RGB color using the wheel or input boxes next to the wheel itself. 
+    A color rectangle is shown with the currently selected color.
+        
+    color_wheel returns a _ColorWheel object which can be used to look at changes in the color wheel in the window's main event loop. 
+        
+    See the _ColorWheel object functions for more information.
+        
+    Parameters:
+        
+    - at          \t - Where to put the Color Selector (in the window or as a popup).  If this is not used, the Color Selector is placed automatically.
+
+    Keywords usable when creating the Color Selector:
+
+    - x,y           \t - 'x' and 'y' keywords can be used in place of using the 'at' parameter, i.e. x=500, y=200 instead of (500,200) or at=(500,200)
+  
+    example:\t - color_wheel = mywin.color_wheel((500,200))     --> Opens a Color Wheel window in the window at (500,200)
+        
+    - while mywin.wait_event() : if (color_wheel.value_changed()) print("Color value = ",color_wheel.get_rgb_value()) --> prints values as the wheel is moved.
+    """
+    def __init__(self,_id) : self.__id = _id
+    
+    def value_changed(self,**kwargs) -> bool :
+        """
+        Returns true of the value has changed since the last time called (i.e. the Mouse Wheel was moved, or a value entered in the input boxes)
+      
+        Useful Keywords:
+        
+        - Peek         \t - When true (i.e. Peek=True), the 'value changed' status is not reset and will always read 'true' (when a change has occurred) until a call occurs without the 'Peek' keyword set to True
+        
+        example: if color_wheel.value_changed() : new_color = color_wheel.get_rgb_value();
+        """
+        return _pybox.ColorWheel_ValueChanged(self.__id,**kwargs)
+    
+    def get_rgb_value(self) -> RgbColor :
+        """
+        Returns the currently selected color in the Color Wheel as an RgbColor value. 
+        
+        This can be used after checking for a value change, such as: 
+        
+        \t -if color_wheel.value_changed() : new_color = color_wheel.get_rgb_value();
+        
+        - See: get_array_value() to return the value as a numpy integer array rather than an RgbColor value. 
+        """
+        value = _pybox.ColorWheel_GetRGBValue(self.__id);
+        return RgbColor(value[0],value[1],value[2]);   
+
+    def get_array_value(self) -> numpy.ndarray :
+        """
+        Returns the currently selected color in the Color Wheel as an numpy integer array. 
+        
+        This can be used after checking for a value change, such as: 
+        
+        \t -if color_wheel.value_changed() : new_color = color_wheel.get_array_value();
+        
+        - See: get_rgb_value() to return the value as an RgbColor value rather than a numpy integer array. 
+        """
+        value = _pybox.ColorWheel_GetRGBValue(self.__id);
+        return numpy.array(value);
+
+    def set_rgb_value(self,RgbValue) -> bool :
+        """
+        Sets the RGB value of the current color selection in the Color Wheel.
+                
+        - Color values may be RgbColor values, lists, tuples, or numpy arrays with 3 values representing red, green and blue (from 0-255)
+        
+        Examples:\t - color_wheel.set_rgb_value((0,255,0)) --> Set Green
+        - color_wheel.set_rgb_value(PanColor.ForestGreen()) --> Set forestgreen  (example used with previous "from pybox import PanColor")
+        """
+        return _pybox.ColorWheel_SetRGBValue(self.__id,RgbValue);
+
+    def set_location(self,at = None,**kwargs) -> bool :
+        """
+        Set the physical location of the Color Wheel. 
+        
+        Examples:\t - color_wheel.SetLocation((500,200))
+        - color_wheel.SetLocation(x=500,y=200)
+        """
+        return _pybox.ColorWheel_SetLocation(self.__id,opt.at(at),**kwargs);
+
+    def show(self,show : bool = True) -> bool :
+        """
+        Shows (or Hides) the Color Wheel. 
+        
+        If the Color Wheel is hidden from view, Show() will re-show the Color Selector. 
+        
+        - The 'show' parameter may be set to 'False' (i.e. color_sel.show(False) to reverse the command and hide the Color Wheel instead)
+        """
+        return _pybox.ColorWheel_Show(self.__id,show);
+
+    def hide(self,hide : bool = True) -> bool :
+        """
+        Hides (or Shows) the Color Wheel. 
+        
+        If the Color Wheel is visible, Hide() will hide it from view.
+        
+        - The 'hide' parameter may be set to 'True' (i.e. color_sel.show(True) to reverse the command and show the Color Wheel instead)
+        """
+        return _pybox.ColorWheel_Hide(self.__id,hide);
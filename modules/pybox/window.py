@@ -0,0 +1,2269 @@
+"""
+Pybox Window -- the Window class and new_window().
+"""
+
+from __future__ import annotations
+
+import numpy
+from ._core import _pybox
+from .colors import _library_color
+from .options import opt
+
+def _display_array(image : numpy.ndarray,args : tuple,kwargs : dict) :
+    "Converts a numpy image for display_bitmap() -- see pybox.convert_bitmap()"
+
+    # uint8 [3] and [4] arrays with packed pixels (i.e. from a BitmapPool) are displayed as they are, without a conversion
+
+    if image.dtype == numpy.uint8 and image.ndim == 3 and image.shape[2] in (3,4) and image.strides[1:] == (image.shape[2],1) : return image,kwargs
+    from .bitmap_convert import _for_display
+    return _for_display(image,args,kwargs)
+
+class _DrawAttribute :
+    """
+    Creates a window's 'draw' object (see pybox.draw) on first use and stores it in the window, so the drawing functions are
+    only imported by programs that draw.
+    """
+    def __get__(self,window,owner) :
+        if window is None : return self
+        from .draw import _WinDraw
+        draw = window.__dict__["draw"] = _WinDraw(window)
+        return draw
+
+class Window :
+    """
+    Pybox Window Class
+
+    With a Pybox window you can do many things.  A Pybox window is basically a simple window that acts as a canvas where you
+    can draw items, place text in different colors and fonts.  You can also place and use controls. 
+
+    You can open as many Windows as you want, as well as create child windows inside of the window itself.
+    """
+    draw = _DrawAttribute()
+
+    def __init__(self,_id : int) : 
+        self.__id           = _id
+        #self.__pointer      = _pybox.WindowGetWindowPointer(_id)
+        self.__frame_stats  = None
+        self.__dirty        = None              # the DirtyRect -- see enable_dirty_tracking()
+        self.__cls_groups   = ()                # the draw groups drawn in the cls() bitmap by display_draw_groups()
+        self.console        = self.__WinConsole(self)
+
+    class __WinConsole :
+        """
+        """
+        def __init__(self, outer): self.__id = outer._Window__id
+
+        def get_integer(self,text = None,*args,**kwargs) -> int :
+            """
+            """
+            return _pybox.WinConsoleGetNumber(self.__id,text,*args,**kwargs)
+        def get_float(self,text = None,*args,**kwargs) -> float :
+            """
+            """
+            return _pybox.WinConsoleGetFloat(self.__id,text,*args,**kwargs)
+           
+          
+        
+
+    #
+    # Main Window Class Functions
+    #
+
+    def exit_button(self,text : str = None) -> bool : 
+        """
+        exit_button() puts a button at the bottom of the window and waits for the user to press it or the Return Key.
+    
+        exit_button() is quick way to let the user know that the program has ended.
+
+        See pybox.exit_button() to bring up an exit button in a separate window with a message.
+        Parameters
+
+        - text       \t -- [optional].  Message to put in the window above the button.  If not specified, a default "program is finished" message is place in the window.
+
+        About exit_button() and Displays using Windows and Graphics
+
+        The exit_button() gives a way to pause the program before it ends so that the Windows and Graphics displaying don't suddenly disappear. 
+
+        Whether Python, C++, or other languages, the Console Window is not part of the running application.  It is a separate application to which the running program is a client.
+        When the program closes down, this other application (a separate process entirely) simply lets you know the program has ended.
+
+        When windows and graphics are displayed in your program, and the program ends, it all disappears suddenly.  In a program with a Console Mode box, this will show a "program has ended"
+        message in the box.  In a Windows application, the program will just "disappear"
+
+        You can use exit_button() as a nice, quick method to pause and let the user know the program is ending in a GUI/graphical method.
+    
+        """
+        return _pybox.WindowExitButton(self.__id,text)
+
+    def set_write_indent(self,indent) -> bool :
+        """
+        Sets the horizontal Write Indent when writing to the window.
+
+        When set to a value, every newline (\n) will set the write position to the next line at the indent given.
+        This function can be useful when writing multiple lines of text indented into the window.
+
+        For example,
+
+        \t -MyWindow.set_write_indent(20)
+
+        will set all new lines at position 20. 
+
+        Use set_write_indent(0) to reset the indent. 
+
+        """
+        return _pybox.WindowSetWriteIndent(self.__id,indent)
+
+    def set_write_padding(self,padding) -> bool :    
+        """
+        Sets the vertical padding between lines (i.e. "\n") when writing to the window.
+
+        The default setting is to start a new line a position in the next line just underneath the last line, based on the size of the font.
+
+        When the write padding is a non-zero value, this value is added to each line.
+
+        For example,
+
+        \t -MyWindow.set_write_padding(5)
+
+        will add 5 extra pixels for every newline on top of the size of the font.
+
+        Use set_write_padding(0) to reset the vertical write padding.
+        """
+        return _pybox.WindowSetWritePadding(self.__id,padding)
+
+ 
+
+    def set_write_pos(self,x,y) -> bool :
+        """
+        See set_write_pos_l() to use a list, tuple, or array to set the write position. 
+
+        Sets the next write position in the window when using the Window.write() function.
+
+        For example,
+
+        \t -MyWindow.set_write_pos(50,100)
+
+        will cause the next Window.Write() output to start at (50,100). 
+
+        Note: the next newline ("\n") seen will reset the horizontal value to the beginning of the line or current Indent setting.
+
+        See set_write_indent() to sent an indent.  For example, set_write_indent(50) would set each newline column to 50.
+        """
+        return _pybox.WindowSetWritePos(self.__id,int(x),int(y))     
+
+    def set_write_pos_l(self,at : list) -> bool :
+        """
+        See set_write_pos() to use independent values to set the write position instead of a list, tuple, or array to set the write position. 
+
+        Sets the next write position in the window when using the Window.write() function.
+
+        For example,
+
+        \t -MyWindow.set_write_pos_l((50,100))
+
+        will cause the next Window.Write() output to start at (50,100). 
+
+        Note: the next newline ("\n") seen will reset the horizontal value to the beginning of the line or current Indent setting.
+
+        See set_write_indent() to sent an indent.  For example, set_write_indent(50) would set each newline column to 50.
+        """        
+        return _pybox.WindowSetWritePos(self.__id,int(at[0]),int(at[1]))
+    
+    def set_write_pos_x(self,x) -> bool :
+        """
+        Sets the next horizontal write position while keeping the current vertical write position.
+
+        After using set_write_pos_x(), the next output from Window.write() will be at this horizonal position (at the same current vertical position).
+        """
+        return _pybox.WindowSetWritePosX(self.__id,int(x))
+
+    def set_bg_color(self,color) -> bool :
+        """
+        Sets the background color of the window.  This will set the next text to display at the color specified.
+
+        See Cls() to clear and change the entire background.
+        After using set_bg_color(), the next cls() will clear the background to this color, unless a clsbitmap() has been set.
+
+        Note: The Window must be set as Opaque.  Otherwise the set_bg_color will not have an effect until a cls() is used.
+        
+        Parameters
+
+        - color         \t -- Background color to set next text output 
+        
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+        Window.set_bg_color("red")                      \t -- Sets the window's background color to the color red
+        Window.set_bg_color(SageColor.Red())            \t -- Sets the window's background color to red, also
+        Window.set_bg_color(PanColor.ForestGreen())     \t -- Sets the window's background color to PanColor.ForestGreen
+        Window.set_bg_color(MyColor)                    \t -- Sets the window's background color to a defined "MyColor", such as MyColor = pybox.RgbColor(0,255,0)
+        """
+        return _pybox.WindowSetBgColor(self.__id,_library_color(color))
+
+    def set_fg_color(self,color) -> bool :
+        """
+        Sets the foreground/text color of the text written to the window.
+
+        This only affects subsequent text written to the window with the write() or other window write functions.
+        This will not affect any current display on the window
+       
+        Note: set_fg_color() and set_text_color() are the same function.
+        
+        Parameters
+
+        - color         \t -- Foreground/Text color to set next output 
+        
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+        Window.set_fg_color("red")                      \t -- Sets the window's text color to the color red
+        Window.set_fg_color(SageColor.Red())            \t -- Sets the window's text color to red, also
+        Window.set_fg_color(PanColor.ForestGreen())     \t -- Sets the window's text color to PanColor.ForestGreen
+        Window.set_fg_color(MyColor)                    \t -- Sets the window's text color to a defined "MyColor", such as MyColor = pybox.RgbColor(0,255,0)
+        """        
+        return _pybox.WindowSetFgColor(self.__id,_library_color(color))
+
+    def set_text_color(self,color) -> bool :
+        """
+        Sets the foreground/text color of the text written to the window.
+
+        This only affects subsequent text written to the window with the Write() or other window write functions.
+        This will not affect any current display on the window
+       
+        Note: set_fg_color() and set_text_color() are the same function.
+        
+        Parameters
+
+        - color         \t -- Foreground/Text color to set next output 
+        
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+        Window.set_text_color("red")                      \t -- Sets the window's text color to the color red
+        Window.set_text_color(SageColor.Red())            \t -- Sets the window's text color to red, also
+        Window.set_text_color(PanColor.ForestGreen())     \t -- Sets the window's text color to PanColor.ForestGreen
+        Window.set_text_color(MyColor)                    \t -- Sets the window's text color to a defined "MyColor", such as MyColor = pybox.RgbColor(0,255,0)
+        """
+        return _pybox.WindowSetFgColor(self.__id,_library_color(color))
+
+    def vsync_wait(self) -> bool :
+        """
+        Waits for the vertical sync to occur before returning. 
+
+        This function can be useful for real-time graphics to sync on the vertical refresh.
+
+        See the pybox GPU/SDL functions (TBD, but being worked on) for accurate and more flexible GPU graphics.
+
+        When frame statistics are enabled (see enable_frame_stats()), each call ends a frame.  The dirty rectangle (see get_dirty_rect())
+        is cleared.
+        """
+        if self.__dirty is not None : self.__dirty.clear()
+        stats = self.__frame_stats
+        if stats is None : return _pybox.WindowVSyncWait(self.__id)
+        stats._begin_present(self,True)
+        result = _pybox.WindowVSyncWait(self.__id)
+        stats._end_present(True)
+        return result
+
+    def enable_frame_stats(self,capacity : int = 300,target_fps : float = 60,overlay : bool = False) -> FrameStats :
+        """
+        Starts tracking frame statistics for the window's render loop, and returns the FrameStats object. 
+        
+        Frame intervals, draw time and present time are measured within vsync_wait() and update() calls, 
+        giving the rolling fps, p95/p99 frame times and the number of missed vertical syncs -- see FrameStats.
+
+        Parameters
+
+        - capacity      \t -- Number of recent frames kept for the fps and percentile values
+        - target_fps    \t -- Expected frame rate (i.e. the monitor refresh rate), used to count missed vertical syncs
+        - overlay       \t -- When True, a frame-time graph and statistics are drawn in the upper-left of the window each frame
+
+        Examples: 
+                    \t -stats = win.enable_frame_stats(overlay=True)
+                    \t -while win.vsync_wait() : ...
+                    \t -print(stats.fps(),stats.p99(),stats.missed_vsyncs())
+        """
+        from .frame_stats import FrameStats
+        self.__frame_stats = FrameStats(capacity,target_fps,overlay)
+        return self.__frame_stats
+
+    def disable_frame_stats(self) -> bool :
+        """
+        Stops tracking frame statistics.  The FrameStats object returned by enable_frame_stats() keeps its values.
+        """
+        self.__frame_stats = None
+        return True
+
+    def frame_stats(self) -> FrameStats :
+        """
+        Returns the window's FrameStats object, or None if frame statistics are not enabled (see enable_frame_stats())
+        """
+        return self.__frame_stats
+
+    def vsync_ready(self) -> bool :
+        """
+        Returns True if the vertical retrace has occured. 
+
+        When this function is used once  (or VsynStartThread()) has been called, Sagebox will return with wait_event() with 
+        VsyncReady as an event, which can be checked with VsyncReady(). 
+
+        - Use VsyncEndThread() to stop the thread that looks for the vertical sync. 
+    
+        When wait_event() returns, it may return from any sort of event, so VsyncReady() must be called to ensure a Vsync has occured.
+   
+        - Use VsyncWait() to stop the thread and wake it up every Vsync period (usually every 60ms, but dependent on monitor settings).
+            \t -if the code between VsyncWait() calls takes longer then the vertical sync, VsyncWait() will come back when the next vertical sync is triggered.
+ 
+        See the pybox GPU/SDL functions (TBD, but being worked on) for accurate and more flexible GPU graphics.
+
+            --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+            --> and will return False after the first call until the event occurs again. 
+
+                In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+
+        """
+        return _pybox.WindowVSyncReady(self.__id)
+    
+    def new_listbox(self,x : int, y : int = None,text=None,width=200,height=400,*args,**kwargs) -> Listbox :
+        """
+        Creates a list box at location x,y. See: new_listbox_l() to specifically use a list/tuple for the (X,Y) position.
+
+        Optional Input parameters:
+
+        - text      \t -- Initial listbox text.  This can be empty.  Multiple entries can be set separated by newlines (i.e. "Item 1\Item 2") listbox.AddItem() can also be used to add text items.
+        - width     \t -- Sets the width of the listbox in the window.  This has a default of 200
+        - height    \t -- Sets the Height of of the listbox in the window.  This has a default of 400
+
+        Keywords and/or Pybox options can be included.  Some various options are as follows:
+
+        - fgColor   \t -- Sets the foreground color of items in the list box
+        - bgColor   \t -- Sets the background color of items in the list box
+        - Defalut   \t -- Sets the default selected item (assuming text is set in the initilization).  See: listbox.SetSelection()
+        - Font      \t -- Sets the font of the listbox text.   The default is about 12 points. 
+
+        Note: The list box height is automatically adjusted to the nearest font size that will fit into the window. 
+
+        Examples:   \t -MyListbox = Window.new_listbox(10,10)    \t - - Open new listbox at (10,10) in the window
+                    \t -MyListbox = Window.new_listbox(PosX,PosY,"Item 1\\nItem 2",fgcolor="Red")  
+        """
+        from .widgets import Listbox
+        return Listbox(_pybox.WindowNewListbox(self.__id,int(x),int(y),text,opt.size(width,height),*args,**kwargs))
+
+    def new_listbox_l(self,loc : list,text=None,width=200,height=400,*args,**kwargs) -> Listbox :
+        """
+        Creates a list box at location loc. See: new_listbox() to specifically use a (x,y) values to create a listbox.
+
+        Optional Input parameters:
+
+        - text      \t -- Initial listbox text.  This can be empty.  Multiple entries can be set separated by newlines (i.e. "Item 1\Item 2") listbox.AddItem() can also be used to add text items.
+        - width     \t -- Sets the width of the listbox in the window.  This has a default of 200
+        - height    \t -- Sets the Height of of the listbox in the window.  This has a default of 400
+
+        Pybox options can be included.  Some various options are as follows:
+
+        - fgColor   \t -- Sets the foreground color of items in the list box
+        - bgColor   \t -- Sets the background color of items in the list box
+        - Defalut   \t -- Sets the default selected item (assuming text is set in the initilization).  See: listbox.SetSelection()
+        - Font      \t -- Sets the font of the listbox text.   The default is about 12 points. 
+
+        Note: The list box height is automatically adjusted to the nearest font size that will fit into the window. 
+
+        Examples:   \t -MyListbox = Window.new_listbox_l((10,10))                                          \t - - Open new listbox at (10,10) in the window
+                    \t -MyListbox = Window.new_listbox_l(MyLocation,"Item 1\\nItem 2",opt.fgcolor("Red"))  
+                    \t -MyListbox = Window.new_listbox_l(MyLocation,"Item 1\\nItem 2",height=300,fgcolor="Red")  
+        """        
+        from .widgets import Listbox
+        return Listbox(_pybox.WindowNewListbox(self.__id,int(loc[0]),int(loc[1]),text,opt.size(width,height),*args,**kwargs))
+
+    def new_button(self,x : int, y : int,title : str,*args,**kwargs) -> Button :
+        """
+        Create a Button at (x,y) in the Window.  See new_button_l() to use a list/tuple for to set the location.
+
+        A Button type object is returned so the button can be used and events retrieved.
+
+        Parameters:
+
+        title       \t -- Sets the text of the button. 
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - fgColor   \t -- Sets the foreground color of items in the list box
+        - font      \t -- Sets the font of the button text.   The default is about 12 points. 
+        - style     \t -- Style("large") will create a larger button
+                    \t -- Style("Windows") will create a windows-style rectangular button
+                    \t -- Style("Panel") will create a rectangular button that blends with the window
+                    \t -- Style("Panel2") will create a rectangular button that blends with no depth when pressing.
+                    \t -- Style("<mystyle>") will create a button of a style that has been created by the program with CreateButtonStyle()
+
+                    \t -With "Windows","Panel" and "Panel2" styles, setting the text color and background color (with opt.fgcolor() and opt.bgcolor()
+                    \t -can make a big difference.
+
+        Examples:   \t -MyWindow.new_button(40,100,"This is a button")
+                    \t -MyWindow.new_button(40,100,"This is a larger button",opt.font(20),opt.style("Windows"))
+                    \t -MyWindow.new_button(40,100,"This is a larger button with red foreground",opt.bgcolor("Red"),opt.style("Panel"))
+        """
+        from .widgets import Button
+        return Button(_pybox.WindowNewButton(self.__id,title,int(x),int(y),*args,**kwargs))
+
+    def new_button_l(self,at : list,title : str, *args, **kwargs) -> Button :
+        """
+        Create a Button at (at) in the Window, where 'at' is a list, tuple or array.  See new_button to use (x,y) values to set the location.
+
+        A Button type object is returned so the button can be used and events retrieved.
+
+        Parameters:
+
+        title       \t -- Sets the text of the button. 
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - fgColor   \t -- Sets the foreground color of items in the list box
+        - Font      \t -- Sets the font of the button text.   The default is about 12 points. 
+        - Style     \t -- Style("large") will create a larger button
+                    \t -- Style("Windows") will create a windows-style rectangular button
+                    \t -- Style("Panel") will create a rectangular button that blends with the window
+                    \t -- Style("Panel2") will create a rectangular button that blends with no depth when pressing.
+                    \t -- Style("<mystyle>") will create a button of a style that has been created by the program with CreateButtonStyle()
+
+                    \t -With "Windows","Panel" and "Panel2" styles, setting the text color and background color (with opt.fgcolor() and opt.bgcolor()
+                    \t -can make a big difference.
+
+        Examples:   \t -MyWindow.new_button_l(40,100,"This is a button")
+                    \t -MyWindow.new_button_l(40,100,"This is a larger button",opt.font(20),opt.style("Windows"))
+                    \t -MyWindow.new_button_l(40,100,"This is a larger button with red foreground",opt.bgcolor("Red"),opt.style("Panel"))
+        """
+        from .widgets import Button
+        return Button(_pybox.WindowNewButton(self.__id,title,int(at[0]),int(at[1]),*args,**kwargs))
+
+    def new_slider(self,x : int, y : int,title : str,width : int = None,*args,**kwargs) -> Slider :
+        """
+        Creates a slider at the (x,y) position in the Window. See: new_slider_l() to use a list/tuple for the (x,y) position.
+
+        A Slider class object is returned where the slider can be accessed and controlled. 
+
+        Parameters:
+
+        - title     \t -- Sets the title of the Slider
+        - width     \t -- [optional] Sets the width of the slider.  This defaults to about 200 pixels in width.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Range             \t -- Set the range of the slider.  The default range is (1,100)          
+        - Default           \t -- Set the default value of the slider.  The edfault is (0)
+        - TextColor         \t -- Sets the color of the label of the slider.
+        - ValueColor        \t -- Sets the text color of the value (same as fgColor()
+        - Style("small")    \t -- Sets a smaller slider handle
+
+        Examples:       \t -window.new_slider(10,10,"This is a slider")
+                        \t -window.new_slider(x,y,"This is a slider",range=(100,500),default=200)
+                        \t -window.new_slider(10,10,"This is a slider",opt.textcolor("Yellow"),opt.valuecolor("red"),opt.style("small"))
+                        \t -window.new_slider(10,10,"This is a slider",textcolor=Yellow,valuecolor=red,Style="small")        \t - - (same as previous example)
+        """
+        from .widgets import Slider
+        return Slider(_pybox.WindowNewSlider(self.__id,title,int(x),int(y),width,*args,**kwargs))
+
+    def new_slider_f(self,x : int, y : int,title : str,width : int = None,*args,**kwargs) -> Slider :
+        """
+        Creates a floating-point slider at the (x,y) position in the Window. See: new_slider_fl() to use a list/tuple for the (x,y) position.
+
+        A Slider class object is returned where the slider can be accessed and controlled. 
+        A floating-point slider sets a default range of 0-1.0
+
+        User slider.get_pos_f() and slider.set_pos_f() to set and retrieve values.
+
+        Range may be either direction (i.e. min,max or max, min). 
+
+        Parameters:
+
+        - title     \t -- Sets the title of the Slider
+        - width     \t -- [optional] Sets the width of the slider.  This defaults to about 200 pixels in width.
+
+        Pybox options can be included.  Some various options are as follows:
+
+        - Range             \t -- Set the range of the slider.  The default range is (1,1.0)          
+        - Default           \t -- Set the default value of the slider.  The edfault is (0)
+        - TextColor         \t -- Sets the color of the label of the slider.
+        - ValueColor        \t -- Sets the text color of the value (same as fgColor()
+        - Style("small")    \t -- Sets a smaller slider handle
+
+        Examples:       \t -window.new_slider_f(10,10,"This is a slider")
+                        \t -window.new_slider_f(x,y,"This is a slider",range=(1,5),default=2.5)
+                        \t -window.new_slider_f(10,10,"This is a slider",opt.textcolor("Yellow"),opt.valuecolor("red"),opt.style("small"))
+                        \t -window.new_slider_f(10,10,"This is a slider",textcolor=Yellow,valuecolor=red,Style="small")        \t - - (same as previous example)
+
+        """
+        from .widgets import Slider
+        return Slider(_pybox.WindowNewSlider(self.__id,title,int(x),int(y),width,opt._opt__as_float(),*args,**kwargs))
+
+    def new_slider_l(self,at : list, title : str,width : int = None,*args,**kwargs) -> Slider :
+        """
+        Creates a slider at the (at) position in the Window. See: new_slider() to use a (x,y) values to set the location of the slider
+
+        A Slider class object is returned where the slider can be accessed and controlled. 
+
+        Parameters:
+
+        - title     \t -- Sets the title of the Slider
+        - width     \t -- [optional] Sets the width of the slider.  This defaults to about 200 pixels in width.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Range             \t -- Set the range of the slider.  The default range is (1,100)          
+        - Default           \t -- Set the default value of the slider.  The edfault is (0)
+        - TextColor         \t -- Sets the color of the label of the slider.
+        - ValueColor        \t -- Sets the text color of the value (same as fgColor()
+        - Style("small")    \t -- Sets a smaller slider handle
+
+        Examples:       \t -window.new_slider_l((10,10),"This is a slider")
+                        \t -window.new_slider_l(MyLocation,"This is a slider",range=(100,500),default=200)
+                        \t -window.new_slider_l((10,10),"This is a slider",opt.textcolor("Yellow"),opt.valuecolor("red"),opt.style("small"))
+                        \t -window.new_slider_l((10,10),"This is a slider",textcolor=Yellow,valuecolor=red,Style="small")        \t - - (same as previous example)
+        """        
+        from .widgets import Slider
+        return Slider(_pybox.WindowNewSlider(self.__id,title,at[0],at[1],width,*args,**kwargs))
+
+    def new_slider_fl(self,at : list, title : str,width : int = None,*args,**kwargs) -> Slider :
+        """
+        Creates a floating-point slider at the (at) position in the Window. 
+        See: new_slider_f() to use a (x,y) values to set the location of the slider
+
+        A Slider class object is returned where the slider can be accessed and controlled. 
+        A floating-point slider sets a default range of 0-1.0
+
+        User slider.get_pos_f() and slider.set_pos_f() to set and retrieve values.
+
+        Range may be either direction (i.e. min,max or max, min). 
+
+        Parameters:
+
+        - title     \t -- Sets the title of the Slider
+        - width     \t -- [optional] Sets the width of the slider.  This defaults to about 200 pixels in width.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Range             \t -- Set the range of the slider.  The default range is (1,1.0)          
+        - Default           \t -- Set the default value of the slider.  The edfault is (0)
+        - TextColor         \t -- Sets the color of the label of the slider.
+        - ValueColor        \t -- Sets the text color of the value (same as fgColor()
+        - Style("small")    \t -- Sets a smaller slider handle
+
+        Examples:       \t -window.new_slider_fl((10,10),"This is a slider")
+                        \t -window.new_slider_fl(MyLocation,"This is a slider",range=(1,2),default=2.5)
+                        \t -window.new_slider_fl((10,10),"This is a slider",opt.textcolor("Yellow"),opt.valuecolor("red"),opt.style("small"))
+                        \t -window.new_slider_fl((10,10),"This is a slider",textcolor=Yellow,valuecolor=red,Style="small")        \t - - (same as previous example)
+        """        
+        from .widgets import Slider
+        return Slider(_pybox.WindowNewSlider(self.__id,title,at[0],at[1],width,*args,**kwargs))
+    
+    def text_widget(self, x : int = 0, y: int = 0,text : str = None,width : int = 0, height : int = 0, *args, **kwargs ) -> CTextWidget :
+        """
+        Create a text widget in the window at (x,y).   See: text_widget_l() to create a text widget using a list or tuple for the (x,y) position.
+
+        Parameters:
+
+        - text          \t -- [optional] Sets the text of the widget.  This can be set later with textwidget.Write()
+                        \t - When text is entered, the text widget is created to the width of the text.  Use the width() parameter to set a width or pad
+                        \t - the text with spaces to reserve width.
+        - width         \t - [optional] Sets the width of the text widget in pixels.  The default is 200 pixels.
+        - height        \t - [optional] Sets the height of the text widget in pixels.  The default is the height of the current font or specified font (when opt.font() is used)
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - TextColor         \t - Sets the text color of the widget (default is current window text color).  Same as opt.fgcolor()
+        - bgColor           \t - Sets the background color of the widget.  The default blends with the window
+        - Font              \t - Sets the font of the text in the text widget
+        - CenterX,CenterY   \t - Centers the text widget in the window horizontally or vertically, respectively.
+        - TextCenter        \t - Centers the text inside of the widget (which can be longer than the text itself).
+                                \t - Use TextCenterX() and CenterX() together to make sure text is centered in the window. This is only needed if the Width of the
+                                \t - Text Widget and the text have been specificed separately.
+
+        - JustBottomCenter, JustBottomLeft, JustBottomRight, JustTopCenter, JustTopLeft, JustTopRight
+        - PadX,PadY     \t - Use thse with the above positioning to move the widget left,right,up, down from automatic placement.
+                        \t - For example, using JustBottomCenter() with PadY(-10) will move the text widget away from the bottom,
+
+        Examples:   \t -window.text_widget(10,10,"This is a text Widget",font=(20))
+                    \t -window.text_widget(0,50,"This is a text widget",centerx=true) \t - Centers Text Widget horizontally
+                    \t -window.text_widget(0,0,width=400,textcenter=True,just_bottomcenter=True,pady=-10,font=20)
+                    \t -window.text_widget(0,0,width=400,opt.textcenter(),opt.justbottomcenter(),opt.pady(-10),opt.font(20))    \t --> Same as previous example.
+        """
+        from .widgets import CTextWidget
+        return CTextWidget(_pybox.WindowTextWidget(self.__id,int(x),int(y),text,width,height,*args,**kwargs))
+
+    def text_widget_l(self, at = (0,0),text : str = None,size : list = (0,0) , *args, **kwargs ) -> CTextWidget :
+        """
+        Create a text widget in the window at (at), where at is a tuple, list or array.   See: text_widget() to create a text widget using separate (x,y) values.
+
+        Parameters:
+
+        - text          \t -- [optional] Sets the text of the widget.  This can be set later with textwidget.Write()
+                        \t - When text is entered, the text widget is created to the width of the text.  Use the width() parameter to set a width or pad
+                        \t - the text with spaces to reserve width.
+        - width         \t - [optional] Sets the width of the text widget in pixels.  The default is 200 pixels.
+        - height        \t - [optional] Sets the height of the text widget in pixels.  The default is the height of the current font or specified font (when opt.font() is used)
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - TextColor         \t - Sets the text color of the widget (default is current window text color).  Same as opt.fgcolor()
+        - bgColor           \t - Sets the background color of the widget.  The default blends with the window
+        - Font              \t - Sets the font of the text in the text widget
+        - CenterX,CenterY   \t - Centers the text widget in the window horizontally or vertically, respectively.
+        - TextCenter        \t - Centers the text inside of the widget (which can be longer than the text itself).
+                                \t - Use TextCenterX() and CenterX() together to make sure text is centered in the window. This is only needed if the Width of the
+                                \t - Text Widget and the text have been specificed separately.
+
+        - JustBottomCenter, JustBottomLeft, JustBottomRight, JustTopCenter, JustTopLeft, JustTopRight
+        - PadX,PadY         \t - Use thse with the above positioning to move the widget left,right,up, down from automatic placement.
+                            \t - For example, using JustBottomCenter() with PadY(-10) will move the text widget away from the bottom,
+
+        Examples:   \t -window.text_widget_l((10,10),"This is a text Widget",font=(20))
+                    \t -window.text_widget_l((0,50),"This is a text widget",centerx=true) \t - Centers Text Widget horizontally
+                    \t -window.text_widget_l(my_location,width=400,textcenter=True,just_bottomcenter=True,pady=-10,font=20)
+                    \t -window.text_widget_l((0,0),width=400,opt.textcenter(),opt.justbottomcenter(),opt.pady(-10),opt.font(20))    \t --> Same as previous example.
+        """
+        from .widgets import CTextWidget
+        return CTextWidget(_pybox.WindowTextWidget(self.__id,at[0],at[1],text,size[0],size[1],*args,**kwargs))
+
+    def new_inputbox(self,x : int, y : int,width : int = 200, height : int = 0, text : str = None,*args,**kwargs) -> InputBox :
+        """
+        Creates a new Input Box (also known as an "Edit Box") where you can enter text data as simple as a few characters are entire paragraphs. 
+
+        The Input box is placed in the window at the (x,y) position.  See: new_inputbox_l() to use a tuple/list for the window position.
+
+        Optional Parameters:
+
+        - width         \t -Sets the width of the input box in pixels.  The default is 250 pixels.
+        - height        \t -Sets the height of the input box in pixels.  The default is set to the default Font for 1 line of text. 
+        - text          \t -This sets the starting text for the input box.  Otheriwse the input box is left blank at first. 
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - font          \t -Sets the font for the input box.  The default is the current font of the window
+        - numbersonly   \t -Causes the input box to only accept numbers. 
+        - readonly      \t -Sets the input box as read only so it can be used as a way to place a large amount of text that can be copied.
+        - textcolor     \t -Sets the color of the text in the input box
+        - bgcolor       \t -Sets the background color of the text in the input box
+        - label         \t -Sets a label to the right of the input box
+                        \t -LabelRight, LabelLeft, LabelBottom, and LabelTop can be used to set the location of the label.
+        - label_color    \t -Sets the color of the label (i.e. opt.label_color("Red"))
+        - multiline     \t -Sets the input box as a multi-line input box.  This allows more than one line to be entered.
+                        \t -A button or some method to end input must be used unless "WantReturn" is specified
+        - wantreturn    \t -For multi-line boxes, this sends a "return pressed" message when the return key is pressed.
+        - password      \t -Causes the input box to display '*' for all text.
+        - noborder      \t -Causes the input box to not use a border so it will blend into the window more seamlessly.
+        - thickborder,Recessed      \t -These are two different border styles that can be used.
+        - vscroll, hscroll          \t -Adds a vertical scrollbar (useful for multi-line boxes) and horizontal scroll bar, respectively
+        - wincolors     \t -Sets the background input box color and text color to the current window color instead of the default white-and-black colors. 
+
+        Examples:   \t -window.new_inputbox(40,50)             \t -- create input box at location 40,50
+                    \t -window.new_inputbox(40,50,height=500)  \t -- create an input box of height 500 pixels
+                    \t -Window.new_inputbox(40,50,opt.font(20),opt.label("Enter Data"))
+                    \t -Window.new_inputbox(40,50,text="This is the default text")
+        """
+        from .widgets import InputBox
+        return InputBox(_pybox.WindowNewInputBox(self.__id,int(x),int(y),int(width),int(height),text,*args,**kwargs))
+
+    def new_inputbox_l(self,at,width : int = 200, height : int = 0, text : str = None,*args,**kwargs) -> InputBox :
+        """
+        Creates a new Input Box (also known as an "Edit Box") where you can enter text data as simple as a few characters are entire paragraphs. 
+
+        The Input box is placed in the window at the (at) position, which can be a list, tuple or array.  See: new_inputbox() to use a individual (x,y) values.
+
+        Optional Parameters:
+
+        - width         \t -Sets the width of the input box in pixels.  The default is 250 pixels.
+        - height        \t -Sets the height of the input box in pixels.  The default is set to the default Font for 1 line of text. 
+        - text          \t -This sets the starting text for the input box.  Otheriwse the input box is left blank at first. 
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - font          \t -Sets the font for the input box.  The default is the current font of the window
+        - numbersonly   \t -Causes the input box to only accept numbers. 
+        - readonly      \t -Sets the input box as read only so it can be used as a way to place a large amount of text that can be copied.
+        - textcolor     \t -Sets the color of the text in the input box
+        - bgcolor       \t -Sets the background color of the text in the input box
+        - label         \t -Sets a label to the right of the input box
+                        \t -LabelRight, LabelLeft, LabelBottom, and LabelTop can be used to set the location of the label.
+        - label_color    \t -Sets the color of the label (i.e. opt.label_color("Red"))
+        - multiline     \t -Sets the input box as a multi-line input box.  This allows more than one line to be entered.
+                        \t -A button or some method to end input must be used unless "WantReturn" is specified
+        - wantreturn    \t -For multi-line boxes, this sends a "return pressed" message when the return key is pressed.
+        - password      \t -Causes the input box to display '*' for all text.
+        - noborder      \t -Causes the input box to not use a border so it will blend into the window more seamlessly.
+        - thickborder,Recessed      \t -These are two different border styles that can be used.
+        - vscroll, hscroll          \t -Adds a vertical scrollbar (useful for multi-line boxes) and horizontal scroll bar, respectively
+        - wincolors     \t -Sets the background input box color and text color to the current window color instead of the default white-and-black colors. 
+
+        Examples:   \t -window.new_inputbox_l(40,50)             \t -- create input box at location 40,50
+                    \t -window.new_inputbox_l(40,50,height=500)  \t -- create an input box of height 500 pixels
+                    \t -Window.new_inputbox_l(40,50,opt.font(20),opt.label("Enter Data"))
+                    \t -Window.new_inputbox_l(40,50,text="This is the default text")
+        """
+        from .widgets import InputBox
+        return InputBox(_pybox.WindowNewInputBox(self.__id,int(at[0]),int(at[1]),int(width),int(height),text,*args,**kwargs))
+
+    def write(self,outstring : str = "", *args,**kwargs) -> bool :
+        """
+        Write Text out to the window. 
+
+        The write() function will write text to the window and can be used with many options.
+
+        A basic example is: window.write("Hello World"), window.write("Hello World"), as well as window.write(f"My Variable is: {MyVariable") 
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - font                          \t -Set the font to be used for the text
+        - center_x, center_x, center_xy    \t -Center the text in various ways (i.e. CenterX centers in the X-axis, etc.)
+        - textcolor                     \t -Set the text color for the text.
+        - bgcolor                       \t -Set the background color for the text
+        - at                            \t -Set the position in the window of the text, i.e. Write("Hello World",opt.at(x,y))
+
+        Controls can be embedded in the text line to change colors and font sizes:
+
+        For example:    \t -window.write("This {r}word{} is in the color red").
+                        \t -Note the {} to close.  With Python formatted strings, an extra "{}" is needed, such as f"MyValue {{r}}{myvalue}{{}} is in red". 
+
+        More than one control can be used such as: write("This is in {r}Red{} and this is in {b}Blue". 
+        You do not need the closing {} if it is as the end of the line.
+
+        - {<color>}     \t -Where the color is a defined color such as {red} (or {r}), {blue}, {skyblue}, etc.   You can use abbreviations for most primary colors, such as
+                            \t - {y} = {yellow}, etc.
+        - {font size}   \t -i.e. "This is in the normal font, and {30}this is in a 30-point font"
+        - {font name}   \t -i.e. "This is in the normal font, and {Courier New,20}This is in a 20-point Courier New font"
+        - {bitmap}      \t -This is TBD in a coming version, and will accept bitmap names to print in the output window.
+       
+        Examples:   \t -MyWindow.write("Hello World",font=40,center=True)     \t -- Writes a big "Hello World" in the center of the screen
+                    \t -MyWindow.write("Hello World",fg_color = "red")               \t -- Writes "Hello World" in red
+                    \t -MyWindow.write("{r}Hello World")                              \t - - Also writes "Hello World" in red
+                    \t -MyWindow.write("Hello World",font=50)                    \t - - Writes "Hello World" in a 50-point font size.
+        """
+        return _pybox.WindowWrite(self.__id,outstring,*args,**kwargs)
+
+    def writeln(self,outstring : str = "", *args, **kwargs) -> bool :
+        "Same as the write() function, but adds a newline after the Write().  See Write() for more information"
+        return _pybox.WindowWriteln(self.__id,outstring,*args,**kwargs)
+
+    def write_xy(self,x,y,text,*args ,**kwargs) -> bool :
+        """
+        Same as write() but puts the text at the (x,y) position given. 
+        See write_xy_l() to use list, tuple, or array for (x,y) instead of independent values.
+
+        See write() for more information
+        """
+        return _pybox.WindowWriteXY(self.__id,int(x),int(y),text,*args,**kwargs)
+
+    def write_xy_l(self,at,text,*args,**kwargs) -> bool :
+        """
+        Same as write() but puts the text at the (x,y) position given. 
+        See write_xy() to use independent values for (x,y) instead of list, tuple, or array.
+
+        See write() for more information
+        """
+        return _pybox.WindowWriteXY(self.__id,int(at[0]),int(at[1]),text,*args,**kwargs)
+
+    def set_font(self,font,*args) -> bool :
+        """
+        Sets the current font of the window.  The font may be a simple number, a font name and size, or a created font using CreateFont()
+
+        Examples:  
+            \t -MyWindow.set_font(40)                      \t -- Sets font size 40 of the default font (Arial)
+            \t -MyWindow.set_font("Times New Roman")      \t -- Sets "Times New Roman" as the font
+            \t -MyWindow.set_font("italic")               \t -- Sets an italic version of the current font
+            \t -MyWindow.set_font("bold")                 \t -- Sets a bold version of the current font
+            \t -MyWindow.set_font("Verdana,italic,30")     \t -- Sets a Veriana, italic, 30-point font
+            \t -MyWindow.set_font("MyFont")                \t -- Sets a previously created font named "MyFont"
+
+        """
+        return _pybox.WindowSetFont(self.__id,opt.font(font),*args)
+    def get_window_size(self,bFrameSize : bool = False) -> list :
+        """
+        Returns the canvas size of the window (i.e. the interior size of the window) as an array (width,height)
+
+        Note: size() and get_window_size() are the same function
+
+        Use get_window_size(True) to return the size of the window including the frame.
+
+        The size is returned as a list.
+
+        Example:
+
+        \t -size = MyWindow.get_window_size()
+        \t -
+        \t -width = size[0]
+        \t -height = size[1]
+
+        Example:
+
+        center = MyWindow.get_window_size()/2
+        """
+ #       return numpy.array(_pybox.WindowGetWindowSize(self.__id,bFrameSize))
+        return _pybox.WindowGetWindowSize(self.__id,bFrameSize)
+        
+    def get_window_center(self,bFrameSize : bool = False) -> list :
+        """
+        Returns center coordinates of the Window's client (visible) area. 
+        """
+        return _pybox.WindowGetWindowCenter(self.__id,bFrameSize)
+
+    def size(self,bFrameSize : bool = False) -> list :
+        """
+        Returns the canvas size of the window (i.e. the interior size of the window) as an array (width,height)
+
+        Note: size() and get_window_size() are the same function
+
+        Use size(True) to return the size of the window including the frame.
+
+        The size is returned as a list.
+
+        Example:
+
+        \t -size = MyWindow.size()
+        \t -
+        \t -width = size[0]
+        \t -height = size[1]
+
+        Example:
+
+        center = MyWindow.size()/2
+        """
+ #       return numpy.array(_pybox.WindowGetWindowSize(self.__id,bFrameSize))
+        return _pybox.WindowGetWindowSize(self.__id,bFrameSize)
+
+
+    def get_window_width(self,frameSize : bool = False) -> int :
+        """
+        Returns the width of the window. Note: get_window_width() and width() are the same function
+
+        By default, the interior width of the window is returned. 
+
+        Parameters:
+
+        - frameSize     \t -- When 'True', the width of the window including the frame is returned.  Otherwise only the interior width is returned.
+
+        Example:
+
+        WinWidth = Win.get_window_width()        \t - - Return Window interior width.
+        WinWidth = Win.get_window_width(True)     \t - - Return Window frame width
+
+        """
+        return _pybox.WindowGetWindowWidth(self.__id,frameSize)
+
+    def width(self,frameSize : bool = False) -> int :
+        """
+        Returns the width of the window. Note: get_window_width() and width() are the same function
+
+        By default, the interior width of the window is returned. 
+
+        Parameters:
+
+        - frameSize     \t -- When 'True', the width of the window including the frame is returned.  Otherwise only the interior width is returned.
+
+        Example:
+
+        WinWidth = Win.width()        \t - - Return Window interior width.
+        WinWidth = Win.width(True)     \t - - Return Window frame width
+
+        """
+        return _pybox.WindowGetWindowWidth(self.__id,frameSize)
+
+    def get_window_height(self,frameSize : bool = False) -> int :
+        """
+        Returns the height of the window. Note: height() and get_window_height() are the same function
+
+        By default, the interior height of the window is returned. 
+
+        Parameters:
+
+        - frameSize     \t -- When 'True', the height of the window including the frame is returned.  Otherwise only the interior height is returned.
+
+        Example:
+
+        WinWidth = Win.get_window_height()        \t - - Return Window interior height.
+        WinWidth = Win.get_window_height(True)     \t - - Return Window frame height
+
+        """
+        return _pybox.WindowGetWindowHeight(self.__id,frameSize)
+
+    def height(self,frameSize : bool = False) -> int :
+        """
+        Returns the height of the window. Note: height() and get_window_height() are the same function
+
+        By default, the interior height of the window is returned. 
+
+        Parameters:
+
+        - frameSize     \t -- When 'True', the height of the window including the frame is returned.  Otherwise only the interior height is returned.
+
+        Example:
+
+        WinWidth = Win.height()        \t - - Return Window interior height.
+        WinWidth = Win.height(True)     \t - - Return Window frame height
+
+        """
+        return _pybox.WindowGetWindowHeight(self.__id,frameSize)    
+
+    def set_window_size(self,width : int, height : int,bInnerSize : bool = True) -> bool :
+        "Sets the width and height of the window.  See set_window_size_l() to use a list, tuple, or array instead of (width,height)"
+        return _pybox.WindowSetWindowSize(self.__id,int(width),int(height),bInnerSize)
+
+    def set_window_size_l(self,size : list,bInnerSize : bool = True) -> bool :
+        "Sets the width and height of the window with the incoming list, array, or tuple, i.e. (Width,Height).  See set_window_size() to use individual width, height parameters."
+        return _pybox.WindowSetWindowSize(self.__id,int(size[0]),int(size[1]),bInnerSize)
+
+    def get_event(self) -> bool :
+        """
+        get_event() waits for an event to occur in your main body of code. 
+
+        - Events are any events such as a mouse move, click, keyboard press, etc. 
+        - Events are also caused by any control change such as moving a slider, pressing a button, or pressing return in an input box. 
+        - Events can also be a window closing, a window moving or changing size -- basically anything happening in the system sends a message
+
+        Until an event occurs, the program is sleeping and not using any CPU time.  Pybox wakes up the program when an event happens. 
+
+        In the event loop, you can check for events.  
+
+        get_event() returns true until all main windows are closed. 
+
+        Example:
+
+                my_button = pybox.dev_button("Press Me")
+                my_slider = pybox.def_slider()
+
+                while pybox.get_event() :
+                    if my_button.pressed() : print("My Button was Pressed")
+                    if my_slider.moved()   : print("Range Slider is now at position",my_slider.get_pos())
+
+
+        In this example, the program sleeps until an event occurs, and then the program checks to see if an event occured with a button or a slider movement. 
+
+        Events are typically one-time:  They report "True" on the first call, and then fals afterwards until another event of the same type happens. 
+        
+        You can also use a callback to retrieve events.  Though this is not recommended or useful for most programs, it can be useful for some specific purposes.
+        See set_event_callback() for more information.
+        """
+        return _pybox.GetEvent()           # probably deprecated -> _pybox.WindowGetEvent(self.__id) 
+
+    def wait_event(self) -> bool :
+        """
+        wait_event() waits for an event to occur in your main body of code. 
+
+        - Events are any events such as a mouse move, click, keyboard press, etc. 
+        - Events are also caused by any control change such as moving a slider, pressing a button, or pressing return in an input box. 
+        - Events can also be a window closing, a window moving or changing size -- basically anything happening in the system sends a message
+
+        Until an event occurs, the program is sleeping and not using any CPU time.  Pybox wakes up the program when an event happens. 
+
+        In the event loop, you can check for events.  
+
+        wait_event() returns true until all main windows are closed. 
+
+        Example:
+
+                my_button = pybox.dev_button("Press Me")
+                my_slider = pybox.def_slider()
+
+                while pybox.wait_event() :
+                    if my_button.pressed() : print("My Button was Pressed")
+                    if my_slider.moved()   : print("Range Slider is now at position",my_slider.get_pos())
+
+
+        In this example, the program sleeps until an event occurs, and then the program checks to see if an event occured with a button or a slider movement. 
+
+        Events are typically one-time:  They report "True" on the first call, and then fals afterwards until another event of the same type happens. 
+        
+        You can also use a callback to retrieve events.  Though this is not recommended or useful for most programs, it can be useful for some specific purposes.
+        See set_event_callback() for more information.
+        """
+        return _pybox.GetEvent()           # probably deprecated -> _pybox.WindowGetEvent(self.__id) 
+
+
+    def display_bitmap(self,x : int, y : int,bitmap,size=None,*args,**kwargs) :
+        """
+        Displays a bitmap on the screen at the (x,y) position given.  See display_bitmap_l() to use a list, array, or tuple for the (x,y) location
+
+        Optional Parameters
+
+        - size      - Sets the size of the bitmap -- the default is the same size as the bitmap. 
+                    \t -note: leaving one value at 0 will cause the bitmap to be scaled proportionally.
+
+                       For example, "window.display_bitmap(MyBitmap,Size=(500,0))" will cause the bitmap to be displayed at a width of 500 pixels 
+                       and height to be proportional to the width and display correctly.
+        - Reversed  \t - This will cause the bitmap to be displayed upside-down, since bitmaps can vary.  Also use display_bitmap_r() to display the bitmaps upside-down
+
+        About Bitmaps: 
+        
+        Bitmaps can be a Pybox CBitmap-type bitmap or an unsigned char numpy array in the form [height][width][3] (i.e. compatible with SciPy, etc.), 
+        where the [3] is Blue, Red, Green unsigned character values.
+
+        uint8 [height][width][4] arrays (Red, Green, Blue, Mask) are displayed with their mask.  Other numpy images -- gray [height][width]
+        images, floating-point images (0-255, or 0-1 with normalized=True or opt.normalized()) and integer images -- are converted first
+        with pybox.convert_bitmap(), keeping the mask of [4] images.  Conversions of images that are not uint8 or
+        floating-point are slower, and are reported by pybox.conversion_stats().
+        """
+        if isinstance(bitmap,numpy.ndarray) : bitmap,kwargs = _display_array(bitmap,args,kwargs)
+        return _pybox.WindowDisplayBitmap(self.__id,bitmap,opt.at(x,y),opt.size(size),*args,**kwargs)
+
+    def display_bitmap_l(self,at : list,bitmap,size=None,*args,**kwargs) :
+        """
+        Displays a bitmap on the screen at the (x,y) position given. See display_bitmap() to use a (x,y) as independent values.
+
+        Optional Keywords and Parameters
+
+        - size      - Sets the size of the bitmap -- the default is the same size as the bitmap. 
+                    \t -note: leaving one value at 0 will cause the bitmap to be scaled proportionally.
+
+                     for Example, "window.display_bitmap_l(MyBitmap,Size=(500,0))" will cause the bitmap to be displayed at a width of 500 pixels 
+                     and height to be proportional to the width and display correctly.
+
+        - Reversed   - This will cause the bitmap to be displayed upside-down, since bitmaps can vary.  Also use display_bitmap_r_l() to display the bitmaps upside-down
+
+        About Bitmaps: 
+        
+        Bitmaps can be a Pybox CBitmap-type bitmap or an unsigned char numpy array in the form [height][width][3] (i.e. compatible with SciPy, etc.), 
+        where the [3] is Blue, Red, Green unsigned character values.
+        """
+        if isinstance(bitmap,numpy.ndarray) : bitmap,kwargs = _display_array(bitmap,args,kwargs)
+        return _pybox.WindowDisplayBitmap(self.__id,bitmap,opt.at(int(at[0]),int(at[1])),opt.size(size),*args,**kwargs)
+
+    def display_bitmap_r(self,x : int, y : int, bitmap, size=None,*args,**kwargs) :
+        """
+        Displays a bitmap upside-down on the screen at the (x,y) position given. See display_bitmap_r_l() to use a list, array, or tuple for the (x,y) location
+
+        For a bitmap that is not displayed upside-down, see display_bitmap()
+
+        Optional Keywords and Parameters
+
+        - size      - Sets the size of the bitmap -- the default is the same size as the bitmap. 
+                    \t -note: leaving one value at 0 will cause the bitmap to be scaled proportionally.
+
+                       For example, "window.display_bitmap_r(MyBitmap,Size=(500,0))" will cause the bitmap to be displayed at a width of 500 pixels and 
+                       height to be proportional to the width and display correctly.
+
+        About Bitmaps: 
+        
+        Bitmaps can be a Pybox CBitmap-type bitmap or an unsigned char numpy array in the form [height][width][3] (i.e. compatible with SciPy, etc.), 
+        where the [3] is Blue, Red, Green unsigned character values.
+        """        
+        if isinstance(bitmap,numpy.ndarray) : bitmap,kwargs = _display_array(bitmap,args,kwargs)
+        return _pybox.WindowDisplayBitmapR(self.__id,bitmap,opt.at(int(x),int(y)),opt.size(size),*args,**kwargs)
+
+    def display_bitmap_r_l(self,at : list, bitmap,size=None,*args,**kwargs) :
+        """
+        Displays a bitmap upside-down on the screen at the (x,y) position given. See display_bitmap_r() to use independent x,y values.
+
+        For a bitmap that is not displayed upside-down, see display_bitmap()
+
+        Optional Parameters
+
+        - size      - Sets the size of the bitmap -- the default is the same size as the bitmap. 
+                    \t -note: leaving one value at 0 will cause the bitmap to be scaled proportionally.
+
+                       For Example, "window.DisplayBitmapR(MyBitmap,size=(500,0))" will cause the bitmap to be displayed at a width of 500 pixels and 
+                       height to be proportional to the width and display correctly.
+
+        About Bitmaps: 
+        
+        Bitmaps can be a Pybox CBitmap-type bitmap or an unsigned char numpy array in the form [height][width][3] (i.e. compatible with SciPy, etc.), 
+        where the [3] is Blue, Red, Green unsigned character values.
+        """        
+        if isinstance(bitmap,numpy.ndarray) : bitmap,kwargs = _display_array(bitmap,args,kwargs)
+        return _pybox.WindowDisplayBitmapR(self.__id,bitmap,opt.at(int(at[0]),int(at[1])),opt.size(size),*args,**kwargs)
+
+    def transform_bitmap(self,x : int, y : int,bitmap,angle : float = 0,zoom : float = 1.0) :
+        """
+        Transform Bitmap will display a bitmap at the (x,y) positon in the window rotated at a specified angle and with a specified zoom. 
+
+        See transform_bitmap_l() to use a list,tuple, or array to specify the location.
+
+        Options:
+
+        - x,y       \t -- Location of the bitmap in the window
+        - bitmap    \t -- The bitmap.  The bitmap may be a pybox bitmap (CBitmap) or an RGB array bitmap (i.e. SciPy -- See DisplayBitmap() for more details.
+        - angle     \t -- The angle in radians to display the bitmap.  The default is 0 (no rotation).  
+        - Zoom      \t -- The zoom factor to display the bitmap.  The default is 1.0 -- for example, 2.0 is 2x the size, etc.
+
+        note: If the bitmap is displayed upside down, add 3.14159 to the angle (i.e. 180 degrees)
+
+        Masks
+
+        If the bitmap has a mask associated with it (i.e. it is a PNG or 32-bit BMP) the mask will be used to create the transparency mask and blend with the window background.
+
+        Example: window.transform_bitmap(50,50,MyBitmap,30*3.14159/180,.5)  - Display a bitmap at 50,50 rotated at 30 degrees at half its size (.5x)
+        """
+        return _pybox.WindowTransformBitmap(self.__id,int(x),int(y),bitmap,float(angle),float(zoom),False)
+
+    def transform_bitmap_l(self,at : list,bitmap,angle : float = 0,zoom : float = 1.0) :
+        """
+        Transform Bitmap will display a bitmap at the (x,y) positon in the window rotated at a specified angle and with a specified zoom. 
+
+        See transform_bitmap() to use a independent x,y values for the location of the bitmap.
+
+        note: If the bitmap is displayed upside down, add 3.14159 to the angle (i.e. 180 degrees)
+
+        Options:
+
+        - x,y       \t -- Location of the bitmap in the window
+        - bitmap    \t -- The bitmap.  The bitmap may be a pybox bitmap (CBitmap) or an RGB array bitmap (i.e. SciPy -- See DisplayBitmap() for more details.
+        - angle     \t -- The angle in radians to display the bitmap.  The default is 0 (no rotation).  
+        - Zoom      \t -- The zoom factor to display the bitmap.  The default is 1.0 -- for example, 2.0 is 2x the size, etc.
+
+        Masks
+
+        If the bitmap has a mask associated with it (i.e. it is a PNG or 32-bit BMP) the mask will be used to create the transparency mask and blend with the window background.
+
+        Example: window.transform_bitmap_l((50,50),MyBitmap,30*3.14159/180,.5)  - Display a bitmap at 50,50 rotated at 30 degrees at half its size (.5x)
+        """
+        return _pybox.WindowTransformBitmap(self.__id,int(at[0]),int(at[1]),bitmap,float(angle),float(zoom),False)
+
+    def get_integer(self,text=None,*args, **kwargs)   -> int :
+        """
+        Gets an integer value from a window that pops up with an input box.  The return value is the integer entered or default value.
+        Call pybox.was_canceled() to determine if the user canceled the input box (opt.nocancel() will disallow the ability to cancel)
+
+        Options:
+
+        text        \t - [optional] The text to put as a header in the box.  You can use multiple lines.
+                    \t - if the first line starts with '+' that line becomes the title in the title bar and subsquent lines are printed in the description.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - Range         \t -Set a range for the input.  This will not allow an input outside of the range, but can allow the user to press return
+        - Default       \t -Sets the default value.  This is placed in the input box when the box first comes up.  If the user presses return on a blank line, the default is returned.
+        - NoCancel      \t -By defaut, there is a cancel button to allow the user to cancel.  You can call pybox.was_canceled() which returns True if the last input box was canceled.
+                        \t -When NoCancel is specified, the user cannot cancel or press return on an empty line and must enter a value (a control-C may be pressed to stop the program.
+
+        Examples:       \t -My Value = window.get_integer("Enter a number")
+                        \t -My Value = window.get_integer("+This is the title bar title\\nEnter a number",range=(1,100),nocancel=True)
+                        \t -My Value = window.get_integer("Enter a number\nNumber should be between 1 and 100,opt.range(1,100),opt.default(10))
+        """
+        return _pybox.WindowGetInteger(self.__id,text,*args, **kwargs)
+
+    def get_float(self,text=None,*args,**kwargs)   -> float :
+        """
+        Gets an floating-point value from a window that pops up with an input box.  The return value is the integer entered or default value.
+        Call pybox.was_canceled() to determine if the user canceled the input box (opt.nocancel() will disallow the ability to cancel)
+
+        Options:
+
+        text        \t - [optional] The text to put as a header in the box.  You can use multiple lines.
+                    \t - if the first line starts with '+' that line becomes the title in the title bar and subsquent lines are printed in the description.
+
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - range         \t -Set a range for the input.  This will not allow an input outside of the range, but can allow the user to press return
+        - default       \t -Sets the default value.  This is placed in the input box when the box first comes up.  If the user presses return on a blank line, the default is returned.
+        - noCancel     \t -By defaut, there is a cancel button to allow the user to cancel.  You can call pybox.was_canceled() which returns True if the last input box was canceled.
+                        \t -When NoCancel is specified, the user cannot cancel or press return on an empty line and must enter a value (a control-C may be pressed to stop the program.
+
+        Examples:       \t -My Value = window.get_float("Enter a number")
+                        \t -My Value = window.get_float("+This is the title bar title\\nEnter a number",range=(1,100),nocancel)
+                        \t -My Value = window.get_float("Enter a number\nNumber should be between 1 and 100,opt.range(1,100),opt.default(10))
+        """
+        return _pybox.WindowGetFloat(self.__id,text,*args,**kwargs)
+
+    def set_cls_bitmap(self,bitmap,cls_now : bool = False) -> bool : 
+        """
+        Sets the bitmap to use as the background bitmap when cls() clears the window. 
+        The Bitmap is placed at (0,0) -- options will be added in a future release to center and size the image 
+
+        A bitmap can be a Pybox/Sagebox bitmap or an array-based bitmap compatible with packages such as SciPy, etc. 
+
+        About Bitmaps: Bitmaps can be a pybox bitmap or a general RGB array bitmap (i.e. numpy array) in the form [height][width][3], where the [3] is Blue, Green, and Red,
+        or an RGB32 bitmap array of [height][width][4] where the 4 values are Red, Green, Blue, and Mask, in that order.
+    
+        The bitmap format can be unsigned char, float, double, mono, mono float, and half-float. 
+
+        Note: The bitmap is copied and stored privately.  The bitmap given to the SetClsBitmap() function does not need to be saved or maintained.
+        """
+        self.__cls_groups = ()
+        return _pybox.WindowSetClsBitmap(self.__id,bitmap,cls_now)
+
+    def set_realtime(self) :
+        """
+        Sets RealTime status for Window.
+        
+        This sets the status of the Window for real-time drawing, includes setting the high-resolution timer and turning off Auto Updates to the Window.
+        
+        This can be used when drawing real-time graphics to a window for smoother graphics using the vertical resync. 
+        
+        Also See: vsync_wait()
+        """
+        return _pybox.WindowSetBool(self.__id,0,True)
+      
+    def cls(self,color1 = None,color2 = None) :
+        """
+        Clears the window to a blank canvas.
+
+        Example: window.Cls()       \t -- this clears the window to the current color(s) or bitmap set for Cls()
+
+        Also see: ClsHold() to clear the window but also stop the window from updating until Update is called (or ClsHold() is called again)
+
+        Parameters
+
+            color1      \t -- [optional] This is the color to clear the screen
+            color2      \t -- [optional] When two colors are used, the window is cleared with a gradient of the two colors
+
+        About Colors
+
+        Colors may be text colors, such as "red" or "forestgreen" or "PanColor:forestgreen" or pybox.RgbColors, such as "0,255,0" for green.
+        Colors may also be symbolic SageColor or PanColor colors, such as SageColor.SkyBlue() or PanColor.Blue()
+
+        Examples:
+
+        cls()                           \t -- Clear the window with the current background color of the window
+        cls("red")                      \t -- Clear the window with the color red
+        cls(SageColor.Red())            \t -- Clears the color with red, also
+        cls(PanColor.ForestGreen())     \t -- Clears the window with PanColor.ForestGreen
+        cls(MyColor)                    \t -- Clears the window with a defined "MyColor", such as MyColor = pybox.RgbColor(0,255,0)
+        cls("black,blue")             \t -- Clears the window with a gradient from black to blue
+        """
+        if color1 is not None or color2 is not None : self.__cls_groups = ()
+        return _pybox.WindowCls(self.__id,_library_color(color1),_library_color(color2),False)
+    
+    def cls_radial(self,color1 = None,color2 = None) :
+        """
+        cls_radial() is like cls(), clearing the window with a backround color.
+        cls_radial() takes two color and will clear the window in a radial pattern from the center.
+
+        This can be a nice alternative to cls(), which clears the window with a plain color or vertical gradient.
+        A radial gradient can look asesthetically nice and focus the viewer on elements in the window.
+
+        note: once cls_radial() is used with colors (e.g. cls_radial("blue,black"), cls() and cls_radial() will remember the last colors and the radial status
+              and clear the window in the same radial colors (blue and black, in this example).
+
+        Examples
+
+
+        cls_radial()      \t\t\t-- use default colors (unless cls_radial() was already used with different colors, in which case it will use those colors)
+        cls_radial("darkblue,black")    \t\t - clear the window with dark blue in the center, extending to black at the edges of the window
+        cls_radial(mycolor1,mycolor2)   \t\t - clear the window with a radial gradient with two program-based colors
+        """
+        self.__cls_groups = ()
+        return _pybox.WindowCls(self.__id,_library_color(color1),_library_color(color2),True)
+
+    def draw_grid(self,spacing : int = 25,**kwargs) -> bool :
+        """
+        Draws a grid of lines in the X and Y axis to create a graph on the screen.
+
+        The "spacing" parameter controls how many pixels are between each set of lines.
+        
+        Keywords and Pybox options can be included.  Some various options are as follows:
+
+        - color                       \t -Sets the color of the grid, i.e. "white","red","45,67,123", etc. Default color is RGB(42,42,42) (i.e. dark gray)
+
+        The default for the "spacing" parameter is 25 pixels.
+
+        Examples:
+     
+        \t -MyWindow.draw_grid()                \t -- Draws default grid
+        \t -MyWindow.write(50)                  \t -- Draws a grid with spacing of 50 pixels 
+        \t -MyWindow.write("green")             \t -- Draws a grid with the color green
+        \t -MyWindow.write(50,"0,255,255")      \t -- Draws a grid with spacing of 50 and an RGB color of (0,255,255) or "cyan"
+        """
+        return _pybox.WindowDrawGrid(self.__id,spacing,**kwargs)
+    
+    def draw_vector(self,p1 : list, p2 : list,line_size,color,**kwargs) : 
+        """
+        Draws a vector from point p1 to p2.  A vector is the same thing as a line, but with some differences and a number of controls that 
+        can be used to modify its behavior and appearance.
+        
+        The vector also has beginning and end 'caps'.  The default is for the beginning of the line to have a round shape (e.g. round cap), and
+        the end of the line to have a larger arrow shape (known as an 'arrow' cap, but because it's larger it's known as an 'arrow anchor')
+        
+        The default behavior for draw_vector is to draw the vector in a white color, with a round beginning cap and an 'arrow anchor' ending cap.
+        
+        Input
+        
+        - p1,p2             - Beginning and End Points of the line, such as (100,400),(600,700) or (x1,y1),(x2,y2), etc.
+        - line_size         -size of the line in pixels.
+        - color             - color of vector line.
+        
+        Example of simple usage: window.draw_vector(p1,p2,10) or draw_vector((x1,y1),(x2,y2),10)
+        
+        Text, colors, and many others may be assign through the following keywords
+
+        - title         - Sets the title to display on the vector line, e.g. title="This is a vector.  Default behavior is no title.
+        - opacity       - Sets the opacity to draw the line.  Range is 0-255, with 0 transparent and 255 fully opaque. Default is 255 (fully opaque).
+        - angle         - Rotates the vector at its center by the angle specified.  "angle" is in degrees.  "AngleDeg" may also be used to specify degrees
+        - angle_rad     - Same as "angle", but uses radians instead of degrees, e.g. angle_rad = 1.57 (for 90 degrees)
+        - text_size     - Sets the relative font size of the label.  The default font varies in size based on line thickness. 
+                          text_size values can me "xxsmall","xsmall","small","medium","large,"xlarge", "xxlarge".  Default is "small".  "default" may also be used as an option.
+        
+        - label_font (or "font")    - Sets a specific font size or type for the vector line.  The font will not change based on line thickness when set in this manner.
+                                      Fonts may be set with just a size, such as a number, e.g. font=25 (for default font Arial at 25 points), or a full font name, e.g. font="time new roman,25"
+        
+        - label_just (or "just")    - Sets the justification of the vector label text.  Default is "top-left".  
+                                      Options are: "top-left","top-left-center","top-center","top-right-center","top-right".  "bottom" and "middle" may be used instead of top to specify the 
+                                      bottom of the vector line or middle of the line (vertically), respectively.  Example: just="bottom-right"
+
+        - capsize       - Sets the beginning and end cap of the vector to a multiple of the capsize specified.  This is useful only for 'anchor' cap types
+                          such as 'round achor', 'arrow anchor',etc.  The anchor types grow and shrink based on line thickness.
+                          using "capsize" can make the beginning and end caps smaller or larger.
+                          example capize=2 makes any anchor cap 2x larger.  see "begcapsize" and "endcapsize" to control cap sizes individually.
+
+        - begcap_size (or "begcap")   - Sets the begininng cap size if the begnining cap is an 'anchor' cap type.  See documentation on 'capsize', which will set both
+                                        beginning and end cap together.
+                          
+        - endcap_size (or "endcap")  - Sets the end cap size if the end cap is an 'anchor' cap type.  See documentation on 'capsize', which will set both
+                                       beginning and end cap together.
+ 
+        - begcap_type       - Sets the beginning cap type.  by default, the cap type for the begining of the vector is "round"
+                              possible types are "round","diamond","arrow","square","flat","round anchor","diamond anchor","arrow anchor","diamond anchor"
+                              "anchor" types are larger and can be made smaller or larger with "capsize" or "begcap_size"
+                                       
+        - endcap_type       - Sets the ending cap type.  by default, the cap type for the enf of the vector is "arrow anchor"
+                              possible types are "round","diamond","arrow","square","flat","round anchor","diamond anchor","arrow anchor","diamond anchor"
+                              "anchor" types are larger and can be made smaller or larger with "capsize" or "begcap_size"
+        - begcap_color      - Sets the color of the beginning cap of the vector.  This is useful for "anchor" cap types which are larger.  
+                              Example: begcap_color="yellow"                             
+        - endcap_color      - Sets the color of the ending cap of the vector.  This is useful for "anchor" cap types which are larger.  
+                              By default, the begining and end caps are the same color as the vector line itself.  Example: endcap_color="red"  
+        - label_pad_x (or "pad_x")  - Sets extra spacing on the left or right of the label on the vector.  Positive values move the title to the right
+                                      (as formed by p1-p2), with negative values moving the title to the left.
+        - label_pad_y (or "pad_y")  - Sets extra spacing on the top or bottom of the label on the vector.  Positive values move the title upwards
+                                      (as formed by p1-p2), with negative values moving the title downward.
+        - label_opacity     - Sets the opacity of the vector's label.  By default, the opacity of the vector label is the same as the line, either by default or
+                              when the line opacity is specifically specified.  Using label_opacity will cause the label's opacity to use this value.
+        - label_color   - Sets the color of the vector label, e.g. label_color="red".  By default, the label's color is white, regardless of the line color.
+        - label_angle   - Sets the label of the angle with 3 options: "horizontal" (default), "vertical", or "vertical 180".  "vertical" and vertical 180" make the label
+                          appear sideways on the line, with "vertial 180" reversing it's direction, with the start of the text appearing away from the line.
+                          Add the term "static" to keep the label the exact orientation regardless of line angle, e.g. 'label_angle="horizontal,static"' will cause
+                          the text to display at 0 degrees relative to the screen rather than the line itself.
+                          
+        - label_up      - Keeps the vector's label right-side up. As the vector rotates and the label's orientation, using "label_up=True" will keep the label
+                          right-side up when the label's angle is such that the label would otherwise appear upside-down.
+        - set_center    - Sets the center of the vector, regardless of p1 and p2.  This calculates the relative center of the vector (i.e. (p1+p2)/2-p1), and
+                          places the center of the vector at the new (x,y) coordinates.  Example set_center=(500,200) or set_center=(x,y)
+                          This is useful in simply specifying a length in the draw_vector call as p1 and p2, such as draw_vector((0,0),(0,x),...) then
+                          setting the center and angle of the vector with "set_canter" and "angle" keywords, respectively/
+        - show_center   - puts a circle in the center of the vector.  This is for purely diagnostic purposes, showing the center is where it should be based on 
+                          the calling's functions calculation.  Use "show_center=True" to show the circle in cyan.  
+                          Use "show_center=<color>" to set the color, e.g. 'show_center="black"'
+        """
+        return _pybox.WindowDrawVector(self.__id,p1[0],p1[1],p2[0],p2[1],line_size,_library_color(color),**kwargs)
+    
+    def new_turtle_graphics(self,**kwargs) :
+        """
+        Gets a new TurtleShell object for Turtle Graphics-type drawing.
+        
+        - Returns a TurtleShell object for drawing to the window in turtle-graphics style.
+        - This incldes real-time Turtle Graphics.
+        
+        TurtleShell is still in development. 
+        
+        This section will be filled out more in future releases.
+        
+        See various TurtleShell examples and function descriptions in the returned TurtleShell object
+        
+        Some Notes:
+        -----------
+        
+        TurtleShell operates the same as Turtle Graphics in most ways.  The functions are the same, with some additions for opacities and gradients, as well as other functions.
+    
+        - TurtleShell does not display each segment drawing, showing each segment after it is drawn.  
+        - As with Turtle Graphics, the speed can be set to show each element drawing.
+        
+        - Setting a speed to zero will allow for real-time graphics. 
+        - TurtleShell is meant to be a Turtle Graphics environmemt with some additions to allow more functionality than original turtle graphics.
+        - TurtleShell is a prototype at the moment, and the idea is to bring more functions into it, including GPU-based and 3-D Turtle Graphics.
+    
+        See various examples and documentation on TurtleShell functions for more information.
+        """
+        from .turtle_shell import TurtleShell
+        return TurtleShell(_pybox.WindowNewTurtleShell(self.__id,**kwargs))
+    
+    def new_draw_group(self,function) -> DrawGroup :
+        """
+        Returns a new DrawGroup -- a function that draws a static part of the window's scene, called by display_draw_groups() in place
+        of cls() and the drawing calls at the start of a frame.  See DrawGroup for more information.
+
+        Parameters
+
+        - function      \t -- Function that draws into the window with the window's functions, called as function(window)
+
+        Examples:
+                    \t -background = win.new_draw_group(lambda win : win.cls_radial("darkblue,black"))
+                    \t -grid       = win.new_draw_group(lambda win : win.draw_grid(50))
+        """
+        from .draw_group import DrawGroup
+        return DrawGroup(self,function)
+
+    def display_draw_groups(self,*groups) -> bool :
+        """
+        Clears the window and draws one or more draw groups, in order (the first group at the bottom) -- use it in place of cls() at
+        the start of each frame.
+
+        The first time the groups are displayed, and when a group is changed (see DrawGroup.set_unchanged()), the window is cleared,
+        the groups' functions are called, and the window's display is set as its cls() bitmap (see use_win_as_cls()).  When the same
+        groups are displayed again, unchanged, the functions are not called and the window is cleared to that bitmap with cls().
+
+        Parameters
+
+        - groups    \t -- Draw groups to display (see new_draw_group()), or one list of groups
+
+        Examples:
+                    \t -win.display_draw_groups(background,grid)
+        """
+        if len(groups) == 1 and isinstance(groups[0],(list,tuple)) : groups = groups[0]
+        from .draw_group import _display_draw_groups
+        self.__cls_groups = _display_draw_groups(self,tuple(groups),self.__cls_groups)
+        return True
+
+    def new_text_block(self,template : str,at=None,*args,**kwargs) -> TextBlock :
+        """
+        Returns a new TextBlock for the window -- a block of text with named slots for values that change, i.e. a readout of 
+        values written each frame.  See TextBlock for more information.
+
+        Parameters
+
+        - template      \t -- Text of the block, with slots written as {$name} or {$name:format}, i.e. "Angle:{x=130}{c}{$angle:.4f}"
+        - at            \t -- [optional] (x,y) position of the block.  By default, the block is written at the current write position.
+        - args,kwargs   \t -- [optional] Options for write(), i.e. font=20
+
+        Examples:
+                    \t -readout = win.new_text_block("Mass 1:{x=130}{g}{$mass1:.2f}\\nZoom:{x=130}{g}{$zoom:.2f}%",at=(10,10))
+                    \t -readout.draw(mass1=pend.mass[0],zoom=pend.zoom*100)
+        """
+        from .text_block import TextBlock
+        return TextBlock(self,template,at,*args,**kwargs)
+
+    def new_display_list(self) -> DisplayList :
+        """
+        Returns a new, empty DisplayList for the window.
+
+        A DisplayList records drawing calls (i.e. display_list.fill_circle(), display_list.line()) instead of drawing them, and draws them
+        all with one replay() call -- i.e. for the parts of a scene that do not change each frame.  Recorded items can be changed with update(). 
+        See DisplayList for more information.
+
+        Examples:
+                    \t -scene = win.new_display_list()
+                    \t -scene.fill_circle(400,300,50,"yellow")
+                    \t -win.cls()
+                    \t -scene.replay()
+        """
+        from .display_list import DisplayList
+        return DisplayList(self)
+
+    def get_mouse_region(self,**kwargs) -> MouseRegion :
+        """
+        Returns a reference to the Window's Mouse Region object.  Each window has one Mouse Region object that it maintains.        <para></para>
+        
+        Mouse Regions can be used to easily highlight, select, and move various 'mouse region' areas, allowing the window to maintain
+        a number of selectable objects for the main program.
+        
+        For example, if you have a curve with a number of selectable points, the Mouse Region object can maintain (and display) these points so the
+        main program does not have to get the mouse input and determine which area is being highlighted, selected, moved, etc.
+        
+        - Keywords can be added for control of the mouse region, notably kw::AutoDraw() to set any drawing characteristics when MouseRegion::AutoDraw() is called.
+        - ** Important Note **. Don't call MouseRegion::UpdatePoints() with the Mouse Region obtained through this function.  UpdatePoints() is automatically called.
+        
+        Keywords usable with mouse_region:
+        
+        - auto_draw           \t - Set auto_draw characteristics for all new regions/points added. See auto_draw() function in returns MouseRegion object.
+        - bound_box()          \t - Sets a bounding region for all new regions/points added.      
+         """ 
+        from .mouse_region import MouseRegion
+        return MouseRegion(_pybox.WindowGetMouseRegion(self.__id,**kwargs))
+
+    def use_win_as_cls(self,use_bitmap : bool = True) :
+        """
+        Sets the current display in the window as the bitmap to display when the Cls() function is used.
+        
+        - Use cls() with any color or bitmap to clear the bitmap usage.
+        - This function may also be called to remove the bitmap as the Cls Bitmap by setting use_bitmap to False, e.g. use_win_as_cls(False)
+
+        Input Parameters :
+        
+        - use_bitmap        \t- [optional] When true, this sets the current window display as the cls() bitmap.  
+                                \t When False, this returns cls() to its normative state that simply clears the window canvas.
+        """
+        self.__cls_groups = ()
+        return _pybox.WindowUseWinasCls(self.__id,use_bitmap)
+    
+    def clip_window(self,x : int,y : int, width : int, height : int) :
+        """
+        Clips the window in the given rectangle, restricting output and drawing to that region.
+        
+        This can be used to restrict write areas, cls(), drawing, etc. 
+        
+        For example, a graph can be drawn with the clip and will not exceed the clip area.  This can be very useful and 
+        allow such drawing and output in place of creating a child window to perform the same task.
+        
+        - Use  reset_clip() or clip_window() (with no paramaters) to remove the clipping region
+        - see clip_window_l() to use a list for x,y and w,h input (respectively), e.g. clip_window_l(pos,size)
+        - see clip_window_r() to use a list for input x,y, width height, e.g. clip_window_r((x,y,w,h))
+        
+        Input Parameters:
+        
+        - x,y                   -\t x,y position of upper-left of clip rectangle
+        - width, height         -\t width and height of rectangle from upper-left (x,y)
+        """
+        return _pybox.WindowClipWindow(self.__id,x,y,width,height)
+
+    def clip_window_l(self,pos : list,size : list) :
+        """
+        Clips the window in the given rectangle, restricting output and drawing to that region.
+        
+        This can be used to restrict write areas, cls(), drawing, etc. 
+        
+        For example, a graph can be drawn with the clip and will not exceed the clip area.  This can be very useful and 
+        allow such drawing and output in place of creating a child window to perform the same task.
+        
+        - Use  reset_clip() or clip_window() (with no paramaters) to remove the clipping region
+        - see clip_window() to use independent values for x,y, and width,height, e.g. clip_window(x,y,width,height)
+        - see clip_window_r() to use a list for input x,y, width height, e.g. clip_window_r((x,y,w,h))
+        
+        Input Parameters:
+        
+        - pos                   -\t x,y position of upper-left of clip rectangle
+        - size                  -\t width and height of rectangle from upper-left (x,y)
+        """
+        return _pybox.WindowClipWindow(self.__id,size_rect[0],size_rect[1],size_rect[2],size_rect[3])
+   
+    def clip_window_r(self,size_rect : list) :
+        """
+        Clips the window in the given rectangle, restricting output and drawing to that region.
+        
+        This can be used to restrict write areas, cls(), drawing, etc. 
+        
+        For example, a graph can be drawn with the clip and will not exceed the clip area.  This can be very useful and 
+        allow such drawing and output in place of creating a child window to perform the same task.
+        
+        - Use  reset_clip() or clip_window() (with no paramaters) to remove the clipping region
+        - see clip_window() to use independent values for x,y, and width,height, e.g. clip_window(x,y,width,height)
+        - see clip_window_l() to use a list for x,y and w,h input (respectively), e.g. clip_window_l(pos,size)
+        
+        Input Parameters:
+        
+        - size_rect             -\t list/array with 4 values: x,y, width and height (x,y position of upper-left of clip rectangle, and width, height)
+        """
+        return _pybox.WindowClipWindow(self.__id,size_rect[0],size_rect[1],size_rect[2],size_rect[3])
+
+    def reset_clip(self) :
+        """
+        Resets any clipping region active for the current window. 
+        
+        See clip_window() for more information
+        """
+        return _pybox.WindowResetClip(self.__id)
+
+    def update(self) :
+        """
+        Updates the window. 
+
+        With Pybox in Python, this is usually not needed.  Pybox is set to update the window automatically from 10-25ms.  However, for real-time uses,
+        setting the udpates to passively "On" means that update() may be needed in some loops, as it better to turn off updates when displaying real-time data. 
+
+        The default for Updates in Pybox is "on_time", where setting Updates to simple "On" gives more control over updating, but also must be managed a little -- Any window that needs updated 
+        (i.e. has been written to since the last udpate) is still updated every 10-20ms, but in a passive manner when Pybox functions are called.
+
+        When Updates are not completely automatic, pybox updates the window whenever most display, event or other function are called.  Pybox only updates windows that need it.
+        However, when a pybox function is not called for a while (such as being in a long loop), the Update may lag.  Update() can be called to ensure the window is updated.
+
+        Even when Updates are simple "on" i.e. passive, wait_event() updates any window that needs it.  If you're in an event loop, the Window will only not be updated (as needed) when
+        Updates are completel turned "off:
+
+        See set_auto_update() for more information.
+
+        Each update displays the whole window -- the Pybox library has no function to display part of a window.  With dirty tracking
+        (see enable_dirty_tracking()), get_dirty_rect() tells whether anything was drawn since the last update, so that an update can be
+        skipped when nothing changed.  The dirty rectangle is cleared by each update.
+
+        When frame statistics are enabled (see enable_frame_stats()) and the loop does not use vsync_wait(), each call ends a frame.
+        """
+        if self.__dirty is not None : self.__dirty.clear()
+        stats = self.__frame_stats
+        if stats is None : return _pybox.WindowUpdate(self.__id)
+        stats._begin_present(self,False)
+        result = _pybox.WindowUpdate(self.__id)
+        stats._end_present(False)
+        return result
+
+    def enable_dirty_tracking(self) -> DirtyRect :
+        """
+        Starts tracking the region drawn in the window since the last update() or vsync_wait() -- see get_dirty_rect().
+
+        The window's drawing functions (draw.*, display_bitmap(), cls(), write(), etc.) add the bounding box of what they draw, including
+        the pen size.  Shapes drawn with a transform set, text, and drawing functions whose area is not known in Python mark the whole
+        window.  Drawing done in other ways (i.e. by controls and widgets, or by the library itself) is not seen -- use mark_dirty() for it.
+
+        The window is still updated as a whole: the Pybox library can't display part of a window.  The dirty rectangle can be used to skip
+        updates when nothing was drawn, or to redraw only the region that changed in the program's own buffers.
+
+        Tracking adds about 2 microseconds to each drawing call.
+
+        Examples:
+                    \t -win.enable_dirty_tracking()
+                    \t -while win.get_event() :
+                    \t -    if ticked() : win.draw.fill_rectangle(10,10,50,20,"red")
+                    \t -    if win.get_dirty_rect() is not None : win.update()     - only when something was drawn
+        """
+        if self.__dirty is None :
+            from .dirty_rect import DirtyRect
+            self.__dirty = DirtyRect(self)
+            self.__dirty._install()
+        return self.__dirty
+
+    def disable_dirty_tracking(self) -> bool :
+        """
+        Stops tracking the region drawn in the window -- see enable_dirty_tracking().
+        """
+        if self.__dirty is not None :
+            self.__dirty._uninstall()
+            self.__dirty = None
+        return True
+
+    def get_dirty_rect(self) :
+        """
+        Returns the (x,y,width,height) bounding box of everything drawn in the window since the last update(), vsync_wait() or clear_dirty(),
+        clipped to the window, or None if nothing was drawn.  See enable_dirty_tracking().
+
+        Without dirty tracking, only the regions added with mark_dirty() are returned.
+        """
+        return None if self.__dirty is None else self.__dirty.rect()
+
+    def mark_dirty(self,x : int = None,y : int = None,width : int = None,height : int = None) -> bool :
+        """
+        Adds a region to the window's dirty rectangle (see get_dirty_rect()), i.e. for drawing that dirty tracking can't see.
+        With no arguments, the whole window is marked as dirty.
+
+        Examples:
+                    \t -win.mark_dirty(100,100,40,20)
+                    \t -win.mark_dirty()                  - the whole window
+        """
+        if self.__dirty is None :
+            from .dirty_rect import DirtyRect
+            self.__dirty = DirtyRect(self)
+        if x is None : self.__dirty.add_window()
+        else : self.__dirty.add(x,y,x + width,y + height)
+        return True
+
+    def clear_dirty(self) -> bool :
+        """
+        Clears the window's dirty rectangle (see get_dirty_rect()).  update() and vsync_wait() clear it as well.
+        """
+        if self.__dirty is not None : self.__dirty.clear()
+        return True
+
+    def dont_update(self) :
+        """
+        Tells Pybox not to update any window until the next pdate() is called manually by the program. 
+        Pybox will stop updating completely -- even on Window repaints -- until pdate() is once again called by the program. 
+
+        This can be useful when generating real-time displays to avoid flickering and partial information being displayed before it is ready.
+        """
+        return _pybox.WindowDontUpdate(self.__id)
+
+    def set_auto_update(self,updateType : str) :
+        """
+        Sets the auto update type in pybox. See Update() for more information.
+
+        The default for pybox is "Immediate".  The default for C++ Sagebox is "On"
+
+        on -    The window will auto passively update every 10-20ms.  This means when any pybox display or wait_event() function is called and a window needs
+                Updating, pybox will do it, but it is not guaranteed for code that lingers/loops after the last display function.  
+            
+                For most applications, pybox will update the window when necessary, since any waiting (i.e. exit_button() or wait_event()) function or
+                display function (i.e. Write()) will update the window if the window needs it. 
+
+                In loops that can take time, or without a pybox call of some sort, sometimes a pybox.Update() may
+                be necessary to ensure the window is updated.
+
+        off -   The window will not be updated, and it is the program's responsibility to do so.
+                This can be useful when redrawing the screen in a real-time setting, to avoid flashing.
+
+        immediate - Updates the screen after every single display operation.  This can be slow when a lot of data is put out to the screen, but it is
+                    guaranteed and the update status never needs to be managed.  This can be useful for putting out data from equipment, etc. 
+                    Also see 'OnTime'
+
+        on_time - The update is mixed with 'On' (which updates when a Pybox function see the window needs it) and a timer in the 25ms range.
+                    If Pybox has not updated the window on its own within 25ms, the timer set will instruct Pybox to do it immediately behind the scenes.
+                    This can be a good mode because it is fast and guaranteed, because the window is only updated every 10-20ms, with a follow-up if
+                    no Pybox functon was called in that time. 
+
+                    This mode can interfere with real-time displays, so setting the Update to either On or Off can be more streamlined in this type of application.
+
+        In all modes, an update displays the whole window (see update()).
+        """
+        return _pybox.WindowSetAutoUpdate(self.__id,updateType)
+
+    def wait_for_close(self) :
+        """
+        Waits for the window to close before continuing. 
+        
+        - Waits until the user closes the window, or a system event closes the window (such as a program shutdown)
+        - If the window is already closed, or is in the process of closing, this function returns without waiting. 
+        - If the window is currently hidden, it will reappear on the screen so that it may be manually closed.
+        """
+        return _pybox.WindowWaitForClose(self.__id)
+    
+    def closing(self) :
+        """
+        Returns true if the Window is closing due to a button press or some other action.
+
+        Use close_button_pressed() (which sets closing status) to determine if the user pressed the button specifically.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.WindowClosing(self.__id)
+
+    def closed(self) :
+        """
+        Returns true if the Window is closing due to a button press or some other action.
+
+        Use close_button_pressed() (which sets closing status) to determine if the user pressed the button specifically.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.WindowClosing(self.__id)
+
+    def close_button_pressed(self) -> bool:
+        """
+        Returns true if the user pressed the close button on the window (upper-right-hand X or pressed ALT-F4). 
+        Pressing the close button sets the Window Closing status.
+
+        You can also use Closing() to determine if the Window wants to close for any reason (i.e. pressing the close button or some system action)
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.WindowButtonClosing(self.__id)
+
+    def show(self,show : bool = True) :
+        """
+        If the window is hidden from view, show() will make the window visible.
+        
+        Parameters: 
+        
+        - show -- when True (default), the window will be made visible on the screen. When false, the window will be hidden
+        """
+        return _pybox.WindowShow(self.__id,show) 
+    
+    def hide(self,hide : bool = True) :
+        """
+        If the window is visible from view, hide() will make the window invisible.
+        
+        Parameters: 
+        
+        - hide -- when True (default), the window will be hidden. When false, the window will be visible on the screen
+        """      
+        return _pybox.WindowShow(self.__id,not hide) 
+
+    def mouse_moved(self) -> bool :
+        """
+        Returns true if a mouse move event has occured.  
+
+        Use get_mouse_pos() to get the current mouse position in the window. 
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.WindowMouseMoved(self.__id)
+
+    def mouse_drag_event(self,*args) -> bool :
+        """
+        Returns True if a Mouse Drag Event has occured in the window.
+
+        A Mouse Drag Event is when the mouse is moved while the mouse button is pressed.
+
+        Optional Parameters: 
+
+        1. True - a value of True (i.e. MouseDragEvent(True)) will return true for a Drag Event if the mouse button is simply clicked
+        \t -(but not moved).  Otherwise, you can use a MouseButtonDown() call
+
+        2. pybox.peek -- Since this is an event, this function will return true only once until the event occurs again.
+        \t -using Peek (i.e. MouseDragEvent(Peek)) will keep the event status as True so it may be called again to receive the
+        \t -same event (True) status.
+
+        Examples: 
+
+        Win.mouse_drag_event()          \t\t --- Returns True if the mouse is being dragged (does not include initial click)
+        Win.mouse_drag_event(True,peek) \t --- Include the initial mouse button click, and do not reset the event
+
+        See also MouseDragPos() and MouseDragPrev() to get the mouse coordinates of the Mouse Drag Event.
+ 
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.WindowMouseDragEvent(self.__id,*args)
+
+    def mouse_drag_ended(self,*args) -> bool :
+        """
+        This event occurs when a mouse drag event is active and the left mouse button is released. 
+        This is essentially the same as a MouseButtonUp event. 
+
+        Use mouse_drag_last() to get the last mouse drag position. 
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.WindowMouseDragEnded(self.__id,*args)
+
+    def mouse_drag_pos(self) -> list :
+        """
+        Returns the last mouse drag mouse coordinates.  When the mouse is moving and a mouse drag event occurs, this function
+        will retrieve the mouse coordinates associated with the event.
+        
+        get__mouse_pos() will return the current mouse coordinates (which should be essentially the same point as the last mouse drag point)
+        """
+        return _pybox.WindowMouseDragPos(self.__id)
+
+    def mouse_drag_prev(self) -> list :
+        """
+        Returns the previous mouse drag points before the current mouse drag points (defined in MouseDragPos()).
+
+        Using mouse_drag_prev() with mouse_drag_last() allows determining the points between the current point and previous point. 
+
+        For example, in response to a mouse_drag_event(), mouse_drag_prev() and mouse_drag_last() will be the two points between the current point and the last point, 
+        such as drawing a line.
+
+        If there has only been one mouse drag event (such as the initial mouse click, when set as an option), mouse_drag_prev() and mouse_drag_last() will return the same point.
+
+        """
+        return _pybox.WindowMouseDragPrev(self.__id)
+
+    def mouse_clicked(self,*args) -> bool :
+        """
+        Returns True if the Left Mouse Button was clicked, False if not and for subsequent events until the next mouse click.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.WindowMouseClicked(self.__id,*args)
+
+    def mouse_button_down(self) -> bool :
+        """
+        Returns True if the Left Mouse button is currently pressed False if it is not pressed.
+        """
+        return _pybox.WindowMouseButtonDown(self.__id)
+
+    def mouse_r_clicked(self,*args) -> bool :
+        """
+        Returns True if the Right Mouse Button was clicked, False if not and for subsequent calls until the next mouse click.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.WindowMouseRClicked(self.__id)
+    def mouse_r_button_down(self) -> bool :
+        """
+        Returns True if the Right Mouse button is currently pressed False if it is not pressed.
+        """
+        return _pybox.WindowMouseRButtonDown(self.__id)
+
+    def get_mouse_pos(self) -> list :
+        "Returns the current Mouse Position.  See get_mouse_click_pos() to retrieve the last clicked position."
+        return _pybox.WindowGetMousePos(self.__id)
+
+    def get_mouse_click_pos(self) -> list :
+        """
+        Returns the last mouse clicked position (Left mouse button click)
+
+        This can be useful for responding to a MouseClick event in obtaining the point where the mouse was clicked as opposed
+        to the current mouse position (GetMousePos()), which can be different.  In this case, GetMouseClickPos() can be an exact location of
+        where the mouse was clicked.
+        """
+        return _pybox.WindowGetMouseClickPos(self.__id)
+
+    def mouse_wheel_moved(self) -> bool :
+        """
+        Returns True if the mouse wheel was moved, False if not or for subequent calls until the next time the MouseWheel is moved (i.e. a new event)
+
+        See: get_mousewheel_value() to get the value and direction of the MouseWheel movement.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.WindowMouseWheelMoved(self.__id)
+
+    def get_mouse_wheel_value(self) -> int :
+        """
+        Returns the value of the last mousewheel movement (-1 or 1 usually).  See MouseWheelMoved() to check when the event occurs.
+
+        This returns the results of the last event and will return the same value until a new event occurs. 
+
+        Usually the value is -1 or 1 to indicate direction, and can be higher (such as -2 or 2) to reflect a mousewheel that has moved very quickly.
+
+        This value can be used to multiply against an increase or decrease in value, such as:
+
+        if MyInputBox.mouse_wheel_moved() : MyValue += Increment*get_mouse_wheel_value()
+        """
+        return _pybox.WindowGetMouseWheelMove(self.__id)
+
+    def capture_mouse(self) :
+        """
+        capture_mouse() will allow the mouse to be moved and pass events to the window even when the mouse is outside the window.
+        This can occur only when the mouse button is down and the capture is released once the left mouse button is released.
+
+        While the left mouse button is pressed, the mouse movements will be reported as events no matter where the mouse is located.
+        Without the mouse capture, the mouse movements (even with the mouse button down) are no longer reported or seen as events once the mouse is
+        outside the window.
+
+        This function is useful for drawing routines where the mouse can move outside of the window.
+        """
+        return _pybox.WindowCaptureMouse(self.__id)
+
+    def capture_release(self) :
+        """
+        Release the mouse capture.  See capture_mouse()
+
+        Usually the mouse capture is released automatically when the left mouse button is released.
+        capture_release() will release the capture even if the mouse button is down, and can be a good way to ensure
+        the mouse capture is no longer active.
+
+        See: capture_released() to respond to a release-capture event.
+        """
+        return _pybox.WindowCaptureRelease(self.__id)
+
+    def capture_released(self,*args) :
+        """
+        Returns True if the Capture was released, False if not or for subsequent calls until the next Capture Release event.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+        """
+        return _pybox.WindowCaptureReleased(self.__id,*args)
+
+    def create_menu(self,menuString : str) -> bool :
+        """
+        Creates a standard menu bar in the window with the menu items in the menuString.
+
+        - The menu string can contain simple items such as: window.create_menu("Help,About,Exit")
+        - Menu string can also contain submenu items, such as: window.create_menu("File[Open,Save,SaveAs],About,Exit")
+        - Menu items can be retrieved by name, such as "File","About", or in the case of sub-menu items, "File:Open"
+        - Menu items can be retrieved by value as well.
+
+        To set a value in a menu, enter a number for each top-level item, such as "File=100[Open,Save,Save As],About=200,Exit=300"
+
+        The submenu values will be the value of the parent + 1 + its position. 
+        For example, "File:Open", "File:Save", and "File:Save As" are numbered 101,102,103, respectively. 
+
+        To use the symbolic names, the menu items must appear in the same manner, such as "File:Save As", but not "File:SaveAs". 
+        "file:save as" and "FILE:SAVE AS" are also ok as the names are not case-sensitive.
+
+        See other menu functions such as get_menu_id(),is_menu_id_selected(), etc. 
+
+        Menu items may be enabled, disabled, checked and unchecked. 
+
+        You can also hide the main menu from view and make it reappear. 
+
+        note: CreateMenu() and QuickMenu() are the same function.  The naming convention hasn't quite been decided.
+
+        Examples: 
+
+        window.create_menu("Help,About,Exit")   - create a simple menu
+        window.create_menu("File[Open,Save,Save As,Exit],About,Help") - create a little more complex menu with sub items
+        window.create_menu("File=100[Open,Save,Save As,Exit],About=200,Help=200") - create a little more complex menu with sub items and user-defined ID values
+
+
+        The menu will appear in the window when it is first created.  Use ShowMenu() and HideMenu() to show/hide the menu.
+        """
+        return _pybox.WindowCreateMenuString(self.__id,menuString)
+
+    def quick_menu(self,menu_string : str) -> bool :
+        """
+        Creates a standard menu bar in the window with the menu items in the menuString.
+
+        - The menu string can contain simple items such as: window.quick_menu("Help,About,Exit")
+        - Menu string can also contain submenu items, such as: window.quick_menu("File[Open,Save,SaveAs],About,Exit")
+        - Menu items can be retrieved by name, such as "File","About", or in the case of sub-menu items, "File:Open"
+        - Menu items can be retrieved by value as well.
+
+        To set a value in a menu, enter a number for each top-level item, such as "File=100[Open,Save,Save As],About=200,Exit=300"
+
+        The submenu values will be the value of the parent + 1 + its position. 
+        For example, "File:Open", "File:Save", and "File:Save As" are numbered 101,102,103, respectively. 
+
+        To use the symbolic names, the menu items must appear in the same manner, such as "File:Save As", but not "File:SaveAs". 
+        "file:save as" and "FILE:SAVE AS" are also ok as the names are not case-sensitive.
+
+        See other menu functions such as get_menu_id(),is_menu_id_selected(), etc. 
+
+        Menu items may be enabled, disabled, checked and unchecked. 
+
+        You can also hide the main menu from view and make it reappear. 
+
+        note: CreateMenu() and QuickMenu() are the same function.  The naming convention hasn't quite been decided.
+
+        Examples: 
+
+        window.quick_menu("Help,About,Exit")   - create a simple menu
+        window.quick_menu("File[Open,Save,Save As,Exit],About,Help") - create a little more complex menu with sub items
+        window.quick_menu("File=100[Open,Save,Save As,Exit],About=200,Help=200") - create a little more complex menu with sub items and user-defined ID values
+
+
+        The menu will appear in the window when it is first created.  Use ShowMenu() and HideMenu() to show/hide the menu.
+        """
+        return _pybox.WindowCreateMenuString(self.__id,menu_string)
+
+    def is_menu_id_selected(self,menu_item) -> bool :
+        """
+        Returns true of a Menu Item has been selected in response to a menu_item_selected() event returning true.
+
+        menu_item_selected() must be called to determine a menu event has been triggerred (i.e. a menu item was selected). 
+        is_menu_id_selected() will return true if the menu item requested was selected. 
+
+        Also see: get_selected_menu_item() to get the numerical ID value of the item selected.
+
+        Parameters:
+
+        - menu_item      \t -- this can be the numerical ID of the menu item or the menu item's name (i.e. "File", "File:Save As", etc.)
+
+        note: This function will always return the value of the last menu item selected.  Use MenuItemSelected() to determine when a menu item is selected.
+        """
+        return _pybox.WindowisMenuIDSelected(self.__id,menu_item)
+
+    def enable_menu_item(self,menu_item,enable : bool = True) -> bool :
+        """
+        Enables (or disables) a menu item.  When disabled, the menu item is grayed-out. 
+        Also see: DisableMenuItem()
+
+        Parameters:
+
+        - menu_item      \t -- this can be the numerical ID of the menu item or the menu item's name (i.e. "File", "File:Save As", etc.)
+        - enable         \t -- when True (default), the menu item is enabled.  Othewise it is disabled.
+
+        """
+        return _pybox.WindowEnableMenuItem(self.__id,menu_item,enable)
+
+    def disable_menu_item(self,menu_item,disable : bool = True) -> bool :
+        """
+        Disables (or enables) a menu item.  When disabled, the menu item is grayed-out. 
+        Also see: EnableMenuItem()
+
+        Parameters:
+
+        - menu_item      \t -- this can be the numerical ID of the menu item or the menu item's name (i.e. "File", "File:Save As", etc.)
+        - bDisable         \t -- when True (default), the menu item is disabled.  Othewise it is enabled.
+
+        """        
+        return _pybox.WindowDisableMenuItem(self.__id,menu_item,disable)
+
+    def set_menu_item_check(self,menu_item,checked : bool = True) -> bool :
+        """
+        Sets or unchecks a menu item.  Note that only sub-menu items can be checked or unchecked.
+
+        Parameters:
+
+        - menu_item     \t -- this can be the numerical ID of the menu item or the menu item's name (i.e. "File", "File:Save As", etc.)
+        - checked           \t -- when True, the menu item is checked.  When False, the menu item is unchecked.
+
+        """                
+        return _pybox.WindowSetMenuItemCheck(self.__id,menu_item,checked)
+
+    def show_menu(self,show_menu : bool = True) -> bool :
+        """
+        Shows (or hides) the menu bar in the window.
+        Also see: hide_menu()
+
+        Parameters:
+
+        - show_menu         \t -- when True (default), the menu is shown in the window.  When False, the menu is hidden.
+
+        """        
+        return _pybox.WindowShowMenu(self.__id,show_menu)
+
+    def hide_menu(self,hide_menu : bool = True) -> bool :
+        """
+        Hides (or shows) the menu bar in the window.
+        Also see: show_menu()
+
+        Parameters:
+
+        - hide_menu         \t -- when True (default), the menu is hidden from the window display.  When False, the menu appears in the window.
+
+        """        
+        return _pybox.WindowHideMenu(self.__id,hide_menu)
+
+    def get_menu_id(self,menu_string : str) -> bool :
+        """
+        Returns the menu ID of the menu string. 
+
+        When a menu is created, such as "File[Save, Save As],Help,About", ID numbers are automatically assigned for each element. 
+
+        In cases where the numbers are assigned in the CreateMenu call, such as "File=100[Save, Save As],Help=200,About=300", the numbers are specified by the program.
+
+        When numbers aren't specified, or to be sure of a number, get_menu_id() will return the value assigned to the menu item.
+
+        Example: window.GetMenuID("File") or window.get_menu_id("File:Save As")
+
+        The latter returns the value assigned to "File:Save As" which can be used later in functions instead of the names. 
+        """
+        return _pybox.WindowGetMenuItemID(self.__id,menu_string)
+
+    def menu_item_selected(self) -> bool :
+        """
+        Returns True of a menu item was selected, False if not or afterwards until another menu item is selected.
+
+        Once a menu item is selected, GetSelectedMenuItem() can be used to retreive the menu item ID of the menu selected.
+        isMenuIDSelected() can be used with a menu ID value or string name to query if a specific menu item was selected.
+
+        Example:
+            if window.menu_item_selected() : 
+                menuID = window.get_selected_menu_item()
+                ... <deal with menuID> ...
+
+            or
+
+            if window.menu_item_selected() : 
+                menuID = window.get_selected_menu_item()
+                if window.is_menu_id_selected("File:Save as") : <do something>
+                if window.is_menu_id_selected("About") : <do something> 
+                etc.
+
+        window.is_menu_id_selected(<menu item ID number) may also be used.
+
+        --> This function an EVENT function: This function will only return a True value ONE TIME PER EVENT 
+        --> and will return False after the first call until the event occurs again. 
+
+            In most events, you can specify "peek=true" as a parameter so that the event will not be reset.
+
+        """
+        return _pybox.WindowMenuItemSelected(self.__id)
+
+    def get_selected_menu_item(self) -> int :
+        """
+        Returns the menu item selected.  This function is called in response to a True value return from WindowItemSelected() call, which
+        tells of a menu selection event.
+
+        get_selected_menu_item() returns the menu ID number of the selected item.  Therefore, the menu ID number of the menu item must be known to use the
+        value.
+
+        See: get_menu_id() to retrieve the menu id number of a string text menu item, such as "File:Save As"
+
+        See: is_menu_id_selected() to determine if a specific menu item ID has been selected.  This function will accept menu strings, such as:
+        \t -iis_menu_id_selected("File:Save as") 
+        """
+        return _pybox.WindowGetSelectedMenuItem(self.__id)
+
+    def print_menu_items(self) -> bool :
+        """
+        Prints a list of all menu item strings with their IDs to the console window and Sagebox Process Window
+
+        This function is helpful in making sure the numbers of the menu items align with expectations. 
+
+        After creating a menu with create_menu()  (i.e. "File[Open, Save, Save As, Exit],Help,About"), print_menu_items() can be used
+        to show the numbers of each item. 
+
+        Menu numbers can be assigned by the program, such as: "File=100[Open, Save, Save As, Exit],Help=200,About"
+
+        --> Basically, print_menu_items() performs a sanity-check to understand and confirm the menu ID values of each menu item and their string values as well.
+        """
+        return _pybox.WindowPrintMenuItems(self.__id)
+
+    def color_selector(self,at=None,**kwargs) -> _ColorSelector :
+        """
+        Opens a Color Selector widget, either in the current window or as a popup window. 
+        
+        With the color selector, you can select an RGB color using the wheel or input boxes next to the wheel itself. 
+        A color rectangle is shown with the currently selected color.
+        
+        color_selector returns a _ColorSelector object which can be used to look at changes in the color wheel in the window's main event loop. 
+        
+        See the _ColorSelector object functions for more information.
+        
+        Parameters:
+        
+        - at          \t - Where to put the Color Selector (in the window or as a popup).  If this is not used, the Color Selector is placed automatically.
+
+        Keywords usable when creating the Color Selector:
+
+        - Popup         \t - When true (i.e. Popup=True), the window pops up as a separate window.  Otherwise, it is placed in the current window at the location specified
+        - x,y           \t - 'x' and 'y' keywords can be used in place of using the 'at' parameter, i.e. x=500, y=200 instead of (500,200) or at=(500,200)
+  
+        examples:\t - color_sel = mywin.color_selector(at=(500,200),popup=True)     --> Opens a Color Selector window as an individual window on the screen at x=500 and y=200
+        - color_sel = mywin.color_selector(at=(500,200))     --> Opens a Color Selector window inside the window 'mywin, at window location x=500 and y=200
+        - color_sel = pybox.color_selector(at=500,200)  --> Opens the same type of window, but as a pybox function without a parent window.
+        
+        - while mywin.wait_event() : if (color_sel.value_changed()) print("Color value = ",color_sel.get_rgb_value()) --> prints values as the wheel is moved.
+        """
+        from .widgets import _ColorSelector
+        return _ColorSelector(_pybox.WindowColorSelector(self.__id,opt.at(at),**kwargs))
+
+    def color_wheel(self,at=None,**kwargs) -> _ColorWheel :
+        """    
+        Creates a Color Wheel widget, put into the existing window as a single color wheel with no other controls but the wheel itself.
+        
+        With the color selector, you can select an RGB color using the wheel or input boxes next to the wheel itself. 
+        A color rectangle is shown with the currently selected color.
+            
+        color_wheel returns a _ColorWheel object which can be used to look at changes in the color wheel in the window's main event loop. 
+            
+        See the _ColorWheel object functions for more information.
+            
+        Parameters:
+            
+        - at          \t - Where to put the Color Selector (in the window or as a popup).  If this is not used, the Color Selector is placed automatically.
+
+        Keywords usable when creating the Color Selector:
+
+        - x,y           \t - 'x' and 'y' keywords can be used in place of using the 'at' parameter, i.e. x=500, y=200 instead of (500,200) or at=(500,200)
+  
+        example:\t - color_wheel = mywin.color_wheel((500,200))     --> Opens a Color Wheel window in the window at (500,200)
+            
+        - while mywin.wait_event() : if (color_wheel.value_changed()) print("Color value = ",color_wheel.get_rgb_value()) --> prints values as the wheel is moved.
+        """
+        from .widgets import _ColorWheel
+        return _ColorWheel(_pybox.WindowColorWheel(self.__id,opt.at(at),**kwargs))
+
+def new_window(title : str=None,size=None,at=None,*args,**kwargs) -> Window       :
+    """
+    Creates a new window on the desktop and returns a window object where you can perform window-based functions on that window.
+
+    Parameters:
+    
+    - title             \t\t - -[optional] Title of window (in title bar)
+    - at                \t\t - -[optional] X,Y location of window
+    - size              \t\t - -[optional] Size of Window, i.e. size=(1000,4000)
+
+    Keywords and Pybox options can be included.  Some various options are as follows:
+
+    - Font          \t -- Sets the default font for the window, i.e. "Font(40)" or "Font("Arial,40")"
+    - bgColor       \t -- Sets the background color of the window (i.e. "bgColor("Red")" or "bgColor(PanColor.ForestGreen())")
+    - bgGradient    \t -- Sets a gradient background color of the window. Such as "bgGradient("black","blue").  You can also use Cls() to clear the window.
+    - TextColor     \t -- Sets the text/foreground color of the window
+    - NoAutoUpdate  \t -- Tells the window to not update automatically when graphics are placed in the window.  The program must call Update().  This can prevent flashing in real-time drawing.
+    - ResizeOk      \t -- Allows the window to be resized by the user. 
+
+    Examples:
+
+        myWindow = new_window()
+        mWindow.write("Hello World\\n")
+
+        myWindow = new_window("This is the Title",Size=(500,200),at=(50,100),opt.bgcolor("PanColor:Blue"))
+        myWindow = new_window(opt.bgcolor("PanColor:Blue"))  # This just sets the background color to blue.  Pybox chooses everything else.
+    """
+    return Window(_pybox.NewWindow(title,opt.at(at),opt.size(size),*args,**kwargs))
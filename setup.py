@@ -0,0 +1,66 @@
+"""
+Builds the sagebox-pybox wheel for the running interpreter from the single-source tree in modules/.
+
+    \t -python -m pip wheel . --no-deps -w dist    \t - - build a wheel for this interpreter
+    \t -python -m pip install .                    \t - - install into this interpreter
+
+Each wheel carries the native extensions for its own interpreter only (modules/pybox/native/cpXY -- see
+pybox/_native.py), and the package bytecode compiled by that interpreter, so it is tagged for one interpreter and
+platform.  Build once with each supported interpreter to get the full set.  The extensions are checked in, and the
+build stops if there are none for the running interpreter rather than making a platform wheel without them.  _pybox
+itself comes from the pybox-gui wheel, which is a dependency on Windows.
+
+The project metadata is in pyproject.toml.
+"""
+
+import os
+import sys
+import py_compile
+import importlib.util
+
+from setuptools import setup
+from setuptools.dist import Distribution
+from setuptools.command.build_py import build_py
+
+TAG     = "cp{0}{1}".format(*sys.version_info[:2])
+TAG_DIR = os.path.join("modules","pybox","native",TAG)
+
+def _native_files() -> list :
+    try :
+        return [name for name in os.listdir(TAG_DIR) if name.endswith((".pyd",".so"))]
+    except OSError :
+        return []
+
+if not _native_files() :
+    sys.exit("sagebox-pybox: no native extensions for {0} in {1}".format(TAG,TAG_DIR))
+
+class BinaryDistribution(Distribution) :
+    "Tags the wheel for this interpreter and platform (cpXY-cpXY-<platform>), since it carries cpXY native extensions"
+    def has_ext_modules(self) -> bool :
+        return True
+
+class BuildPy(build_py) :
+    """
+    Compiles the modules into the build directory, so the wheel ships bytecode.  The .pyc files are hash-based
+    (checked against the source rather than its timestamp), so they stay valid when the wheel is unpacked and the
+    source files get new timestamps.
+    """
+    def initialize_options(self) :
+        super().initialize_options()
+        self.compile = 1
+
+    def byte_compile(self,files) :
+        for file in files :
+            if not file.endswith(".py") : continue
+            py_compile.compile(file,cfile=importlib.util.cache_from_source(file),dfile=os.path.relpath(file,self.build_lib),
+                               doraise=True,invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)
+
+setup(
+    package_dir             = { "" : "modules" },
+    packages                = ["pybox"],
+    py_modules              = ["lcd_widget","dial_widget"],
+    package_data            = { "pybox" : ["native/{0}/*".format(TAG)] },
+    include_package_data    = False,
+    distclass               = BinaryDistribution,
+    cmdclass                = { "build_py" : BuildPy },
+)
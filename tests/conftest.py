@@ -0,0 +1,30 @@
+"""
+Test fixtures.  The tests run pybox on the headless backend (modules/pybox/_headless.py), which has only the entry points
+of the native _pybox library.
+"""
+
+import os
+import sys
+
+os.environ["PYBOX_HEADLESS"] = "1"
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"modules"))
+
+import numpy
+import pytest
+import pybox
+from pybox import _headless
+
+@pytest.fixture(autouse=True)
+def headless() :
+    "Starts each test with no windows, bitmaps or events"
+    _headless.reset()
+    yield _headless
+    _headless.reset()
+
+@pytest.fixture
+def win() :
+    return pybox.new_window(size=(200,150))
+
+def pixels(window) -> numpy.ndarray :
+    "A copy of a window's RGB framebuffer"
+    return _headless.framebuffer(window).copy()
@@ -0,0 +1,136 @@
+"""
+Tests of Bitmap memory (numpy views, from_array()) and BitmapPool.
+"""
+
+import gc
+import numpy
+import pytest
+import pybox
+from pybox import bitmap_convert
+from conftest import pixels
+
+def test_view_is_bitmap_memory() :
+    bitmap = pybox.create_bitmap(10,7)
+    numpy.asarray(bitmap)[2,3] = (1,2,3)
+    assert tuple(numpy.asarray(bitmap)[2,3]) == (1,2,3)
+    assert numpy.asarray(bitmap).strides[0] == 32                      # rows padded to 4 bytes
+
+def test_view_keeps_memory() :
+    bitmap = pybox.create_bitmap(1000,1000)
+    view   = numpy.asarray(bitmap)
+    view[:] = 7
+    part   = view[10:20]
+    del view
+    gc.collect()
+    other = numpy.full(3_000_000,9,dtype=numpy.uint8)
+    assert (part == 7).all() and other[0] == 9
+    assert not hasattr(bitmap,"delete")                                 # the library can't delete bitmaps
+
+def test_from_array_copies() :
+    pixels = numpy.zeros((6,8,3),dtype=numpy.uint8)
+    bitmap = pybox.Bitmap.from_array(pixels)
+    pixels[1,2] = (4,5,6)
+    assert tuple(numpy.asarray(bitmap)[1,2]) == (0,0,0)
+    assert (numpy.asarray(pybox.Bitmap.from_array(pixels)) == pixels).all()
+    assert (numpy.asarray(pybox.Bitmap.from_array(pixels*100.0)) == numpy.clip(pixels*100.0,0,255)).all()
+
+def test_copied_memory_is_read_only(headless,monkeypatch) :
+    memory = headless.BitmapGetMemory
+    monkeypatch.setattr(headless,"BitmapGetMemory",lambda id : numpy.array(memory(id)))
+    monkeypatch.setattr(pybox._core,"_shared_memory",None)
+    bitmap = pybox.create_bitmap(10,7)
+    assert not numpy.asarray(bitmap).flags.writeable
+    with pytest.raises(NotImplementedError) :
+        pybox.Bitmap.from_array(numpy.ones((7,10,3),dtype=numpy.uint8))
+
+def test_pool_copy_without_shared_memory(headless,monkeypatch) :
+    memory = headless.BitmapGetMemory
+    monkeypatch.setattr(headless,"BitmapGetMemory",lambda id : numpy.array(memory(id)))
+    monkeypatch.setattr(pybox._core,"_shared_memory",None)
+    pool   = pybox.BitmapPool()
+    image  = numpy.random.default_rng(2).integers(0,256,(7,10,3),dtype=numpy.uint8)
+    copies = [pool.copy(image),pool.copy(image.astype(numpy.int32)),pool.copy(pybox.create_bitmap(10,7))]
+    assert numpy.array_equal(numpy.asarray(copies[0]),image) and numpy.array_equal(numpy.asarray(copies[1]),image)
+    assert not numpy.asarray(copies[2]).any()
+    assert all(numpy.asarray(copy).flags.writeable for copy in copies)   # pooled arrays, not read-only copies of bitmaps
+    for copy in copies : pool.release(copy)
+    stats = pool.stats()
+    assert (stats["acquired"],stats["released"],stats["in_use"]) == (3,3,0)
+
+def test_pool_bounded_without_shared_memory(headless,win,monkeypatch) :
+    monkeypatch.setattr(pybox._core,"_shared_memory",False)
+    pool   = pybox.BitmapPool(max_free=2)
+    image  = numpy.random.default_rng(3).integers(0,256,(500,1000,3),dtype=numpy.uint8)
+    frames = [pool.copy(image) for _ in range(4)]
+    for frame in frames : pool.release(frame)
+    for _ in range(50) :
+        frame = pool.copy(image)
+        win.display_bitmap(0,0,frame)
+        pool.release(frame)
+    stats = pool.stats()
+    assert (stats["created"],stats["reused"],stats["free"],stats["dropped"]) == (4,50,2,2)
+    assert stats["free_bytes"] == 2*1_500_000
+    assert numpy.array_equal(pixels(win)[10,10],image[10,10,::-1])
+
+def test_pool_arrays_displayed_as_they_are(win,monkeypatch) :
+    pool  = pybox.BitmapPool()
+    frame = pool.acquire(30,20,4)
+    frame[:] = (0,0,255,255)                                            # blue, Red, Green, Blue, Mask
+    monkeypatch.setattr(bitmap_convert._display_converter,"convert",None)          # not converted
+    win.display_bitmap(0,0,frame)
+    assert tuple(pixels(win)[10,10]) == (0,0,255)
+
+@pytest.mark.parametrize("copied",[False,True])
+def test_get_array_is_library_memory(copied,monkeypatch) :
+    "get_array() returns BitmapGetMemory() as it is -- writable, also when the library returns a copy -- and does not hold the bitmap"
+    memory = pybox._core._pybox.BitmapGetMemory
+    if copied : monkeypatch.setattr(pybox._core._pybox,"BitmapGetMemory",lambda id : None if memory(id) is None else numpy.array(memory(id)))
+    monkeypatch.setattr(pybox._core,"_shared_memory",None)
+    bitmap = pybox.create_bitmap(10,7)
+    array  = bitmap.get_array()
+    assert array.flags.writeable and array.shape == (7,10,3)
+    array[:] = 5
+    assert pybox.Bitmap(0).get_array() is None
+
+def test_pool_reuses_bitmaps() :
+    pool  = pybox.BitmapPool(max_free=1)
+    first = pool.acquire(64,32)
+    pool.release(first)
+    assert pool.acquire(64,32) is first
+    assert pool.stats()["reused"] == 1
+
+def test_pool_release_errors() :
+    pool   = pybox.BitmapPool()
+    bitmap = pool.acquire(8,8)
+    pool.release(bitmap)
+    with pytest.raises(ValueError) :
+        pool.release(bitmap)
+    with pytest.raises(ValueError) :
+        pool.release(pybox.create_bitmap(8,8))
+
+def test_pool_copy() :
+    pool  = pybox.BitmapPool()
+    image = numpy.random.default_rng(1).integers(0,256,(9,13,3),dtype=numpy.uint8)
+    copy  = pool.copy(image)
+    assert isinstance(copy,pybox.Bitmap) and numpy.array_equal(numpy.asarray(copy),image)
+    mask  = pool.copy(image[:,:,0])
+    assert mask.shape == (9,13) and mask.strides[0] == 16
+
+def test_pool_drops_past_max_free() :
+    pool    = pybox.BitmapPool(max_free=1)
+    bitmaps = [pool.acquire(30,10) for _ in range(3)]
+    for bitmap in bitmaps : pool.release(bitmap)
+    stats   = pool.stats()
+    assert (stats["dropped"],stats["free"],stats["free_bytes"]) == (2,1,92*10)
+    pool.close()
+    assert (pool.stats()["dropped"],len(pool)) == (3,0)
+
+def test_pool_release_with_live_view() :
+    pool   = pybox.BitmapPool(max_free=0)
+    bitmap = pool.acquire(20,20)
+    view   = numpy.asarray(bitmap)
+    view[:] = 5
+    pool.release(bitmap)
+    assert pool.stats()["dropped"] == 1
+    numpy.full(1_000_000,1,dtype=numpy.uint8)
+    assert (view == 5).all()
@@ -0,0 +1,47 @@
+"""
+Tests of convert_bitmap() and the conversion of numpy images by display_bitmap().
+"""
+
+import numpy
+import pytest
+import pybox
+from conftest import pixels
+
+def test_uint8_not_copied() :
+    image = numpy.zeros((4,8,3),dtype=numpy.uint8)
+    assert pybox.convert_bitmap(image) is image
+
+def test_float_and_gray() :
+    image = numpy.full((2,3),0.5,dtype=numpy.float32)
+    assert (pybox.convert_bitmap(image,normalized=True) == 127).all()
+    assert pybox.convert_bitmap(numpy.full((2,3),300,dtype=numpy.int64)).max() == 255
+    with pytest.raises(ValueError) :
+        pybox.convert_bitmap(numpy.zeros((2,3,2)))
+
+def test_display_bitmap_layouts(win) :
+    bgr  = numpy.zeros((4,4,3),dtype=numpy.uint8)
+    bgr[:] = (255,0,0)                                                  # blue
+    rgba = numpy.zeros((4,4,4),dtype=numpy.uint8)
+    rgba[:] = (255,0,0,255)                                             # red
+    win.display_bitmap(0,0,bgr)
+    win.display_bitmap(10,0,rgba)
+    win.display_bitmap(20,0,numpy.full((4,4),0.25),normalized=True)
+    image = pixels(win)
+    assert tuple(image[1,1]) == (0,0,255)
+    assert tuple(image[1,11]) == (255,0,0)
+    assert tuple(image[1,21]) == (63,63,63)
+
+def test_display_bitmap_keeps_mask(win) :
+    win.cls("white")
+    before = pixels(win)
+    rgba = numpy.zeros((4,4,4),dtype=numpy.uint8)
+    rgba[:] = (255,0,0,0)                                               # red, fully transparent
+    win.display_bitmap(0,0,rgba)
+    win.display_bitmap_l((10,0),rgba.astype(numpy.float32))
+    win.display_bitmap(20,0,rgba/255.0,normalized=True)
+    assert numpy.array_equal(pixels(win),before)
+    rgba[:,:,3] = 255
+    win.display_bitmap(20,0,rgba.astype(numpy.float64))
+    assert tuple(pixels(win)[1,21]) == (255,0,0)
+    assert pybox.convert_bitmap(rgba,keep_mask=True) is rgba
+    assert pybox.convert_bitmap(rgba.astype(numpy.int32),keep_mask=True,swap_channels=True)[0,0].tolist() == [0,0,255,255]
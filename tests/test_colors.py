@@ -0,0 +1,61 @@
+"""
+Tests of pybox.color(), RgbColor and the color palettes.
+"""
+
+import numpy
+import pytest
+import pybox
+from pybox import _headless
+from conftest import pixels
+
+def test_colors_passed_to_library(win,monkeypatch) :
+    calls = []
+    monkeypatch.setattr(_headless,"WindowDrawCircle",lambda *args,**kwargs : calls.append((args[4],kwargs)) or True)
+    win.draw.fill_circle(50,50,10,pybox.color("cyan"))
+    win.draw.fill_circle(50,50,10,"cyan")
+    win.draw.fill_circle(50,50,10,pybox.color("cyan(170)"))
+    win.draw.fill_circle(50,50,10,"cyan(170)",opacity=128)
+    win.draw.fill_circle(50,50,10,pybox.color((0,255,255,170)))
+    assert calls[0] == calls[1] == (pybox.RgbColor(0,255,255),{}) and type(calls[0][0]) is pybox.RgbColor
+    assert calls[2:] == [("cyan(170)",{}),("cyan(170)",{"opacity" : 128}),("0,255,255(170)",{})]    # opacities as the library reads them
+
+@pytest.mark.parametrize("text",["{255,255,0,128}","sage:skyblue","red,green,blue","nosuchcolor(100)"])
+def test_library_color_strings_passed_as_given(win,monkeypatch,text) :
+    "Strings pybox does not read exactly are passed to the library unchanged"
+    calls = []
+    monkeypatch.setattr(_headless,"WindowDrawCircle",lambda *args,**kwargs : calls.append(args[4]) or True)
+    monkeypatch.setattr(_headless,"WindowCls",lambda *args : calls.append(args[1]) or True)
+    win.draw.fill_circle(50,50,10,text)
+    win.cls(text)
+    assert calls == [text,text]
+    with pytest.raises(ValueError) : pybox.color(text)
+
+def test_color_strings_resolved_once(win,monkeypatch) :
+    parsed = []
+    monkeypatch.setattr(_headless,"GetColor",lambda text,get=_headless.GetColor : parsed.append(text) or get(text))
+    for _ in range(3) : win.draw.fill_circle(50,50,10,"MediumVioletRed(99)")
+    assert len(parsed) <= 1
+
+def test_opacity_and_gradient(win) :
+    win.cls("black")
+    win.draw.fill_circle(50,50,10,pybox.color("white(128)"))
+    assert tuple(pixels(win)[50,50]) == (128,128,128)
+    win.cls(pybox.color("black,blue"))
+    assert tuple(pixels(win)[0,0]) == (0,0,0) and pixels(win)[-1,0,2] > 200
+
+def test_palette_constants_are_rgbcolors() :
+    assert type(pybox.PanColor.Red) is pybox.RgbColor and pybox.PanColor.Red() is pybox.PanColor.Red
+    assert type(pybox.SageColor.SkyBlue) is pybox.RgbColor
+    assert tuple(pybox.colors.PAN_COLORS[pybox.colors.PAN_COLOR_NAMES.index("Red")]) == tuple(pybox.PanColor.Red)
+    red = numpy.asarray(pybox.PanColor.Red)
+    assert red.dtype == numpy.uint8 and red.tolist() == [255,0,0] and not red.flags.writeable
+    assert numpy.array([pybox.PanColor.Red,pybox.PanColor.Blue,pybox.color("white(100)")]).shape == (3,3)
+
+def test_lists_of_rgbcolors(win) :
+    win.cls("black")
+    win.draw.set_pixels(numpy.array([50,150]),numpy.array([50,50]),[pybox.PanColor.Red,pybox.color("0,0,255")])
+    assert tuple(pixels(win)[50,50]) == (255,0,0) and tuple(pixels(win)[50,150]) == (0,0,255)
+    trail = pybox.TrailBuffer(2,colors=[pybox.PanColor.Red,pybox.PanColor.Blue])
+    trail.append((0,0))
+    trail.append((1,1))
+    assert trail.colors.tolist() == [[255,0,0],[0,0,255]]
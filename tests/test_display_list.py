@@ -0,0 +1,43 @@
+"""
+Tests of DisplayList.
+"""
+
+import numpy
+import pytest
+import pybox
+from conftest import pixels
+
+def _scene(draw) -> list :
+    "Draws (or records) a scene with a run of circles between other calls, and returns the handles"
+    handles = [draw.fill_rectangle(5,5,40,30,"blue")]
+    handles += [draw.fill_circle(30 + 25*i,80,8,"yellow") for i in range(6)]
+    handles.append(draw.line(0,140,199,140,"white"))
+    return handles
+
+def test_replay_matches_drawing(win,headless,monkeypatch) :
+    calls   = []
+    circle  = headless.WindowDrawCircle
+    win.cls("black")
+    _scene(win.draw)
+    expected = pixels(win)
+    scene = win.new_display_list()
+    _scene(scene)
+    win.cls("black")
+    monkeypatch.setattr(headless,"WindowDrawCircle",lambda *args,**kwargs : calls.append(args[4]) or circle(*args,**kwargs))
+    assert len(scene) == 8 and scene.replay()
+    assert numpy.array_equal(pixels(win),expected)
+    assert [(c.red,c.green,c.blue) for c in calls] == [(255,255,0)]*6      # one library call per recorded circle
+
+def test_update_and_remove(win) :
+    scene   = win.new_display_list()
+    handles = _scene(scene)
+    scene.replay()
+    assert scene.update(handles[3],y=40,inside_color="red")
+    assert scene.remove(handles[-1]) and handles[-1] not in scene and not scene.remove(handles[-1])
+    win.cls("black")
+    scene.replay()
+    image = pixels(win)
+    assert tuple(image[40,80]) == (255,0,0) and tuple(image[80,80]) == (0,0,0)
+    assert tuple(image[80,105]) == (255,255,0) and tuple(image[140,100]) == (0,0,0)
+    with pytest.raises(KeyError) : scene.update(handles[-1],x=0)
+    with pytest.raises(AttributeError) : scene.get_opacity()
@@ -0,0 +1,71 @@
+"""
+Tests of the batch drawing functions.
+"""
+
+import numpy
+import pytest
+import pybox
+from conftest import pixels
+
+def _cloud(count=2000,seed=1) :
+    rng     = numpy.random.default_rng(seed)
+    points  = rng.uniform(20,60,(count,2))
+    colors  = rng.integers(0,256,(count,4),dtype=numpy.uint8)
+    return points,colors
+
+def _plot(win,blend,colors,opacity=255) :
+    points,_ = _cloud()
+    win.cls("black")
+    win.draw.plot_points(points,colors,blend=blend,opacity=opacity)
+    return pixels(win).astype(int)
+
+def test_plot_points_replace_matches_set_pixel(win) :
+    points,colors = _cloud()
+    win.cls("black")
+    for (x,y),color in zip(numpy.floor(points).astype(int).tolist(),colors[:,:3].tolist()) : win.draw.set_pixel(x,y,color)
+    expected = pixels(win)
+    assert numpy.array_equal(_plot(win,"replace",colors),expected)
+
+def test_plot_points_add_on_black(win) :
+    win.cls("black")
+    win.draw.plot_points([(10,10),(10.5,10.5),(30,30)],[(100,50,0,255),(100,50,0,255),(200,0,0,128)],blend="add")
+    image = pixels(win)
+    assert tuple(image[10,10]) == (200,100,0)                            # two points added on the same pixel
+    assert abs(int(image[30,30,0]) - 100) <= 1 and tuple(image[0,0]) == (0,0,0)
+
+def test_set_pixels(win) :
+    win.cls("black")
+    xs,ys = numpy.array([1,2,2,500]),numpy.array([1,3,3,1])
+    win.draw.set_pixels(xs,ys,numpy.array([(255,0,0),(0,255,0),(0,0,255),(9,9,9)]))
+    image = pixels(win)
+    assert tuple(image[1,1]) == (255,0,0) and tuple(image[3,2]) == (0,0,255) and tuple(image[0,0]) == (0,0,0)
+
+def test_set_pixels_calls(win,headless,monkeypatch) :
+    calls = []
+    for name in ("WindowDrawPixel","WindowDisplayBitmap") :
+        function = getattr(headless,name)
+        monkeypatch.setattr(headless,name,lambda *args,name=name,function=function,**kwargs : calls.append(name) or function(*args,**kwargs))
+    ys,xs = numpy.mgrid[10:30,10:30]
+    win.cls("black")
+    win.draw.set_pixels(xs[:2,:2],ys[:2,:2],"red")                      # a few pixels: one call each
+    assert calls == ["WindowDrawPixel"]*4
+    calls.clear()
+    win.draw.set_pixels(xs,ys,pybox.RgbColor(0,200,0))                 # a filled box: one image
+    assert calls == ["WindowDisplayBitmap"]
+    image = pixels(win)
+    assert tuple(image[10,10]) == (0,200,0) and tuple(image[29,29]) == (0,200,0) and tuple(image[30,30]) == (0,0,0)
+
+def test_push_and_pop_transform(win) :
+    win.cls("black")
+    win.draw.translate_transform(100,75)
+    win.draw.push_transform()
+    win.draw.rotate_transform(90)
+    win.draw.translate_transform(40,0)
+    win.draw.fill_rectangle(-5,-5,10,10,"red")                            # at (100,115)
+    win.draw.pop_transform()
+    win.draw.fill_rectangle(-5,-5,10,10,"green")                          # at (100,75)
+    win.draw.reset_transform()
+    image = pixels(win)
+    assert tuple(image[115,100]) == (255,0,0) and tuple(image[75,100]) == (0,255,0)
+    assert tuple(image[75,140]) == (0,0,0)
+    with pytest.raises(ValueError) : win.draw.pop_transform()
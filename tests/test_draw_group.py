@@ -0,0 +1,51 @@
+"""
+Tests of Window.new_draw_group() and display_draw_groups().
+"""
+
+import pybox
+from conftest import pixels
+
+def _counted(calls : list,name : str,function) :
+    "A draw group function that records its calls"
+    def draw(win) :
+        calls.append(name)
+        function(win)
+    return draw
+
+def test_group_drawn_once(win) :
+    calls      = []
+    background = win.new_draw_group(_counted(calls,"background",lambda w : w.cls("darkblue,black")))
+    expected   = None
+    for frame in range(3) :
+        assert background.display()
+        if expected is None : expected = pixels(win)
+        assert (pixels(win) == expected).all() and background.is_unchanged()
+        win.draw.fill_circle(50,50,20,"yellow")
+    assert calls == ["background"]
+    background.set_unchanged(False)
+    background.display()
+    assert calls == ["background"]*2
+
+def test_groups_drawn_in_order(win) :
+    calls = []
+    sky   = win.new_draw_group(_counted(calls,"sky",lambda w : w.cls("red")))
+    grid  = win.new_draw_group(_counted(calls,"grid",lambda w : w.draw.fill_rectangle(0,0,10,10,"blue")))
+    win.display_draw_groups(sky,grid)
+    win.draw.fill_circle(100,100,20,"white")
+    win.display_draw_groups([sky,grid])
+    image = pixels(win)
+    assert tuple(image[5,5]) == (0,0,255) and tuple(image[100,100]) == (255,0,0)
+    assert calls == ["sky","grid"]
+    win.display_draw_groups(sky)                                             # different groups: drawn again
+    assert calls == ["sky","grid","sky"] and tuple(pixels(win)[5,5]) == (255,0,0)
+
+def test_cls_with_colors_redraws_groups(win) :
+    calls = []
+    group = win.new_draw_group(_counted(calls,"group",lambda w : w.draw_grid()))
+    group.display()
+    win.cls("green")                                                    # replaces the cls() bitmap
+    group.display()
+    assert calls == ["group","group"]
+    win.cls()
+    group.display()
+    assert calls == ["group","group"]
@@ -0,0 +1,45 @@
+"""
+Tests of the headless backend itself -- windows, drawing, text, bitmap files and events.
+"""
+
+import numpy
+import pybox
+from pybox import _headless
+from conftest import pixels
+
+def test_window_framebuffer(win) :
+    assert pixels(win).shape == (150,200,3)
+    win.cls("red")
+    assert (pixels(win) == (255,0,0)).all()
+
+def test_fill_circle(win) :
+    win.cls("black")
+    win.draw.fill_circle(100,75,20,"green")
+    image = pixels(win)
+    assert tuple(image[75,100]) == (0,255,0)
+    assert tuple(image[75,125]) == (0,0,0)
+
+def test_write_logs_text(win) :
+    win.write("{red}Hello{} world")
+    assert [text for _,_,text in _headless.text_log(win)] == ["Hello world"]
+
+def test_bitmap_file_round_trip(tmp_path,win) :
+    image = numpy.random.default_rng(0).integers(0,256,(150,200,3),dtype=numpy.uint8)
+    _headless.framebuffer(win)[:] = image
+    _headless.save_image(win,str(tmp_path / "frame.bmp"))
+    bitmap = pybox.read_image_file(str(tmp_path / "frame.bmp"))
+    assert bitmap.is_valid()
+    assert numpy.array_equal(numpy.asarray(bitmap)[:,:,::-1],image)
+
+def test_vsync_frame_limit(win) :
+    _headless.set_frame_limit(3)
+    try :
+        assert sum(1 for _ in iter(win.vsync_wait,False)) == 3
+    finally :
+        _headless.set_frame_limit(300)
+
+def test_posted_mouse_click(win) :
+    _headless.post_event("mouse_click",win,pos=(10,20))
+    pybox.get_event()
+    assert win.mouse_clicked()
+    assert tuple(win.get_mouse_click_pos()) == (10,20)
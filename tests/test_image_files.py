@@ -0,0 +1,96 @@
+"""
+Tests of read_image_file_async(), prefetch_image_files() and the cache of decoded image files.
+"""
+
+import threading
+import numpy
+import pytest
+import pybox
+import pybox.image_files as image_files
+
+@pytest.fixture
+def files(tmp_path,headless) :
+    "Three small .bmp files, with an empty image cache"
+    paths = []
+    for index in range(3) :
+        paths.append(str(tmp_path / "image{0}.bmp".format(index)))
+        headless._write_image(numpy.full((6,10,3),index*40,dtype=numpy.uint8),paths[-1])
+    pybox.clear_image_cache()
+    pybox.image_cache_stats(reset=True)
+    yield paths
+    pybox.clear_image_cache()
+
+@pytest.fixture
+def calls(headless,monkeypatch) :
+    "The names of the threads that call the Pybox library's ReadImageFile() and CreateBitmap()"
+    names = []
+    for name in ("ReadImageFile","CreateBitmap") :
+        def call(*args,_function=getattr(headless,name),**kwargs) :
+            names.append(threading.current_thread().name)
+            return _function(*args,**kwargs)
+        monkeypatch.setattr(headless,name,call)
+    return names
+
+@pytest.fixture
+def decoder(headless,monkeypatch) :
+    "A pure image decoder, as PIL or OpenCV would be"
+    monkeypatch.setattr(image_files,"_decoder",lambda : headless._read_image)
+
+def test_decoded_on_reader_threads(files,calls,decoder,headless) :
+    assert all(future.result() for future in pybox.prefetch_image_files(files))
+    assert calls == []                                                  # nothing from the library on the reader threads
+    count  = len(headless._bitmaps)
+    bitmap = pybox.read_image_file_async(files[1]).result()
+    assert len(headless._bitmaps) == count + 1                          # only the Bitmap returned
+    assert (numpy.asarray(bitmap) == 40).all()
+    assert calls == [threading.current_thread().name]
+    assert pybox.image_cache_stats()["hits"] == 1
+
+def test_library_decodes_on_caller_thread(files,calls,monkeypatch) :
+    monkeypatch.setattr(image_files,"_decoder",lambda : None)
+    future = pybox.read_image_file_async(files[2])
+    assert future.exception() is None                                  # read from the disk
+    assert calls == []
+    bitmap = future.result()
+    assert future.result() is bitmap
+    assert (numpy.asarray(bitmap) == 80).all()
+    assert calls == [threading.current_thread().name]
+    assert (numpy.asarray(pybox.read_image_file(files[2],cached=True)) == 80).all()     # from the cache
+    assert pybox.image_cache_stats()["hits"] == 1
+
+@pytest.mark.parametrize("reader",["thread","library","failing","installed"])
+def test_async_matches_sync(tmp_path,headless,monkeypatch,reader) :
+    if reader == "installed" and image_files._decoder() is None : pytest.skip("PIL and OpenCV are not installed")
+    decoders = { "thread" : headless._read_image, "library" : None, "failing" : lambda path : 1/0 }
+    if reader in decoders : monkeypatch.setattr(image_files,"_decoder",lambda : decoders[reader])
+    path = str(tmp_path / "noise.bmp")
+    headless._write_image(numpy.random.default_rng(3).integers(0,256,(7,13,3),dtype=numpy.uint8),path)
+    pybox.clear_image_cache()
+    try :
+        expected = numpy.array(pybox.read_image_file(path))
+        assert numpy.array_equal(numpy.asarray(pybox.read_image_file_async(path).result()),expected)
+        assert numpy.array_equal(numpy.asarray(pybox.read_image_file(path,cached=True)),expected)     # from the cache
+    finally :
+        pybox.clear_image_cache()
+
+def test_keywords_in_key(files,decoder) :
+    pybox.read_image_file_async(files[0]).result()
+    pybox.read_image_file_async(files[0],option=1).result()
+    pybox.read_image_file_async(files[0],option=1).result()
+    stats = pybox.image_cache_stats()
+    assert (stats["misses"],stats["hits"],stats["entries"]) == (2,1,2)
+
+def test_missing_file(files) :
+    assert not pybox.read_image_file_async(files[0] + ".missing").result().is_valid()
+    assert pybox.prefetch_image_files([files[0] + ".missing"])[0].result() is False
+
+def test_set_image_cache(files,decoder) :
+    pybox.read_image_file_async(files[0]).result()
+    with pytest.raises(ValueError) :
+        pybox.set_image_cache(0,workers=0)
+    assert pybox.image_cache_stats()["entries"] == 1                    # not changed by the failed call
+    try :
+        pybox.set_image_cache(0)
+        assert pybox.image_cache_stats()["entries"] == 0
+    finally :
+        pybox.set_image_cache()
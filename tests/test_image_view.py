@@ -0,0 +1,37 @@
+"""
+Tests of ImagePyramid and the image viewers with very large images.
+"""
+
+import numpy
+import pytest
+import pybox
+
+def _image(width=300,height=200) :
+    image = numpy.zeros((height,width,3),dtype=numpy.uint8)
+    image[:,:,2] = 255                                                  # red, as Blue, Green, Red
+    return image
+
+def test_pyramid_levels() :
+    pyramid = pybox.ImagePyramid(_image(),tile_size=64)
+    assert (pyramid.width,pyramid.height) == (300,200)
+    assert pyramid.level_size(1) == (150,100)
+    assert tuple(pyramid.render(0,0,30,20,scale=0.5)[5,5]) == (0,0,255)
+
+def test_pyramid_rgba_source() :
+    image = numpy.zeros((40,40,4),dtype=numpy.uint8)
+    image[:] = (255,0,0,255)                                            # red, as Red, Green, Blue, Mask
+    assert tuple(pybox.ImagePyramid(image,tile_size=16).tile(0,0,0)[0,0]) == (0,0,255)
+
+def test_memmap_full_resolution(tmp_path,headless) :
+    image = numpy.lib.format.open_memmap(str(tmp_path / "image.npy"),mode="w+",dtype=numpy.uint8,shape=(200,300,3))
+    image[:] = _image()
+    view  = pybox.img_view(image,size=(150,100))
+    assert headless.viewer_images(view.id)[0].shape == (200,300,3)
+    before_after = pybox.img_before_after(image,image)
+    assert [shown.shape for shown in headless.viewer_images(before_after.id)] == [(200,300,3)]*2
+
+def test_pyramid_overview(headless,monkeypatch) :
+    monkeypatch.setattr(pybox.image_pyramid.ImagePyramid,"overview",lambda self,size : numpy.zeros((100,150,3),dtype=numpy.uint8))
+    with pytest.warns(RuntimeWarning) :
+        view = pybox.img_view(pybox.ImagePyramid(_image()))
+    assert headless.viewer_images(view.id)[0].shape == (100,150,3)
@@ -0,0 +1,53 @@
+"""
+Tests of compiled markup and TextBlock.
+"""
+
+import pybox
+from pybox import _headless
+from pybox.markup import Markup
+
+def _written(monkeypatch,name) -> list :
+    "Records the arguments of a headless entry point"
+    calls = []
+    entry = getattr(_headless,name)
+    monkeypatch.setattr(_headless,name,lambda *args,**kwargs : calls.append(args) or entry(*args,**kwargs))
+    return calls
+
+def test_equal_compares_spans() :
+    red   = pybox.markup.compile("{r}a").spans
+    plain = pybox.markup.compile("a").spans
+    assert Markup(red,"a") != Markup(plain,"a")
+    assert Markup(red,"a") == Markup(red,"a")
+    assert pybox.markup.compile("{r}a") == pybox.markup.compile("{r}a")
+
+def test_text_block(win) :
+    block = win.new_text_block("Mass:{x=130}{g}{$mass:.2f}\nZoom:{x=130}{c}{$zoom:.0f}%",at=(10,10))
+    block.draw(mass=1.5,zoom=100)
+    assert block.text == "Mass:{x=130}{g}1.50\nZoom:{x=130}{c}100%"
+    assert [span.fg for span in block.markup.spans if span.text in ("1.50","100")] == ["g","c"]
+    markup = block.markup
+    assert not block.set(mass=1.5) and block.markup is markup
+    assert block.set(mass=2) and block.markup.spans[2:] == markup.spans[2:]
+    block.draw()
+    assert [text for _,_,text in _headless.text_log(win)] == ["Mass:1.50","Zoom:100%","Mass:2.00","Zoom:100%"]
+
+def test_text_block_empty_slot(win) :
+    template = pybox.markup.compile("a{$x:.2f}b{$y}")
+    assert template.parts == ("a","b","") and [name for _,name,_ in template.slots] == ["x","y"]
+    block = win.new_text_block("a{$x:.2f}b{$y}")
+    block.set(x=1,y="z")
+    assert block.set(x=None) and block.text == "abz" and block["x"] is None
+
+def test_markup_written_as_text(win,monkeypatch) :
+    writes = _written(monkeypatch,"WindowWrite")
+    block  = win.new_text_block("Angle:{x=130}{r}{$angle:.1f}")
+    block.draw(angle=0.25)
+    assert writes[-1][1] == "Angle:{x=130}{r}0.2"
+
+def test_braces_in_values_escaped(win,monkeypatch) :
+    writes = _written(monkeypatch,"WindowWrite")
+    block  = win.new_text_block("{c}{$label}")
+    block.draw(label="{r}x}")
+    assert block.markup.spans[-1].text == "{r}x}" and pybox.markup.compile(block.text).plain == "{r}x}"
+    assert [args[1] for args in writes] == ["{c}{{r}}x}}"]
+    assert [text for _,_,text in _headless.text_log(win)] == ["{r}x}"]
@@ -0,0 +1,38 @@
+"""
+Tests of structured options and OptionSet.
+"""
+
+import pytest
+import pybox
+from pybox import _headless
+from pybox import opt, OptionSet
+
+def test_interned_fields() :
+    assert opt.at(10,20) is opt.at(10,20) and opt.at(10,20) is not opt.at(10.0,20.0)
+    assert opt.at(10,20)._opt__fields == (("LocX",10),("LocY",20))
+    assert opt.at(10,20)._opt__text == ",LocX=10,LocY=20,"
+    assert opt.font("Arial,20")._opt__text == ',Font="Arial,20",'
+    assert (opt.at(1,2) + opt.size(3,4))._opt__fields == (("LocX",1),("LocY",2),("SizeX",3),("SizeY",4))
+    assert (opt.at(1,2) + opt.title("x"))._opt__fields is None
+
+@pytest.mark.parametrize("option",[opt.at(10,20) + opt.size(30,40),opt.font("Arial,20") + opt.range(1,5),
+                                   OptionSet(opt.at(1,2),"bgColor=red",opt.at(3,4))])
+def test_string_reads_as_fields(option) :
+    "The native library reads the option string -- it must give the same values as the fields"
+    assert _headless._options([option._opt__text],{}) == _headless._options([option],{})
+
+def test_option_set_keeps_last() :
+    options = OptionSet(opt.at(1,2),opt.title("a"))
+    options += opt.at(3,4)
+    options.add(None,"Title=b")
+    assert len(options) == 4
+    assert options._opt__text == ",LocX=3,LocY=4,Title=b,"
+    assert options._opt__fields is None
+    assert OptionSet(opt.at(1,2),opt.size(5,6),opt.at(3,4))._opt__fields == (("SizeX",5),("SizeY",6),("LocX",3),("LocY",4))
+    with pytest.raises(TypeError) : options.add(5)
+
+def test_option_set_window() :
+    options = OptionSet(opt.size(100,100))
+    options.add(opt.size(120,90),opt.bgcolor("red"))
+    win = pybox.new_window(options)
+    assert win.get_window_size() == [120,90]
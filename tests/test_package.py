@@ -0,0 +1,63 @@
+"""
+Tests of the pybox package -- names imported on first use, and the native extension loader.
+"""
+
+import os
+import sys
+import json
+import subprocess
+import importlib.machinery
+import pytest
+import pybox
+from pybox import _native
+
+_MODULES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"modules")
+
+def _imported(code : str,headless : str,tmp_path) -> list :
+    "Runs code after 'import pybox' in a new interpreter, and returns the pybox modules imported"
+    env = dict(os.environ,PYBOX_HEADLESS=headless,PYBOX_NATIVE_CACHE=str(tmp_path/"native.txt"),PYTHONPATH=_MODULES)
+    script = "import sys,json,pybox\n{0}\nprint(json.dumps(sorted(m for m in sys.modules if m.startswith('pybox'))))".format(code)
+    return json.loads(subprocess.run([sys.executable,"-c",script],env=env,capture_output=True,text=True,check=True).stdout)
+
+@pytest.mark.skipif(sys.platform == "win32",reason="the native library is loaded on Windows")
+@pytest.mark.parametrize("headless",["1","0"])                      # "0" -- falls back to the headless backend without the native library
+def test_modules_imported_on_first_use(headless,tmp_path) :
+    assert _imported("",headless,tmp_path) == ["pybox","pybox._core","pybox._headless","pybox._native","pybox.options"]
+    modules = _imported("pybox.new_window(size=(20,20)).draw.fill_circle(5,5,2,'red')",headless,tmp_path)
+    assert {"pybox.window","pybox.draw","pybox.colors"} <= set(modules) and "pybox.widgets" not in modules
+
+def test_lazy_names() :
+    for name,module in pybox._LAZY.items() :
+        value = getattr(pybox,name)
+        assert value is sys.modules["pybox." + module] if name == module else value is getattr(sys.modules["pybox." + module],name)
+    assert set(pybox._LAZY) <= set(dir(pybox))
+    with pytest.raises(AttributeError) : pybox.no_such_name
+
+@pytest.fixture
+def native_dir(tmp_path,monkeypatch) :
+    "An extension directory with one extension, and a cache file for it"
+    directory = tmp_path/"cp3x"
+    directory.mkdir()
+    (directory/("_ext" + importlib.machinery.EXTENSION_SUFFIXES[0])).write_bytes(b"")
+    monkeypatch.setattr(_native,"TAG_DIR",str(directory))
+    monkeypatch.setattr(_native,"_paths",None)
+    monkeypatch.setenv("PYBOX_NATIVE_CACHE",str(tmp_path/"cache"/"native.txt"))
+    return directory
+
+def test_native_paths_cached(native_dir,monkeypatch) :
+    path = str(native_dir/("_ext" + importlib.machinery.EXTENSION_SUFFIXES[0]))
+    assert _native.find("_ext") == path and _native.find("_pybox") is None
+    assert os.path.isfile(os.environ["PYBOX_NATIVE_CACHE"])
+    monkeypatch.setattr(_native,"_paths",None)
+    monkeypatch.setattr(_native,"_scan",None)                           # read from the cache file
+    assert _native.extension_paths() == { "_ext" : path }
+
+def test_native_cache_rebuilt(native_dir,monkeypatch) :
+    _native.extension_paths()
+    (native_dir/("_new" + importlib.machinery.EXTENSION_SUFFIXES[0])).write_bytes(b"")
+    os.utime(native_dir,ns=(1,1))                                       # the directory changed
+    monkeypatch.setattr(_native,"_paths",None)
+    assert sorted(_native.extension_paths()) == ["_ext","_new"]
+    monkeypatch.setenv("PYBOX_NATIVE_CACHE","0")
+    monkeypatch.setattr(_native,"_paths",None)
+    assert sorted(_native.extension_paths()) == ["_ext","_new"]
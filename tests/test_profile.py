@@ -0,0 +1,46 @@
+"""
+Tests of the profiler (pybox.profile).
+"""
+
+import pytest
+import pybox
+
+@pytest.fixture
+def profile() :
+    pybox.profile.reset()
+    pybox.profile.enable()
+    yield pybox.profile
+    pybox.profile.disable()
+    pybox.profile.reset()
+
+def test_calls_and_frames(win,profile) :
+    for frame in range(3) :
+        win.cls("black")
+        win.draw.fill_circle(20,20,10,"red")
+        win.draw.fill_circle(60,20,10,"red")
+        win.update()
+    report  = profile.report()
+    entries = report["entry_points"]
+    assert report["frames"]["count"] == 3
+    assert entries["WindowUpdate"]["calls"] == 3
+    assert entries["WindowDrawCircle"]["calls"] == 6
+    assert entries["WindowDrawCircle"]["calls_per_frame"] == 2
+    assert report["calls"] == sum(e["calls"] for e in entries.values())
+
+def test_frames_without_calls(win,profile) :
+    for frame in range(4) :
+        if frame == 1 : win.draw.fill_circle(20,20,10,"red")
+        win.cls()
+        win.update()
+    entry = profile.report()["entry_points"]["WindowDrawCircle"]
+    assert entry["calls_per_frame"] == 0.25 and entry["frame_p50_us"] == 0
+
+def test_disable_and_reset(win,profile) :
+    win.cls()
+    profile.disable()
+    assert not profile.is_enabled()
+    win.cls()
+    assert profile.report()["entry_points"]["WindowCls"]["calls"] == 1
+    profile.reset()
+    assert profile.report()["calls"] == 0
+    assert "Pybox Profile" in profile.write()
@@ -0,0 +1,29 @@
+"""
+Tests of TrailBuffer.
+"""
+
+import numpy
+import pybox
+from conftest import pixels
+
+def test_ring_and_transform(win) :
+    trail = pybox.TrailBuffer(3,colors=[(255,0,0)]*3)
+    for point in [(0,0),(1,0),(2,0),(3,0)] : trail.append(point)
+    assert trail.points.tolist() == [[1,0],[2,0],[3,0]]
+    trail.set_transform(40,(20,75))
+    win.cls("black")
+    win.draw.line_segments(trail,pen_size=3)
+    assert tuple(pixels(win)[75,100]) == (255,0,0)                      # (2,0) drawn at (100,75)
+    assert tuple(pixels(win)[75,150]) == (0,0,0)                        # not drawn from the untransformed points
+
+def test_per_point_colors_without_color() :
+    trail = pybox.TrailBuffer(3,per_point_colors=True)
+    trail.append((0,0))
+    trail.append((1,0),(255,0,0))
+    trail.append((2,0))
+    trail.append((3,0),(0,0,255))
+    trail.append((4,0))                                                 # over a slot that held a color
+    assert trail.colors.tolist() == [[255,0,0],[0,0,255],[0,0,255]]
+    trail.clear()
+    trail.append((0,0))
+    assert trail.colors.tolist() == [[255,255,255]]
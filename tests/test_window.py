@@ -0,0 +1,58 @@
+"""
+Tests of frame statistics and dirty rectangles.
+"""
+
+import types
+import numpy
+from pybox import frame_stats
+from conftest import pixels
+
+class _Clock :
+    "A perf_counter() that only moves with advance()"
+    def __init__(self) : self.now = 100.0
+    def advance(self,seconds : float) : self.now += seconds
+    def perf_counter(self) -> float : return self.now
+
+def test_frame_stats_missed_vsyncs(win,monkeypatch) :
+    clock = _Clock()
+    monkeypatch.setattr(frame_stats,"time",types.SimpleNamespace(perf_counter=clock.perf_counter))
+    stats = win.enable_frame_stats(capacity=8,target_fps=50)
+    for frame in range(11) :
+        clock.advance(.064 if frame == 5 else .02)                       # one frame takes 3 vertical syncs
+        win.draw.fill_rectangle(0,0,10,10,"red")
+        win.vsync_wait()
+    assert stats.frames() == 10 and len(stats.intervals()) == 8
+    assert stats.missed_vsyncs() == 2 and stats.late_frames() == 1
+    assert numpy.allclose(stats.intervals(3),.02) and numpy.allclose(stats.draw_times(),stats.intervals())
+    counts,edges = stats.histogram(bins=3,max_ms=90)
+    assert list(counts) == [7,0,1] and edges[-1] == 90
+    assert stats.report()["frames"] == 10 and "missed vsyncs 2" in stats.write()
+
+def test_frame_stats_overlay(win) :
+    win.cls("white")
+    stats = win.enable_frame_stats(overlay=True)
+    for _ in range(3) : win.vsync_wait()
+    assert tuple(pixels(win)[12,12]) == (0,0,0) and tuple(pixels(win)[140,190]) == (255,255,255)
+    assert win.disable_frame_stats() and win.frame_stats() is None and stats.frames() == 2
+
+def test_dirty_rect(win) :
+    assert win.get_dirty_rect() is None
+    win.enable_dirty_tracking()
+    win.draw.fill_circle(50,40,10,"red")
+    win.draw.line(100,100,120,110,"white",pen_size=4)
+    assert win.get_dirty_rect() == (38,28,85,85)                            # padded by half the pen size + 1
+    win.update()
+    assert win.get_dirty_rect() is None
+    win.display_bitmap(150,100,numpy.zeros((20,80,3),dtype=numpy.uint8))
+    assert win.get_dirty_rect() == (148,98,52,24)                           # clipped to the 200x150 window
+    win.clear_dirty()
+    win.draw.translate_transform(10,10)
+    win.draw.fill_circle(5,5,2,"red")                                       # drawn with a transform: the whole window
+    win.draw.reset_transform()
+    assert win.get_dirty_rect() == (0,0,200,150)
+    win.vsync_wait()
+    win.mark_dirty(10,20,5,5)
+    assert win.get_dirty_rect() == (10,20,5,5)
+    assert win.disable_dirty_tracking() and win.get_dirty_rect() is None
+    win.draw.fill_circle(50,40,10,"red")
+    assert "fill_circle" not in vars(win.draw)